@@ -89,6 +89,40 @@ class _myThread2(Process):
         fo.write(dumps(splitCorrelation,-1))
         fo.close()
 
+class _LazyNeighbourhoods(object):
+    """
+    Descriptor computing on first access the *gamma*, *notGamma*
+    and *neighbourhoodBitsets* attributes of a Digraph instance with the
+    given *method* and caching the result in the instance dictionary.
+    An explicit assignment of the attribute overrides the lazy value and
+    drops the cached attributes listed in *invalidates*.
+    """
+    def __init__(self,name,method,invalidates=()):
+        self.name = name
+        self.method = method
+        self.invalidates = invalidates
+
+    def __get__(self,obj,objtype=None):
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            value = getattr(obj,self.method)()
+            obj.__dict__[self.name] = value
+            return value
+
+    def __set__(self,obj,value):
+        obj.__dict__[self.name] = value
+        for att in self.invalidates:
+            obj.__dict__.pop(att,None)
+
+    def __delete__(self,obj):
+        try:
+            del obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
 class Digraph(object):
     
     """
@@ -100,8 +134,10 @@ class Digraph(object):
     1. A collection of digraph nodes called **actions** (decision alternatives): a list, set or (ordered) dictionary of nodes with 'name' and 'shortname' attributes,
     2. A logical characteristic **valuationdomain**, a dictionary with three decimal entries: the minimum (-1.0, means certainly false), the median (0.0, means missing information) and the maximum characteristic value (+1.0, means certainly true),
     3. The digraph **relation** : a double dictionary indexed by an oriented pair of actions (nodes) and carrying a characteristic value in the range of the previous valuation domain,
-    4. Its associated **gamma function** : a dictionary containing the direct successors, respectively predecessors of each action, automatically added by the object constructor,
-    5. Its associated **notGamma function** : a dictionary containing the actions that are not direct successors respectively predecessors of each action, automatically added by the object constructor.
+    4. Its associated **gamma function** : a dictionary containing the direct successors, respectively predecessors of each action, computed on first access and cached,
+    5. Its associated **notGamma function** : a dictionary containing the actions that are not direct successors respectively predecessors of each action, computed on first access and cached.
+
+    The *gamma* and *notGamma* attributes, as well as the *neighbourhoodBitsets* index (see :py:class:`digraphsTools.NeighbourhoodBitsets`), are lazily computed from the current relation. After an in-site modification of self.relation, the cached neighbourhoods must be dropped with the :py:meth:`~digraphs.Digraph.resetNeighbourhoods` method.
 
     A previously stored :py:class:`digraphs.Digraph` instance may be reloaded with the *file* argument::
     
@@ -130,6 +166,13 @@ class Digraph(object):
 
     """
 
+    gamma = _LazyNeighbourhoods('gamma','gammaSets',
+                                invalidates=('neighbourhoodBitsets',))
+    notGamma = _LazyNeighbourhoods('notGamma','notGammaSets',
+                                   invalidates=('neighbourhoodBitsets',))
+    neighbourhoodBitsets = _LazyNeighbourhoods('neighbourhoodBitsets',
+                                               'computeNeighbourhoodBitsets')
+
     def __repr__(self):
         """
         Default presentation method for Digraph instances.
@@ -158,11 +201,15 @@ class Digraph(object):
         reprString += 'Attributes    : %s\n' % atts       
         print(reprString)        
     
-    def __init__(self,file=None,order=7):
+    def __init__(self,file=None,order=7,MemoryMapped=False):
         #import digraphs,sys,copy
         from randomDigraphs import RandomValuationDigraph
         from decimal import Decimal
-        if file is None:
+        from digraphsTools import isBinarySnapshotFile
+        if file is not None and isBinarySnapshotFile(file):
+            # binary snapshot stored with the saveBinary() method
+            self.loadBinary(file,MemoryMapped=MemoryMapped)
+        elif file is None:
             self.name = 'emptyDigraph'
             self.actions = {}
             self.order = 0
@@ -1865,16 +1912,19 @@ class Digraph(object):
         """
         Renders the mean and variance of the valuation
         of the non reflexive pairs.
+
+        With an 'integer' valuation backend, the mean and the standard
+        deviation are rendered in the units of the unscaled valuation.
         """
         from math import sqrt
-        mean = Decimal('0.0')
-        squares = Decimal('0.0')
+        mean = self._valuationNumber(0)
+        squares = self._valuationNumber(0)
         #actions = self.actions
         #n = len(self.actions)
         
         n = self.order
         n2 = n * (n-1)
-        n2d = Decimal(str(n2))
+        n2d = self._valuationNumber(n2)
         relation = self.relation
         for x,rx in relation.items():
             for y,rxy in rx.items():
@@ -1883,10 +1933,14 @@ class Digraph(object):
                     squares += rxy*rxy
         mean = mean / n2d
         if Sampling:
-            var = ( squares / (n2d-Decimal('1')) ) - (mean * mean)
+            var = ( squares / (n2d-1) ) - (mean * mean)
         else:
             var = squares / n2d - (mean * mean)
         stdDev = sqrt(var)
+        if self.valuationBackend() == 'integer':
+            scale = self.valuationdomain['scale']
+            mean /= scale
+            stdDev /= scale
         if Comments:
             print('mean: %.5f, std. dev.: %.5f' % (mean,stdDev))
         return mean,stdDev
@@ -2282,8 +2336,15 @@ class Digraph(object):
              The correlation index with a completely indeterminate relation
              is by convention 0.0 at determination level 0.0 .
 
+        With a 'float' or 'integer' valuation backend of self, the correlation
+        and the determination are computed in float arithmetic without copying self.
+
         """
         from copy import copy,deepcopy
+        if self.valuationBackend() != 'decimal':
+            return self._computeFastOrdinalCorrelation(other,MedianCut=MedianCut,
+                                                       filterRelation=filterRelation,
+                                                       Debug=Debug)
         g = deepcopy(self)
         g.recodeValuation(-1,1)
         actions = g.actions
@@ -2355,6 +2416,60 @@ class Digraph(object):
             return {'MedianCut':MedianCut, 'correlation': Decimal('0.0'),
                     'determination': determination}
 
+    def _computeFastOrdinalCorrelation(self,other,MedianCut=False,
+                                       filterRelation=None,Debug=False):
+        """
+        Float arithmetic version of the :py:meth:`~digraphs.Digraph.computeOrdinalCorrelation`
+        method for the 'float' and 'integer' valuation backends.
+        """
+        actions = [x for x in self.actions]
+
+        def _normalized(relation,vd):
+            # linear recoding to [-1,1] as done by recodeValuation(-1,1)
+            Min = float(vd['min'])
+            Med = float(vd['med'])
+            Amplitude = float(vd['max']) - Min
+            res = {}
+            for x in actions:
+                rx = relation[x]
+                if MedianCut:
+                    res[x] = {y: (1.0 if float(rx[y]) > Med else \
+                                  (-1.0 if float(rx[y]) < Med else 0.0))
+                              for y in actions}
+                else:
+                    res[x] = {y: -1.0 + 2.0*(float(rx[y]) - Min)/Amplitude
+                              for y in actions}
+            return res
+
+        grel = _normalized(self.relation,self.valuationdomain)
+        if isinstance(other,dict):
+            orel = _normalized(other,{'min': -1, 'med': 0, 'max': 1})
+        else:
+            orel = _normalized(other.relation,other.valuationdomain)
+        if filterRelation is not None:
+            Med = self.valuationdomain['med']
+        correlation = 0.0
+        determination = 0.0
+        n = len(actions)
+        n2 = n*(n-1)
+        for x in actions:
+            grx = grel[x]
+            orx = orel[x]
+            for y in actions:
+                if x != y:
+                    if filterRelation is not None and filterRelation[x][y] == Med:
+                        continue
+                    correlation += min( max(-grx[y],orx[y]), max(grx[y],-orx[y]) )
+                    determination += min( abs(grx[y]),abs(orx[y]) )
+                    if Debug:
+                        print(x,y,grx[y],orx[y],correlation,determination)
+        if determination > 0.0:
+            return { 'MedianCut':MedianCut, 'correlation': correlation/determination,
+                     'determination': determination / n2 }
+        else:
+            return {'MedianCut':MedianCut, 'correlation': 0.0,
+                    'determination': determination}
+
     def computeBipolarCorrelation(self, other, MedianCut=False,
                                   filterRelation=None, Debug=False):
         """
@@ -2411,6 +2526,136 @@ class Digraph(object):
             print(result)
         return result
 
+    def valuationBackend(self):
+        """
+        Renders the numerical type of the characteristic valuation:
+        'decimal' (default), 'float' or 'integer'
+        (see :py:meth:`~digraphs.Digraph.convertValuationBackend`).
+        """
+        try:
+            return self.valuationdomain['backend']
+        except KeyError:
+            return 'decimal'
+
+    def _valuationNumber(self,value):
+        """
+        Renders the *value*, expressed in the units of the valuation domain,
+        in the numerical type of the current valuation backend.
+        Non integral values are kept as Decimals with the 'integer' backend.
+        """
+        backend = self.valuationBackend()
+        if backend == 'float':
+            return float(value)
+        value = Decimal(str(value))
+        if backend == 'integer' and value == value.to_integral_value():
+            return int(value)
+        return value
+
+    def convertValuationBackend(self,backend='float',ndigits=None,Comments=False):
+        """
+        Converts in site the numerical type of the characteristic valuation.
+
+        *Parameters*:
+
+            - *backend*: 'decimal' | 'float' (default) | 'integer';
+              with the 'decimal' backend, the default of Digraph3, the valuation is stored in Decimal values;
+              with the 'float' backend, the valuation is stored in float values rounded to *ndigits* decimal digits,
+              recorded in the *ndigits* entry of the valuation domain;
+              with the 'integer' backend, the valuation is stored in integer values scaled by 10**ndigits,
+              the valuation domain is scaled likewise and its *scale* entry records the scaling factor.
+            - *ndigits*: the explicit precision of the converted valuation.
+              If None, all the decimal digits of the current valuation are kept (at most 15).
+
+        The 'float' and 'integer' backends avoid the Decimal arithmetic overhead in the
+        :py:meth:`~digraphs.Digraph.recodeValuation`, :py:meth:`~digraphs.Digraph.closeTransitive`,
+        :py:meth:`~digraphs.Digraph.computeDeterminateness` and
+        :py:meth:`~digraphs.Digraph.computeOrdinalCorrelation` methods, and in the
+        epistemic *omax* and *omin* fusion operators. The 'decimal' backend remains the export format:
+        converting back to it recovers the Decimal valuation and the original valuation domain.
+
+        When *ndigits* covers the decimal digits of the valuation, the conversions preserve the
+        polarities and the order of all the characteristic values.
+
+        >>> from randomDigraphs import RandomValuationDigraph
+        >>> g = RandomValuationDigraph(order=5,seed=1)
+        >>> g.convertValuationBackend('integer')
+        >>> g.valuationdomain['min'],g.valuationdomain['max'],g.valuationdomain['scale']
+        (-100, 100, 100)
+        >>> g.convertValuationBackend('decimal')
+        >>> g.valuationdomain['max']
+        Decimal('1.00')
+
+        """
+        from decimal import Decimal
+        if backend not in ('decimal','float','integer'):
+            print('Error: unknown valuation backend %s !' % str(backend))
+            return
+        vd = self.valuationdomain
+        oldBackend = self.valuationBackend()
+        relation = self.relation
+        isView = isinstance(relation,ArrayRelationView)
+        if oldBackend == 'integer':
+            oldScale = Decimal(vd['scale'])
+        else:
+            oldScale = Decimal('1')
+
+        def _toDecimal(v):
+            if isinstance(v,float):
+                return Decimal(repr(v))/oldScale
+            return Decimal(v)/oldScale
+
+        if ndigits is None:
+            if isView:
+                ndigits = relation.ndigits
+            elif oldBackend == 'integer':
+                ndigits = len(str(vd['scale'])) - 1
+            elif oldBackend == 'float':
+                ndigits = vd['ndigits']
+            else:
+                values = [vd['min'],vd['med'],vd['max']]
+                for x in relation:
+                    values += list(relation[x].values())
+                ndigits = computeDecimalDigits(values)
+        formatString = '%%.%df' % ndigits
+        scale = 10**ndigits
+        if backend == 'decimal':
+            def _convert(v):
+                return Decimal(formatString % _toDecimal(v))
+        elif backend == 'float':
+            def _convert(v):
+                return round(float(_toDecimal(v)),ndigits)
+        else:
+            def _convert(v):
+                return int((_toDecimal(v) * scale).to_integral_value())
+        if Comments:
+            print('Converting the %s valuation to a %s valuation with %d decimal digits'\
+                  % (oldBackend,backend,ndigits))
+        if isView:
+            relation.backend = backend
+            relation.ndigits = ndigits
+            relation._formatString = formatString
+        else:
+            newRelation = {}
+            for x in relation:
+                newRelation[x] = {y: _convert(v) for y,v in relation[x].items()}
+            self.relation = newRelation
+        for key in ('min','med','max','precision'):
+            if key in vd:
+                vd[key] = _convert(vd[key])
+        for key in ('backend','scale','ndigits'):
+            vd.pop(key,None)
+        if backend == 'decimal':
+            vd['hasIntegerValuation'] = (ndigits == 0)
+        elif backend == 'float':
+            vd['backend'] = backend
+            vd['ndigits'] = ndigits
+            vd['hasIntegerValuation'] = False
+        else:
+            vd['backend'] = backend
+            vd['scale'] = scale
+            vd['hasIntegerValuation'] = True
+        self.resetNeighbourhoods()
+
     def convertValuationToDecimal(self):
         """
         Convert the float valuation limits to Decimals.
@@ -2904,29 +3149,34 @@ class Digraph(object):
         """
         from decimal import Decimal
         Med = self.valuationdomain['med']
-        transRel = self.closeTransitive(InSite=False)
         ntriples = 0
         trans = 0
         weakTrans = 0
         intrans = 0
         openTriples = []
         weakTriples = []
-        for x in self.actions:
-            for y in self.actions:
-                if x != y:
-                    for z in self.actions:
-                        if z != x and z != y:
-                            if transRel[x][y] > Med and\
-                               transRel[y][z] > Med:
-                                ntriples += 1
-                                if self.relation[x][z] > Med:
-                                    trans += 1
-                                elif self.relation[x][z] == Med:
-                                    weakTrans += 1
-                                    weakTriples.append([x,y,z])
-                                else:
-                                    intrans += 1
-                                    openTriples.append([x,y,z])
+        if ReturnWeakIntransitiveTriples:
+            transRel = self.closeTransitive(InSite=False)
+            for x in self.actions:
+                for y in self.actions:
+                    if x != y:
+                        for z in self.actions:
+                            if z != x and z != y:
+                                if transRel[x][y] > Med and\
+                                   transRel[y][z] > Med:
+                                    ntriples += 1
+                                    if self.relation[x][z] > Med:
+                                        trans += 1
+                                    elif self.relation[x][z] == Med:
+                                        weakTrans += 1
+                                        weakTriples.append([x,y,z])
+                                    else:
+                                        intrans += 1
+                                        openTriples.append([x,y,z])
+        else:
+            # counting the triples on the closure bitsets
+            ntriples,trans,weakTrans = self._countClosureTriples()
+            intrans = ntriples - trans - weakTrans
         if ntriples > 0:
             tres = Decimal(str(trans))/Decimal(str(ntriples))
             wtres = Decimal(str(trans+weakTrans))/Decimal(str(ntriples))
@@ -2968,24 +3218,28 @@ class Digraph(object):
         """
         from decimal import Decimal
         Med = self.valuationdomain['med']
-        transRel = self.closeTransitive(InSite=False)
         ntriples = 0
         nclosed = 0
         closedTriples = []
         openTriples = []
-        for x in self.actions:
-            for y in self.actions:
-                if x != y:
-                    for z in self.actions:
-                        if z != x and z != y:
-                            if transRel[x][y] > Med and\
-                               transRel[y][z] > Med:
-                                ntriples += 1
-                                if self.relation[x][z] > Med:
-                                    nclosed += 1
-                                    closedTriples.append([x,y,z])
-                                else:
-                                    openTriples.append([x,y,z])
+        if ReturnTransitiveTriples or ReturnIntransitiveTriples:
+            transRel = self.closeTransitive(InSite=False)
+            for x in self.actions:
+                for y in self.actions:
+                    if x != y:
+                        for z in self.actions:
+                            if z != x and z != y:
+                                if transRel[x][y] > Med and\
+                                   transRel[y][z] > Med:
+                                    ntriples += 1
+                                    if self.relation[x][z] > Med:
+                                        nclosed += 1
+                                        closedTriples.append([x,y,z])
+                                    else:
+                                        openTriples.append([x,y,z])
+        else:
+            # counting the triples on the closure bitsets
+            ntriples,nclosed,nWeak = self._countClosureTriples()
         if ntriples > 0:
             res = Decimal(str(nclosed))/Decimal(str(ntriples))
         else:
@@ -3031,18 +3285,50 @@ class Digraph(object):
         else:
             return False
 
+    def _countClosureTriples(self):
+        """
+        Renders the tuple (ntriples, nclosed, nweak) where *ntriples* is the number
+        of x > y > z triples of distinct nodes in the transitive closure of self,
+        and *nclosed*, resp. *nweak*, the number of these triples such that
+        r(x,z) > Med, resp. r(x,z) == Med, in self.relation.
+        """
+        from digraphsTools import NeighbourhoodBitsets,\
+             computeBitsetTransitiveClosure
+        nb = NeighbourhoodBitsets(self.actions,self.relation,
+                                  self.valuationdomain['med'])
+        closure = computeBitsetTransitiveClosure(nb.dominated)
+        dominated = nb.dominated
+        notDominated = nb.notDominated
+        full = nb.full
+        ntriples = 0
+        nclosed = 0
+        nweak = 0
+        for i in range(nb.order):
+            notI = ~(1 << i)
+            weak = full & ~(dominated[i] | notDominated[i]) & notI
+            m = closure[i]
+            while m:
+                low = m & -m
+                zs = closure[low.bit_length()-1] & notI
+                ntriples += bin(zs).count('1')
+                nclosed += bin(zs & dominated[i]).count('1')
+                nweak += bin(zs & weak).count('1')
+                m ^= low
+        return ntriples,nclosed,nweak
+
     def computeSizeTransitiveClosure(self):
         """
         Renders the size of the transitive closure of a digraph.
         """
-        import copy
+        from digraphsTools import NeighbourhoodBitsets,\
+             computeBitsetTransitiveClosure
         Med = self.valuationdomain['med']
-        relation = self.closeTransitive(InSite=False)
-        n1 = 0
-        for rx in relation.values():
-            for rxy in rx.values():
-                if rxy > Med:
-                    n1 += 1
+        nb = NeighbourhoodBitsets(self.actions,self.relation,Med)
+        closure = computeBitsetTransitiveClosure(nb.dominated)
+        # the loops are kept as such in the closure
+        n1 = len([x for x in self.actions if self.relation[x][x] > Med])
+        for c in closure:
+            n1 += bin(c).count('1')
         return n1
 
 
@@ -3054,54 +3340,52 @@ class Digraph(object):
 
             - If *Reverse* == True (False default) all transitive links are dropped, otherwise all transitive links are closed with min[r(x,y),r(y,z)];
             - If *Insite* == False (True by default) the methods return a modified copy of self.relation without altering the original self.relation, otherwise self.relation is modified.
-           
+
+        The crisp closure is computed on the neighbourhood bitsets via the strong components
+        condensation (see :py:func:`digraphsTools.computeBitsetTransitiveClosure`). A missing transitive link x -> z
+        is closed with the max-min strength of the paths from x to z (see :py:func:`digraphsTools.computeMaxMinClosure`).
+        With *Reverse* == True, the links x -> z such that x -> y -> z in the closure,
+        for some y != x,z, are negated.
         """
-        from copy import deepcopy
-        actions = set(self.actions)
+        from digraphsTools import NeighbourhoodBitsets,\
+             computeBitsetTransitiveClosure, computeMaxMinClosure
+        actionsList = [x for x in self.actions]
         Med = self.valuationdomain['med']
-        Change = True
-        i = 0
-        currRelation = deepcopy(self.relation)
-        while Change:
-            Change = False
-            curriRelation = deepcopy(currRelation)
-            i += 1
-            for x in actions:
-                for y in actions:
-                    if x != y:
-                        for z in actions:
-                            if z != x and z != y: 
-                                if min(curriRelation[y][x],curriRelation[x][z]) > Med \
-                                      and curriRelation[y][z] <= Med:
-                                    currRelation[y][z] =\
-                                      min(curriRelation[y][x],curriRelation[x][z])
-                                    Change = True
+        nb = NeighbourhoodBitsets(actionsList,self.relation,Med)
+        dominated = nb.dominated
+        if Reverse:
+            closure,transitiveArcs = computeBitsetTransitiveClosure(dominated,
+                                                    WithTransitiveArcs=True)
+        else:
+            closure = computeBitsetTransitiveClosure(dominated)
+        # the characteristic values are immutable: copying the rows is enough
+        currRelation = {x: dict(self.relation[x]) for x in self.relation}
+        members = nb.members
+        nbrClosed = 0
+        if any(closure[i] & ~dominated[i] for i in range(len(actionsList))):
+            maxMin = computeMaxMinClosure(actionsList,self.relation,Med)
+            for i,x in enumerate(actionsList):
+                missing = closure[i] & ~dominated[i]
+                if missing:
+                    rx = currRelation[x]
+                    mx = maxMin[x]
+                    for z in members(missing):
+                        rx[z] = mx[z]
+                        nbrClosed += 1
         if Comments:
-            print('iterations: %d' %i )
+            print('closed transitive links: %d' % nbrClosed)
         if Reverse:
-            Change = True
-            i = 0
-            while Change:
-                Change = False
-                i += 1
-                curriRelation = deepcopy(currRelation)
-                for x in actions:
-                    for y in actions:
-                            if x != y:
-                                for z in actions:
-                                    if z != x and z != y:
-                                        if min(curriRelation[y][x],curriRelation[x][z]) > Med \
-                                           and curriRelation[y][z] > Med:
-                                            currRelation[y][z] = -curriRelation[y][z]
-                                            Change = True
-                    #relation[y][z] =\
-                #-(max(relation[y][z],min(relation[y][x],relation[x][z])))
+            nbrDropped = 0
+            for i,x in enumerate(actionsList):
+                rx = currRelation[x]
+                for z in members(transitiveArcs[i]):
+                    rx[z] = -rx[z]
+                    nbrDropped += 1
             if Comments:
-                print('reverse iterations: %d' %i)
+                print('dropped transitive links: %d' % nbrDropped)
         if InSite:
-            self.relation = deepcopy(currRelation)
-            self.gamma = self.gammaSets()
-            self.notGamma = self.notGammaSets()
+            self.relation = currRelation
+            self.resetNeighbourhoods()
         else:
             return currRelation
 
@@ -4774,6 +5058,10 @@ class Digraph(object):
         Export as PDF (default) the principal projection of
         the valued relation using the three principal eigen vectors.
 
+        With *pictureFormat=None*, no R script is run and only the
+        rotation csv file is written, computed in process with the
+        :py:meth:`~digraphs.Digraph.computePrincipalAxes` method.
+
         Implemeted picture formats are: 
         'pdf' (default), 'png', 'jpeg' and 'xfig'.
 
@@ -4800,6 +5088,21 @@ class Digraph(object):
         if tempDir is None:
             tempDir = '.'
         import os,time
+        if pictureFormat is None:
+            # no principal image is required: the rotation is computed in process
+            import csv
+            values,P,actionsList = self.computePrincipalAxes(Colwise=Colwise,
+                                                             Reduced=Reduced)
+            if Colwise:
+                fo = open('%s/rotationCol.csv' % tempDir,'w')
+            else:
+                fo = open('%s/rotationRow.csv' % tempDir,'w')
+            csvfo = csv.writer(fo,quoting=csv.QUOTE_NONNUMERIC)
+            csvfo.writerow(['V%d' % (k+1) for k in range(len(values))])
+            for i in range(len(actionsList)):
+                csvfo.writerow([float('%.15g' % P[k][i]) for k in range(len(values))])
+            fo.close()
+            return
         if plotFileName is None:
             plotFileName = "%s/%s" % (tempDir,self.name)
         else:
@@ -5798,6 +6101,8 @@ class Digraph(object):
         If *InPercents* is True, returns the average determination in percentage of
         (Max - Med) difference.
 
+        With a 'float' or 'integer' valuation backend, the result is a float.
+
         >>> from outrankingDigraphs import BipolarOutrankingDigraph
         >>> from randomPerfTabs import Random3ObjectivesPerformanceTableau
         >>> t = Random3ObjectivesPerformanceTableau(numberOfActions=7,numberOfCriteria=7,seed=101)
@@ -5837,6 +6142,18 @@ class Digraph(object):
         relation = self.relation
         #actions = self.actions
         order = self.order
+        if self.valuationBackend() != 'decimal':
+            # float arithmetic with the 'float' and 'integer' backends
+            D = 0
+            for x,rx in relation.items():
+                for y,rxy in rx.items():
+                    if x != y:
+                        D += abs(rxy - Med)
+            determination = D / max(order*(order-1),1)
+            if InPercents:
+                return (determination/(Max - Med) + 1.0) / 2.0 * 100.0
+            else:
+                return determination / self.valuationdomain.get('scale',1)
         D = Decimal('0.0')
         for x,rx in relation.items():
             for y,rxy in rx.items():
@@ -6299,28 +6616,24 @@ class Digraph(object):
         """
         Renders the distribtion of neighbourhood depths.
         """
-        import array,copy
-        actions = set(self.actions)
-        order = len(actions)
+        import array
+        from digraphsTools import computeBitsetPathLengths
+        nb = self.neighbourhoodBitsets
+        order = nb.order
         nv = order + 1
         vecNeighbourhoodDepth = array.array('i', [0] * nv)
-        for x in actions:
-            nbx = 0
-            neighbx = set([x])
-            restactions = actions - neighbx
-            while restactions != set() and nbx < order:
-                nbx += 1
-                iterneighbx = copy.copy(neighbx)
-                for y in iterneighbx:
-                    if Oriented:
-                        neighbx = neighbx | self.gamma[y][0]
-                    else:
-                        neighbx = neighbx | self.gamma[y][0] | self.gamma[y][1]
-                restactions = actions - neighbx
-            if restactions != set():
+        if Oriented:
+            successors = nb.dominated
+        else:
+            successors = [nb.dominated[i] | nb.absorbed[i]
+                          for i in range(order)]
+        # the neighbourhood depth is the eccentricity of each node
+        lengths = computeBitsetPathLengths(successors)
+        for row in lengths.tolist():
+            if min(row) < 0:
                 vecNeighbourhoodDepth[order] += 1
             else:
-                vecNeighbourhoodDepth[nbx] += 1
+                vecNeighbourhoodDepth[max(row)] += 1
         return vecNeighbourhoodDepth
 
 
@@ -6360,16 +6673,30 @@ class Digraph(object):
     def strongComponents(self, setPotential = False):
         """
         Renders the set of strong components of self.
+
+        With *setPotential* = True, the strong components of the weak links (r >= Med) are rendered.
+        The components are computed in linear time (see :py:meth:`~digraphs.Digraph.computeCondensation`).
         """
-        neighbourhoods = self.neighbourhoodCollection(Oriented = True, Potential = setPotential)
-        strongComponents = set()
-        for x in self.actions:
-            componentx = set([x])
-            for y in neighbourhoods[x]:
-                if x in neighbourhoods[y]:
-                    componentx = componentx | set([y])
-            strongComponents = strongComponents | set([frozenset(componentx)])
-        return strongComponents
+        condensation = self.computeCondensation(Potential=setPotential)
+        return set(condensation.components)
+
+    def computeCondensation(self,Potential=False):
+        """
+        Renders the :py:class:`digraphs.DigraphCondensation` DAG of the strong components
+        of the strict links (r > Med), or of the weak links (r >= Med) when *Potential* = True.
+
+        The components are computed with Tarjan's algorithm on the neighbourhood bitsets
+        (see :py:func:`digraphsTools.computeBitsetStrongComponents`) and rendered in topological order.
+
+        >>> from randomDigraphs import RandomDigraph
+        >>> g = RandomDigraph(order=10,arcProbability=0.2,seed=1)
+        >>> cd = g.computeCondensation()
+        >>> set(cd.components) == g.strongComponents()
+        True
+        >>> all(j > k for k in range(len(cd)) for j in cd.successors[k])
+        True
+        """
+        return DigraphCondensation(self,Potential=Potential)
 
     def showMIS(self,withListing=True):
         """
@@ -6551,15 +6878,10 @@ class Digraph(object):
         print('*--- Computing preKernels ---*')
         actions = set(self.actions)
         n = len(actions)
-        dompreKernels = set()
-        abspreKernels = set()
         t0 = time.time()
-        for choice in self.independentChoices(self.singletons()):
-            restactions = actions - choice[0][0]
-            if restactions <= choice[0][1]:
-                dompreKernels.add(choice[0][0])
-            if restactions <= choice[0][2]:
-                abspreKernels.add(choice[0][0])
+        self.computePreKernels()
+        dompreKernels = self.dompreKernels
+        abspreKernels = self.abspreKernels
         t1 = time.time()
         if withListing:
             print('Dominant preKernels :')
@@ -6598,43 +6920,28 @@ class Digraph(object):
         computing dominant and absorbent preKernels:
             Result in self.dompreKernels and self.abspreKernels
         """
-        actions = set(self.actions)
-        n = len(actions)
-        dompreKernels = set()
-        abspreKernels = set()
-        for choice in self.independentChoices(self.singletons()):
-            restactions = actions - choice[0][0]
-            if restactions <= choice[0][1]:
-                dompreKernels.add(choice[0][0])
-            if restactions <= choice[0][2]:
-                abspreKernels.add(choice[0][0])
-        self.dompreKernels = dompreKernels
-        self.abspreKernels = abspreKernels
-
+        self.dompreKernels = set(self.generateDomPreKernels())
+        self.abspreKernels = set(self.generateAbsPreKernels())
 
     def generateDomPreKernels(self):
         """
-        Generate all dominant prekernels from independent choices generator.
+        Generate all dominant prekernels with a pruned Bron-Kerbosch enumeration
+        of the maximal independent choices
+        (see :py:meth:`digraphsTools.NeighbourhoodBitsets.generatePreKernels`).
         """
-        actions = set(self.actions)
-        for item in self.independentChoices(self.singletons()):
-            choice = item[0][0]
-            gammaDomChoice = item[0][1]
-            restactions = actions - choice
-            if restactions <= gammaDomChoice:
-                yield choice
+        nb = self.neighbourhoodBitsets
+        for mask in nb.generatePreKernels('dominant'):
+            yield frozenset(nb.members(mask))
 
     def generateAbsPreKernels(self):
         """
-        Generate all absorbent prekernels from independent choices generator.
+        Generate all absorbent prekernels with a pruned Bron-Kerbosch enumeration
+        of the maximal independent choices
+        (see :py:meth:`digraphsTools.NeighbourhoodBitsets.generatePreKernels`).
         """
-        actions = set(self.actions)
-        for item in self.independentChoices(self.singletons()):
-            choice = item[0][0]
-            gammaAbsChoice = item[0][2]
-            restactions = actions - choice
-            if restactions <= gammaAbsChoice:
-                yield choice
+        nb = self.neighbourhoodBitsets
+        for mask in nb.generatePreKernels('absorbent'):
+            yield frozenset(nb.members(mask))
 
     def components(self):
         """Renders the list of connected components."""
@@ -6714,6 +7021,26 @@ class Digraph(object):
         return worstRanks
 
 
+    def computeNeighbourhoodBitsets(self):
+        """
+        Renders the :py:class:`digraphsTools.NeighbourhoodBitsets` index
+        of the strict neighbourhoods of self.
+
+        The index is cached in the *self.neighbourhoodBitsets* attribute
+        on first access.
+        """
+        return NeighbourhoodBitsets(self.actions,self.relation,
+                                    self.valuationdomain['med'])
+
+    def resetNeighbourhoods(self):
+        """
+        Drops the cached *gamma*, *notGamma* and *neighbourhoodBitsets*
+        attributes, which will be recomputed from the current
+        self.relation on next access.
+        """
+        for att in ('gamma','notGamma','neighbourhoodBitsets'):
+            self.__dict__.pop(att,None)
+
     def gammaSets(self):
         """
         Renders the dictionary of neighborhoods {node: (dx,ax)}
@@ -6721,6 +7048,8 @@ class Digraph(object):
         the absorbed neighborhood.
 
         """
+        if isinstance(self.relation,ArrayRelationView):
+            return self.neighbourhoodBitsets.gammaSets()
         Med = self.valuationdomain['med']
         actions = self.actions
         relation = self.relation
@@ -6745,6 +7074,8 @@ class Digraph(object):
         the not absorbed neighborhood.
 
         """
+        if isinstance(self.relation,ArrayRelationView):
+            return self.neighbourhoodBitsets.notGammaSets()
         Med = self.valuationdomain['med']
         actions = self.actions
         relation = self.relation
@@ -6859,40 +7190,32 @@ class Digraph(object):
         return s
 
 
-    def MISgen(self,S,I):
+    def MISgen(self,S=None,I=None):
         """
-        generator of maximal independent choices (voir Byskov 2004):
-            * S ::= remaining nodes;
-            * I ::= current independent choice
+        generator of maximal independent choices:
+            * S ::= remaining nodes (all nodes by default);
+            * I ::= current independent choice (empty by default).
+
+        The choices are enumerated with a Bron-Kerbosch algorithm with pivoting
+        on the bitsets of the complement of the strict neighbourhoods
+        (see :py:meth:`digraphsTools.NeighbourhoodBitsets.generateMaximalIndependentChoices`)
+        and gathered in self.misset.
 
         .. note::
 
                 Inititalize: self.MISgen(set(self.actions),frozenset()),
                 (see self.showMIS() method)
-                
              
         """
-        if S == set():
-            add = 1
-            self.missetit = self.misset.copy()
-            for mis in self.missetit:
-                if mis < I:
-                    self.misset.remove(mis)
-                else:
-                    if I <= mis:
-                        add = 0
-                        break
-            if add == 1:
-                self.misset = self.misset | frozenset([I])
-                yield I
-        else:
-            v = S.pop()
-            Sv = S - (self.gamma[v][0] | self.gamma[v][1])
-            Iv = I | set([v])
-            for choice in self.MISgen(Sv,Iv):
-                yield choice
-            for choice in self.MISgen(S,I):
-                yield choice
+        nb = self.neighbourhoodBitsets
+        try:
+            misset = self.misset
+        except AttributeError:
+            misset = self.misset = set()
+        for mask in nb.generateMaximalIndependentChoices(S,I):
+            choice = frozenset(nb.members(mask))
+            misset.add(choice)
+            yield choice
 
     def independentChoices(self,U):
         """
@@ -7003,8 +7326,15 @@ class Digraph(object):
 
         *ndigits* indicates the number of decimal digits of the valuation. 
 
+        With a 'float' or 'integer' valuation backend (see :py:meth:`~digraphs.Digraph.convertValuationBackend`),
+        the recoding is computed in float arithmetic and the valuation keeps its backend with
+        *ndigits* decimal digits.
+
         """
         from decimal import Decimal
+        if self.valuationBackend() != 'decimal':
+            self._recodeFastValuation(newMin,newMax,ndigits,Debug=Debug)
+            return
         formatString = '%%.%df' % ndigits
         oldMax = Decimal(formatString % self.valuationdomain['max'])
         oldMin = Decimal(formatString % self.valuationdomain['min'])
@@ -7061,6 +7391,87 @@ class Digraph(object):
         else:
             self.valuationdomain['hasIntegerValuation'] = False
         self.relation = newrelation
+        self.resetNeighbourhoods()
+
+    def _recodeFastValuation(self,newMin,newMax,ndigits,Debug=False):
+        """
+        Float arithmetic version of the :py:meth:`~digraphs.Digraph.recodeValuation`
+        method for the 'float' and 'integer' valuation backends.
+        """
+        vd = self.valuationdomain
+        backend = vd['backend']
+        oldMin = vd['min']
+        oldMed = vd['med']
+        oldMax = vd['max']
+        oldAmplitude = float(oldMax - oldMin)
+        try:
+            oldPrecision = vd['precision']
+        except KeyError:
+            oldPrecision = 0
+        newMin = float(newMin)
+        newMax = float(newMax)
+        newMed = (newMin + newMax)/2.0
+        newAmplitude = newMax - newMin
+        if backend == 'integer':
+            scale = 10**ndigits
+            def _convert(v):
+                return int(round(v*scale))
+        else:
+            def _convert(v):
+                return round(v,ndigits)
+        nMin = _convert(newMin)
+        nMed = _convert(newMed)
+        nMax = _convert(newMax)
+        if Debug:
+            print(oldMin, oldMed, oldMax, oldAmplitude)
+            print(nMin, nMed, nMax, newAmplitude)
+        relation = self.relation
+        if isinstance(relation,ArrayRelationView):
+            # the float array is recoded in site
+            import numpy as np
+            array = relation.array
+            if relation.backend == 'integer':
+                arrayScale = 10**relation.ndigits
+                aMin,aMed,aMax = oldMin/arrayScale,oldMed/arrayScale,oldMax/arrayScale
+            else:
+                aMin,aMed,aMax = float(oldMin),float(oldMed),float(oldMax)
+            isMin = array == aMin
+            isMed = array == aMed
+            isMax = array == aMax
+            array -= aMin
+            array *= newAmplitude/(aMax - aMin)
+            array += newMin
+            array[isMin] = newMin
+            array[isMed] = newMed
+            array[isMax] = newMax
+            np.round(array,ndigits,out=array)
+            relation.ndigits = ndigits
+            relation._formatString = '%%.%df' % ndigits
+        else:
+            newRelation = {}
+            for x in relation:
+                newRelation[x] = {}
+                nrx = newRelation[x]
+                for y,v in relation[x].items():
+                    if v == oldMax:
+                        nrx[y] = nMax
+                    elif v == oldMin:
+                        nrx[y] = nMin
+                    elif v == oldMed:
+                        nrx[y] = nMed
+                    else:
+                        nrx[y] = _convert(newMin + ((v - oldMin)/oldAmplitude)*newAmplitude)
+            self.relation = newRelation
+        vd['min'] = nMin
+        vd['med'] = nMed
+        vd['max'] = nMax
+        vd['precision'] = _convert(float(oldPrecision)/float(oldMax))
+        if backend == 'integer':
+            vd['scale'] = scale
+        else:
+            vd['ndigits'] = ndigits
+            vd['hasIntegerValuation'] = (ndigits == 0)
+        self.resetNeighbourhoods()
 
     def dominantChoices(self,S):
         """
@@ -7287,9 +7698,9 @@ class Digraph(object):
         #import array
         actions = self.actions
         n = len(actions)
-        Min = Decimal(str(self.valuationdomain['min']))
-        Med = Decimal(str(self.valuationdomain['med']))
-        Max = Decimal(str(self.valuationdomain['max']))
+        Min = self._valuationNumber(self.valuationdomain['min'])
+        Med = self._valuationNumber(self.valuationdomain['med'])
+        Max = self._valuationNumber(self.valuationdomain['max'])
         for x in actions:
             relation[x][x] = Max
         result = Max
@@ -7337,7 +7748,7 @@ class Digraph(object):
         result = Max
         for x in choice:
             nbclx = self.readdomvector(x,relation)
-            nbclchoice = [Decimal(str(Min)) for i in actions]
+            nbclchoice = [self._valuationNumber(Min) for i in actions]
             restchoice = set(choice)
             restchoice.remove(x)
             for y in restchoice:
@@ -7378,6 +7789,82 @@ class Digraph(object):
         else:
             return Max
 
+    def saveBinary(self,fileName='tempdigraph',Comments=True):
+        """
+        Persistent storage of a Digraph class instance in a compact binary
+        snapshot file <fileName.d3b> (see :py:func:`digraphsTools.saveBinarySnapshot`).
+
+        The actions and the valuation domain are stored in the JSON index header
+        and the relation characteristics in a float64 n x n array.
+        Such a snapshot is reloaded, without parsing and executing any Python code,
+        with the *Digraph(fileName)* constructor or the
+        :py:meth:`~digraphs.Digraph.loadBinary` method.
+
+        Requires the *numpy* package.
+        """
+        import numpy as np
+        from digraphsTools import saveBinarySnapshot, computeDecimalDigits
+        fileName = str(fileName)
+        if not fileName.endswith('.d3b'):
+            fileName += '.d3b'
+        if Comments:
+            print('*--- Saving digraph in binary file: <%s> ---*' % fileName)
+        actionsKeys = [x for x in self.actions]
+        relation = self.relation
+        values = [relation[x][y] for x in actionsKeys for y in actionsKeys]
+        relationArray = np.array([float(v) for v in values],dtype=np.float64)
+        relationArray = relationArray.reshape((len(actionsKeys),len(actionsKeys)))
+        valuationdomain = self.valuationdomain
+        header = {'type': 'Digraph',
+                  'class': self.__class__.__name__,
+                  'name': self.name,
+                  'actions': self.actions,
+                  'actionsKeys': actionsKeys,
+                  'valuationdomain': valuationdomain,
+                  'relationDigits': computeDecimalDigits(values +\
+                            [valuationdomain['min'],valuationdomain['max']]),
+                  }
+        for att in ('reflections','rotations'):
+            try:
+                header[att] = getattr(self,att)
+            except AttributeError:
+                pass
+        saveBinarySnapshot(fileName,header,{'relation': relationArray})
+
+    def loadBinary(self,fileName,MemoryMapped=False):
+        """
+        Loads a digraph stored with the :py:meth:`~digraphs.Digraph.saveBinary` method.
+
+        With *MemoryMapped* = True, *self.relation* is a lazy dictionary view
+        (:py:class:`digraphsTools.ArrayRelationView`) on a copy-on-write memory
+        mapping of the snapshot file, otherwise a genuine double dictionary of
+        Decimal values.
+        """
+        from digraphsTools import loadBinarySnapshot, ArrayRelationView
+        name = str(fileName)
+        if name.endswith('.d3b'):
+            name = name[:-4]
+        header,arrays = loadBinarySnapshot(name + '.d3b',MemoryMapped=MemoryMapped)
+        if header.get('type') != 'Digraph':
+            print('Error: %s.d3b is not a digraph snapshot!' % name)
+            return
+        self.name = name
+        self.actions = header['actions']
+        self.order = len(self.actions)
+        self.valuationdomain = header['valuationdomain']
+        self.convertValuationToDecimal()
+        relation = ArrayRelationView(arrays['relation'],header['actionsKeys'],
+                                     ndigits=header['relationDigits'])
+        if MemoryMapped:
+            self.relation = relation
+        else:
+            self.relation = relation.todict()
+        for att in ('reflections','rotations'):
+            if att in header:
+                setattr(self,att,header[att])
+        # gamma and notGamma are computed on first access
+        self.resetNeighbourhoods()
+
     def save(self,fileName='tempdigraph',option=None,DecimalValuation=True,decDigits=2):
         """Persistent storage of a Digraph class instance in the form of
             a python source code file"""
@@ -7564,45 +8051,29 @@ class Digraph(object):
         Renders a double dictionary with the directed distances, i.e. the shortest path lengths between all self.actions. 
 
         Equals *None* if there does not exist a directed path between two actions.
-        
+
+        The distances are computed by a breadth first search from each action on the neighbourhood bitsets
+        of the strict (r > Med), resp. weak (r >= Med) when *WeakPaths* = True, links
+        (see :py:func:`digraphsTools.computeBitsetPathLengths`).
+        They are rendered as a :py:class:`digraphsTools.PathLengthsView` dictionary view on the compact
+        integer matrix *distances.array*. The valued max-min path strengths are given by the
+        :py:meth:`~digraphs.Digraph.computeBottleneckPathStrengths` method.
+
         *Source*: Claude Berge, *The Theory of Graphs*, Dover (2001) pp. 119, original in French Dunod (1958)
         """
+        from digraphsTools import NeighbourhoodBitsets, PathLengthsView,\
+             computeBitsetPathLengths
         Med = self.valuationdomain['med']
-        Min = self.valuationdomain['min']
-        relation = self.relation
         actions = [x for x in self.actions]
-        order = self.order
-        ri = {}
-        for i in range(1,order):
-            if i == 1:
-                ri[i] = relation
-            else:
-                ri[i] = {}
-                for x in actions:
-                    ri[i][x] = {}
-                    for y in actions:
-                        ri[i][x][y] = Med
-                        if x != y:
-                            accz = ri[i-1][x][y]
-                            for z in actions:
-                                #if x != z and y != z:
-                                accz = max(accz,min(ri[i-1][x][z],ri[1][z][y]))
-                            ri[i][x][y] = accz
-        distances = {}
-        for x in actions:
-            distances[x] = {}
-            for y in actions:
-                distances[x][y] = None
-                if x == y:
-                    distances[x][y] = 0
-                else:
-                    for i in range(order-1,0,-1):
-                        if WeakPaths:
-                            if ri[i][x][y] >= Med:
-                                distances[x][y] = i
-                        else:
-                            if ri[i][x][y] > Med:
-                                distances[x][y] = i
+        nb = NeighbourhoodBitsets(actions,self.relation,Med)
+        if WeakPaths:
+            full = nb.full
+            successors = [full & ~(nb.notDominated[i] | (1 << i))
+                          for i in range(nb.order)]
+        else:
+            successors = nb.dominated
+        distances = PathLengthsView(computeBitsetPathLengths(successors),
+                                    actions)
         if Comments:
             if WeakPaths:
                 print('Shortest weak path lengths')
@@ -7612,8 +8083,6 @@ class Digraph(object):
             for x in actions:
                 for y in actions:
                     print(x,y,distances[x][y])
-        if Debug:
-            self.ri = ri
         if WeakPaths:
             self.shortestWeakPathLengths = distances
         else:
@@ -7622,6 +8091,30 @@ class Digraph(object):
 
     #-------------------
 
+    def computeBottleneckPathStrengths(self,Comments=False):
+        """
+        Renders a double dictionary with the bottleneck, i.e. max-min, path strengths between all self.actions:
+        the maximal over all the paths from x to y of the minimal characteristic value along the path.
+        The diagonal is set to the median valuation.
+
+        A path strength is positive, resp. not negative, if and only if there exists a path of
+        strict, resp. weak, links from x to y.
+        The strengths are computed once with a vectorized Floyd-Warshall sweep
+        (see :py:func:`digraphsTools.computeBottleneckPathStrengths`).
+        """
+        from digraphsTools import computeBottleneckPathStrengths
+        actions = [x for x in self.actions]
+        strengths = computeBottleneckPathStrengths(actions,self.relation,
+                                                   self.valuationdomain['med'])
+        if Comments:
+            print('Bottleneck path strengths')
+            print('x, y, strength')
+            for x in actions:
+                for y in actions:
+                    print(x,y,strengths[x][y])
+        self.bottleneckPathStrengths = strengths
+        return strengths
+
     def computeDigraphCentres(self,WeakDistances=False,Comments=False):
         """
         The centers of a digraph are the nodes with finite minimal shortes path lengths.
@@ -7650,13 +8143,15 @@ class Digraph(object):
         aN = {}
         actions = [x for x in self.actions]
         order = self.order
-        for x in actions:
-            aN[x] = 0
-            for y in actions:
-                if distances[x][y] is not None:
-                    aN[x] = max(aN[x],distances[x][y])
-                else:
-                    aN[x] = order
+        # maximal distances on the compact distances matrix
+        lengths = distances.array
+        eccentricities = lengths.max(axis=1).tolist()
+        unreachable = (lengths < 0).any(axis=1).tolist()
+        for i,x in enumerate(actions):
+            if unreachable[i]:
+                aN[x] = order
+            else:
+                aN[x] = eccentricities[i]
         if Comments:
             if WeakDistances:
                 print('Maximal weak neighborhood distances')
@@ -8304,8 +8799,8 @@ class Digraph(object):
         if Min != -Max:
             # the characteristic valuation is not bipolar !
             maxAmplitude = abs(Max-Med) + abs(Min-Med)
-            degP = Decimal('0')
-            degN = Decimal('0')
+            degP = Med - Med
+            degN = Med - Med
             nParcs = 0
             nNarcs = 0
             minAmplitude = maxAmplitude
@@ -8364,9 +8859,9 @@ class Digraph(object):
                 degN += relation[y][x]
                 nNarcs += 1            
         if nParcs != 0:
-            degP /= Decimal(str(nParcs))
+            degP /= nParcs
         if nNarcs != 0:
-            degN /= Decimal(str(nNarcs))
+            degN /= nNarcs
         if Debug:
             print('degP,degN,minLink',degP,degN,minLink)
         return degP,degN,minLink
@@ -8376,8 +8871,8 @@ class Digraph(object):
         Parameter: choice.
         Renders the negation of a choice v characteristic's vector.
         """
-        Max = Decimal(str(self.valuationdomain['max']))
-        Min = Decimal(str(self.valuationdomain['min']))
+        Max = self._valuationNumber(self.valuationdomain['max'])
+        Min = self._valuationNumber(self.valuationdomain['min'])
         #print v
         nv = [Max - v[x] + Min for x in range(len(v))]
         return nv
@@ -8395,7 +8890,7 @@ class Digraph(object):
         Paramaters: choice characteristic values.
         Renders the sharpest of two characteristic values x and y.
         """
-        med = Decimal(str(self.valuationdomain['med']))
+        med = self._valuationNumber(self.valuationdomain['med'])
         if x >= med and y >= med:
             return max(x,y)
         elif x <= med and y <= med:
@@ -8408,7 +8903,7 @@ class Digraph(object):
         Parameters: two choice characteristic vectors
         Renders the inner product of two characteristic vetors.
         """
-        res = Decimal(str(self.valuationdomain['min']))
+        res = self._valuationNumber(self.valuationdomain['min'])
         for i in range(len(v1)):
             res = max(res, min(v1[i],v2[i]))
         return res
@@ -8449,8 +8944,8 @@ class Digraph(object):
         """
         actions = self.actions
         relation = self.relation
-        Min = Decimal(str(self.valuationdomain['min']))
-        Med = Decimal(str(self.valuationdomain['med']))
+        Min = self._valuationNumber(self.valuationdomain['min'])
+        Med = self._valuationNumber(self.valuationdomain['med'])
         relation_k = {}
         for x in actions:
             relation_k[x] = {}
@@ -8475,8 +8970,8 @@ class Digraph(object):
         """
         actions = self.actions
         relation = self.relation
-        Min = Decimal(str(self.valuationdomain['min']))
-        Med = Decimal(str(self.valuationdomain['med']))
+        Min = self._valuationNumber(self.valuationdomain['min'])
+        Med = self._valuationNumber(self.valuationdomain['med'])
         relation_k = {}
         for x in actions:
             relation_k[x] = {}
@@ -9841,9 +10336,9 @@ class Digraph(object):
         import copy
         from operator import itemgetter
         temp = copy.deepcopy(self)
-        Max = Decimal(str(temp.valuationdomain['max']))
-        Min = Decimal(str(temp.valuationdomain['min']))
-        Med = Decimal(str(temp.valuationdomain['med']))
+        Max = temp._valuationNumber(temp.valuationdomain['max'])
+        Min = temp._valuationNumber(temp.valuationdomain['min'])
+        Med = temp._valuationNumber(temp.valuationdomain['med'])
         actions = [x for x in temp.actions]
         #actions.sort()
         relation = temp.relation
@@ -9910,9 +10405,9 @@ class Digraph(object):
         import copy
         from operator import itemgetter
         temp = copy.deepcopy(self)
-        Max = Decimal(str(temp.valuationdomain['max']))
-        Min = Decimal(str(temp.valuationdomain['min']))
-        Med = Decimal(str(temp.valuationdomain['med']))
+        Max = temp._valuationNumber(temp.valuationdomain['max'])
+        Min = temp._valuationNumber(temp.valuationdomain['min'])
+        Med = temp._valuationNumber(temp.valuationdomain['med'])
         actions = [x for x in temp.actions]
         #actions.sort()
         relation = temp.relation
@@ -9991,9 +10486,9 @@ class Digraph(object):
         import copy
         from operator import itemgetter
         temp = copy.deepcopy(self)
-        Max = Decimal(str(temp.valuationdomain['max']))
-        Min = Decimal(str(temp.valuationdomain['min']))
-        Med = Decimal(str(temp.valuationdomain['med']))
+        Max = temp._valuationNumber(temp.valuationdomain['max'])
+        Min = temp._valuationNumber(temp.valuationdomain['min'])
+        Med = temp._valuationNumber(temp.valuationdomain['med'])
         actions = [x for x in temp.actions]
         relation = temp.relation
         domChoices = []
@@ -10187,10 +10682,10 @@ class Digraph(object):
 
         If inPercent, *result* shifted (+1) and reduced (/2) to [0,1] range. 
         """
-        Min = Decimal(str(self.valuationdomain['min']))
-        Max = Decimal(str(self.valuationdomain['max']))
-        Med = Decimal(str(self.valuationdomain['med']))
-        result = Decimal('0.0')
+        Min = self._valuationNumber(self.valuationdomain['min'])
+        Max = self._valuationNumber(self.valuationdomain['max'])
+        Med = self._valuationNumber(self.valuationdomain['med'])
+        result = Med - Med
         n = len(vec)
         for i in range(n):
             try:
@@ -10201,7 +10696,7 @@ class Digraph(object):
         result /= n*(Max-Med)
         #print result
         if inPercent:
-            return (result + Decimal('1.0'))/Decimal('2.0')
+            return (result + 1)/2
         else:
             return result*(Max-Med)
 
@@ -10222,9 +10717,9 @@ class Digraph(object):
 
         temp = copy.deepcopy(self)
 
-        Max = Decimal(str(temp.valuationdomain['max']))
-        Min = Decimal(str(temp.valuationdomain['min']))
-        Med = Decimal(str(temp.valuationdomain['med']))
+        Max = temp._valuationNumber(temp.valuationdomain['max'])
+        Min = temp._valuationNumber(temp.valuationdomain['min'])
+        Med = temp._valuationNumber(temp.valuationdomain['med'])
         actions = [x for x in temp.actions]
         relation = temp.relation
         absChoices = []
@@ -10319,15 +10814,15 @@ class Digraph(object):
         html += '  absorbency          : %.2f<br/>\n' % (dega)
         if choiceType == "good":
             html += '  covering (%%): %.2f<br/>\n' %\
-                ( self.averageCoveringIndex(choice,direction='out') * Decimal('100') )
+                ( float(self.averageCoveringIndex(choice,direction='out')) * 100.0 )
         elif choiceType == "bad":
             html += '  covered (%%) : %.2f<br/>\n' %\
-                ( self.averageCoveringIndex(choice,direction='in') * Decimal('100') )
+                ( float(self.averageCoveringIndex(choice,direction='in')) * 100.0 )
         else:
             html += '  covering (%%): %.2f<br/>\n' %\
-                ( self.averageCoveringIndex(choice) * Decimal('100') )            
+                ( float(self.averageCoveringIndex(choice)) * 100.0 )            
             
-        html += '  determinateness (in %%) : %.2f</p>\n' % (determ*Decimal('100.0'))
+        html += '  determinateness (in %%) : %.2f</p>\n' % (float(determ)*100.0)
         if ChoiceVector:
             html += '<p>  - characteristic vector = {\n'
             for i in range(len(actions)):
@@ -10376,16 +10871,16 @@ class Digraph(object):
         print('  absorbency          : %.2f' % (dega))
         if choiceType == "good":
             print('  covering (%)' + '        : %.2f' %\
-                  ( self.averageCoveringIndex(choice,direction='out') * Decimal('100') ))
+                  ( float(self.averageCoveringIndex(choice,direction='out')) * 100.0 ))
         elif choiceType == "bad":
             print('  covered (%) ' + '        : %.2f' %\
-                  ( self.averageCoveringIndex(choice,direction='in') * Decimal('100') ))
+                  ( float(self.averageCoveringIndex(choice,direction='in')) * 100.0 ))
         else:
             print('  covering (%)' + '        : %.2f' %\
-                  ( self.averageCoveringIndex(choice) * Decimal('100') ))
+                  ( float(self.averageCoveringIndex(choice)) * 100.0 ))
             
         print("  determinateness (%)", end=' ')
-        print(': %.2f' % (determ*Decimal('100.0')))
+        print(': %.2f' % (float(determ)*100.0))
         if ChoiceVector:
             print('  - characteristic vector = {', end=' ')
             for i in range(len(actions)):
@@ -11640,8 +12135,9 @@ class Digraph(object):
         actionsList = [x for x in self.actions]
         incCopelandScores = []
         decCopelandScores = []
+        Med = c.valuationdomain['med']
         for x in actionsList:
-            copelandScore = Decimal('0')
+            copelandScore = Med
             for y in actionsList:
                 copelandScore += cRelation[x][y] - cRelation[y][x]
             #actions[x]['score'] = copelandScore
@@ -11849,10 +12345,18 @@ class Digraph(object):
 
     def computeKemenyRanking(self,
                            orderLimit=7, seed=None,
-                           sampleSize=1000, Debug=False):
+                           sampleSize=1000,
+                           maxNbrOfRankings=5040,
+                           Debug=False):
         """
         Renders a ranking from best to worst of the actions with maximal Kemeny index.
 
+        Digraphs of order up to 7 are ranked by exact enumeration of all permutations.
+        Digraphs of order 8 up to *orderLimit* are ranked exactly with the
+        :py:meth:`~digraphs.Digraph.computeExactKemenyRankings` method, a subset dynamic programming
+        solver which handles orders of 15 to 25 actions in seconds.
+        At most *maxNbrOfRankings* maximal rankings are then stored in *self.maximalRankings*.
+
         .. note::
         
              Returns a tuple: kemenyRanking (from best to worst), kemenyIndex.
@@ -11871,6 +12375,16 @@ class Digraph(object):
         ## respecting a maximum of marginal majority margins
         if n > orderLimit:
             return None
+        if n > 7:
+            result = self.computeExactKemenyRankings(
+                                        maxNbrOfRankings=maxNbrOfRankings,
+                                        Debug=Debug)
+            if result is None:
+                return None
+            maximalRankings, kemenyIndex = result
+            self.maximalRankings = maximalRankings
+            self.kemenyIndex = kemenyIndex
+            return list(maximalRankings[0]), kemenyIndex
         kemenyIndex = Decimal(str(n)) * Decimal(str(n)) * Min
         s = 1
         maximalRankings = []
@@ -11905,6 +12419,189 @@ class Digraph(object):
         #kemenyOrder.reverse()
         return kemenyRanking, kemenyIndex
 
+    def computeExactKemenyRankings(self,maxNbrOfRankings=5040,
+                                   maxComponentOrder=24,
+                                   Comments=False,Debug=False):
+        """
+        Exact computation, without enumerating all permutations, of the
+        rankings of maximal Kemeny index. Requires the *numpy* package.
+
+        The actions are first partitioned into the strong components
+        of the weak majority digraph *{(x,y) : r(x,y) - r(y,x) >= 0}*.
+        The condensation of this digraph is a transitive tournament
+        and all Kemeny rankings respect its order.
+        Each component is then ranked by a Held-Karp like dynamic
+        programming over the subsets of its actions, computed in integer
+        arithmetic and vectorized over all the subsets of same cardinality.
+        The maximal rankings are recovered by backtracking all the optimal
+        choices of the dynamic program.
+
+        *maxNbrOfRankings* bounds the number of maximal rankings rendered
+        and *maxComponentOrder* the order of the strong components which
+        may be ranked (a component of order k requires about 2^k x 8 bytes).
+
+        Returns a tuple: (maximalRankings, kemenyIndex), or None
+        if a strong component exceeds *maxComponentOrder*.
+        
+        Usage example:
+
+        >>> from outrankingDigraphs import *
+        >>> t = RandomCBPerformanceTableau(numberOfActions=15,seed=3)
+        >>> g = BipolarOutrankingDigraph(t)
+        >>> rankings,kemenyIndex = g.computeExactKemenyRankings()
+        >>> rankings[0]
+         ['a05', 'a09', 'a07', 'a02', 'a13', 'a04', 'a08', 'a14', 'a10',
+          'a11', 'a03', 'a15', 'a12', 'a01', 'a06']
+        >>> kemenyIndex
+         Decimal('73.2084')
+        >>> len(rankings)
+         2
+
+        """
+        import numpy as np
+        from itertools import product
+        relation = self.relation
+        actions = [x for x in self.actions]
+        n = len(actions)
+        if n == 0:
+            return [[]], Decimal('0')
+
+        # exact integer majority margins
+        margins = [[Decimal(str(relation[x][y])) - Decimal(str(relation[y][x]))\
+                    for y in actions] for x in actions]
+        exponent = min([0] + [m.as_tuple().exponent for row in margins for m in row\
+                              if m.is_finite()])
+        w = [[int(m.scaleb(-exponent)) for m in row] for row in margins]
+
+        # strong components of the weak majority digraph in decreasing order
+        components = self._weakMajorityComponents(w)
+        if Comments:
+            print('Strong components orders:',[len(c) for c in components])
+        componentsRankings = []
+        for comp in components:
+            k = len(comp)
+            if k > maxComponentOrder:
+                print('Error: strong component of order %d exceeds the maxComponentOrder %d' % (k,maxComponentOrder))
+                return None
+            if k < 3:
+                if k == 2 and w[comp[0]][comp[1]] == 0:
+                    componentsRankings.append([comp,[comp[1],comp[0]]])
+                else:
+                    componentsRankings.append([comp])
+                continue
+            compRankings = self._kemenySubsetsDP(comp,w,
+                                    maxNbrOfRankings=maxNbrOfRankings,
+                                    Debug=Debug)
+            componentsRankings.append(compRankings)
+        maximalRankings = []
+        for combination in product(*componentsRankings):
+            ranking = [actions[i] for part in combination for i in part]
+            maximalRankings.append(ranking)
+            if len(maximalRankings) >= maxNbrOfRankings:
+                break
+        ranking = maximalRankings[0]
+        kemenyIndex = sum((relation[ranking[i]][ranking[j]] - relation[ranking[j]][ranking[i]])\
+                          for i in range(n) for j in range(i+1,n))
+        if Debug:
+            print('Exact Kemeny ranking = ', ranking)
+            print('Exact Kemeny Index = ', kemenyIndex)
+            print('# of maximal rankings = ', len(maximalRankings))
+        return maximalRankings, kemenyIndex
+
+    @staticmethod
+    def _weakMajorityComponents(w):
+        """
+        Renders the strong components, from best to worst, of the digraph
+        {(i,j) : w[i][j] >= 0} given by an integer margins matrix *w*
+        (iterative Tarjan algorithm on bitsets, see
+        :py:func:`digraphsTools.computeBitsetStrongComponents`).
+        """
+        from digraphsTools import computeBitsetStrongComponents
+        n = len(w)
+        successors = []
+        for i in range(n):
+            wi = w[i]
+            mask = 0
+            for j in range(n):
+                if j != i and wi[j] >= 0:
+                    mask |= 1 << j
+            successors.append(mask)
+        components = []
+        for component in computeBitsetStrongComponents(successors):
+            comp = []
+            while component:
+                low = component & -component
+                comp.append(low.bit_length()-1)
+                component ^= low
+            components.append(comp)
+        # Tarjan renders the sink components first
+        components.reverse()
+        return components
+
+    @staticmethod
+    def _kemenySubsetsDP(comp,w,maxNbrOfRankings=5040,Debug=False):
+        """
+        Held-Karp like dynamic programming over the subsets of the
+        action indexes in *comp* where best[T] is the maximal Kemeny index
+        of a ranking of the subset T placed in front of the others.
+        Renders the list of optimal rankings of *comp*.
+        """
+        import numpy as np
+        k = len(comp)
+        K = 1 << k
+        cw = np.array([[w[a][b] for b in comp] for a in comp],dtype=np.int64)
+        nbrOfChunks = (k+7)//8
+        # inTables[y][c][v] = sum of cw[x][y] for x in the bits v of chunk c
+        bits = np.arange(256,dtype=np.int64)
+        inTables = np.zeros((k,nbrOfChunks,256),dtype=np.int64)
+        for c in range(nbrOfChunks):
+            for b in range(8):
+                x = 8*c + b
+                if x >= k:
+                    break
+                hasBit = ((bits >> b) & 1).astype(bool)
+                inTables[:,c,hasBit] += cw[x,:,np.newaxis]
+        masks = np.arange(K,dtype=np.int64)
+        popCounts = np.zeros(K,dtype=np.int64)
+        for b in range(k):
+            popCounts += (masks >> b) & 1
+        layerOrder = np.argsort(popCounts,kind='stable')
+        layerBounds = np.searchsorted(popCounts[layerOrder],np.arange(k+2))
+        NEG = np.iinfo(np.int64).min // 4
+        best = np.full(K,NEG,dtype=np.int64)
+        best[0] = 0
+        for s in range(1,k+1):
+            M = layerOrder[layerBounds[s]:layerBounds[s+1]]
+            bestM = np.full(M.shape,NEG,dtype=np.int64)
+            for y in range(k):
+                has = ((M >> y) & 1).astype(bool)
+                prev = M[has] ^ (1 << y)
+                gain = best[prev]
+                for c in range(nbrOfChunks):
+                    gain = gain + inTables[y,c,(prev >> (8*c)) & 255]
+                bestM[has] = np.maximum(bestM[has],gain)
+            best[M] = bestM
+        if Debug:
+            print('component', comp, 'best index', best[K-1])
+        # backtracking all optimal rankings
+        cwl = cw.tolist()
+        bestl = best
+        rankings = []
+        work = [(K-1,[])]
+        while work and len(rankings) < maxNbrOfRankings:
+            T,suffix = work.pop()
+            if T == 0:
+                rankings.append([comp[i] for i in suffix])
+                continue
+            members = [i for i in range(k) if (T >> i) & 1]
+            target = int(bestl[T])
+            for y in reversed(members):
+                prev = T ^ (1 << y)
+                gain = sum(cwl[x][y] for x in members if x != y)
+                if int(bestl[prev]) + gain == target:
+                    work.append((prev,[y]+suffix))
+        return rankings
+
     def computeKemenyOrder(self,orderLimit=7,Debug=False):
         """
         Renders a ordering from worst to best of the actions with maximal Kemeny index.
@@ -11919,17 +12616,87 @@ class Digraph(object):
             ranking.reverse()
         return ranking, self.kemenyIndex
 
+    def computePrincipalAxes(self,Colwise=False,Reduced=False,
+                             nbrOfAxes=None,Randomized=None,
+                             seed=None,Debug=False):
+        """
+        Native *numpy* eigen decomposition of the (row or column wise)
+        centered valued adjacency table X of *self*, the actions being sorted,
+        i.e. of the matrix X.X^T as computed with R in the
+        :py:meth:`~digraphs.Digraph.exportPrincipalImage` method.
+
+        When *Randomized* is True, only the *nbrOfAxes* (default 3) first axes
+        are computed with a randomized truncated singular values decomposition of X
+        (power iterations and given random *seed*). By default, the randomized
+        decomposition is used for digraphs of order greater than 500.
+
+        Returns a tuple (eigenValues, P, actionsList) where *P[k][i]* gives the
+        coordinate, i.e. eigenvalue times eigen vector component, of the i-th action
+        on the k-th principal axis. The sign of each eigen vector is fixed such
+        that its component of largest absolute value is positive.
+        """
+        import numpy as np
+        actionsList = [x for x in self.actions]
+        actionsList.sort()
+        n = len(actionsList)
+        relation = self.relation
+        x = np.array([[float(relation[a][b]) for b in actionsList]\
+                      for a in actionsList],dtype=float)
+        if Colwise:
+            x = x.T
+        # as in the R script, the column means are recycled along the rows
+        colMeans = x.mean(axis=0)
+        X = x - colMeans[:,np.newaxis]
+        if Reduced:
+            sd = x.std(axis=0,ddof=1)
+            sd[sd == 0.0] = 1.0
+            X = X / (sd[:,np.newaxis]*n)
+        if Randomized is None:
+            Randomized = n > 500
+        if nbrOfAxes is None:
+            nbrOfAxes = n if not Randomized else 3
+        nbrOfAxes = min(nbrOfAxes,n)
+        if Randomized:
+            rng = np.random.default_rng(seed)
+            oversampling = min(n,nbrOfAxes + 10)
+            Q = X @ rng.standard_normal((n,oversampling))
+            Q,_ = np.linalg.qr(Q)
+            for i in range(4):
+                Q,_ = np.linalg.qr(X.T @ Q)
+                Q,_ = np.linalg.qr(X @ Q)
+            Ub,s,Vt = np.linalg.svd(Q.T @ X,full_matrices=False)
+            vectors = (Q @ Ub)[:,:nbrOfAxes]
+            values = (s**2)[:nbrOfAxes]
+        else:
+            values,vectors = np.linalg.eigh(X @ X.T)
+            values = values[::-1][:nbrOfAxes]
+            vectors = vectors[:,::-1][:,:nbrOfAxes]
+        signs = np.sign(vectors[np.abs(vectors).argmax(axis=0),
+                                np.arange(vectors.shape[1])])
+        signs[signs == 0.0] = 1.0
+        vectors = vectors * signs
+        P = values[:,np.newaxis] * vectors.T
+        if Debug:
+            print('eigen values: ', values)
+        return values, P, actionsList
+
     def computePrincipalScores(self, plotFileName=None,
                               Colwise=False, imageType=None,
                               tempDir=None,
                                bgcolor='cornsilk',
+                              RScript=False, Randomized=None, seed=None,
                               Comments=False, Debug=False):
         """
         Renders a ordered list of the first principal eigenvector of the covariance of the valued outdegrees of self.
 
+        By default, the scores are computed in process with the
+        :py:meth:`~digraphs.Digraph.computePrincipalAxes` method
+        (*Randomized* and *seed* parameters). The former R script is only run
+        when a principal image type is required or when *RScript* = True.
+
         .. note::
 
-           The method, relying on writing and reading temporary files by default in a temporary directory is threading and multiprocessing safe !
+           The R script, relying on writing and reading temporary files by default in a temporary directory, is threading and multiprocessing safe !
            (see Digraph.exportPrincipalImage method)
 
         """
@@ -11937,6 +12704,26 @@ class Digraph(object):
         from operator import itemgetter
         from tempfile import TemporaryDirectory
         from decimal import Decimal
+        if not RScript:
+            values,P,listActions = self.computePrincipalAxes(Colwise=Colwise,
+                                                             nbrOfAxes=1,
+                                                             Randomized=Randomized,
+                                                             seed=seed)
+            principalScores = [(Decimal('%.15g' % P[0][i]),listActions[i])\
+                               for i in range(len(listActions))]
+            principalScores.sort(reverse=True,key=itemgetter(0))
+            if imageType is not None:
+                tempd = TemporaryDirectory(dir=tempDir)
+                self.exportPrincipalImage(Colwise=Colwise,Comments=Comments,
+                                          pictureFormat=imageType,
+                                          plotFileName=plotFileName,
+                                          bgcolor=bgcolor,
+                                          tempDir=tempd.name)
+                if not Debug:
+                    tempd.cleanup()
+            if Debug:
+                print(principalScores)
+            return principalScores
         tempd = TemporaryDirectory(dir=tempDir)
         tempDirName = tempd.name
         self.exportPrincipalImage(Colwise=Colwise,Comments=Comments,
@@ -11997,116 +12784,230 @@ class Digraph(object):
         else:
             return list(reversed([x[1] for x in principalScores]))
 
-    def computeSlaterRanking(self,isProbabilistic=False, seed=None, sampleSize=1000, Debug=False):
-        """
-        Renders a ranking of the actions with minimal Slater index.
-        Return a tuple: slaterOrder, slaterIndex
+    def computeSlaterRanking(self,isProbabilistic=False, seed=None,
+                             sampleSize=1000, Heuristic=False,
+                             nbrOfRestarts=10, Debug=False):
         """
-        from random import seed, shuffle
-        try:
-            from math import copysign
-            CopySign = True
-        except:
-            CopySign = False
-        from digraphsTools import all_perms
+        Renders a ranking of the actions with maximal Slater index, i.e.
+        the sum, over all pairs (x,y) with x ranked before y,
+        of copysign(1,r(x,y)) - copysign(1,r(y,x)) in the [-1,1] recoded
+        valuation, where a median valuation counts as +1.
 
+        *Parameters*:
 
-        Min = self.valuationdomain['min']
-        relationOrig = self.relation
-        minOrig = self.valuationdomain['min']
-        maxOrig = self.valuationdomain['max']
-        self.recodeValuation(-1,1)
+            * *Heuristic* = False (default): exact computation with
+              a feedback arc set branch and bound, solved separately on each
+              strong component of the majority digraph;
+            * *Heuristic* = True: local search over single action insertions
+              (including the adjacent swaps) with incremental index updates,
+              restarted from the Copeland ranking and from *nbrOfRestarts*
+              random rankings generated with the given *seed*;
+            * *isProbabilistic* = True is kept as a synonym of *Heuristic* = True;
+            * *sampleSize*: the maximal number of improving insertion moves of each
+              heuristic local search; ignored by the exact computation.
+
+        .. note::
+
+             The exact computation remains exponential in the order of the largest
+             strong component: random tournaments of order 20 are ranked in about a second,
+             whereas outranking digraphs of order 30 are mostly ranked in a few seconds.
+
+        Return a tuple: slaterRanking, slaterIndex
+        """
+        Med = self.valuationdomain['med']
         relation = self.relation
         actions = [x for x in self.actions]
         n = len(actions)
-
-        ## Monte Carlo computation of a Slater order
         if isProbabilistic:
-            if seed is not None:
-                seed = seed
-            a = list(actions)
-            slaterIndex = -(n*n)
-            slaterRanking = list(a)
-            sampleSize = sampleSize
-
-            for s in range(sampleSize):
-                shuffle(a)
-                kcurr = 0
-                for i in range(n):
-                    for j in range(i+1,n):
-                        if CopySign:
-                            kcurr += copysign(1,relation[a[i]][a[j]]) - copysign(1,relation[a[j]][a[i]])
-                        else:
-                            if relation[a[i]][a[j]] > 0:
-                                kcurr += 1
-                            elif relation[a[i]][a[j]] < 0:
-                                kcurr -= 1
-                            if relation[a[j]][a[i]] > 0:
-                                kcurr -= 1
-                            elif relation[a[j]][a[i]] < 0:
-                                kcurr += 1
-
-                if kcurr > slaterIndex:
-                    slaterIndex = kcurr
-                    slaterRanking = list(a)
-                    if Debug:
-                        print(s, slaterIndex)
-            if Debug:
-                print('Probabilistic Slater Order = ', slaterRanking)
-                print('Probabilistic Slater Index = ', slaterIndex)
-                print('with samplesize :            ', sampleSize)
+            Heuristic = True
 
+        # copysign(1,r(x,y)) in the [-1,1] recoded valuation
+        def _sign(v):
+            if v < Med:
+                return -1
+            else:
+                return 1
 
-## Exact computation of a Slater order
-## respecting a maximum of marginal majority margins
-        else:
+        signs = [[_sign(relation[x][y]) if x != y else 0 for y in actions]\
+                 for x in actions]
+        w = [[signs[i][j] - signs[j][i] for j in range(n)] for i in range(n)]
 
-            slaterIndex = -(n*n)
-            slaterOrder = list(actions)
-            s = 0
-            for a in all_perms(slaterOrder):
-                kcurr = 0
-                s += 1
-                for i in range(n):
-                    ai = a[i]
-                    rai = relation[a[i]]
-                    for j in range(i+1,n):
-                        aj = a[j]
-                        if CopySign:
-                            kcurr += copysign(1,rai[aj]) -\
-                                     copysign(1,relation[aj][ai])
-                        else:
-                            if rai[aj] > 0:
-                                kcurr += 1
-                            elif rai[aj] < 0:
-                                kcurr -= 1
-                            if relation[aj][ai] > 0:
-                                kcurr -= 1
-                            elif relation[aj][ai] < 0:
-                                kcurr += 1
-                        #kcurr += copysign(1,relation[a[i]][a[j]]) - copysign(1,relation[a[j]][a[i]])
-                if Debug:
-                    print(s, a, kcurr)
-                if kcurr >= slaterIndex:
-                    slaterIndex = kcurr
-                    slaterRanking = list(a)
-                    if Debug:
-                        print(s, slaterRanking, slaterIndex)
-            if Debug:
-                print('Exact Slater Order = ', slaterRanking)
+        # the strong components of the weak majority digraph are
+        # ranked in their condensation order
+        components = self._weakMajorityComponents(w)
+        ranking = []
+        for comp in components:
+            if len(comp) < 3:
+                compRanking = list(comp)
+                if len(comp) == 2 and w[comp[0]][comp[1]] < 0:
+                    compRanking.reverse()
+            elif Heuristic:
+                compRanking = self._slaterLocalSearch(comp,w,
+                                              nbrOfRestarts=nbrOfRestarts,
+                                              seed=seed,maxMoves=sampleSize)
+            else:
+                compRanking = self._slaterBranchAndBound(comp,w,
+                                              seed=seed,Debug=Debug)
+            ranking += compRanking
+        slaterRanking = [actions[i] for i in ranking]
+        slaterIndex = float(sum(w[ranking[i]][ranking[j]] for i in range(n)\
+                                for j in range(i+1,n)))
+        if Debug:
+            print('Strong components orders: ', [len(c) for c in components])
+            if Heuristic:
+                print('Heuristic Slater Ranking = ', slaterRanking)
+                print('Heuristic Slater Index = ', slaterIndex)
+            else:
+                print('Exact Slater Ranking = ', slaterRanking)
                 print('Exact Slater Index = ', slaterIndex)
-                print('# of permutations  = ', s)
-
-        self.recodeValuation(minOrig,maxOrig)
         return slaterRanking, slaterIndex
 
+    @staticmethod
+    def _slaterInsertionSearch(ranking,w,maxMoves=None):
+        """
+        Improves in place the *ranking* with respect to the integer
+        margins *w* by moving single actions to their best insertion
+        position until no improving move remains, or until *maxMoves*
+        improving moves were done.
+        """
+        n = len(ranking)
+        moves = 0
+        Improved = True
+        while Improved:
+            Improved = False
+            for i in range(n):
+                x = ranking[i]
+                wx = w[x]
+                bestDelta = 0
+                bestj = i
+                delta = 0
+                for j in range(i-1,-1,-1):
+                    delta += 2*wx[ranking[j]]
+                    if delta > bestDelta:
+                        bestDelta = delta
+                        bestj = j
+                delta = 0
+                for j in range(i+1,n):
+                    delta -= 2*wx[ranking[j]]
+                    if delta > bestDelta:
+                        bestDelta = delta
+                        bestj = j
+                if bestj != i:
+                    ranking.pop(i)
+                    ranking.insert(bestj,x)
+                    Improved = True
+                    moves += 1
+                    if maxMoves is not None and moves >= maxMoves:
+                        return ranking
+        return ranking
+
+    @staticmethod
+    def _slaterLocalSearch(comp,w,nbrOfRestarts=10,seed=None,maxMoves=None):
+        """
+        Multi-start insertion local search on the actions indexes in *comp*,
+        each local search doing at most *maxMoves* improving moves.
+        """
+        import random
+        rng = random.Random(seed)
+        def _index(r):
+            k = len(r)
+            return sum(w[r[i]][r[j]] for i in range(k) for j in range(i+1,k))
+        copeland = sorted(comp,key=lambda x: -sum(w[x][y] for y in comp))
+        bestRanking = Digraph._slaterInsertionSearch(copeland,w,maxMoves)
+        bestIndex = _index(bestRanking)
+        for s in range(nbrOfRestarts):
+            r = list(comp)
+            rng.shuffle(r)
+            r = Digraph._slaterInsertionSearch(r,w,maxMoves)
+            index = _index(r)
+            if index > bestIndex:
+                bestIndex = index
+                bestRanking = r
+        return bestRanking
+
+    @staticmethod
+    def _slaterBranchAndBound(comp,w,seed=None,Debug=False):
+        """
+        Exact feedback arc set branch and bound on the action indexes in *comp*.
+
+        Rankings are built from the top. With G(x) the sum of the positive
+        margins of x among the m remaining actions, sorted in decreasing order,
+        the forward margins of the remaining actions are bounded by
+        sum_i min(2(m-i), G_(i)) (Landau like bound). A branch is also cut when
+        the same set of ranked actions was already reached with a better index,
+        or when the last ranked action would gain by being inserted earlier.
+        The local search result serves as initial incumbent.
+        """
+        import sys
+        k = len(comp)
+        incumbent = Digraph._slaterLocalSearch(comp,w,seed=seed)
+        best = [sum(w[incumbent[i]][incumbent[j]] for i in range(k)\
+                    for j in range(i+1,k)), list(incumbent)]
+        positiveSums = {x: sum(max(w[x][y],0) for y in comp) for x in comp}
+        seen = {}
+        nodes = [0]
+
+        def _branch(mask,remaining,G,value,prefix):
+            nodes[0] += 1
+            m = len(remaining)
+            if m == 0:
+                if value > best[0]:
+                    best[0] = value
+                    best[1] = list(prefix)
+                return
+            sortedG = sorted((G[z] for z in remaining),reverse=True)
+            forwardBound = 0
+            for i in range(m):
+                forwardBound += min(2*(m-1-i),sortedG[i])
+            if value + 2*forwardBound - sum(sortedG) <= best[0]:
+                return
+            if seen.get(mask,value-1) >= value:
+                return
+            seen[mask] = value
+            children = []
+            for y in remaining:
+                wy = w[y]
+                # y must not gain by being inserted earlier in the prefix
+                delta = 0
+                for p in reversed(prefix):
+                    delta += wy[p]
+                    if delta > 0:
+                        break
+                if delta > 0:
+                    continue
+                children.append((sum(wy[z] for z in remaining),y))
+            children.sort(reverse=True)
+            for gain,y in children:
+                childRemaining = [z for z in remaining if z != y]
+                childG = dict(G)
+                for z in childRemaining:
+                    if w[z][y] > 0:
+                        childG[z] -= w[z][y]
+                prefix.append(y)
+                _branch(mask | (1 << y),childRemaining,childG,
+                        value + gain,prefix)
+                prefix.pop()
+
+        recursionLimit = sys.getrecursionlimit()
+        if recursionLimit < k + 100:
+            sys.setrecursionlimit(k + 100)
+        try:
+            _branch(0,list(comp),positiveSums,0,[])
+        finally:
+            sys.setrecursionlimit(recursionLimit)
+        if Debug:
+            print('component', comp, 'index', best[0], '# nodes', nodes[0])
+        return best[1]
+
     def computeSlaterOrder(self,isProbabilistic=False,
-                           seed=None,sampleSize=1000,Debug=False):
+                           seed=None,sampleSize=1000,
+                           Heuristic=False,Debug=False):
         """
         Reversed return from computeSlaterRanking method.
         """
         slaterOrder,slaterIndex = self.computeSlaterRanking(isProbabilistic=isProbabilistic,
-                                                          seed=seed, sampleSize=sampleSize, Debug=Debug)
+                                                          seed=seed, sampleSize=sampleSize,
+                                                          Heuristic=Heuristic, Debug=Debug)
         slaterOrder.reverse()
         return slaterOrder,slaterIndex
 
@@ -12145,12 +13046,12 @@ class Digraph(object):
         """
         from decimal import Decimal
         relation = self.relation
-        n = Decimal(str(len(K1)*len(K2)))
+        n = self._valuationNumber(len(K1)*len(K2))
         if Debug:
             print('K1 = ', K1, ', K2 = ', K2, ', n = ', n)
 
-        rK1SK2 = Decimal('0')
-        rK2SK1 = Decimal('0')
+        rK1SK2 = self._valuationNumber(0)
+        rK2SK1 = self._valuationNumber(0)
         for x in K1:
             rx = relation[x]
             for y in K2:
@@ -13811,7 +14712,7 @@ class PolarisedDigraph(Digraph):
             StrictCut = True
             KeepValues = False
         else:
-            level = Decimal(str(level))
+            level = self._valuationNumber(level)
         self.name = 'cut_' + str(level)+ '_' + str(digraph.name)
         self.actions = deepcopy(digraph.actions)
         if AlphaCut:
@@ -13842,7 +14743,7 @@ class PolarisedDigraph(Digraph):
         Min = self.valuationdomain['min']
         Max = self.valuationdomain['max']
         Med = self.valuationdomain['med']
-        level = Decimal(str(level))
+        level = self._valuationNumber(level)
         compLevel = Max - level + Min
         if level < Med:
             print('Cut Level :', level, 'too low !!!')
@@ -13856,9 +14757,10 @@ class PolarisedDigraph(Digraph):
             return relationin
         # change to a normalized [-1,0,1] valuation domain
         if KeepValues == False:
-            Min = Decimal('-1')
-            Max = Decimal('1')
-            Med = Decimal('0')
+            unit = self.valuationdomain.get('scale',1)
+            Min = self._valuationNumber(-unit)
+            Max = self._valuationNumber(unit)
+            Med = self._valuationNumber(0)
             self.valuationdomain['min'] = Min
             self.valuationdomain['max'] = Max
             self.valuationdomain['med'] = Med
@@ -13907,7 +14809,7 @@ class PolarisedDigraph(Digraph):
         actions = self.actions
         Min = self.valuationdomain['min']
         Max = self.valuationdomain['max']
-        level = Decimal(str(level))
+        level = self._valuationNumber(level)
         relationout = {}
         for a in actions:
             relationout[a] = {}
@@ -15272,9 +16174,177 @@ class CocaDigraph(Digraph):
 
 #------------------------------------------
 
+class SubDigraphView(Digraph):
+    """
+    Restriction of a *digraph* to an *actionsSubset*, sharing the
+    actions' descriptions, the valuation domain and the characteristic values
+    of the original digraph without copying them
+    (see :py:class:`digraphsTools.SubRelationView`).
+
+    Mind that an assignment like *self.relation[x][y] = value* modifies the original digraph.
+    """
+    def __init__(self,digraph,actionsSubset,name=None):
+        from collections import OrderedDict
+        from digraphsTools import SubRelationView
+        if name is None:
+            self.name = digraph.name + '_sub'
+        else:
+            self.name = name
+        if isinstance(digraph.actions,dict):
+            actions = OrderedDict()
+            for x in actionsSubset:
+                actions[x] = digraph.actions[x]
+        else:
+            actions = [x for x in actionsSubset]
+        self.actions = actions
+        self.valuationdomain = digraph.valuationdomain
+        self.relation = SubRelationView(digraph.relation,actions)
+        self.order = len(actions)
+
+class DigraphCondensation(object):
+    """
+    Condensation DAG of the strong components of a *digraph*, i.e. of its
+    strict links (r > Med), or of its weak links (r >= Med) when *Potential* = True.
+
+    *Attributes*:
+
+        - *components*: the list of the strong components (frozensets) in topological order,
+          i.e. every component comes before all the components it leads to,
+        - *componentOf*: the dictionary {x: k} of the component index of each action,
+        - *successors*, *predecessors*: the lists of the sets of the component indexes
+          directly following, resp. preceding, each component in the DAG,
+        - *order*: the number of components.
+
+    The restriction of the digraph to a component is given,
+    without copying, by the :py:meth:`~digraphs.DigraphCondensation.componentDigraph` method.
+
+    >>> from randomDigraphs import RandomDigraph
+    >>> g = RandomDigraph(order=8,arcProbability=0.3,seed=2)
+    >>> cd = g.computeCondensation()
+    >>> [list(c) for c in cd.topologicalOrder()] == [list(cd[k]) for k in range(len(cd))]
+    True
+    """
+    def __init__(self,digraph,Potential=False):
+        from digraphsTools import NeighbourhoodBitsets,\
+             computeBitsetStrongComponents
+        self.digraph = digraph
+        self.Potential = Potential
+        if Potential:
+            nb = NeighbourhoodBitsets(digraph.actions,digraph.relation,
+                                      digraph.valuationdomain['med'])
+            full = nb.full
+            successors = [full & ~(nb.notDominated[i] | (1 << i))
+                          for i in range(nb.order)]
+        else:
+            nb = digraph.neighbourhoodBitsets
+            successors = nb.dominated
+        # Tarjan renders the components in reverse topological order
+        masks = computeBitsetStrongComponents(successors)
+        masks.reverse()
+        actionsList = nb.actionsList
+        componentOfIndex = [0]*nb.order
+        components = []
+        for k,mask in enumerate(masks):
+            members = []
+            m = mask
+            while m:
+                low = m & -m
+                i = low.bit_length() - 1
+                members.append(actionsList[i])
+                componentOfIndex[i] = k
+                m ^= low
+            components.append(frozenset(members))
+        self.components = components
+        self.componentOf = {x: componentOfIndex[i]
+                            for i,x in enumerate(actionsList)}
+        self.order = len(components)
+        dagSuccessors = []
+        dagPredecessors = [set() for k in range(self.order)]
+        for k,mask in enumerate(masks):
+            out = 0
+            m = mask
+            while m:
+                low = m & -m
+                out |= successors[low.bit_length()-1]
+                m ^= low
+            out &= ~mask
+            succ = set()
+            while out:
+                low = out & -out
+                kj = componentOfIndex[low.bit_length()-1]
+                succ.add(kj)
+                out &= ~masks[kj]
+            dagSuccessors.append(succ)
+            for kj in succ:
+                dagPredecessors[kj].add(k)
+        self.successors = dagSuccessors
+        self.predecessors = dagPredecessors
+        self.componentMasks = masks
+
+    def __repr__(self):
+        reprString = '*------- Digraph condensation description ------*\n'
+        reprString += 'Digraph name        : %s\n' % self.digraph.name
+        reprString += 'Potential links     : %s\n' % self.Potential
+        reprString += 'Nbr of components   : %d\n' % self.order
+        reprString += 'Nbr of DAG arcs     : %d\n' %\
+                      sum(len(succ) for succ in self.successors)
+        return reprString
+
+    def __len__(self):
+        return self.order
+
+    def __iter__(self):
+        return iter(self.components)
+
+    def __getitem__(self,k):
+        return self.components[k]
+
+    def topologicalOrder(self,Reverse=False):
+        """
+        Renders the list of the strong components in topological order,
+        or in reverse topological order when *Reverse* = True.
+        """
+        if Reverse:
+            return list(reversed(self.components))
+        return list(self.components)
+
+    def sources(self):
+        """
+        Renders the list of the indexes of the components without predecessors.
+        """
+        return [k for k in range(self.order) if not self.predecessors[k]]
+
+    def sinks(self):
+        """
+        Renders the list of the indexes of the components without successors.
+        """
+        return [k for k in range(self.order) if not self.successors[k]]
+
+    def componentDigraph(self,k):
+        """
+        Renders the :py:class:`digraphs.SubDigraphView` restriction of the digraph
+        to the *k*-th component, without copying its relation.
+        """
+        digraph = self.digraph
+        members = [x for x in digraph.actions if self.componentOf[x] == k]
+        return SubDigraphView(digraph,members,
+                              name='%s_scc%d' % (digraph.name,k+1))
+
+    def showComponents(self):
+        """
+        Shows the strong components in topological order with their DAG successors.
+        """
+        print('*---- strong components in topological order ----*')
+        for k,component in enumerate(self.components):
+            print('%d: %s -> %s' % (k,sorted(component,key=str),
+                                    sorted(self.successors[k])))
+
 class StrongComponentsCollapsedDigraph(Digraph):
     """
     Reduction of Digraph object to its strong components.
+
+    The collapsed components are ordered in the topological order of the
+    condensation DAG (see :py:class:`digraphs.DigraphCondensation`).
     """
     def __init__(self,digraph=None):
         from copy import copy,deepcopy
@@ -15284,7 +16354,7 @@ class StrongComponentsCollapsedDigraph(Digraph):
         else:
            self.name = digraph.name + '_Scc'
            self.valuationdomain = deepcopy(digraph.valuationdomain)
-           scc = digraph.strongComponents()
+           scc = digraph.computeCondensation().topologicalOrder()
            actions = OrderedDict()
            for i,strongComponent in enumerate(scc):
                actionShortName = 'Scc_'+str(i+1)
@@ -811,6 +811,1464 @@ def flatten(iterable, ltypes=abc.Iterable):
         except:
             break
 
+#--------- numpy array backed relations -------------
+
+class _ArrayRelationRow(abc.MutableMapping):
+    """
+    Lazy dictionary view on a row *i* of a :py:class:`ArrayRelationView`.
+    """
+    __slots__ = ('_view','_i')
+
+    def __init__(self,view,i):
+        self._view = view
+        self._i = i
+
+    def __getitem__(self,y):
+        view = self._view
+        return view._decode(view.array[self._i,view.columnIndex[y]])
+
+    def __setitem__(self,y,value):
+        view = self._view
+        view.array[self._i,view.columnIndex[y]] = view._encode(value)
+
+    def __delitem__(self,y):
+        raise TypeError('relation view entries cannot be deleted')
+
+    def __iter__(self):
+        return iter(self._view.columnKeysList)
+
+    def __len__(self):
+        return len(self._view.columnKeysList)
+
+    def __contains__(self,y):
+        return y in self._view.columnIndex
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def copy(self):
+        return dict(self.items())
+
+class ArrayRelationView(abc.MutableMapping):
+    """
+    Dictionary compatible lazy view on a square *numpy* valuation array.
+
+    *array* is a float64 n x n array, *keys* the ordered list of the n
+    action keys and *ndigits* the number of decimal digits of the
+    Decimal values rendered by *relation[x][y]*. A rectangular array,
+    like a criteria x actions evaluation table, may be viewed when
+    the ordered *columnKeys* are given.
+
+    The *backend* parameter sets the numerical type of the rendered values
+    (see :py:meth:`digraphs.Digraph.convertValuationBackend`): 'decimal' (default),
+    'float' (rounded to *ndigits*) or 'integer' (scaled by 10**ndigits).
+
+    The view allows the algorithms written for the traditional
+    double dictionary *relation* attribute to run unchanged on digraphs
+    whose valuation is computed and stored in a numpy array.
+    Assignments like *relation[x][y] = value* are written back into the array.
+
+    Usage example:
+
+    >>> import numpy as np
+    >>> from digraphsTools import ArrayRelationView
+    >>> rel = ArrayRelationView(np.array([[0.0,0.5],[-1.0,0.0]]),['a','b'],ndigits=2)
+    >>> rel['a']['b']
+    Decimal('0.50')
+    >>> rel.todict()
+    {'a': {'a': Decimal('0.00'), 'b': Decimal('0.50')}, 'b': {'a': Decimal('-1.00'), 'b': Decimal('0.00')}}
+
+    """
+    def __init__(self,array,keys,ndigits=4,columnKeys=None,backend='decimal'):
+        self.array = array
+        self.keysList = list(keys)
+        self.index = {x: i for i,x in enumerate(self.keysList)}
+        if columnKeys is None:
+            self.columnKeysList = self.keysList
+            self.columnIndex = self.index
+        else:
+            self.columnKeysList = list(columnKeys)
+            self.columnIndex = {y: j for j,y in enumerate(self.columnKeysList)}
+        self.ndigits = ndigits
+        self._formatString = '%%.%df' % ndigits
+        self.backend = backend
+
+    def _decode(self,value):
+        if self.backend == 'float':
+            return round(float(value),self.ndigits)
+        elif self.backend == 'integer':
+            return int(round(value * 10**self.ndigits))
+        return Decimal(self._formatString % value)
+
+    def _encode(self,value):
+        if self.backend == 'integer':
+            return value / 10**self.ndigits
+        return float(value)
+
+    def __getitem__(self,x):
+        return _ArrayRelationRow(self,self.index[x])
+
+    def __setitem__(self,x,row):
+        i = self.index[x]
+        index = self.columnIndex
+        for y,value in row.items():
+            self.array[i,index[y]] = self._encode(value)
+
+    def __delitem__(self,x):
+        raise TypeError('relation view entries cannot be deleted')
+
+    def __iter__(self):
+        return iter(self.keysList)
+
+    def __len__(self):
+        return len(self.keysList)
+
+    def __contains__(self,x):
+        return x in self.index
+
+    def __repr__(self):
+        return repr(self.todict())
+
+    def copy(self):
+        return self.todict()
+
+    def todict(self):
+        """
+        Materializes the view into a traditional double dictionary
+        of Decimal (by default), float or integer values.
+        """
+        decode = self._decode
+        columnKeys = self.columnKeysList
+        relation = {}
+        for i,x in enumerate(self.keysList):
+            row = self.array[i].tolist()
+            relation[x] = {y: decode(row[j]) for j,y in enumerate(columnKeys)}
+        return relation
+
+class _SubRelationRow(abc.MutableMapping):
+    """
+    Lazy dictionary view on the row *x* of a :py:class:`SubRelationView`.
+    """
+    __slots__ = ('_row','_index')
+
+    def __init__(self,row,index):
+        self._row = row
+        self._index = index
+
+    def __getitem__(self,y):
+        if y not in self._index:
+            raise KeyError(y)
+        return self._row[y]
+
+    def __setitem__(self,y,value):
+        if y not in self._index:
+            raise KeyError(y)
+        self._row[y] = value
+
+    def __delitem__(self,y):
+        raise TypeError('relation view entries cannot be deleted')
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self,y):
+        return y in self._index
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def copy(self):
+        return dict(self.items())
+
+class SubRelationView(abc.MutableMapping):
+    """
+    Dictionary compatible view on the restriction of a double dictionary,
+    or :py:class:`ArrayRelationView`, *relation* to the ordered *keys*.
+
+    No characteristic value is copied: *view[x][y]* reads *relation[x][y]*
+    and the assignments are written back into the underlying *relation*.
+
+    >>> rel = {'a': {'a': 0, 'b': 1, 'c': -1},
+    ...        'b': {'a': -1, 'b': 0, 'c': 1},
+    ...        'c': {'a': 1, 'b': -1, 'c': 0}}
+    >>> sub = SubRelationView(rel,['a','b'])
+    >>> sub.todict()
+    {'a': {'a': 0, 'b': 1}, 'b': {'a': -1, 'b': 0}}
+    """
+    def __init__(self,relation,keys):
+        self.relation = relation
+        self.keysList = list(keys)
+        self.index = {x: i for i,x in enumerate(self.keysList)}
+
+    def __getitem__(self,x):
+        if x not in self.index:
+            raise KeyError(x)
+        return _SubRelationRow(self.relation[x],self.index)
+
+    def __setitem__(self,x,row):
+        if x not in self.index:
+            raise KeyError(x)
+        rx = self.relation[x]
+        for y,value in row.items():
+            rx[y] = value
+
+    def __delitem__(self,x):
+        raise TypeError('relation view entries cannot be deleted')
+
+    def __iter__(self):
+        return iter(self.keysList)
+
+    def __len__(self):
+        return len(self.keysList)
+
+    def __contains__(self,x):
+        return x in self.index
+
+    def __repr__(self):
+        return repr(self.todict())
+
+    def copy(self):
+        return self.todict()
+
+    def todict(self):
+        """
+        Materializes the view into a traditional double dictionary.
+        """
+        keysList = self.keysList
+        relation = {}
+        for x in keysList:
+            rx = self.relation[x]
+            relation[x] = {y: rx[y] for y in keysList}
+        return relation
+
+#---------- neighbourhood bitsets -----------------
+
+def generateBitsetMaximalCliques(adjacency,R=0,P=None,X=0,
+                                 cover=None,coveredBy=None):
+    """
+    Generator of the maximal cliques of an undirected graph given by
+    the list *adjacency* of the integer neighbourhood bitsets of its
+    vertices 0, 1, ..., n-1 (loops are ignored).
+
+    Implements the Bron-Kerbosch algorithm with Tomita pivoting on an
+    explicit stack: *R* is the current clique, *P* the candidate and
+    *X* the excluded vertices bitsets. By default *P* gathers all the
+    vertices. The cliques are yielded as bitsets.
+
+    When the list *cover* of covering bitsets is given, only the maximal
+    cliques R such that R together with the vertices covered by R gathers
+    all the vertices of the graph are yielded; *coveredBy* is the
+    converse list of *cover*, used for pruning the branches that cannot
+    any more cover some vertex.
+
+    The maximal independent sets of a graph are the maximal cliques
+    of its complement.
+
+    >>> adjacency = [0b0110,0b0101,0b0011,0b0000]
+    >>> [bin(c) for c in generateBitsetMaximalCliques(adjacency)]
+    ['0b111', '0b1000']
+
+    """
+    n = len(adjacency)
+    full = (1 << n) - 1
+    adj = [adjacency[i] & ~(1 << i) & full for i in range(n)]
+    if P is None:
+        P = full
+    if cover is not None and coveredBy is None:
+        coveredBy = [0]*n
+        for i in range(n):
+            m = cover[i]
+            while m:
+                low = m & -m
+                coveredBy[low.bit_length()-1] |= 1 << i
+                m ^= low
+
+    def _covered(R):
+        C = R
+        m = R
+        while m:
+            low = m & -m
+            C |= cover[low.bit_length()-1]
+            m ^= low
+        return C
+
+    def _isCoverable(R,C,P):
+        need = full & ~C & ~P
+        while need:
+            low = need & -need
+            if not coveredBy[low.bit_length()-1] & P:
+                return False
+            need ^= low
+        return True
+
+    def _pivotCandidates(P,X):
+        U = P | X
+        best = -1
+        pivot = 0
+        while U:
+            low = U & -U
+            u = low.bit_length() - 1
+            c = bin(P & adj[u]).count('1')
+            if c > best:
+                best = c
+                pivot = u
+            U ^= low
+        return P & ~adj[pivot]
+
+    if cover is None:
+        C = 0
+    else:
+        C = _covered(R)
+        if not _isCoverable(R,C,P):
+            return
+    if P == 0:
+        if X == 0 and (cover is None or C == full):
+            yield R
+        return
+    stack = [[R,P,X,C,_pivotCandidates(P,X)]]
+    while stack:
+        frame = stack[-1]
+        R,P,X,C,cand = frame
+        if cand == 0:
+            stack.pop()
+            continue
+        low = cand & -cand
+        v = low.bit_length() - 1
+        frame[4] = cand ^ low
+        frame[1] = P & ~low
+        frame[2] = X | low
+        Rv = R | low
+        Pv = P & adj[v]
+        Xv = X & adj[v]
+        if cover is not None:
+            Cv = C | low | cover[v]
+            if not _isCoverable(Rv,Cv,Pv):
+                continue
+        else:
+            Cv = 0
+        if Pv == 0:
+            if Xv == 0 and (cover is None or Cv == full):
+                yield Rv
+        else:
+            stack.append([Rv,Pv,Xv,Cv,_pivotCandidates(Pv,Xv)])
+
+class NeighbourhoodBitsets(object):
+    """
+    Bitset index of the strict neighbourhoods of a bipolar-valued digraph.
+
+    Each node *x* of the ordered *actionsList* is coded by the bit
+    1 << *index[x]*. For the node of rank *i*, the integer masks
+
+        * *dominated[i]* gather the nodes y != x such that r(x,y) > Med,
+        * *absorbed[i]* gather the nodes y != x such that r(y,x) > Med,
+        * *notDominated[i]* gather the nodes y != x such that r(x,y) < Med,
+        * *notAbsorbed[i]* gather the nodes y != x such that r(y,x) < Med.
+
+    When the *relation* is an :py:class:`~digraphsTools.ArrayRelationView`,
+    the masks are packed directly from the underlying numpy array.
+
+    Usage example::
+
+        >>> from randomDigraphs import RandomValuationDigraph
+        >>> g = RandomValuationDigraph(order=5,seed=1)
+        >>> nb = g.neighbourhoodBitsets
+        >>> nb.dneighbors('a1') == g.gamma['a1'][0]
+        True
+        >>> nb.isIndependent(['a1','a2']) == (g.intstab({'a1','a2'}) >= g.valuationdomain['med'])
+        True
+
+    """
+    def __init__(self,actions,relation,Med):
+        self.actionsList = [x for x in actions]
+        self.index = {x: i for i,x in enumerate(self.actionsList)}
+        self.order = len(self.actionsList)
+        self.full = (1 << self.order) - 1
+        if isinstance(relation,ArrayRelationView) \
+           and relation.keysList == self.actionsList \
+           and relation.columnKeysList == self.actionsList:
+            if relation.backend == 'integer':
+                Med = Med / 10**relation.ndigits
+            self._packArray(relation.array,float(Med))
+        else:
+            self._packRelation(relation,Med)
+
+    def _packRelation(self,relation,Med):
+        actionsList = self.actionsList
+        n = self.order
+        dominated = [0]*n
+        absorbed = [0]*n
+        notDominated = [0]*n
+        notAbsorbed = [0]*n
+        for i,x in enumerate(actionsList):
+            rx = relation[x]
+            bi = 1 << i
+            for j,y in enumerate(actionsList):
+                if i != j:
+                    r = rx[y]
+                    if r > Med:
+                        dominated[i] |= 1 << j
+                        absorbed[j] |= bi
+                    elif r < Med:
+                        notDominated[i] |= 1 << j
+                        notAbsorbed[j] |= bi
+        self.dominated = dominated
+        self.absorbed = absorbed
+        self.notDominated = notDominated
+        self.notAbsorbed = notAbsorbed
+
+    def _packArray(self,array,Med):
+        import numpy as np
+        positive = np.asarray(array) > Med
+        negative = np.asarray(array) < Med
+        np.fill_diagonal(positive,False)
+        np.fill_diagonal(negative,False)
+
+        def _rowMasks(b):
+            packed = np.packbits(b,axis=1,bitorder='little')
+            return [int.from_bytes(row.tobytes(),'little') for row in packed]
+
+        self.dominated = _rowMasks(positive)
+        self.absorbed = _rowMasks(positive.T)
+        self.notDominated = _rowMasks(negative)
+        self.notAbsorbed = _rowMasks(negative.T)
+
+    def mask(self,choice):
+        """
+        Renders the bitset of the nodes in *choice*.
+        """
+        index = self.index
+        m = 0
+        for x in choice:
+            m |= 1 << index[x]
+        return m
+
+    def members(self,mask):
+        """
+        Renders the set of nodes coded in the bitset *mask*.
+        """
+        actionsList = self.actionsList
+        res = set()
+        while mask:
+            low = mask & -mask
+            res.add(actionsList[low.bit_length()-1])
+            mask ^= low
+        return res
+
+    def dneighbors(self,node):
+        """ Renders the set of strictly dominated out-neighbors of a node."""
+        return self.members(self.dominated[self.index[node]])
+
+    def aneighbors(self,node):
+        """ Renders the set of strictly absorbed in-neighbors of a node."""
+        return self.members(self.absorbed[self.index[node]])
+
+    def gammaSets(self):
+        """
+        Renders the dictionary of neighborhoods {node: (dx,ax)}
+        as produced by the :py:meth:`digraphs.Digraph.gammaSets` method.
+        """
+        members = self.members
+        return {x: (members(self.dominated[i]),members(self.absorbed[i]))
+                for i,x in enumerate(self.actionsList)}
+
+    def notGammaSets(self):
+        """
+        Renders the dictionary of not neighborhoods {node: (dx,ax)}
+        as produced by the :py:meth:`digraphs.Digraph.notGammaSets` method.
+        """
+        members = self.members
+        return {x: (members(self.notDominated[i]),members(self.notAbsorbed[i]))
+                for i,x in enumerate(self.actionsList)}
+
+    def compatibilities(self):
+        """
+        Renders the list of the bitsets of the nodes neither strictly
+        dominated nor strictly absorbing each node, i.e. the neighbourhoods
+        of the complement of the symmetric strict link graph.
+        """
+        full = self.full
+        dominated = self.dominated
+        absorbed = self.absorbed
+        return [full & ~(dominated[i] | absorbed[i] | (1 << i))
+                for i in range(self.order)]
+
+    def generateMaximalIndependentChoices(self,S=None,I=None):
+        """
+        Generator of the bitsets of the maximal independent choices
+        (Bron-Kerbosch with pivoting on the complement graph).
+
+        *S* and *I* optionally restrict the enumeration to the maximal
+        independent choices of the nodes in S extending the independent
+        choice I.
+        """
+        compatibilities = self.compatibilities()
+        if I is None:
+            R = 0
+        else:
+            R = self.mask(I)
+        if S is None:
+            P = self.full & ~R
+        else:
+            P = self.mask(S) & ~R
+        m = R
+        while m:
+            low = m & -m
+            P &= compatibilities[low.bit_length()-1]
+            m ^= low
+        return generateBitsetMaximalCliques(compatibilities,R=R,P=P)
+
+    def generatePreKernels(self,direction='dominant'):
+        """
+        Generator of the bitsets of the dominant (default), resp. absorbent,
+        prekernels, i.e. the independent choices strictly dominating,
+        resp. absorbing, all the other nodes.
+        """
+        if direction == 'dominant':
+            cover,coveredBy = self.dominated,self.absorbed
+        else:
+            cover,coveredBy = self.absorbed,self.dominated
+        return generateBitsetMaximalCliques(self.compatibilities(),
+                                            cover=cover,coveredBy=coveredBy)
+
+    def isIndependent(self,choice):
+        """
+        True if no strict link relates two nodes of *choice*, i.e.
+        the valued independence degree of *choice* is not negative.
+        """
+        index = self.index
+        dominated = self.dominated
+        m = self.mask(choice)
+        for x in choice:
+            if dominated[index[x]] & m:
+                return False
+        return True
+
+    def isDominant(self,choice):
+        """
+        True if every node not in *choice* is strictly dominated
+        by some node in *choice*.
+        """
+        index = self.index
+        dominated = self.dominated
+        covered = self.mask(choice)
+        for x in choice:
+            covered |= dominated[index[x]]
+        return covered == self.full
+
+    def isAbsorbent(self,choice):
+        """
+        True if every node not in *choice* is strictly absorbed
+        by some node in *choice*.
+        """
+        index = self.index
+        absorbed = self.absorbed
+        covered = self.mask(choice)
+        for x in choice:
+            covered |= absorbed[index[x]]
+        return covered == self.full
+
+    def strongComponents(self):
+        """
+        Renders the list of the bitsets of the strong components of the
+        strict link digraph, in reverse topological order
+        (see :py:func:`digraphsTools.computeBitsetStrongComponents`).
+        """
+        return computeBitsetStrongComponents(self.dominated)
+
+    def transitiveClosure(self):
+        """
+        Renders the list of the bitsets of the strict dominated nodes
+        in the transitive closure of the strict link digraph
+        (see :py:func:`digraphsTools.computeBitsetTransitiveClosure`).
+        """
+        return computeBitsetTransitiveClosure(self.dominated)
+
+#---------- bitset strong components and transitive closure ----------
+
+def computeBitsetStrongComponents(successors):
+    """
+    Renders the list of the bitsets of the strong components of the
+    digraph given by the list *successors* of the integer successors bitsets
+    of its vertices 0, 1, ..., n-1 (loops are ignored).
+
+    Implements Tarjan's algorithm with an explicit stack. The components
+    are rendered in reverse topological order of the condensation digraph,
+    i.e. every component comes after all the components it leads to.
+
+    >>> computeBitsetStrongComponents([0b010,0b001,0b001])
+    [3, 4]
+    """
+    n = len(successors)
+    index = [-1]*n
+    lowLink = [0]*n
+    onStack = 0
+    stack = []
+    components = []
+    counter = 0
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        index[root] = lowLink[root] = counter
+        counter += 1
+        stack.append(root)
+        onStack |= 1 << root
+        work = [[root,successors[root] & ~(1 << root)]]
+        while work:
+            top = work[-1]
+            v,rest = top
+            if rest:
+                low = rest & -rest
+                top[1] = rest ^ low
+                w = low.bit_length() - 1
+                if index[w] < 0:
+                    index[w] = lowLink[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    onStack |= low
+                    work.append([w,successors[w] & ~low])
+                elif onStack & low:
+                    if index[w] < lowLink[v]:
+                        lowLink[v] = index[w]
+            else:
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if lowLink[v] < lowLink[u]:
+                        lowLink[u] = lowLink[v]
+                if lowLink[v] == index[v]:
+                    component = 0
+                    while True:
+                        w = stack.pop()
+                        component |= 1 << w
+                        if w == v:
+                            break
+                    onStack &= ~component
+                    components.append(component)
+    return components
+
+def computeBitsetTransitiveClosure(successors,components=None,
+                                   WithTransitiveArcs=False):
+    """
+    Renders the list of the bitsets of the vertices y != x reachable
+    from each vertex x in the digraph given by the list *successors* of the
+    integer successors bitsets of its vertices 0, 1, ..., n-1 (loops are ignored).
+
+    The reachable sets are computed once per strong component, in reverse
+    topological order of the condensation digraph (see :py:func:`digraphsTools.computeBitsetStrongComponents`),
+    so that each component only gathers the reachable sets of its successor components.
+
+    With *WithTransitiveArcs* = True, renders the tuple (closure, transitiveArcs), where
+    *transitiveArcs* gathers for each vertex x the bitset of the vertices z such that
+    x -> y -> z in the closure for some vertex y != x,z, i.e. the arcs dropped by a transitive reduction.
+
+    >>> computeBitsetTransitiveClosure([0b010,0b100,0b000])
+    [6, 4, 0]
+    >>> computeBitsetTransitiveClosure([0b010,0b100,0b000],WithTransitiveArcs=True)
+    ([6, 4, 0], [4, 0, 0])
+    """
+    n = len(successors)
+    if components is None:
+        components = computeBitsetStrongComponents(successors)
+    componentOf = [0]*n
+    reach = []
+    closure = [0]*n
+    transitiveArcs = [0]*n
+    for ci,component in enumerate(components):
+        members = []
+        out = 0
+        m = component
+        while m:
+            low = m & -m
+            i = low.bit_length() - 1
+            members.append(i)
+            componentOf[i] = ci
+            out |= successors[i]
+            m ^= low
+        out &= ~component
+        if len(members) > 1:
+            reachable = component
+        else:
+            reachable = 0
+        # the successor components are already processed
+        indirect = 0
+        while out:
+            low = out & -out
+            cj = componentOf[low.bit_length() - 1]
+            reachable |= components[cj] | reach[cj]
+            indirect |= reach[cj]
+            out &= ~(components[cj] | reach[cj])
+        reach.append(reachable)
+        for i in members:
+            closure[i] = reachable & ~(1 << i)
+        if WithTransitiveArcs:
+            size = len(members)
+            for i in members:
+                if size > 2:
+                    within = reachable
+                elif size == 2:
+                    within = reachable & ~(component & ~(1 << i))
+                else:
+                    within = 0
+                transitiveArcs[i] = closure[i] & (indirect | within)
+    if WithTransitiveArcs:
+        return closure,transitiveArcs
+    else:
+        return closure
+
+def computeMaxMinClosure(actionsList,relation,Med):
+    """
+    Renders the double dictionary of the max-min path strengths
+    between the strictly linked vertices of the transitive closure of
+    a bipolar-valued *relation* on the ordered *actionsList*, i.e. for each
+    path x -> ... -> y of strict links (r > *Med*), the maximal over these paths
+    of the minimal characteristic value along the path.
+
+    The strengths are computed once with a vectorized Floyd-Warshall sweep
+    on the integer ranks of the positive characteristic values, which
+    are finally decoded into the original values. Loops are ignored.
+    Requires the *numpy* package.
+    """
+    values,strength = _computeBottleneckRanks(actionsList,relation,Med)
+    n = len(actionsList)
+    maxMin = {}
+    for i,x in enumerate(actionsList):
+        row = strength[i].tolist()
+        maxMin[x] = {actionsList[j]: values[row[j]-1]
+                     for j in range(n) if j != i and row[j] > 0}
+    return maxMin
+
+def _computeBottleneckRanks(actionsList,relation,Med=None):
+    """
+    Renders the sorted list *values* of the off-diagonal characteristic values
+    (only those > *Med* when *Med* is given) and the int32 *numpy* array of the ranks
+    1, 2, ... in *values* of the max-min path strengths, 0 marking the absence of a path.
+    The strengths are computed by a vectorized Floyd-Warshall sweep.
+    """
+    import numpy as np
+    n = len(actionsList)
+    if Med is None:
+        values = sorted({relation[x][y] for x in actionsList
+                         for y in actionsList if x != y})
+    else:
+        values = sorted({relation[x][y] for x in actionsList
+                         for y in actionsList if x != y and relation[x][y] > Med})
+    rank = {v: k+1 for k,v in enumerate(values)}
+    strength = np.zeros((n,n),dtype=np.int32)
+    for i,x in enumerate(actionsList):
+        rx = relation[x]
+        for j,y in enumerate(actionsList):
+            if i != j:
+                r = rx[y]
+                if Med is None or r > Med:
+                    strength[i,j] = rank[r]
+    for k in range(n):
+        column = strength[:,k]
+        rows = np.flatnonzero(column)
+        if len(rows) == 0:
+            continue
+        strength[rows] = np.maximum(strength[rows],
+                                    np.minimum(column[rows,None],strength[k]))
+    return values,strength
+
+def computeBottleneckPathStrengths(actionsList,relation,Med):
+    """
+    Renders the double dictionary of the valued bottleneck, i.e. max-min,
+    path strengths between all the vertices x != y of a bipolar-valued *relation* on
+    the ordered *actionsList*: the maximal over all the paths from x to y of the minimal
+    characteristic value along the path. The diagonal is set to *Med*.
+
+    A strength is > *Med*, resp. >= *Med*, if and only if there exists a path of
+    strict, resp. weak, links from x to y. Requires the *numpy* package.
+    """
+    values,strength = _computeBottleneckRanks(actionsList,relation)
+    n = len(actionsList)
+    strengths = {}
+    for i,x in enumerate(actionsList):
+        row = strength[i].tolist()
+        strengths[x] = {actionsList[j]: values[row[j]-1] for j in range(n)}
+        strengths[x][x] = Med
+    return strengths
+
+#---------- bitset shortest path lengths ----------
+
+class PathLengthsView(ArrayRelationView):
+    """
+    Dictionary compatible view on a compact integer *numpy* matrix of
+    shortest path lengths, where the negative entries mark the absence of a path.
+
+    *lengths[x][y]* renders an integer or *None*, and the underlying
+    matrix is accessible as *lengths.array*.
+
+    >>> import numpy as np
+    >>> lengths = PathLengthsView(np.array([[0,1],[-1,0]]),['a','b'])
+    >>> lengths['a']['b'], lengths['b']['a']
+    (1, None)
+    """
+    def __init__(self,array,keys):
+        ArrayRelationView.__init__(self,array,keys,ndigits=0,
+                                   backend='integer')
+
+    def _decode(self,value):
+        if value < 0:
+            return None
+        return int(value)
+
+    def _encode(self,value):
+        if value is None:
+            return -1
+        return value
+
+def computeBitsetPathLengths(successors):
+    """
+    Renders the n x n int32 *numpy* matrix of the shortest path lengths in the
+    digraph given by the list *successors* of the integer successors bitsets of its vertices
+    0, 1, ..., n-1, with 0 on the diagonal and -1 when there is no path.
+
+    Runs a breadth first search from each source on the successors bitsets,
+    each level being the union of the successors of the previous one.
+
+    >>> computeBitsetPathLengths([0b010,0b100,0b000]).tolist()
+    [[0, 1, 2], [-1, 0, 1], [-1, -1, 0]]
+    """
+    import numpy as np
+    n = len(successors)
+    lengths = np.full((n,n),-1,dtype=np.int32)
+    for source in range(n):
+        row = [-1]*n
+        row[source] = 0
+        visited = 1 << source
+        frontier = visited
+        depth = 0
+        while frontier:
+            depth += 1
+            level = 0
+            while frontier:
+                low = frontier & -frontier
+                level |= successors[low.bit_length()-1]
+                frontier ^= low
+            level &= ~visited
+            visited |= level
+            frontier = level
+            while level:
+                low = level & -level
+                row[low.bit_length()-1] = depth
+                level ^= low
+        lengths[source] = row
+    return lengths
+
+#---------- optimal assignments and weighted matchings -------------
+
+def computeMaximumWeightAssignment(weights):
+    """
+    Renders the list *assignment* such that row i is assigned to column
+    assignment[i] in a maximum total weight assignment of the n x n
+    matrix *weights* (list of lists of int, float or Decimal values).
+
+    Implements the Hungarian algorithm with row and column potentials
+    in O(n^3) time. With integer weights, all the computations are exact.
+
+    >>> computeMaximumWeightAssignment([[1,5],[4,2]])
+    [1, 0]
+    """
+    n = len(weights)
+    if n == 0:
+        return []
+    zero = weights[0][0] - weights[0][0]
+    # minimizing the negated weights; rows and columns are indexed from 1,
+    # column 0 is the virtual column of the row being assigned
+    u = [zero]*(n+1)
+    v = [zero]*(n+1)
+    rowOf = [0]*(n+1)
+    way = [0]*(n+1)
+    for i in range(1,n+1):
+        rowOf[0] = i
+        j0 = 0
+        minSlack = [None]*(n+1)
+        used = [False]*(n+1)
+        while True:
+            used[j0] = True
+            i0 = rowOf[j0]
+            wi0 = weights[i0-1]
+            ui0 = u[i0]
+            delta = None
+            j1 = 0
+            for j in range(1,n+1):
+                if not used[j]:
+                    cur = -wi0[j-1] - ui0 - v[j]
+                    if minSlack[j] is None or cur < minSlack[j]:
+                        minSlack[j] = cur
+                        way[j] = j0
+                    if delta is None or minSlack[j] < delta:
+                        delta = minSlack[j]
+                        j1 = j
+            for j in range(n+1):
+                if used[j]:
+                    u[rowOf[j]] += delta
+                    v[j] -= delta
+                else:
+                    minSlack[j] -= delta
+            j0 = j1
+            if rowOf[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            rowOf[j0] = rowOf[j1]
+            j0 = j1
+    assignment = [0]*n
+    for j in range(1,n+1):
+        assignment[rowOf[j]-1] = j - 1
+    return assignment
+
+def computeMaximumWeightPerfectMatching(order,weights):
+    """
+    Renders the list *mate* of a maximum weight perfect matching in the
+    complete graph on the vertices 0, 1, ..., order-1 (order being even),
+    where mate[x] is the partner of vertex x.
+
+    The *weights* argument is either an order x order symmetric matrix
+    or a dictionary with the (x,y) vertex pairs, x < y, as keys. The
+    weights must be integers; the computations are then exact.
+
+    Implements Edmonds' weighted blossom algorithm in the primal-dual
+    version of Galil (1986) in O(n^3) time, following the public
+    domain implementation of J. van Rantwijk.
+
+    >>> computeMaximumWeightPerfectMatching(4,{(0,1):1,(0,2):3,(0,3):1,
+    ...                                        (1,2):1,(1,3):3,(2,3):1})
+    [2, 3, 0, 1]
+    """
+    if order % 2 != 0:
+        raise ValueError('the order %d is not even' % order)
+    if order == 0:
+        return []
+    edges = []
+    for i in range(order):
+        for j in range(i+1,order):
+            if isinstance(weights,dict):
+                edges.append([i,j,weights[(i,j)]])
+            else:
+                edges.append([i,j,weights[i][j]])
+    # a perfect matching has always order/2 edges: shifting all the
+    # weights to positive values does not change the optimal matchings
+    minWeight = min(e[2] for e in edges)
+    for e in edges:
+        e[2] = 2*(e[2] - minWeight) + 2
+    nvertex = order
+    nedge = len(edges)
+    maxWeight = max(e[2] for e in edges)
+    endpoint = [edges[p//2][p%2] for p in range(2*nedge)]
+    neighbend = [[] for i in range(nvertex)]
+    for k in range(nedge):
+        i,j,w = edges[k]
+        neighbend[i].append(2*k+1)
+        neighbend[j].append(2*k)
+    mate = [-1]*nvertex
+    label = [0]*(2*nvertex)
+    labelend = [-1]*(2*nvertex)
+    inblossom = list(range(nvertex))
+    blossomparent = [-1]*(2*nvertex)
+    blossomchilds = [None]*(2*nvertex)
+    blossombase = list(range(nvertex)) + [-1]*nvertex
+    blossomendps = [None]*(2*nvertex)
+    bestedge = [-1]*(2*nvertex)
+    blossombestedges = [None]*(2*nvertex)
+    unusedblossoms = list(range(nvertex,2*nvertex))
+    dualvar = [maxWeight]*nvertex + [0]*nvertex
+    allowedge = [False]*nedge
+    queue = []
+
+    def slack(k):
+        i,j,wt = edges[k]
+        return dualvar[i] + dualvar[j] - 2*wt
+
+    def blossomLeaves(b):
+        if b < nvertex:
+            yield b
+        else:
+            for t in blossomchilds[b]:
+                if t < nvertex:
+                    yield t
+                else:
+                    yield from blossomLeaves(t)
+
+    def assignLabel(w,t,p):
+        while True:
+            b = inblossom[w]
+            label[w] = label[b] = t
+            labelend[w] = labelend[b] = p
+            bestedge[w] = bestedge[b] = -1
+            if t == 1:
+                queue.extend(blossomLeaves(b))
+                return
+            # t == 2: the mate of the base gets an S label
+            base = blossombase[b]
+            w,t,p = endpoint[mate[base]],1,mate[base] ^ 1
+
+    def scanBlossom(v,w):
+        path = []
+        base = -1
+        while v != -1 or w != -1:
+            b = inblossom[v]
+            if label[b] & 4:
+                base = blossombase[b]
+                break
+            path.append(b)
+            label[b] = 5
+            if labelend[b] == -1:
+                v = -1
+            else:
+                v = endpoint[labelend[b]]
+                b = inblossom[v]
+                v = endpoint[labelend[b]]
+            if w != -1:
+                v,w = w,v
+        for b in path:
+            label[b] = 1
+        return base
+
+    def addBlossom(base,k):
+        v,w,wt = edges[k]
+        bb = inblossom[base]
+        bv = inblossom[v]
+        bw = inblossom[w]
+        b = unusedblossoms.pop()
+        blossombase[b] = base
+        blossomparent[b] = -1
+        blossomparent[bb] = b
+        blossomchilds[b] = path = []
+        blossomendps[b] = endps = []
+        while bv != bb:
+            blossomparent[bv] = b
+            path.append(bv)
+            endps.append(labelend[bv])
+            v = endpoint[labelend[bv]]
+            bv = inblossom[v]
+        path.append(bb)
+        path.reverse()
+        endps.reverse()
+        endps.append(2*k)
+        while bw != bb:
+            blossomparent[bw] = b
+            path.append(bw)
+            endps.append(labelend[bw] ^ 1)
+            w = endpoint[labelend[bw]]
+            bw = inblossom[w]
+        label[b] = 1
+        labelend[b] = labelend[bb]
+        dualvar[b] = 0
+        for v in blossomLeaves(b):
+            if label[inblossom[v]] == 2:
+                queue.append(v)
+            inblossom[v] = b
+        bestedgeto = [-1]*(2*nvertex)
+        for bv in path:
+            if blossombestedges[bv] is None:
+                nblists = [[p//2 for p in neighbend[v]]
+                           for v in blossomLeaves(bv)]
+            else:
+                nblists = [blossombestedges[bv]]
+            for nblist in nblists:
+                for k in nblist:
+                    i,j,wt = edges[k]
+                    if inblossom[j] == b:
+                        i,j = j,i
+                    bj = inblossom[j]
+                    if bj != b and label[bj] == 1 and\
+                       (bestedgeto[bj] == -1 or slack(k) < slack(bestedgeto[bj])):
+                        bestedgeto[bj] = k
+            blossombestedges[bv] = None
+            bestedge[bv] = -1
+        blossombestedges[b] = [k for k in bestedgeto if k != -1]
+        bestedge[b] = -1
+        for k in blossombestedges[b]:
+            if bestedge[b] == -1 or slack(k) < slack(bestedge[b]):
+                bestedge[b] = k
+
+    def expandBlossom(b,endstage):
+        for s in blossomchilds[b]:
+            blossomparent[s] = -1
+            if s < nvertex:
+                inblossom[s] = s
+            elif endstage and dualvar[s] == 0:
+                expandBlossom(s,endstage)
+            else:
+                for v in blossomLeaves(s):
+                    inblossom[v] = s
+        if (not endstage) and label[b] == 2:
+            entrychild = inblossom[endpoint[labelend[b] ^ 1]]
+            j = blossomchilds[b].index(entrychild)
+            if j & 1:
+                j -= len(blossomchilds[b])
+                jstep = 1
+                endptrick = 0
+            else:
+                jstep = -1
+                endptrick = 1
+            p = labelend[b]
+            while j != 0:
+                label[endpoint[p ^ 1]] = 0
+                label[endpoint[blossomendps[b][j-endptrick] ^ endptrick ^ 1]] = 0
+                assignLabel(endpoint[p ^ 1],2,p)
+                allowedge[blossomendps[b][j-endptrick]//2] = True
+                j += jstep
+                p = blossomendps[b][j-endptrick] ^ endptrick
+                allowedge[p//2] = True
+                j += jstep
+            bv = blossomchilds[b][j]
+            label[endpoint[p ^ 1]] = label[bv] = 2
+            labelend[endpoint[p ^ 1]] = labelend[bv] = p
+            bestedge[bv] = -1
+            j += jstep
+            while blossomchilds[b][j] != entrychild:
+                bv = blossomchilds[b][j]
+                if label[bv] == 1:
+                    j += jstep
+                    continue
+                for v in blossomLeaves(bv):
+                    if label[v] != 0:
+                        break
+                if label[v] != 0:
+                    label[v] = 0
+                    label[endpoint[mate[blossombase[bv]]]] = 0
+                    assignLabel(v,2,labelend[v])
+                j += jstep
+        label[b] = labelend[b] = -1
+        blossomchilds[b] = blossomendps[b] = None
+        blossombase[b] = -1
+        blossombestedges[b] = None
+        bestedge[b] = -1
+        unusedblossoms.append(b)
+
+    def augmentBlossom(b,v):
+        t = v
+        while blossomparent[t] != b:
+            t = blossomparent[t]
+        if t >= nvertex:
+            augmentBlossom(t,v)
+        i = j = blossomchilds[b].index(t)
+        if i & 1:
+            j -= len(blossomchilds[b])
+            jstep = 1
+            endptrick = 0
+        else:
+            jstep = -1
+            endptrick = 1
+        while j != 0:
+            j += jstep
+            t = blossomchilds[b][j]
+            p = blossomendps[b][j-endptrick] ^ endptrick
+            if t >= nvertex:
+                augmentBlossom(t,endpoint[p])
+            j += jstep
+            t = blossomchilds[b][j]
+            if t >= nvertex:
+                augmentBlossom(t,endpoint[p ^ 1])
+            mate[endpoint[p]] = p ^ 1
+            mate[endpoint[p ^ 1]] = p
+        blossomchilds[b] = blossomchilds[b][i:] + blossomchilds[b][:i]
+        blossomendps[b] = blossomendps[b][i:] + blossomendps[b][:i]
+        blossombase[b] = blossombase[blossomchilds[b][0]]
+
+    def augmentMatching(k):
+        v,w,wt = edges[k]
+        for s,p in ((v,2*k+1),(w,2*k)):
+            while True:
+                bs = inblossom[s]
+                if bs >= nvertex:
+                    augmentBlossom(bs,s)
+                mate[s] = p
+                if labelend[bs] == -1:
+                    break
+                t = endpoint[labelend[bs]]
+                bt = inblossom[t]
+                s = endpoint[labelend[bt]]
+                j = endpoint[labelend[bt] ^ 1]
+                if bt >= nvertex:
+                    augmentBlossom(bt,j)
+                mate[j] = labelend[bt]
+                p = labelend[bt] ^ 1
+
+    # each stage augments the matching by one edge
+    for stage in range(nvertex):
+        label[:] = [0]*(2*nvertex)
+        bestedge[:] = [-1]*(2*nvertex)
+        blossombestedges[nvertex:] = [None]*nvertex
+        allowedge[:] = [False]*nedge
+        queue[:] = []
+        for v in range(nvertex):
+            if mate[v] == -1 and label[inblossom[v]] == 0:
+                assignLabel(v,1,-1)
+        augmented = False
+        while True:
+            while queue and not augmented:
+                v = queue.pop()
+                for p in neighbend[v]:
+                    k = p // 2
+                    w = endpoint[p]
+                    if inblossom[v] == inblossom[w]:
+                        continue
+                    if not allowedge[k]:
+                        kslack = slack(k)
+                        if kslack <= 0:
+                            allowedge[k] = True
+                    if allowedge[k]:
+                        if label[inblossom[w]] == 0:
+                            assignLabel(w,2,p ^ 1)
+                        elif label[inblossom[w]] == 1:
+                            base = scanBlossom(v,w)
+                            if base >= 0:
+                                addBlossom(base,k)
+                            else:
+                                augmentMatching(k)
+                                augmented = True
+                                break
+                        elif label[w] == 0:
+                            label[w] = 2
+                            labelend[w] = p ^ 1
+                    elif label[inblossom[w]] == 1:
+                        b = inblossom[v]
+                        if bestedge[b] == -1 or kslack < slack(bestedge[b]):
+                            bestedge[b] = k
+                    elif label[w] == 0:
+                        if bestedge[w] == -1 or kslack < slack(bestedge[w]):
+                            bestedge[w] = k
+            if augmented:
+                break
+            # dual variables update
+            deltatype = -1
+            delta = deltaedge = deltablossom = None
+            for v in range(nvertex):
+                if label[inblossom[v]] == 0 and bestedge[v] != -1:
+                    d = slack(bestedge[v])
+                    if deltatype == -1 or d < delta:
+                        delta = d
+                        deltatype = 2
+                        deltaedge = bestedge[v]
+            for b in range(2*nvertex):
+                if blossomparent[b] == -1 and label[b] == 1 and bestedge[b] != -1:
+                    d = slack(bestedge[b]) // 2
+                    if deltatype == -1 or d < delta:
+                        delta = d
+                        deltatype = 3
+                        deltaedge = bestedge[b]
+            for b in range(nvertex,2*nvertex):
+                if blossombase[b] >= 0 and blossomparent[b] == -1 and\
+                   label[b] == 2 and (deltatype == -1 or dualvar[b] < delta):
+                    delta = dualvar[b]
+                    deltatype = 4
+                    deltablossom = b
+            if deltatype == -1:
+                # no further improvement possible
+                deltatype = 1
+                delta = max(0,min(dualvar[:nvertex]))
+            for v in range(nvertex):
+                if label[inblossom[v]] == 1:
+                    dualvar[v] -= delta
+                elif label[inblossom[v]] == 2:
+                    dualvar[v] += delta
+            for b in range(nvertex,2*nvertex):
+                if blossombase[b] >= 0 and blossomparent[b] == -1:
+                    if label[b] == 1:
+                        dualvar[b] += delta
+                    elif label[b] == 2:
+                        dualvar[b] -= delta
+            if deltatype == 1:
+                break
+            elif deltatype == 2:
+                allowedge[deltaedge] = True
+                i,j,wt = edges[deltaedge]
+                if label[inblossom[i]] == 0:
+                    i,j = j,i
+                queue.append(i)
+            elif deltatype == 3:
+                allowedge[deltaedge] = True
+                i,j,wt = edges[deltaedge]
+                queue.append(i)
+            elif deltatype == 4:
+                expandBlossom(deltablossom,False)
+        if not augmented:
+            break
+        for b in range(nvertex,2*nvertex):
+            if blossomparent[b] == -1 and blossombase[b] >= 0 and\
+               label[b] == 1 and dualvar[b] == 0:
+                expandBlossom(b,True)
+    for v in range(nvertex):
+        if mate[v] >= 0:
+            mate[v] = endpoint[mate[v]]
+    return mate
+
+#---------- binary snapshots -----------------
+
+_snapshotMagic = b'DIGRAPH3'
+_snapshotVersion = 1
+_snapshotAlignment = 64
+
+def _encodeSnapshotObject(obj,path='header'):
+    """
+    Recursively renders *obj* JSON serializable, Decimal, tuple, set
+    and non string keyed dict objects being tagged.
+
+    Raises a TypeError, naming its *path* in the header, on any other
+    type of object.
+    """
+    from numbers import Integral, Real
+    if isinstance(obj,Decimal):
+        return {'__decimal__': str(obj)}
+    elif isinstance(obj,bool) or obj is None or isinstance(obj,(int,float,str)):
+        return obj
+    elif isinstance(obj,Integral):
+        return int(obj)
+    elif isinstance(obj,Real):
+        return float(obj)
+    elif isinstance(obj,tuple):
+        return {'__tuple__': [_encodeSnapshotObject(v,'%s[%d]' % (path,i))\
+                              for i,v in enumerate(obj)]}
+    elif isinstance(obj,(set,frozenset)):
+        return {'__set__': [_encodeSnapshotObject(v,'%s{}' % path) for v in obj]}
+    elif isinstance(obj,list):
+        return [_encodeSnapshotObject(v,'%s[%d]' % (path,i)) for i,v in enumerate(obj)]
+    elif isinstance(obj,abc.Mapping):
+        if all(isinstance(k,str) and not k.startswith('__') for k in obj):
+            return {k: _encodeSnapshotObject(v,'%s[%r]' % (path,k)) for k,v in obj.items()}
+        else:
+            return {'__items__': [[_encodeSnapshotObject(k,'%s key' % path),
+                                   _encodeSnapshotObject(v,'%s[%r]' % (path,k))]\
+                                  for k,v in obj.items()]}
+    else:
+        raise TypeError('%s of type %s cannot be stored in a binary snapshot'\
+                        % (path,type(obj).__name__))
+
+def _decodeSnapshotPairs(pairs):
+    """
+    *object_pairs_hook* inverting the :py:func:`_encodeSnapshotObject` tags.
+    """
+    from collections import OrderedDict
+    if len(pairs) == 1:
+        key,value = pairs[0]
+        if key == '__decimal__':
+            return Decimal(value)
+        elif key == '__tuple__':
+            return tuple(value)
+        elif key == '__set__':
+            return set(value)
+        elif key == '__items__':
+            return OrderedDict((_hashableSnapshotKey(k),v) for k,v in value)
+    return OrderedDict(pairs)
+
+def _hashableSnapshotKey(key):
+    if isinstance(key,list):
+        return tuple(_hashableSnapshotKey(k) for k in key)
+    elif isinstance(key,set):
+        return frozenset(key)
+    else:
+        return key
+
+def computeDecimalDigits(values,maxDigits=15):
+    """
+    Renders the maximal number of decimal digits, bounded by *maxDigits*,
+    of the given Decimal (or int) *values*. Float values count for *maxDigits*.
+    """
+    ndigits = 0
+    for v in values:
+        if isinstance(v,Decimal):
+            exponent = v.as_tuple().exponent
+            if isinstance(exponent,int) and -exponent > ndigits:
+                ndigits = -exponent
+        elif isinstance(v,float):
+            return maxDigits
+        if ndigits >= maxDigits:
+            return maxDigits
+    return ndigits
+
+def isBinarySnapshotFile(fileName):
+    """
+    Checks if *fileName* designates a binary snapshot, i.e. either ends with
+    the *.d3b* extension, or no *fileName.py* but a *fileName.d3b* file exists.
+    """
+    from os.path import isfile
+    fileName = str(fileName)
+    if fileName.endswith('.d3b'):
+        return True
+    return not isfile(fileName+'.py') and isfile(fileName+'.d3b')
+
+def saveBinarySnapshot(fileName,header,arrays):
+    """
+    Stores a JSON serializable (see :py:func:`_encodeSnapshotObject`) *header*
+    dictionary and a dictionary of named *numpy* *arrays* in the binary file *fileName*.
+
+    File layout: the 8 bytes magic *DIGRAPH3*, the format version and the header
+    length (little endian uint32, uint32 and uint64), the utf-8 JSON header,
+    followed by the raw C ordered arrays, each one aligned on 64 bytes in order to be
+    memory-mappable. The header records the dtype, shape and relative offset of each array.
+    """
+    import json,struct
+    import numpy as np
+    arrayDescriptors = {}
+    offset = 0
+    arrays = {name: np.ascontiguousarray(a) for name,a in arrays.items()}
+    for name,a in arrays.items():
+        offset = -(-offset // _snapshotAlignment) * _snapshotAlignment
+        arrayDescriptors[name] = {'dtype': a.dtype.str,
+                                  'shape': list(a.shape),
+                                  'offset': offset}
+        offset += a.nbytes
+    fileHeader = dict(header)
+    fileHeader['arrays'] = arrayDescriptors
+    headerBytes = json.dumps({k: _encodeSnapshotObject(v,k)\
+                              for k,v in fileHeader.items()}).encode('utf-8')
+    prefix = _snapshotMagic + struct.pack('<IIQ',_snapshotVersion,0,len(headerBytes))
+    dataStart = len(prefix) + len(headerBytes)
+    dataStart = -(-dataStart // _snapshotAlignment) * _snapshotAlignment
+    with open(fileName,'wb') as fo:
+        fo.write(prefix)
+        fo.write(headerBytes)
+        fo.write(b'\0' * (dataStart - len(prefix) - len(headerBytes)))
+        position = 0
+        for name,a in arrays.items():
+            start = arrayDescriptors[name]['offset']
+            fo.write(b'\0' * (start - position))
+            fo.write(a.tobytes())
+            position = start + a.nbytes
+
+def loadBinarySnapshot(fileName,MemoryMapped=False):
+    """
+    Renders the tuple (header, arrays) stored with :py:func:`saveBinarySnapshot`.
+
+    With *MemoryMapped* = True, the arrays are copy-on-write *numpy.memmap* views
+    on the file, otherwise they are read into memory.
+    """
+    import json,struct
+    import numpy as np
+    with open(fileName,'rb') as fi:
+        prefix = fi.read(24)
+        if len(prefix) < 24 or prefix[:8] != _snapshotMagic:
+            raise ValueError('%s is not a Digraph3 binary snapshot' % fileName)
+        version,reserved,headerLength = struct.unpack('<IIQ',prefix[8:])
+        if version > _snapshotVersion:
+            raise ValueError('unsupported snapshot version %d' % version)
+        header = json.loads(fi.read(headerLength).decode('utf-8'),
+                            object_pairs_hook=_decodeSnapshotPairs)
+        dataStart = 24 + headerLength
+        dataStart = -(-dataStart // _snapshotAlignment) * _snapshotAlignment
+        arrays = {}
+        for name,descriptor in header.pop('arrays').items():
+            dtype = np.dtype(descriptor['dtype'])
+            shape = tuple(descriptor['shape'])
+            offset = dataStart + descriptor['offset']
+            count = 1
+            for d in shape:
+                count *= d
+            if MemoryMapped and count > 0:
+                arrays[name] = np.memmap(fileName,dtype=dtype,mode='c',
+                                         offset=offset,shape=shape)
+            else:
+                fi.seek(offset)
+                arrays[name] = np.fromfile(fi,dtype=dtype,count=count).reshape(shape)
+    return header,arrays
+
 def total_size(o, handlers={}, verbose=False):
     """ Returns the approximate memory footprint of an object and all of its contents.
 
@@ -363,7 +363,7 @@ class Graph(object):
 
     def _MISgen(self,S,I):
         """
-        generator of maximal independent choices (voir Byskov 2004):
+        generator of maximal independent choices:
             * S ::= remaining nodes;
             * I ::= current independent choice
 
@@ -374,27 +374,58 @@ class Graph(object):
             - See self.showMIS() for usage instructions.
             
         """
-        if S == set():
-            add = 1
-            self.missetit = self.misset.copy()
-            for mis in self.missetit:
-                if mis < I:
-                    self.misset.remove(mis)
-                else:
-                    if I <= mis:
-                        add = 0
-                        break
-            if add == 1:
-                self.misset = self.misset | frozenset([I])
-                yield I
-        else:
-            v = S.pop()
-            Sv = S - (self.gamma[v])
-            Iv = I | set([v])
-            for choice in self._MISgen(Sv,Iv):
-                yield choice
-            for choice in self._MISgen(S,I):
+        from digraphsTools import generateBitsetMaximalCliques
+        verticesList,adjacency = self._adjacencyBitsets(Complement=True)
+        index = {x: i for i,x in enumerate(verticesList)}
+        R = 0
+        for x in I:
+            R |= 1 << index[x]
+        P = 0
+        for x in S:
+            P |= 1 << index[x]
+        P &= ~R
+        for x in I:
+            P &= adjacency[index[x]]
+        misset = set(self.misset)
+        self.misset = misset
+        try:
+            for mask in generateBitsetMaximalCliques(adjacency,R=R,P=P):
+                choice = frozenset(self._bitsetMembers(mask,verticesList))
+                misset.add(choice)
                 yield choice
+        finally:
+            self.misset = frozenset(misset)
+
+    def _adjacencyBitsets(self,Complement=False):
+        """
+        Renders the list of the vertices keys and the list of the integer
+        bitsets of their neighbourhoods in self, or in the complement of self
+        when *Complement* is True.
+        """
+        verticesList = [x for x in self.vertices]
+        index = {x: i for i,x in enumerate(verticesList)}
+        full = (1 << len(verticesList)) - 1
+        adjacency = []
+        for i,x in enumerate(verticesList):
+            m = 0
+            for y in self.gamma[x]:
+                m |= 1 << index[y]
+            if Complement:
+                m = full & ~(m | (1 << i))
+            adjacency.append(m)
+        return verticesList,adjacency
+
+    @staticmethod
+    def _bitsetMembers(mask,verticesList):
+        """
+        Renders the list of the vertices coded in the bitset *mask*.
+        """
+        members = []
+        while mask:
+            low = mask & -mask
+            members.append(verticesList[low.bit_length()-1])
+            mask ^= low
+        return members
 
     def _saveEdges(self,fileName='graphEdges',Agrum=False,Decimal=True):
         """
@@ -455,18 +486,20 @@ class Graph(object):
 
         .. Note::
 
-            - Computes the maximal independent vertex sets in the dual of self.
+            - Bron-Kerbosch enumeration with pivoting on the neighbourhood bitsets of self
+              (see :py:func:`digraphsTools.generateBitsetMaximalCliques`).
             - Result is stored in self.cliques.
 
         """
-        import time,copy
+        import time
+        from digraphsTools import generateBitsetMaximalCliques
         if Comments:
             print('*---  Maximal Cliques ---*')
         t0 = time.time()
-        dualSelf = -self
-        dualSelf.misset = set()
         vertices = set([x for x in self.vertices])
-        self.cliques = [m[0] for m in dualSelf.generateIndependent(dualSelf._singletons()) if m[0] == m[2]]
+        verticesList,adjacency = self._adjacencyBitsets()
+        self.cliques = [frozenset(self._bitsetMembers(m,verticesList))
+                        for m in generateBitsetMaximalCliques(adjacency)]
         t1 = time.time()
         n = len(vertices)
         v = [0 for i in range(n+1)] 
@@ -602,16 +635,20 @@ class Graph(object):
 
         .. Note::
         
+            - Bron-Kerbosch enumeration with pivoting on the neighbourhood bitsets
+              of the complement of self (see :py:func:`digraphsTools.generateBitsetMaximalCliques`).
             - Result is stored in self.misset !
 
         """
         import time
+        from digraphsTools import generateBitsetMaximalCliques
         if Comments:
             print('*---  Maximal Independent Sets ---*')
         t0 = time.time()
-        self.misset = set()
         vertices = set([x for x in self.vertices])
-        self.misset = [m[0] for m in self.generateIndependent(self._singletons()) if m[0] == m[2]]
+        verticesList,adjacency = self._adjacencyBitsets(Complement=True)
+        self.misset = [frozenset(self._bitsetMembers(m,verticesList))
+                       for m in generateBitsetMaximalCliques(adjacency)]
         t1 = time.time()
         n = len(vertices)
         v = [0 for i in range(n+1)] 
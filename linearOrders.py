@@ -2512,10 +2512,11 @@ class KemenyRanking(LinearOrder):
         """
         constructor for generating a linear order
         from a given other digraph by exact enumeration
-        of all permutations of actions.
+        of all permutations of actions (order < 8) or by exact
+        dynamic programming over the subsets of actions (order <= *orderLimit*).
         """
         if other.order > orderLimit:
-            print('Digraph order %d to high. The default limit (7) may be changed with the oderLimit argument.' % (other.order) )
+            print('Digraph order %d to high. The default limit (7) may be changed with the orderLimit argument (up to about 25).' % (other.order) )
             return
                   
         from digraphs import all_perms
@@ -2535,7 +2536,7 @@ class KemenyRanking(LinearOrder):
         kemenyRankings = other.computeKemenyRanking(orderLimit=orderLimit,Debug=False)
         if kemenyRankings is None:
             print('Intantiation error: unable to compute the Kemeny Order !!!')
-            print('Digraph order %d is required to be lower than 8!' % n)
+            print('Digraph order %d is too high for an exact computation!' % other.order)
             return
 ##        elif len(other.maximalRankings) == 1:
 ##            kemenyRanking = kemenyRankings[0]
@@ -2622,26 +2623,49 @@ class KemenyOrder(KemenyRanking):
 
 class SlaterRanking(KemenyRanking):
     """
-    Instantiates a Slater ranking by instantiating a *KemenyRanking* from the Condorcet Digraph -the median cut polarised digraph- of a given bipolar-valued Digraph instance. 
+    Instantiates a linear ranking with maximal Slater index of a given bipolar-valued
+    Digraph instance, computed with the :py:meth:`~digraphs.Digraph.computeSlaterRanking` method.
+
+    Digraphs of order up to *orderLimit* are ranked with the exact feedback arc set
+    branch and bound of the method.
+    With *Heuristic* = True, the ranking is computed, whatever the order of the digraph,
+    with the local search of the same method, randomly restarted with the given *seed*.
     """
-    def __init__(self,other,orderLimit=7,Debug=False):
+    def __init__(self,other,orderLimit=7,Heuristic=False,seed=None,Debug=False):
         """
         A constructor for generating a linear order
-        from a given other digraph by exact enumeration
+        from a given other digraph by exact or heuristic optimisation
         """
-        from digraphs import PolarisedDigraph
-        from copy import copy,deepcopy
-        c = PolarisedDigraph(other)
-        sl = KemenyOrder(c,orderLimit=orderLimit,Debug=Debug)
+        from copy import deepcopy
+        from decimal import Decimal
+        if other.order > orderLimit and not Heuristic:
+            print('Digraph order %d to high. The default limit (7) may be changed with the orderLimit argument or use the Heuristic flag.' % (other.order) )
+            return
+        slaterRanking,slaterIndex = other.computeSlaterRanking(Heuristic=Heuristic,
+                                                               seed=seed,Debug=Debug)
         self.name = other.name + '_ranked'        
         self.actions = deepcopy(other.actions)
         self.order = len(self.actions)
-        self.valuationdomain = copy(sl.valuationdomain)
-        self.relation = deepcopy(sl.relation)
-        self.slaterOrder = copy(sl.kemenyOrder)
-        self.slaterRanking = copy(sl.kemenyRanking)
-        self.slaterIndex = copy(sl.maxKemenyIndex)
-        self.maximalRankings = copy(sl.maximalRankings)
+        Min = Decimal('-1.0')
+        Max = Decimal('1.0')
+        Med = Decimal('0.0')
+        self.valuationdomain = {'min': Min, 'med': Med, 'max': Max}
+        rank = {x: i for i,x in enumerate(slaterRanking)}
+        relation = {}
+        for x in self.actions:
+            relation[x] = {}
+            for y in self.actions:
+                if rank[x] < rank[y]:
+                    relation[x][y] = Max
+                elif rank[x] > rank[y]:
+                    relation[x][y] = Min
+                else:
+                    relation[x][y] = Med
+        self.relation = relation
+        self.slaterRanking = slaterRanking
+        self.slaterOrder = list(reversed(slaterRanking))
+        self.slaterIndex = slaterIndex
+        self.maximalRankings = [slaterRanking]
         self.gamma = self.gammaSets()
         self.notGamma = self.notGammaSets()
 
@@ -2672,6 +2696,9 @@ class PrincipalOrder(LinearOrder):
         None/default, "pdf", "png" and "xfig".
 
         The plot file name only matters with a non None image type.
+        The principal scores are computed in process with *numpy*
+        (see :py:meth:`~digraphs.Digraph.computePrincipalScores`); R is only
+        required for drawing the principal image.
         """
         from copy import copy, deepcopy
         from decimal import Decimal
@@ -80,17 +80,54 @@ from digraphs import qtilingIndexList
 ##
 ##    return newrelation
 
+#-----------------
+# performance tableaux broadcasted to the workers of a MPWorkerPool
+# and cached per worker process
+_workerPerfTabs = {}
+_workerPerfTabsCacheSize = 4
+
+class _SharedPerfTabHandle(object):
+    """
+    Picklable reference to a performance tableau broadcasted
+    by a :py:class:`~mpOutrankingDigraphs.MPWorkerPool` instance.
+    """
+    __slots__ = ('key','sharedMemoryName','size')
+    def __init__(self,key,sharedMemoryName,size):
+        self.key = key
+        self.sharedMemoryName = sharedMemoryName
+        self.size = size
+
+def _getWorkerPerfTab(handle):
+    """
+    Renders the performance tableau referenced by *handle*, unpickling it
+    from the shared memory block only on its first use in the worker process.
+    """
+    try:
+        return _workerPerfTabs[handle.key]
+    except KeyError:
+        from multiprocessing import shared_memory
+        from pickle import loads
+        shm = shared_memory.SharedMemory(name=handle.sharedMemoryName)
+        perfTab = loads(bytes(shm.buf[:handle.size]))
+        shm.close()
+        if len(_workerPerfTabs) >= _workerPerfTabsCacheSize:
+            del _workerPerfTabs[next(iter(_workerPerfTabs))]
+        _workerPerfTabs[handle.key] = perfTab
+        return perfTab
+
 def worker_func1(args):
     # computing the genuine bipolar-valued outranking situations
     # with considerable performance differences counts between
     # the given *actionKey* performance record and the complete set of
     # performance records
-    # in: args=(actionKey,perfTab);
+    # in: args=(actionKey,perfTab); perfTab may be a broadcast handle
     # out: relation, considerableDiffs
 
     # in variables
     splitIndex = args[0]
     perfTab = args[1]
+    if isinstance(perfTab,_SharedPerfTabHandle):
+        perfTab = _getWorkerPerfTab(perfTab)
     actions = perfTab.actions
     actionsList = [ x for x in actions]
     criteria = perfTab.criteria
@@ -171,6 +208,154 @@ def worker_func1(args):
 
     return [relation, considerableDiffs]
 
+#-----------------
+class MPWorkerPool(object):
+    """
+    Long-lived multiprocessing pool of workers which may be reused across
+    many :py:class:`~mpOutrankingDigraphs.MPBipolarOutrankingDigraph` constructions
+    via the *workerPool* parameter.
+
+    *Parameters*:
+        * *nbrCores*: number of worker processes; if *None* the *cpu_count()* method is used.
+        * *startMethod*: 'spawn' (default) | 'forkserver' | 'fork'.
+
+    Each performance tableau is pickled into a shared memory block
+    and unpickled at most once per worker process, the tasks referring to it
+    by a light handle. The broadcasted tableaux are identified by a
+    fingerprint of their pickled content, so that a tableau modified
+    after its broadcast is shared again instead of being served stale.
+    A construction releases the shared memory block of a tableau it
+    broadcasted itself; a tableau explicitly broadcasted beforehand with the
+    :py:meth:`~mpOutrankingDigraphs.MPWorkerPool.broadcast` method
+    remains shared until it is released.
+
+    *Usage example*:
+
+    >>> from randomPerfTabs import RandomCBPerformanceTableau
+    >>> from mpOutrankingDigraphs import *
+    >>> with MPWorkerPool(nbrCores=4) as pool:
+    ...     for s in range(1,11):
+    ...         pt = RandomCBPerformanceTableau(numberOfActions=300,seed=s)
+    ...         bg = MPBipolarOutrankingDigraph(pt,workerPool=pool)
+    
+    A module-wide pool is available with the :py:func:`~mpOutrankingDigraphs.getSharedWorkerPool` function.
+
+    .. warning:: Like for the *MPBipolarOutrankingDigraph* constructor, the main entry code of
+        a python script using a 'spawn' or 'forkserver' worker pool must be
+        protected with the *if __name__ == '__main__':* test.
+    
+    """
+    def __init__(self,nbrCores=None,startMethod=None):
+        if startMethod is None:
+            startMethod = 'spawn'
+        ctx = multiprocessing.get_context(startMethod)
+        self.startMethod = '%s' % ctx.get_start_method()
+        if nbrCores is None:
+            nbrCores = ctx.cpu_count()
+        self.nbrCores = nbrCores
+        self.pool = ctx.Pool(processes=nbrCores)
+        self._broadcasts = {}
+        self._counter = 0
+
+    def __repr__(self):
+        reprString = '*------- MPWorkerPool instance description ------*\n'
+        reprString += 'Worker processes     : %d\n' % self.nbrCores
+        reprString += "Start method         : \'%s\'\n" % self.startMethod
+        reprString += 'Broadcasted tableaux : %d\n' % len(self._broadcasts)
+        return reprString
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*args):
+        self.close()
+
+    def broadcast(self,perfTab):
+        """
+        Shares *perfTab* with the workers of the pool and renders its handle.
+        A performance tableau already broadcasted with the same content
+        is not copied again into shared memory.
+        """
+        return self._broadcast(perfTab)[0]
+
+    def _broadcast(self,perfTab):
+        """
+        Renders the (handle, isNew) pair of the broadcasted *perfTab*.
+        """
+        from multiprocessing import shared_memory
+        from pickle import dumps
+        from hashlib import sha1
+        data = dumps(perfTab,-1)
+        fingerprint = sha1(data).hexdigest()
+        try:
+            return self._broadcasts[fingerprint][0],False
+        except KeyError:
+            pass
+        shm = shared_memory.SharedMemory(create=True,size=max(1,len(data)))
+        shm.buf[:len(data)] = data
+        self._counter += 1
+        key = '%d-%d-%s' % (os.getpid(),self._counter,fingerprint)
+        handle = _SharedPerfTabHandle(key,shm.name,len(data))
+        self._broadcasts[fingerprint] = (handle,shm)
+        return handle,True
+
+    def release(self,perfTab):
+        """
+        Frees the shared memory block of a broadcasted *perfTab*,
+        given either as performance tableau or as broadcast handle.
+        """
+        if isinstance(perfTab,_SharedPerfTabHandle):
+            fingerprints = [f for f in self._broadcasts\
+                            if self._broadcasts[f][0].key == perfTab.key]
+        else:
+            from pickle import dumps
+            from hashlib import sha1
+            fingerprints = [sha1(dumps(perfTab,-1)).hexdigest()]
+        for fingerprint in fingerprints:
+            try:
+                handle,shm = self._broadcasts.pop(fingerprint)
+            except KeyError:
+                continue
+            shm.close()
+            shm.unlink()
+
+    def map(self,func,tasks):
+        """
+        Renders the list of *func* results on the *tasks* list.
+        """
+        return self.pool.map(func,tasks)
+
+    def close(self):
+        """
+        Releases all broadcasted tableaux and terminates the worker processes.
+        """
+        for fingerprint in list(self._broadcasts.keys()):
+            self.release(self._broadcasts[fingerprint][0])
+        self.pool.terminate()
+        self.pool.join()
+
+_sharedWorkerPool = None
+
+def getSharedWorkerPool(nbrCores=None,startMethod=None):
+    """
+    Renders the module-wide :py:class:`~mpOutrankingDigraphs.MPWorkerPool` instance,
+    starting it with the given *nbrCores* and *startMethod* parameters on the first call.
+    """
+    global _sharedWorkerPool
+    if _sharedWorkerPool is None:
+        _sharedWorkerPool = MPWorkerPool(nbrCores=nbrCores,
+                                         startMethod=startMethod)
+    return _sharedWorkerPool
+
+def closeSharedWorkerPool():
+    """
+    Terminates the module-wide :py:class:`~mpOutrankingDigraphs.MPWorkerPool` instance.
+    """
+    global _sharedWorkerPool
+    if _sharedWorkerPool is not None:
+        _sharedWorkerPool.close()
+        _sharedWorkerPool = None
+
 #-----------------
 from outrankingDigraphs import BipolarOutrankingDigraph
 class MPBipolarOutrankingDigraph(BipolarOutrankingDigraph):
@@ -184,6 +369,8 @@ class MPBipolarOutrankingDigraph(BipolarOutrankingDigraph):
         * *nbrCores*: controls the maximal number of cores that will be used in the multiprocessing phases. If *None* is given, the *os.cpu_count()* method is used in order to determine the number of available cores on the SMP machine.
         * *startMethod*: 'spawn' (default) | 'forkserver' | 'fork'; if *None* the default is used.
         * *MultipleInterpreters*: False (default) | True; as of Python3.14+ when True isolated multiple interpreters may be run in parallel.
+        * *workerPool*: None (default) | a :py:class:`~mpOutrankingDigraphs.MPWorkerPool` instance. When given, the long-lived workers of the pool are used instead of a new pool, and the performance tableau is broadcasted only once to each worker. The *nbrCores* and *startMethod* parameters are then taken from the pool, and the *self.workerPool* attribute is set to True.
+        * *WithGammaSets*: False (default) | True; when True, the *gamma* and *notGamma* neighbourhoods are computed by the constructor. Otherwise they are computed on first access.
 
     *Usage example*
 
@@ -254,7 +441,6 @@ class MPBipolarOutrankingDigraph(BipolarOutrankingDigraph):
         val1 = self.runTimes['totalTime']
         val2 = self.runTimes['dataInput']
         val3 = self.runTimes['computeRelation']
-        val4 = self.runTimes['gammaSets']
         reprString += '----  Constructor run times (in sec.) ----\n'
         try:
             reprString += 'Threads            : %d\n' % self.nbrThreads
@@ -278,16 +464,20 @@ class MPBipolarOutrankingDigraph(BipolarOutrankingDigraph):
             reprString += 'Normalize relation : %.5f\n' % val3n
         except:
              pass
-        reprString += 'Gamma sets         : %.5f\n' % val4
+        try:
+            reprString += 'Gamma sets         : %.5f\n' % self.runTimes['gammaSets']
+        except KeyError:
+            reprString += 'Gamma sets         : lazy\n'
         return reprString
 
 
     # --------- main class
 
-    def __init__(self,argPerfTab,WithGammaSets=True,
+    def __init__(self,argPerfTab,WithGammaSets=False,
                  Normalized=True,ndigits=4,
                  startMethod=None,
                  MultipleInterpreters=False,
+                 workerPool=None,
                  nbrCores=None,Comments=False):
         from decimal import Decimal
         from time import time
@@ -315,24 +505,39 @@ class MPBipolarOutrankingDigraph(BipolarOutrankingDigraph):
         actions = self.actions
         actionsList = [a for a in actions]
         t1 = time()
-        if startMethod is None:
-            startMethod = 'spawn'
-        ctx_in_main = multiprocessing.get_context(startMethod)
-        self.startMethod = '%s' % ctx_in_main.get_start_method()
         relation = {}
         considerableDiffs = {}
         for x in actions:
             relation[x] = {}
             considerableDiffs[x] = {}
-        if nbrCores is None:
-            nbrCores = ctx_in_main.cpu_count()
+        if workerPool is not None:
+            self.startMethod = workerPool.startMethod
+            nbrCores = workerPool.nbrCores
+        else:
+            if startMethod is None:
+                startMethod = 'spawn'
+            ctx_in_main = multiprocessing.get_context(startMethod)
+            self.startMethod = '%s' % ctx_in_main.get_start_method()
+            if nbrCores is None:
+                nbrCores = ctx_in_main.cpu_count()
         self.nbrThreads = nbrCores
+        self.workerPool = workerPool is not None
         #from digraphsTools import qtilingIndexList
         splitIndex = qtilingIndexList(actionsList,nbrCores,Debug=False)
         if Comments:
             print(splitIndex)
-        tasks = [(splitIndex[i],perfTab,Comments) for i in range(nbrCores)]
-        if MultipleInterpreters:
+        if workerPool is not None:
+            perfTabHandle,isNew = workerPool._broadcast(perfTab)
+            tasks = [(splitIndex[i],perfTabHandle,Comments) for i in range(nbrCores)]
+            try:
+                for result in workerPool.map(worker_func1, tasks):
+                    relation.update(result[0])
+                    considerableDiffs.update(result[1])
+            finally:
+                if isNew:
+                    workerPool.release(perfTabHandle)
+        elif MultipleInterpreters:
+            tasks = [(splitIndex[i],perfTab,Comments) for i in range(nbrCores)]
             if version_info[1] >= 14 :
                 import concurrent.futures as cf
                 #with cf.ProcessPoolExecutor(mp_context=ctx_in_main) as pool:
@@ -345,6 +550,7 @@ class MPBipolarOutrankingDigraph(BipolarOutrankingDigraph):
             else:
                 print('For multiple interpreters Python3.14+ is required!')
         else:
+            tasks = [(splitIndex[i],perfTab,Comments) for i in range(nbrCores)]
             with ctx_in_main.Pool(processes=nbrCores) as pool:
                 #print(tasks)
                 for result in pool.map(worker_func1, tasks):
@@ -371,13 +577,13 @@ class MPBipolarOutrankingDigraph(BipolarOutrankingDigraph):
             # convincing run times; further tests are needed !!!
             # self.recodeValuation(ndigits=ndigits,Comments=Comments)
             runTimes['normalizeRelation'] = time() - tn
-        t2 = time()
         if WithGammaSets:
+            t2 = time()
             if Comments:
                 print('Adding the gamma sets')
             self.gamma = self.gammaSets()
             self.notGamma = self.notGammaSets()
-        runTimes['gammaSets'] = time() - t2
+            runTimes['gammaSets'] = time() - t2
         runTimes['totalTime'] = time() - t0
         self.runTimes = runTimes
 
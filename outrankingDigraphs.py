@@ -3873,6 +3873,37 @@ class _Electre3OutrankingDigraph(OutrankingDigraph):
         else:
             return Decimal('0.0')
 
+# multiprocessing shared memory worker for BipolarOutrankingDigraph class
+def _sharedMemoryRelationWorker(threadID,digraph,actionsKeys,
+                                sharedMemoryName,splitIndex,
+                                hasNoVeto,hasBipolarVeto,
+                                hasSymmetricThresholds,Debug):
+    import numpy as np
+    from multiprocessing import shared_memory
+    if Debug:
+        print("Starting working on thread %s with rows %s" % (str(threadID),str(splitIndex)))
+    # the shared memory block is unlinked by the parent process
+    shm = shared_memory.SharedMemory(name=sharedMemoryName)
+    n = len(actionsKeys)
+    fromi, toi = splitIndex
+    splitActions = actionsKeys[fromi:toi]
+    splitRelation = BipolarOutrankingDigraph._constructRelationSimple(
+                                digraph,digraph.criteria,
+                                digraph.evaluation,
+                                initial=splitActions,
+                                terminal=actionsKeys,
+                                hasNoVeto=hasNoVeto,
+                                hasBipolarVeto=hasBipolarVeto,
+                                WithConcordanceRelation=False,
+                                WithVetoCounts=False,
+                                Debug=False,
+                                hasSymmetricThresholds=hasSymmetricThresholds)
+    sharedValuation = np.ndarray((n,n),dtype=np.float64,buffer=shm.buf)
+    sharedValuation[fromi:toi] = [[float(splitRelation[x][y]) for y in actionsKeys]\
+                                  for x in splitActions]
+    del sharedValuation
+    shm.close()
+
 # multiprocessing thread for BipolarOutrankingDigraph class
 class _myBODGThread(Process):
     def __init__(self, target,args):
@@ -3942,6 +3973,15 @@ class _myBODGThread(Process):
     # .......
 
 
+class _PerformanceDifferencesCountView(ArrayRelationView):
+    """
+    Lazy view on the (positive,negative) counts of considerable performance
+    differences of a vectorized :py:class:`~outrankingDigraphs.BipolarOutrankingDigraph`,
+    rendered in the format of the *largePerformanceDifferencesCount* dictionary.
+    """
+    def _decode(self,value):
+        return {'positive': int(value[0]), 'negative': int(value[1])}
+
 class BipolarOutrankingDigraph(OutrankingDigraph):
     """
     Specialization of the abstract OutrankingDigraph root class for generating
@@ -3965,6 +4005,21 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
         * startMethod: 'spawn' (default), 'forkserver' or 'fork' (not safe against dead locks)
         * nbrCores: controls the maximal number of cores that will be used in the multiprocessing phases.
           If None is given, the os.cpu_count method is used in order to determine the number of available CPU cores on the SMP machine.
+        * Vectorized: False by default. If True, the *numpy* package is required and the outranking characteristics are computed
+          in one batched pass per criterion on a criteria x actions evaluation matrix.
+          The resulting float n x n valuation array is stored in the *self.valuation* slot and
+          the *self.relation* slot is a lazy dictionary compatible :py:class:`~digraphsTools.ArrayRelationView` on this array.
+          *Threading* is ignored in this case.
+        * SharedMemory: False by default. If True and *Threading* is True, the *numpy* package is required and
+          the multiprocessing workers write their outranking characteristics directly into a preallocated
+          :py:class:`multiprocessing.shared_memory.SharedMemory` block of the n x n valuation,
+          instead of pickling their partial relations to temporary files.
+          The *self.relation* slot is then, like in the *Vectorized* case, a lazy :py:class:`~digraphsTools.ArrayRelationView`.
+        * WithMarginalCharacteristics: False by default. If True, the *numpy* package is required and the weight independent
+          marginal characteristics (local concordance, veto and counter-veto states) of all pairs of actions are kept per criterion
+          in the *self.marginalCharacteristics* slot, so that the :py:meth:`~outrankingDigraphs.BipolarOutrankingDigraph.updateCriterion`
+          method may update the outranking relation in O(n^2) after editing the weight or the thresholds of a single criterion.
+          Mind the memory requirement of up to 3 x m x n^2 float values.
 
    .. warning:: The multiprocessing :py:class:`~outrankingDigraphs.BipolarOutrankingDigraph` constructor uses
         by default the 'spawn' start-mathod for threading.
@@ -4019,7 +4074,6 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
         val1 = self.runTimes['totalTime']
         val2 = self.runTimes['dataInput']
         val3 = self.runTimes['computeRelation']
-        val4 = self.runTimes['gammaSets']
         reprString += '----  Constructor run times (in sec.) ----\n'
         try:
             if self.nbrThreads > 0:
@@ -4033,7 +4087,10 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
         reprString += 'Total time       : %.5f\n' % val1
         reprString += 'Data input       : %.5f\n' % val2
         reprString += 'Compute relation : %.5f\n' % val3
-        reprString += 'Gamma sets       : %.5f\n' % val4
+        try:
+            reprString += 'Gamma sets       : %.5f\n' % self.runTimes['gammaSets']
+        except KeyError:
+            reprString += 'Gamma sets       : lazy\n'
         return reprString
     
     def __init__(self,argPerfTab=None,
@@ -4053,6 +4110,9 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
                  WithConcordanceRelation=True,
                  WithVetoCounts=True,
                  nbrCores=None,
+                 SharedMemory=False,
+                 Vectorized=False,
+                 WithMarginalCharacteristics=False,
                  Debug=False,Comments=False):
         from copy import deepcopy
         from time import time
@@ -4069,6 +4129,10 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
             perfTab = PerformanceTableau(argPerfTab)
         else:
             perfTab = argPerfTab
+        # sharing a copy-on-write view of the performance tableau
+        # instead of deep copying it
+        if CopyPerfTab:
+            perfTab = PerformanceTableauView(perfTab)
 
         # set Threading parameters
         if Threading:
@@ -4086,10 +4150,7 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
                     actions[x] = {'name': str(x)}
                 self.actions = actions
             else:
-                if CopyPerfTab:
-                    self.actions = deepcopy(perfTab.actions)
-                else:
-                    self.actions = perfTab.actions
+                self.actions = perfTab.actions
         else:
             actions = {}
             for x in actionsSubset:
@@ -4120,27 +4181,18 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
         # objectives
         if objectivesSubset is None:
             try:
-                if CopyPerfTab:
-                    self.objectives = deepcopy(perfTab.objectives)
-                else:
-                    self.objectives = perfTab.objectives
+                self.objectives = perfTab.objectives
             except:
                 pass
         else:
             objectives = OrderedDict()
             for obj in objectivesSubset:
-                if CopyPerfTab:
-                    objectives[obj] = deepcopy(perfTab.objectives[obj])
-                else:
-                    objectives[obj] = perfTab.objectives[obj]
+                objectives[obj] = perfTab.objectives[obj]
             self.objectives = objectives
                 
         # criteria coalition
         if criteriaSubset is None and objectivesSubset is None and coalition is None:
-            if CopyPerfTab:
-                self.criteria = deepcopy(perfTab.criteria)
-            else:
-                self.criteria = perfTab.criteria
+            self.criteria = perfTab.criteria
         else:
             criteria = OrderedDict()
             if criteriaSubset is None:
@@ -4160,16 +4212,10 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
                     return
                 else:
                     for g in coalition:
-                        if CopyPerfTab:
-                            criteria[g] = deepcopy(perfTab.criteria[g])
-                        else:
-                            criteria[g] = perfTab.criteria[g]
+                        criteria[g] = perfTab.criteria[g]
             else:
                 for g in criteriaSubset:
-                    if CopyPerfTab:
-                        criteria[g] = deepcopy(perfTab.criteria[g])
-                    else:
-                        criteria[g] = perfTab.criteria[g]
+                    criteria[g] = perfTab.criteria[g]
             self.criteria = criteria
         # convert criteria weights to Decimal format    
         criteria = OrderedDict()
@@ -4186,10 +4232,7 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
                 coalition += objCrit
 
         for g in coalition:
-            if CopyPerfTab:
-                criteria[g] = deepcopy(perfTab.criteria[g])
-            else:
-                criteria[g] = perfTab.criteria[g]
+            criteria[g] = perfTab.criteria[g]
                     
         self.criteria = criteria
         self.convertWeight2Decimal()
@@ -4215,17 +4258,15 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
 
         # insert performance Data
         if CopyPerfTab:
-            self.evaluation = deepcopy(perfTab.evaluation)
-            self.NA = deepcopy(perfTab.NA)
+            # ordinary dictionary of the copied evaluation rows
+            self.evaluation = dict(perfTab.evaluation.items())
         else:
             self.evaluation = perfTab.evaluation
-            self.NA = perfTab.NA
+        self.NA = perfTab.NA
         if not BigData:
             self.convertEvaluation2Decimal()
         try:
-            if CopyPerfTab:
-                self.description = deepcopy(perfTab.description)
-            elif not BigData:
+            if CopyPerfTab or not BigData:
                 self.description = perfTab.description
         except:
             pass
@@ -4242,7 +4283,24 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
         criteria = self.criteria
         evaluation = self.evaluation
         actionsKeys = list(dict.keys(actions))
-        self.relation = self._constructRelationWithThreading(criteria,\
+        # veto settings reused by the addActions method
+        self.hasNoVeto = hasNoVeto
+        self.hasBipolarVeto = hasBipolarVeto
+        if Vectorized:
+            self.nbrThreads = 0
+            self.startMethod = None
+            self.relation = self._constructRelationVectorized(criteria,\
+                                                evaluation,\
+                                                actionsKeys,\
+                                                hasNoVeto=hasNoVeto,\
+                                                hasBipolarVeto=hasBipolarVeto,\
+                                                hasSymmetricThresholds=True,\
+                                                WithConcordanceRelation=WithConcordanceRelation,\
+                                                WithVetoCounts=WithVetoCounts,\
+                                                ndigits=ndigits,\
+                                                Debug=Debug)
+        else:
+            self.relation = self._constructRelationWithThreading(criteria,\
                                                 evaluation,\
                                                 initial=actionsKeys,\
                                                 terminal=actionsKeys,\
@@ -4255,26 +4313,610 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
                                                 WithConcordanceRelation=WithConcordanceRelation,\
                                                 WithVetoCounts=WithVetoCounts,\
                                                 nbrCores=nbrCores,\
+                                                SharedMemory=SharedMemory,\
                                                 Debug=Debug,Comments=Comments)
 
         # rounding up to ndigits
-        Min = self.valuationdomain['min']
-        Max = self.valuationdomain['max']
-        self.recodeValuation(Min,Max,ndigits)
+        if isinstance(self.relation,ArrayRelationView):
+            self._recodeArrayValuation(ndigits)
+        else:
+            Min = self.valuationdomain['min']
+            Max = self.valuationdomain['max']
+            self.recodeValuation(Min,Max,ndigits)
         # finished relation computing time stamp
         self.runTimes['computeRelation'] = time() - tcp
 
-        # ----  computing the gamma sets
-        tg = time()
-        self.gamma = self.gammaSets()
-        self.notGamma = self.notGammaSets()
-        self.runTimes['gammaSets'] = time() - tg 
+        if WithMarginalCharacteristics:
+            tm = time()
+            self._computeMarginalCharacteristics()
+            self.runTimes['marginalCharacteristics'] = time() - tm
+
+        # ----  the gamma sets are computed on first access
 
         # total constructor time
         self.runTimes['totalTime'] = time() - tt
         if Comments:
             print(self)
         
+    def addActions(self,perfData,Comments=False):
+        """
+        Adds in place the decision actions of a *perfData* performance tableau,
+        gathering the new actions and their evaluations on all the criteria
+        of the outranking digraph.
+
+        Only the pairwise outranking characteristics involving a new action,
+        i.e. 2*n*k + k*k pairs when adding k actions to an outranking digraph
+        of order n, are computed. The relation, the concordance relation, the
+        vetos and negativeVetos records and the large performance differences
+        counts are patched in place, as well as the already computed gamma and
+        notGamma neighbourhoods.
+
+        >>> from randomPerfTabs import RandomPerformanceTableau
+        >>> t = RandomPerformanceTableau(numberOfActions=10,seed=1)
+        >>> g = BipolarOutrankingDigraph(t,actionsSubset=['a01','a02','a03','a04','a05','a06','a07','a08'])
+        >>> nt = PartialPerformanceTableau(t,actionsSubset=['a09','a10'])
+        >>> g.addActions(nt)
+        >>> g.order
+        10
+        >>> g.relation == BipolarOutrankingDigraph(t).relation
+        True
+
+        """
+        from time import time
+        from copy import deepcopy
+        t0 = time()
+        actions = self.actions
+        criteria = self.criteria
+        evaluation = self.evaluation
+        newKeys = [x for x in perfData.actions]
+        for x in newKeys:
+            if x in actions:
+                print('Error: action %s is already present !' % str(x))
+                return
+        for g in criteria:
+            try:
+                evg = perfData.evaluation[g]
+                for x in newKeys:
+                    evg[x]
+            except KeyError:
+                print('Error: missing evaluations on criterion %s !' % str(g))
+                return
+        # the new characteristics are computed in the decimal backend
+        backend = self.valuationBackend()
+        if backend != 'decimal':
+            vd = self.valuationdomain
+            if isinstance(self.relation,ArrayRelationView):
+                ndigits = self.relation.ndigits
+            elif backend == 'integer':
+                ndigits = len(str(vd['scale'])) - 1
+            else:
+                ndigits = vd['ndigits']
+            self.convertValuationBackend('decimal')
+        oldKeys = [x for x in actions]
+        # inserting the new actions and their evaluations
+        if isinstance(perfData.actions,list):
+            for x in newKeys:
+                actions[x] = {'name': str(x)}
+        else:
+            for x in newKeys:
+                actions[x] = deepcopy(perfData.actions[x])
+        for g in criteria:
+            evg = evaluation[g]
+            isDecimal = isinstance(next(iter(evg.values()),Decimal('0')),Decimal)
+            for x in newKeys:
+                if isDecimal:
+                    evg[x] = Decimal(str(perfData.evaluation[g][x]))
+                else:
+                    evg[x] = perfData.evaluation[g][x]
+        allKeys = oldKeys + newKeys
+        self.order = len(allKeys)
+        # kept marginal characteristics are recomputed when needed
+        self.__dict__.pop('marginalCharacteristics',None)
+
+        # computing the new pairs only
+        rowsBlock = self._constructRelationBlock(newKeys,allKeys)
+        columnsBlock = self._constructRelationBlock(oldKeys,newKeys)
+        for slot,(newRows,newColumns) in zip(('relation','concordanceRelation',
+                                              'largePerformanceDifferencesCount'),
+                                             zip(rowsBlock,columnsBlock)):
+            if newRows is None:
+                continue
+            current = getattr(self,slot)
+            if isinstance(current,ArrayRelationView):
+                setattr(self,slot,self._resizeArrayView(current,allKeys,
+                                                        newRows,newColumns))
+            else:
+                for x in oldKeys:
+                    current[x].update(newColumns[x])
+                current.update(newRows)
+        for slot,newRecords,newColumnsRecords in zip(('vetos','negativeVetos'),
+                                                     rowsBlock[3:],columnsBlock[3:]):
+            if newRecords is not None:
+                getattr(self,slot).extend(newRecords + newColumnsRecords)
+        if isinstance(self.relation,ArrayRelationView):
+            self.valuation = self.relation.array
+            self.resetNeighbourhoods()
+        else:
+            self._patchNeighbourhoods(addedKeys=newKeys)
+        if backend != 'decimal':
+            self.convertValuationBackend(backend,ndigits=ndigits)
+        t = time() - t0
+        self.runTimes['addActions'] = t
+        self.runTimes['totalTime'] += t
+        if Comments:
+            print('Added %d actions in %.5f sec.' % (len(newKeys),t))
+
+    def removeActions(self,keys,Comments=False):
+        """
+        Removes in place the decision actions *keys* (list of action keys)
+        from the outranking digraph.
+
+        The relation, the concordance relation, the vetos and negativeVetos
+        records, the large performance differences counts and the already
+        computed gamma and notGamma neighbourhoods are patched in place;
+        no outranking characteristic is recomputed.
+        """
+        from time import time
+        t0 = time()
+        actions = self.actions
+        removed = set()
+        for x in keys:
+            if x not in actions:
+                print('Error: action %s is not present !' % str(x))
+                return
+            removed.add(x)
+        keptKeys = [x for x in actions if x not in removed]
+        self.__dict__.pop('marginalCharacteristics',None)
+        for slot in ('relation','concordanceRelation',
+                     'largePerformanceDifferencesCount'):
+            current = getattr(self,slot,None)
+            if current is None:
+                continue
+            if isinstance(current,ArrayRelationView):
+                setattr(self,slot,self._resizeArrayView(current,keptKeys))
+            else:
+                for x in removed:
+                    del current[x]
+                for x in keptKeys:
+                    cx = current[x]
+                    for y in removed:
+                        del cx[y]
+        for slot in ('vetos','negativeVetos'):
+            records = getattr(self,slot,None)
+            if records is not None:
+                records[:] = [record for record in records
+                              if record[0][0] not in removed
+                              and record[0][1] not in removed]
+        for x in removed:
+            del actions[x]
+        for g in self.criteria:
+            evg = self.evaluation[g]
+            for x in removed:
+                del evg[x]
+        self.order = len(keptKeys)
+        if isinstance(self.relation,ArrayRelationView):
+            self.valuation = self.relation.array
+            self.resetNeighbourhoods()
+        else:
+            self._patchNeighbourhoods(removedKeys=removed)
+        t = time() - t0
+        self.runTimes['removeActions'] = t
+        self.runTimes['totalTime'] += t
+        if Comments:
+            print('Removed %d actions in %.5f sec.' % (len(removed),t))
+
+    def updateCriterion(self,g,weight=None,thresholds=None,Comments=False):
+        """
+        Updates in place the outranking digraph after editing the significance
+        *weight* and/or the discrimination *thresholds* of criterion *g*.
+
+        *thresholds* is a dictionary like {'ind': (a,b), 'veto': (a,b), ...};
+        a None value removes the corresponding threshold.
+
+        The global valuation, the concordance relation, the vetos and
+        negativeVetos records and the large performance differences counts
+        are recomputed from the marginal characteristics of all the pairs of
+        actions kept per criterion (see the *WithMarginalCharacteristics*
+        parameter of the constructor), so that only the marginal
+        characteristics of criterion *g* are recomputed, and only when its
+        thresholds or its preference direction change.
+        When the marginal characteristics are not yet kept, they are
+        computed on the first update.
+
+        >>> from randomPerfTabs import RandomCBPerformanceTableau
+        >>> t = RandomCBPerformanceTableau(numberOfActions=10,seed=1)
+        >>> g = BipolarOutrankingDigraph(t,WithMarginalCharacteristics=True)
+        >>> g.updateCriterion('c1',weight=10,thresholds={'veto': None})
+        >>> g.criteria['c1']['weight']
+        Decimal('10')
+
+        """
+        from time import time
+        import numpy as np
+        criteria = self.criteria
+        if g not in criteria:
+            print('Error: criterion %s is not present !' % str(g))
+            return
+        t0 = time()
+        try:
+            marginals = self.marginalCharacteristics
+        except AttributeError:
+            marginals = self._computeMarginalCharacteristics()
+        crit = criteria[g]
+        oldWeight = crit['weight']
+        oldSign = oldWeight > Decimal('0')
+        if weight is not None:
+            crit['weight'] = Decimal(str(weight))
+        UpdateMarginals = (crit['weight'] > Decimal('0')) != oldSign
+        if thresholds is not None:
+            UpdateMarginals = True
+            critThresholds = crit.setdefault('thresholds',{})
+            for key,value in thresholds.items():
+                if value is None:
+                    critThresholds.pop(key,None)
+                else:
+                    critThresholds[key] = (Decimal(str(value[0])),
+                                           Decimal(str(value[1])))
+        concordance = marginals['concordance']
+        concordance -= marginals['lc'][g] * float(abs(oldWeight))
+        if UpdateMarginals:
+            previousStates = (marginals['veto'][g],marginals['negativeVeto'][g])
+            self._setCriterionMarginals(marginals,g,Sign=-1)
+            hasNoVeto = getattr(self,'hasNoVeto',False)
+            hasBipolarVeto = getattr(self,'hasBipolarVeto',True)
+            for c,lc,veto,negativeVeto in self._iterArrayMarginalCharacteristics(
+                                        {g: crit},self.evaluation,
+                                        marginals['actionsKeys'],
+                                        hasNoVeto=hasNoVeto,
+                                        hasBipolarVeto=hasBipolarVeto):
+                marginals['lc'][g] = lc
+                marginals['veto'][g] = veto
+                marginals['negativeVeto'][g] = negativeVeto
+            self._setCriterionMarginals(marginals,g,Sign=1)
+            if 'pairwiseVetoes' in marginals:
+                self._updatePairwiseVetoes(marginals,g,previousStates)
+        concordance += marginals['lc'][g] * float(abs(crit['weight']))
+        self._updateRelationFromMarginals()
+        t = time() - t0
+        self.runTimes['updateCriterion'] = t
+        self.runTimes['totalTime'] += t
+        if Comments:
+            print('Criterion %s updated in %.5f sec.' % (str(g),t))
+
+    def _computeMarginalCharacteristics(self):
+        """
+        Computes and stores in the *self.marginalCharacteristics* slot the
+        marginal characteristics of all pairs of actions per criterion,
+        their weighted concordance sum and the counts of large performance
+        differences, vetoes and counter-vetoes.
+        """
+        import numpy as np
+        actionsKeys = [x for x in self.actions]
+        n = len(actionsKeys)
+        criteria = self.criteria
+        marginals = {'actionsKeys': actionsKeys,
+                     'lc': {}, 'veto': {}, 'negativeVeto': {},
+                     'concordance': np.zeros((n,n)),
+                     'negativeCounts': np.zeros((n,n),dtype=np.int32),
+                     'positiveCounts': np.zeros((n,n),dtype=np.int32),
+                     'vetoCounts': np.zeros((n,n),dtype=np.int32),
+                     'counterVetoCounts': np.zeros((n,n),dtype=np.int32)}
+        for c,lc,veto,negativeVeto in self._iterArrayMarginalCharacteristics(
+                                    criteria,self.evaluation,actionsKeys,
+                                    hasNoVeto=getattr(self,'hasNoVeto',False),
+                                    hasBipolarVeto=getattr(self,'hasBipolarVeto',True)):
+            marginals['lc'][c] = lc
+            marginals['veto'][c] = veto
+            marginals['negativeVeto'][c] = negativeVeto
+            marginals['concordance'] += lc * float(abs(criteria[c]['weight']))
+            self._setCriterionMarginals(marginals,c,Sign=1)
+        self.marginalCharacteristics = marginals
+        return marginals
+
+    @staticmethod
+    def _setCriterionMarginals(marginals,c,Sign=1):
+        """
+        Adds (*Sign* = 1) or removes (*Sign* = -1) the veto states of
+        criterion *c* to or from the counts of the *marginals* dictionary.
+        """
+        veto = marginals['veto'][c]
+        if veto is None:
+            return
+        marginals['negativeCounts'] += Sign * (veto > -1.0)
+        marginals['vetoCounts'] += Sign * (veto > 0.0)
+        negativeVeto = marginals['negativeVeto'][c]
+        if negativeVeto is not None:
+            marginals['positiveCounts'] += Sign * (negativeVeto > -1.0)
+            marginals['counterVetoCounts'] += Sign * (negativeVeto > 0.0)
+
+    def _updateRelationFromMarginals(self):
+        """
+        Recomputes the relation, the concordance relation, the vetos and
+        negativeVetos records and the large performance differences counts
+        from the kept marginal characteristics, the same way as the
+        *_constructRelationVectorized* method does.
+        """
+        import numpy as np
+        marginals = self.marginalCharacteristics
+        actionsKeys = marginals['actionsKeys']
+        hasNoVeto = getattr(self,'hasNoVeto',False)
+        hasBipolarVeto = getattr(self,'hasBipolarVeto',True)
+        criteria = self.criteria
+        vd = self.valuationdomain
+        backend = self.valuationBackend()
+        if backend == 'integer':
+            scale = vd['scale']
+            Max = float(vd['max'])/scale
+        else:
+            Max = float(vd['max'])
+        ndigits = self.ndigits
+        formatString = '%%.%df' % ndigits
+        totalweight = float(sum(abs(criteria[c]['weight']) for c in criteria))
+        if totalweight != 0.0:
+            concordIndex = marginals['concordance'] / totalweight
+        else:
+            concordIndex = marginals['concordance'].copy()
+        concordIndex = np.round(concordIndex,12)
+        np.fill_diagonal(concordIndex,0.0)
+        vetoIndex = np.full(concordIndex.shape,-1.0)
+        if not hasBipolarVeto:
+            for veto in marginals['veto'].values():
+                if veto is not None:
+                    np.maximum(vetoIndex,veto,out=vetoIndex)
+        outrankIndex = self._arrayOutrankingIndex(concordIndex,
+                                                  marginals['vetoCounts'] > 0,
+                                                  marginals['counterVetoCounts'] > 0,
+                                                  vetoIndex,
+                                                  hasBipolarVeto=hasBipolarVeto)
+        np.fill_diagonal(outrankIndex,0.0)
+        valuation = np.round(outrankIndex * Max,ndigits)
+
+        # relation
+        relation = self.relation
+        if isinstance(relation,ArrayRelationView):
+            relation.array[:,:] = valuation
+            self.valuation = relation.array
+        else:
+            if backend == 'float':
+                def _encode(v):
+                    return round(v,vd['ndigits'])
+            elif backend == 'integer':
+                def _encode(v):
+                    return int(round(v*scale))
+            else:
+                domain = dict([(float(vd[key]),vd[key])
+                               for key in ('min','med','max')])
+                def _encode(v):
+                    try:
+                        return domain[v]
+                    except KeyError:
+                        return Decimal(formatString % v)
+            for i,x in enumerate(actionsKeys):
+                rx = relation[x]
+                for j,v in enumerate(valuation[i].tolist()):
+                    rx[actionsKeys[j]] = _encode(v)
+
+        # concordance relation and vetoes
+        if isinstance(relation,ArrayRelationView):
+            def _concordValue(i,j):
+                return Decimal(formatString % (concordIndex[i,j]*Max))
+        else:
+            # dict-backed digraphs keep the Decimal precision of the constructor
+            weightSum = sum(abs(criteria[c]['weight']) for c in criteria)
+            numerators = np.round(marginals['concordance'],12)
+            decimalMax = Decimal(repr(Max))
+            def _concordDecimal(i,j):
+                numerator = Decimal(repr(numerators[i,j].item()))
+                if weightSum != Decimal('0'):
+                    return numerator / weightSum
+                return numerator
+            def _concordValue(i,j):
+                try:
+                    return self.concordanceRelation[actionsKeys[i]][actionsKeys[j]]*decimalMax
+                except AttributeError:
+                    return _concordDecimal(i,j)*decimalMax
+        if 'concordanceRelation' in self.__dict__:
+            if isinstance(self.concordanceRelation,ArrayRelationView):
+                self.concordanceRelation = ArrayRelationView(concordIndex,
+                                                             actionsKeys,
+                                                             ndigits=ndigits)
+            else:
+                # only the changed pairs are rewritten
+                concordanceRelation = self.concordanceRelation
+                for i,x in enumerate(actionsKeys):
+                    crx = concordanceRelation[x]
+                    for j,v in enumerate(concordIndex[i].tolist()):
+                        y = actionsKeys[j]
+                        if abs(float(crx[y]) - v) > 1e-12:
+                            crx[y] = _concordDecimal(i,j)
+        if 'largePerformanceDifferencesCount' in self.__dict__:
+            counts = _PerformanceDifferencesCountView(
+                np.stack((marginals['positiveCounts'],
+                          -marginals['negativeCounts']),axis=-1),
+                actionsKeys)
+            if isinstance(self.largePerformanceDifferencesCount,ArrayRelationView):
+                self.largePerformanceDifferencesCount = counts
+            else:
+                self.largePerformanceDifferencesCount = counts.todict()
+        if 'vetos' in self.__dict__:
+            try:
+                pairwiseVetoes = marginals['pairwiseVetoes']
+            except KeyError:
+                pairwiseVetoes = {}
+                rows,cols = np.nonzero((marginals['negativeCounts'] != 0) |
+                                       (marginals['positiveCounts'] != 0))
+                for i,j in zip(rows.tolist(),cols.tolist()):
+                    pairwiseVetoes[(i,j)] = self._pairwiseVetoes(
+                                            actionsKeys[i],actionsKeys[j],
+                                            hasNoVeto=hasNoVeto)
+                marginals['pairwiseVetoes'] = pairwiseVetoes
+            vetos = []
+            negativeVetos = []
+            for (i,j),(abVetoes,abNegativeVetoes) in sorted(pairwiseVetoes.items()):
+                concordValue = _concordValue(i,j)
+                if abVetoes != []:
+                    vetos.append(([actionsKeys[i],actionsKeys[j],concordValue],
+                                  abVetoes))
+                if hasBipolarVeto and abNegativeVetoes != []:
+                    negativeVetos.append(([actionsKeys[i],actionsKeys[j],concordValue],
+                                          abNegativeVetoes))
+            self.vetos = vetos
+            if hasBipolarVeto:
+                self.negativeVetos = negativeVetos
+        self.resetNeighbourhoods()
+
+    def _updatePairwiseVetoes(self,marginals,g,previousStates):
+        """
+        Updates the cached pairwise veto situations of the *marginals*
+        dictionary on the pairs where criterion *g* shows, before or after
+        its update, a considerable performance difference.
+        """
+        import numpy as np
+        actionsKeys = marginals['actionsKeys']
+        pairwiseVetoes = marginals['pairwiseVetoes']
+        criteriaIndex = dict([(c,k) for k,c in enumerate(self.criteria)])
+        states = [state for state in previousStates +
+                  (marginals['veto'][g],marginals['negativeVeto'][g])
+                  if state is not None]
+        if states == []:
+            return
+        mask = np.zeros(states[0].shape,dtype=bool)
+        for state in states:
+            mask |= state > -1.0
+        restriction = {g: self.criteria[g]}
+        hasNoVeto = getattr(self,'hasNoVeto',False)
+        rows,cols = np.nonzero(mask)
+        for i,j in zip(rows.tolist(),cols.tolist()):
+            abVetoes,abNegativeVetoes = pairwiseVetoes.get((i,j),([],[]))
+            gVetoes,gNegativeVetoes = self._pairwiseVetoes(actionsKeys[i],
+                                        actionsKeys[j],hasNoVeto=hasNoVeto,
+                                        criteria=restriction)
+            abVetoes = [item for item in abVetoes if item[0] != g] + gVetoes
+            abVetoes.sort(key=lambda item: criteriaIndex[item[0]])
+            abNegativeVetoes = [item for item in abNegativeVetoes
+                                if item[0] != g] + gNegativeVetoes
+            abNegativeVetoes.sort(key=lambda item: criteriaIndex[item[0]])
+            if abVetoes == [] and abNegativeVetoes == []:
+                pairwiseVetoes.pop((i,j),None)
+            else:
+                pairwiseVetoes[(i,j)] = (abVetoes,abNegativeVetoes)
+
+    def _constructRelationBlock(self,initial,terminal):
+        """
+        Renders the relation, concordance relation, large performance
+        differences counts, vetos and negativeVetos records restricted to
+        the pairs (x,y) with x in *initial* and y in *terminal*, rounded
+        like the constructor does. The attributes which are not stored
+        in the outranking digraph are rendered as None.
+        """
+        slots = ('concordanceRelation','largePerformanceDifferencesCount',
+                 'vetos','negativeVetos')
+        saved = dict([(slot,self.__dict__[slot]) for slot in slots
+                      if slot in self.__dict__])
+        hasBipolarVeto = getattr(self,'hasBipolarVeto',True)
+        relation = self._constructRelation(self.criteria,self.evaluation,
+                                initial=initial,terminal=terminal,
+                                hasNoVeto=getattr(self,'hasNoVeto',False),
+                                hasBipolarVeto=hasBipolarVeto,
+                                WithConcordanceRelation='concordanceRelation' in saved,
+                                WithVetoCounts='vetos' in saved)
+        block = [relation]
+        for slot in slots:
+            if slot in saved:
+                block.append(self.__dict__[slot])
+                self.__dict__[slot] = saved[slot]
+            else:
+                block.append(None)
+        # same rounding as the recodeValuation method
+        vd = self.valuationdomain
+        formatString = '%%.%df' % self.ndigits
+        Min = vd['min']
+        Med = vd['med']
+        Max = vd['max']
+        for x in relation:
+            rx = relation[x]
+            for y in rx:
+                if rx[y] != Min and rx[y] != Med and rx[y] != Max:
+                    rx[y] = Decimal(formatString % rx[y])
+        # the vectorized constructor rounds the concordance of the veto records
+        if isinstance(self.relation,ArrayRelationView):
+            for records in block[3:]:
+                if records is not None:
+                    for record in records:
+                        record[0][2] = Decimal(formatString % record[0][2])
+        return block
+
+    def _resizeArrayView(self,view,keys,newRows=None,newColumns=None):
+        """
+        Renders a copy of an :py:class:`~digraphsTools.ArrayRelationView` *view*
+        restricted to, or extended to, the list of action *keys*.
+        The entries of new actions are given by the *newRows* and
+        *newColumns* dictionaries.
+        """
+        import numpy as np
+        oldIndex = view.index
+        n = len(keys)
+        array = np.zeros((n,n) + view.array.shape[2:],dtype=view.array.dtype)
+        kept = [i for i,x in enumerate(keys) if x in oldIndex]
+        old = [oldIndex[keys[i]] for i in kept]
+        array[np.ix_(kept,kept)] = view.array[np.ix_(old,old)]
+        newView = view.__class__(array,keys,ndigits=view.ndigits,
+                                 backend=view.backend)
+        if newRows is not None:
+            if view.__class__ is _PerformanceDifferencesCountView:
+                def encode(v):
+                    return (v['positive'],v['negative'])
+            else:
+                encode = newView._encode
+            index = newView.index
+            for block in (newRows,newColumns):
+                for x in block:
+                    i = index[x]
+                    for y,v in block[x].items():
+                        array[i,index[y]] = encode(v)
+        return newView
+
+    def _patchNeighbourhoods(self,addedKeys=(),removedKeys=()):
+        """
+        Updates in place the already computed gamma and notGamma
+        neighbourhoods after adding or removing actions.
+        """
+        cached = self.__dict__
+        if 'gamma' not in cached and 'notGamma' not in cached:
+            return
+        Med = self.valuationdomain['med']
+        relation = self.relation
+        added = set(addedKeys)
+        removed = set(removedKeys)
+        oldKeys = [x for x in self.actions if x not in added]
+        for slot,polarity in (('gamma',1),('notGamma',-1)):
+            if slot not in cached:
+                continue
+            neighbourhoods = cached[slot]
+            if removed:
+                for x in removed:
+                    del neighbourhoods[x]
+                for x in neighbourhoods:
+                    dx,ax = neighbourhoods[x]
+                    dx -= removed
+                    ax -= removed
+            for x in oldKeys:
+                dx,ax = neighbourhoods[x]
+                rx = relation[x]
+                for y in addedKeys:
+                    if (rx[y] - Med)*polarity > 0:
+                        dx.add(y)
+                    if (relation[y][x] - Med)*polarity > 0:
+                        ax.add(y)
+            for x in addedKeys:
+                rx = relation[x]
+                neighbourhoods[x] = (
+                    set([y for y in self.actions
+                         if y != x and (rx[y] - Med)*polarity > 0]),
+                    set([y for y in self.actions
+                         if y != x and (relation[y][x] - Med)*polarity > 0]))
+        cached.pop('neighbourhoodBitsets',None)
+
     def computeCriterionRelation(self,c,a,b,hasSymmetricThresholds=True):
         """
         Compute the outranking characteristic for actions x and y
@@ -4338,7 +4980,9 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
                            tempDir=None,
                            WithConcordanceRelation=True,
                            WithVetoCounts=True,
-                           nbrCores=None,Comments=False):
+                           nbrCores=None,
+                           SharedMemory=False,
+                           Comments=False):
         """
         Specialization of the corresponding BipolarOutrankingDigraph method
         """
@@ -4370,6 +5014,16 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
                                     Debug=Debug,\
                                     hasSymmetricThresholds=hasSymmetricThresholds)
         ##
+        elif SharedMemory: # parallel computation in a shared valuation array
+            return self._constructRelationWithSharedMemory(criteria,\
+                                    evaluation,\
+                                    initial=initial,\
+                                    hasNoVeto=hasNoVeto,\
+                                    hasBipolarVeto=hasBipolarVeto,\
+                                    hasSymmetricThresholds=hasSymmetricThresholds,\
+                                    startMethod=startMethod,\
+                                    nbrCores=nbrCores,\
+                                    Debug=Debug,Comments=Comments)
         else:  # parallel computation
             from copy import copy, deepcopy
             from io import BytesIO
@@ -4510,6 +5164,74 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
                                 rx[y] = sprx[y]   
                 return relation
 
+    def _constructRelationWithSharedMemory(self,criteria,
+                           evaluation,
+                           initial=None,
+                           hasNoVeto=False,
+                           hasBipolarVeto=True,
+                           hasSymmetricThresholds=True,
+                           startMethod=None,
+                           nbrCores=None,
+                           Debug=False,Comments=False):
+        """
+        Multiprocessing construction of the bipolar valued outranking relation
+        where each worker writes its rows of outranking characteristics
+        directly into a preallocated shared memory n x n float valuation array.
+
+        Renders a lazy :py:class:`~digraphsTools.ArrayRelationView`
+        on a private copy of the shared valuation array.
+        """
+        import numpy as np
+        from multiprocessing import shared_memory
+        if initial is None:
+            initial = self.actions
+        actionsKeys = list(initial)
+        n = len(actionsKeys)
+        # setting default start method
+        if startMethod is None:
+            startMethod = 'spawn'
+        mpctx = mp.get_context(startMethod)
+        self.startMethod = mpctx.get_start_method()
+        if nbrCores is None:
+            nbrCores = mpctx.cpu_count()
+        nbrOfJobs = max(1,min(nbrCores,n))
+        self.nbrThreads = nbrOfJobs
+        if Comments:
+            print('Threading with shared memory ...')
+            print('Nbr of cpus = ',nbrCores)
+            print('nbr of jobs = ',nbrOfJobs)
+        splitIndex = qtilingIndexList(actionsKeys,nbrOfJobs)
+        shm = shared_memory.SharedMemory(create=True,size=max(1,n*n*8))
+        try:
+            sharedValuation = np.ndarray((n,n),dtype=np.float64,buffer=shm.buf)
+            sharedValuation[:] = float(self.valuationdomain['med'])
+            jobs = []
+            for j in range(nbrOfJobs):
+                splitThread = mpctx.Process(target=_sharedMemoryRelationWorker,
+                                        args=(j,self,actionsKeys,
+                                              shm.name,splitIndex[j],
+                                              hasNoVeto,hasBipolarVeto,
+                                              hasSymmetricThresholds,Debug))
+                splitThread.start()
+                jobs.append(splitThread)
+            for splitThread in jobs:
+                splitThread.join()
+            if Comments:    
+                print('Exiting computing threads')
+            for j,splitThread in enumerate(jobs):
+                if splitThread.exitcode != 0:
+                    print('Error: shared memory worker %d failed; recomputing its rows' % j)
+                    _sharedMemoryRelationWorker(j,self,actionsKeys,
+                                                shm.name,splitIndex[j],
+                                                hasNoVeto,hasBipolarVeto,
+                                                hasSymmetricThresholds,Debug)
+            valuation = np.array(sharedValuation)
+            del sharedValuation
+        finally:
+            shm.close()
+            shm.unlink()
+        return ArrayRelationView(valuation,actionsKeys,ndigits=self.ndigits)
+
     def _constructRelationSimple(self,criteria,
                            evaluation,
                            initial=None,
@@ -4690,11 +5412,15 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
             
         """
         from digraphsTools import omax,omin
+        from perfTabs import _readOnlyDict
         ## default setting for digraphs
         if initial is None:
             initial = self.actions
         if terminal is None:
             terminal = self.actions
+        # nothing is written below: read copy-on-write views directly
+        criteria = {c: _readOnlyDict(crit) for c,crit in criteria.items()}
+        evaluation = {c: _readOnlyDict(evaluation[c]) for c in criteria}
         
 ##        totalweight = Decimal('0.0')
 ##        for c in dict.keys(criteria):
@@ -4877,6 +5603,409 @@ class BipolarOutrankingDigraph(OutrankingDigraph):
 
 
     
+    def _constructRelationVectorized(self,criteria,
+                                     evaluation,
+                                     actionsKeys,
+                                     hasNoVeto=False,
+                                     hasBipolarVeto=True,
+                                     hasSymmetricThresholds=True,
+                                     WithConcordanceRelation=True,
+                                     WithVetoCounts=True,
+                                     ndigits=4,
+                                     Debug=False):
+        """
+        Renders the bipolar valued outranking relation as a lazy
+        :py:class:`~digraphsTools.ArrayRelationView` on a float n x n *numpy* array.
+
+        The local concordance, veto and counter-veto characteristics
+        of all pairs of actions are computed in one batched pass per criterion
+        (see *_iterArrayMarginalCharacteristics*).
+        The semantics are the same as in the
+        :py:meth:`~outrankingDigraphs.BipolarOutrankingDigraph._constructRelation` method.
+
+        Parameters:
+            * criteria, evaluation: the performance tableau data,
+            * actionsKeys: the ordered list of action keys,
+            * ndigits: rounding precision of the characteristic values.
+        
+        """
+        import numpy as np
+        from digraphsTools import ArrayRelationView
+        n = len(actionsKeys)
+        Max = float(self.valuationdomain['max'])
+        totalweight = float(sum(abs(criteria[c]['weight']) for c in criteria))
+
+        concordance = np.zeros((n,n),dtype=np.float64)
+        # counts of considerable negative and positive performance differences
+        negativeCounts = np.zeros((n,n),dtype=np.int32)
+        positiveCounts = np.zeros((n,n),dtype=np.int32)
+        # counts of vetoes and counter-vetoes
+        vetoCounts = np.zeros((n,n),dtype=np.int32)
+        counterVetoCounts = np.zeros((n,n),dtype=np.int32)
+        # Electre like veto index
+        vetoIndex = np.full((n,n),-1.0)
+        
+        for c,lc,veto,negativeVeto in self._iterArrayMarginalCharacteristics(
+                                        criteria,evaluation,actionsKeys,
+                                        hasNoVeto=hasNoVeto,
+                                        hasBipolarVeto=hasBipolarVeto,
+                                        hasSymmetricThresholds=hasSymmetricThresholds):
+            concordance += lc * abs(float(criteria[c]['weight']))
+            if veto is None:
+                continue
+            negativeCounts += veto > -1.0
+            vetoCounts += veto > 0.0
+            np.maximum(vetoIndex,veto,out=vetoIndex)
+            if hasBipolarVeto:
+                positiveCounts += negativeVeto > -1.0
+                counterVetoCounts += negativeVeto > 0.0
+
+        if totalweight != 0.0:
+            concordIndex = concordance / totalweight
+        else:
+            concordIndex = concordance
+        # guarding the median against floating point residues
+        concordIndex = np.round(concordIndex,12)
+        np.fill_diagonal(concordIndex,0.0)
+
+        outrankIndex = self._arrayOutrankingIndex(concordIndex,
+                                                  vetoCounts > 0,
+                                                  counterVetoCounts > 0,
+                                                  vetoIndex,
+                                                  hasBipolarVeto=hasBipolarVeto)
+        np.fill_diagonal(outrankIndex,0.0)
+        valuation = outrankIndex * Max
+        if Debug:
+            print(valuation)
+        formatString = '%%.%df' % ndigits
+
+        # storing concordance relation and vetoes
+        if WithConcordanceRelation:
+            self.concordanceRelation = ArrayRelationView(concordIndex,
+                                                         actionsKeys,
+                                                         ndigits=ndigits)
+        if WithVetoCounts:
+            self.largePerformanceDifferencesCount = \
+                _PerformanceDifferencesCountView(
+                    np.stack((positiveCounts,-negativeCounts),axis=-1),
+                    actionsKeys)
+            vetos,negativeVetos = self._arrayVetoRecords(concordIndex,
+                                        negativeCounts,positiveCounts,
+                                        actionsKeys,Max,
+                                        hasNoVeto=hasNoVeto,
+                                        hasBipolarVeto=hasBipolarVeto,
+                                        hasSymmetricThresholds=hasSymmetricThresholds,
+                                        ndigits=ndigits)
+            self.vetos = vetos
+            if hasBipolarVeto:
+                self.negativeVetos = negativeVetos
+
+        return ArrayRelationView(valuation,actionsKeys,ndigits=ndigits)
+
+    def _arrayVetoRecords(self,concordIndex,negativeCounts,positiveCounts,
+                          actionsKeys,Max,
+                          hasNoVeto=False,
+                          hasBipolarVeto=True,
+                          hasSymmetricThresholds=True,
+                          ndigits=4):
+        """
+        Renders the *vetos* and *negativeVetos* records of the pairs of
+        actions showing considerable performance differences, given the
+        n x n concordance index and counts arrays.
+        """
+        import numpy as np
+        formatString = '%%.%df' % ndigits
+        vetos = []
+        negativeVetos = []
+        rows,cols = np.nonzero((negativeCounts != 0) | (positiveCounts != 0))
+        for i,j in zip(rows.tolist(),cols.tolist()):
+            a = actionsKeys[i]
+            b = actionsKeys[j]
+            abVetoes,abNegativeVetoes = self._pairwiseVetoes(a,b,
+                                    hasNoVeto=hasNoVeto,
+                                    hasSymmetricThresholds=hasSymmetricThresholds)
+            concordValue = Decimal(formatString % (concordIndex[i,j]*Max))
+            if abVetoes != []:
+                vetos.append(([a,b,concordValue],abVetoes))
+            if hasBipolarVeto and abNegativeVetoes != []:
+                negativeVetos.append(([a,b,concordValue],abNegativeVetoes))
+        return vetos,negativeVetos
+
+    def _iterArrayMarginalCharacteristics(self,criteria,evaluation,actionsKeys,
+                                          hasNoVeto=False,
+                                          hasBipolarVeto=True,
+                                          hasSymmetricThresholds=True,
+                                          columnsKeys=None,
+                                          evaluationArrays=None):
+        """
+        Generator of the weight independent marginal characteristics of all
+        pairs of actions, criterion by criterion.
+
+        Yields tuples (c, lc, veto, negativeVeto) of n x n *numpy* arrays,
+        where *lc* is the local concordance (0.0 with missing evaluations),
+        *veto* and *negativeVeto* the local veto and counter-veto states
+        (-1.0 with missing evaluations). *veto* and *negativeVeto* are None
+        when the criterion has no veto thresholds or *hasNoVeto* is True,
+        *negativeVeto* is None when *hasBipolarVeto* is False.
+
+        When a list of *columnsKeys* is given, the arrays are rectangular
+        and concern the pairs (x,y) with x in *actionsKeys* and y in *columnsKeys*.
+
+        When a dictionary of *evaluationArrays* is given, its entry c holds the
+        float64 *numpy* arrays of the evaluations of the *actionsKeys* and of the
+        *columnsKeys* on criterion c, and the *evaluation* dictionary is not used.
+        """
+        import numpy as np
+        NA = float(self.NA)
+        for c,crit in criteria.items():
+            if evaluationArrays is not None:
+                ev,evy = evaluationArrays[c]
+            else:
+                ev = np.array([float(evaluation[c][x]) for x in actionsKeys],
+                              dtype=np.float64).reshape(len(actionsKeys))
+                if columnsKeys is None:
+                    evy = ev
+                else:
+                    evy = np.array([float(evaluation[c][y]) for y in columnsKeys],
+                                   dtype=np.float64).reshape(len(columnsKeys))
+            valid = ev != NA
+            validy = evy != NA
+            validAB = np.logical_and.outer(valid,validy)
+            absEv = np.abs(ev)
+            absEvy = np.abs(evy)
+            maxAB = np.maximum.outer(absEv,absEvy)
+            if hasSymmetricThresholds:
+                base = maxAB
+            else:
+                base = absEv[:,np.newaxis]
+            # tolerance for comparing float differences with thresholds
+            # the same way as exact Decimal differences
+            eps = 1e-9 * (1.0 + max(float(absEv[valid].max(initial=0.0)),
+                                    float(absEvy[validy].max(initial=0.0))))
+            ind = self._arrayThreshold(crit,'ind',maxAB)
+            wp = self._arrayThreshold(crit,'weakPreference',base)
+            p = self._arrayThreshold(crit,'pref',base)
+            if crit['weight'] > Decimal('0.0'):
+                d = np.subtract.outer(ev,evy)
+            else:
+                d = np.subtract.outer(ev,evy) * -1.0
+            lc = np.where(validAB,self._arrayLocalConcordance(d,ind,wp,p,eps),0.0)
+            veto = None
+            negativeVeto = None
+            if not hasNoVeto:
+                wv = self._arrayThreshold(crit,'weakVeto',base)
+                v = self._arrayThreshold(crit,'veto',base)
+                if wv is not None or v is not None:
+                    veto = np.where(validAB,self._arrayLocalVeto(d,wv,v,eps),-1.0)
+                    if hasBipolarVeto:
+                        negativeVeto = np.where(validAB,
+                                                self._arrayLocalVeto(-d,wv,v,eps),-1.0)
+            yield c,lc,veto,negativeVeto
+
+    @staticmethod
+    def _arrayOutrankingIndex(concordIndex,hasVeto,hasCounterVeto,vetoIndex,
+                              hasBipolarVeto=True):
+        """
+        Array version of the epistemic fusion of the concordance index with
+        the veto and counter-veto states (see *_constructRelation*).
+        The veto arrays are broadcasted against the *concordIndex* array.
+        """
+        import numpy as np
+        if hasBipolarVeto:
+            positive = (concordIndex > 0.0) | hasCounterVeto
+            negative = (concordIndex < 0.0) | hasVeto
+            return np.where(positive & ~negative,
+                            np.where(hasCounterVeto,1.0,concordIndex),
+                            np.where(negative & ~positive,
+                                     np.where(hasVeto,-1.0,concordIndex),
+                                     0.0))
+        else:
+            return np.minimum(concordIndex,-vetoIndex)
+
+    def _computeArrayCLTLikelihoods(self,concordanceRelation,
+                                    distribution='triangular',
+                                    betaParameter=2,
+                                    Debug=False):
+        """
+        Vectorized computation of the pairwise CLT likelihoods of the
+        at least as good as relation for all the pairs (x,y) of the
+        *concordanceRelation* (dictionary of dictionaries).
+
+        The mean of the marginal concordance sum is the concordance
+        characteristic recoded into [-sum of weights; +sum of weights],
+        its variance the sum of the squared weights of the criteria with
+        non zero marginal characteristic, multiplied by the variance factor
+        of the weights *distribution*: 1/3 (uniform), 1/6 (triangular)
+        or 1/(2a+1) (beta with a = b = *betaParameter*).
+
+        Renders the same likelihoods as the non vectorized
+        *computeCLTLikelihoods* methods.
+        """
+        import numpy as np
+        from math import erf
+        if distribution == 'uniform':
+            varFactor = 1.0/3.0
+        elif distribution == 'triangular':
+            varFactor = 1.0/6.0
+        elif distribution == 'beta':
+            varFactor = 1.0/(2.0*float(betaParameter) + 1.0)
+        else:
+            print('Error: invalid distribution %s' % distribution)
+            return None
+        rowsKeys = [x for x in concordanceRelation]
+        columnsKeys = [y for y in dict.fromkeys(y for x in rowsKeys
+                                                for y in concordanceRelation[x])]
+        columnsIndex = dict([(y,j) for j,y in enumerate(columnsKeys)])
+        # means of the marginal concordance sums
+        r = np.zeros((len(rowsKeys),len(columnsKeys)))
+        for i,x in enumerate(rowsKeys):
+            rx = concordanceRelation[x]
+            r[i,[columnsIndex[y] for y in rx]] = [float(rx[y]) for y in rx]
+        vd = self.valuationdomain
+        oldMin = float(vd['min'])
+        oldAmplitude = float(vd['max']) - oldMin
+        criteria = self.criteria
+        sumWeights = float(sum([abs(criteria[g]['weight']) for g in criteria]))
+        means = -sumWeights + ((r - oldMin)/oldAmplitude) * (2.0 * sumWeights)
+        # variances of the marginal concordance sums
+        variances = np.zeros(r.shape)
+        for g,lc,veto,negativeVeto in self._iterArrayMarginalCharacteristics(
+                                    criteria,self.evaluation,rowsKeys,
+                                    hasNoVeto=True,columnsKeys=columnsKeys):
+            gWeight = float(abs(criteria[g]['weight']))
+            variances += np.abs(lc) * (gWeight*gWeight)
+        sigmas = np.sqrt(varFactor*variances) * 1.4142135623731
+        z = np.divide(-means,sigmas,out=np.zeros(r.shape),where=sigmas > 0.0)
+        lhArray = -np.frompyfunc(erf,1,1)(z).astype(np.float64)
+        lh = {}
+        for i,x in enumerate(rowsKeys):
+            lhi = lhArray[i]
+            lh[x] = dict([(y,float(lhi[columnsIndex[y]]))
+                          for y in concordanceRelation[x]])
+            if Debug:
+                print(x,lh[x])
+        return lh
+
+    def _recodeArrayValuation(self,ndigits=4):
+        """
+        Rounds in place the numpy valuation array of an
+        :py:class:`~digraphsTools.ArrayRelationView` *self.relation* to *ndigits*
+        decimal digits and normalizes the valuation domain the same way
+        as the :py:meth:`~digraphs.Digraph.recodeValuation` method does.
+        """
+        import numpy as np
+        relation = self.relation
+        np.round(relation.array,ndigits,out=relation.array)
+        relation.ndigits = ndigits
+        relation._formatString = '%%.%df' % ndigits
+        formatString = relation._formatString
+        vd = self.valuationdomain
+        for key in ('min','med','max'):
+            vd[key] = Decimal(formatString % vd[key])
+        vd['precision'] = vd['precision']/vd['max']
+        vd['hasIntegerValuation'] = (ndigits == 0)
+        self.valuation = relation.array
+        self.resetNeighbourhoods()
+
+    @staticmethod
+    def _arrayThreshold(crit,key,base):
+        """
+        Renders the array of *key* discrimination threshold values
+        or None if the threshold is not defined on criterion *crit*.
+        """
+        try:
+            th = crit['thresholds'][key]
+        except KeyError:
+            return None
+        return float(th[0]) + float(th[1]) * base
+
+    @staticmethod
+    def _arrayLocalConcordance(d,ind,wp,p,eps=0.0):
+        """
+        Array version of the *_localConcordance* method.
+        Threshold comparisons are made up to the tolerance *eps*.
+        """
+        import numpy as np
+        if ind is not None:
+            agree = d >= -ind - eps
+        elif wp is not None:
+            agree = d > -wp + eps
+        else:
+            agree = None
+        if p is not None:
+            if agree is None:
+                lc = np.where(d < 0.0,-1.0,1.0)
+            else:
+                lc = np.where(agree,1.0,0.0)
+            return np.where(d <= -p + eps,-1.0,lc)
+        elif agree is not None:
+            return np.where(agree,1.0,-1.0)
+        else:
+            return np.where(d < 0.0,-1.0,1.0)
+
+    @staticmethod
+    def _arrayLocalVeto(d,wv,v,eps=0.0):
+        """
+        Array version of the *_localVeto* method.
+        Applied to *-d*, renders the *_localNegativeVeto* characteristics.
+        """
+        import numpy as np
+        if wv is not None:
+            lv = np.where(d <= -wv + eps,0.0,-1.0)
+        else:
+            lv = np.full(d.shape,-1.0)
+        if v is not None:
+            return np.where(d <= -v + eps,1.0,lv)
+        else:
+            return lv
+
+    def _pairwiseVetoes(self,a,b,hasNoVeto=False,hasSymmetricThresholds=True,
+                        criteria=None):
+        """
+        Renders the lists of veto and counter-veto situations
+        observed between actions *a* and *b* in the format of
+        the *self.vetos* and *self.negativeVetos* records.
+        The observations may be restricted to a subset of *criteria*.
+        """
+        if criteria is None:
+            criteria = self.criteria
+        evaluation = self.evaluation
+        NA = self.NA
+        abVetoes = []
+        abNegativeVetoes = []
+        if hasNoVeto:
+            return abVetoes,abNegativeVetoes
+        for c,crit in criteria.items():
+            evalca = evaluation[c][a]
+            evalcb = evaluation[c][b]
+            if evalca == NA or evalcb == NA:
+                continue
+            if hasSymmetricThresholds:
+                base = max(abs(evalca),abs(evalcb))
+            else:
+                base = abs(evalca)
+            try:
+                wvx,wvy = crit['thresholds']['weakVeto'][:2]
+                wv = wvx + wvy * base
+            except KeyError:
+                wv = None
+            try:
+                vx,vy = crit['thresholds']['veto'][:2]
+                v = vx + vy * base
+            except KeyError:
+                v = None
+            if crit['weight'] > Decimal('0.0'):
+                d = evalca - evalcb
+            else:
+                d = evalcb - evalca
+            veto = self._localVeto(d,wv,v)
+            if veto >= Decimal('0'):
+                abVetoes.append((c,(veto,d,wv,v)))
+            negativeVeto = self._localNegativeVeto(d,wv,v)
+            if negativeVeto >= Decimal('0'):
+                abNegativeVetoes.append((c,(negativeVeto,d,wv,v)))
+        return abVetoes,abNegativeVetoes
+
     def criterionCharacteristicFunction(self,c,a,b,hasSymmetricThresholds=True):
         """
         Renders the characteristic value of the comparison of a and b on criterion c.
@@ -8981,6 +10110,7 @@ class ConfidentBipolarOutrankingDigraph(BipolarOutrankingDigraph):
         * distribution: {triangular|uniform|beta}, probability distribution used for generating random weights
         * betaParameter: a = b (default = 2)
         * confidence: required likelihood (in %) of the outranking relation
+        * Vectorized: computes the CLT likelihoods with *numpy* arrays (default)
         * other standard parameters from the BipolarOutrankingDigraph class (see documentation).
 
     """
@@ -8994,6 +10124,7 @@ class ConfidentBipolarOutrankingDigraph(BipolarOutrankingDigraph):
                  Normalized=True,
                  #Threading=False,
                  #nbrOfCPUs=1,
+                 Vectorized=True,
                  Debug=False,):
         # getting module ressources and setting the random seed
         from copy import copy, deepcopy
@@ -9033,6 +10164,7 @@ class ConfidentBipolarOutrankingDigraph(BipolarOutrankingDigraph):
         self.likelihoods = self.computeCLTLikelihoods(distribution=distribution,
                                                       betaParameter=betaParameter,
                                                       #Threading=Threading,
+                                                      Vectorized=Vectorized,
                                                       Debug=Debug)
         self.relation = self._computeConfidentRelation(
             bodg.relation,
@@ -9145,11 +10277,23 @@ class ConfidentBipolarOutrankingDigraph(BipolarOutrankingDigraph):
                               betaParameter=None,
                               #Threading=False,
                               #nbrOfCPUs=1,
+                              Vectorized=True,
                               Debug=False):
         """
         Renders the pairwise CLT likelihood of the at least as good as relation
         neglecting all considerable large performance differences polarisations.
-        """
+
+        With *Vectorized* = True (default), the likelihoods of all the pairs
+        are computed at once with *numpy* arrays
+        (see the BipolarOutrankingDigraph._computeArrayCLTLikelihoods method).
+        """
+        if Vectorized:
+            if betaParameter is None:
+                betaParameter = self.betaParameter
+            return self._computeArrayCLTLikelihoods(self.concordanceRelation,
+                                                    distribution=distribution,
+                                                    betaParameter=betaParameter,
+                                                    Debug=Debug)
         from copy import copy as deepcopy
         from decimal import Decimal
         from math import sqrt
@@ -9322,6 +10466,125 @@ class ConfidentBipolarOutrankingDigraph(BipolarOutrankingDigraph):
 
 
 #--------------------        
+class _PairwiseQuantilesSketch(object):
+    """
+    Incremental estimator of the quantiles of many series of observations
+    (one series per row) with a bounded memory.
+
+    Each row keeps its estimated quantiles on a fixed grid of *nbrOfQuantiles*
+    equally spaced probabilities, including 0 (minimum) and 1 (maximum).
+    A new block of observations is merged, like in the
+    :py:class:`~randomNumbers.IncrementalQuantilesEstimator` class, by
+    averaging the piecewise linear CDF of the current quantiles with the
+    empirical CDF of the block, weighted by their numbers of observations,
+    and inverting the merged CDF on the grid. The computations are
+    vectorized over all the rows.
+
+    The quantiles of the first block are computed exactly, the same way
+    as the *StochasticBipolarOutrankingDigraph._computeQuantile* method does.
+    """
+    def __init__(self,nbrOfRows,nbrOfQuantiles=101):
+        import numpy as np
+        self.nbrOfRows = nbrOfRows
+        self.probabilities = np.linspace(0.0,1.0,nbrOfQuantiles)
+        self.quantiles = None
+        self.nbrOfObservations = 0
+
+    @staticmethod
+    def _sortedQuantiles(sortedBlock,probabilities):
+        """
+        Interpolated quantiles of the rows of a sorted block of observations.
+        """
+        import numpy as np
+        b = sortedBlock.shape[1]
+        q = b * probabilities
+        flq = np.minimum(np.floor(q).astype(np.int64),b-1)
+        clq = np.minimum(np.ceil(q).astype(np.int64),b-1)
+        low = sortedBlock[:,flq]
+        return low + (q - flq) * (sortedBlock[:,clq] - low)
+
+    def addBlock(self,block):
+        """
+        Merges a *nbrOfRows* x b array of new observations.
+        """
+        import numpy as np
+        block = np.sort(block,axis=1)
+        b = block.shape[1]
+        probs = self.probabilities
+        if self.quantiles is None:
+            self.quantiles = self._sortedQuantiles(block,probs)
+            self.quantiles[:,0] = block[:,0]
+            self.quantiles[:,-1] = block[:,-1]
+            self.nbrOfObservations = b
+            return
+        N,K = self.quantiles.shape
+        n = self.nbrOfObservations
+        # merging by chunks of rows keeps the temporary arrays small
+        rowChunk = max(1,2**20 // (K + b))
+        for i in range(0,N,rowChunk):
+            rows = slice(i,i+rowChunk)
+            self.quantiles[rows] = self._mergeRows(self.quantiles[rows],n,
+                                                   block[rows],probs)
+        self.nbrOfObservations = n + b
+
+    @staticmethod
+    def _mergeRows(Q,n,block,probs):
+        """
+        Merges the rows of a sorted block of observations into the
+        quantiles *Q* estimated from *n* observations.
+        """
+        import numpy as np
+        N,K = Q.shape
+        b = block.shape[1]
+        M = K + b
+        C = np.concatenate((Q,block),axis=1)
+        order = np.argsort(C,axis=1,kind='stable')
+        U = np.take_along_axis(C,order,axis=1)
+        isBlock = order >= K
+        # last position of each run of equal values
+        positions = np.arange(M)
+        runEnds = np.empty((N,M),dtype=np.int64)
+        runEnds[:,:-1] = np.where(U[:,1:] != U[:,:-1],positions[:-1],M-1)
+        runEnds[:,-1] = M-1
+        runEnds = np.minimum.accumulate(runEnds[:,::-1],axis=1)[:,::-1]
+        # empirical CDF of the block
+        Fblock = np.take_along_axis(np.cumsum(isBlock,axis=1),runEnds,axis=1) / float(b)
+        # current piecewise linear CDF
+        jQ = np.take_along_axis(np.cumsum(~isBlock,axis=1),runEnds,axis=1) - 1
+        j = np.clip(jQ,0,K-2)
+        q0 = np.take_along_axis(Q,j,axis=1)
+        q1 = np.take_along_axis(Q,j+1,axis=1)
+        width = q1 - q0
+        frac = np.clip(np.divide(U - q0,width,out=np.ones_like(U),where=width > 0.0),0.0,1.0)
+        Fold = probs[j] + frac * (probs[j+1] - probs[j])
+        Fold[jQ < 0] = 0.0
+        Fold[jQ >= K-1] = 1.0
+        F = np.maximum.accumulate((n * Fold + b * Fblock) / float(n + b),axis=1)
+        # inverting the merged CDF on the probabilities grid
+        span = 2.0 + float(max(np.abs(U[:,0]).max(),np.abs(U[:,-1]).max()))
+        valueOffsets = (np.arange(N,dtype=np.float64) * 2.0 * span)[:,np.newaxis]
+        probOffsets = (np.arange(N,dtype=np.float64) * 2.0)[:,np.newaxis]
+        newQ = np.interp((probs + probOffsets).ravel(),
+                         (F + probOffsets).ravel(),
+                         (U + valueOffsets).ravel()).reshape((N,K)) - valueOffsets
+        newQ = np.where(probs <= F[:,:1],U[:,:1],newQ)
+        newQ[:,0] = U[:,0]
+        newQ[:,-1] = U[:,-1]
+        return newQ
+
+    def quantile(self,p):
+        """
+        Renders the array of the estimated *p* quantiles of all the rows.
+        """
+        import numpy as np
+        probs = self.probabilities
+        k = int(np.searchsorted(probs,p))
+        if k < len(probs) and abs(probs[k] - p) < 1e-12:
+            return self.quantiles[:,k]
+        k = max(1,min(k,len(probs)-1))
+        w = (p - probs[k-1]) / (probs[k] - probs[k-1])
+        return self.quantiles[:,k-1] + w * (self.quantiles[:,k] - self.quantiles[:,k-1])
+
 class StochasticBipolarOutrankingDigraph(BipolarOutrankingDigraph):
     """
     Stochastic bipolar outranking digraph based on multiple criteria of uncertain significance.
@@ -9341,6 +10604,18 @@ class StochasticBipolarOutrankingDigraph(BipolarOutrankingDigraph):
         * distribution: {triangular|extTriangular|uniform|beta(2,2)|beta(4,4)}, probability distribution used for generating random weights
         * spread: weight range = weight mode +- (weight mode * spread)
         * likelihood: 1.0 - frequency of valuations of opposite sign compared to the median valuation.
+        * CopyPerfTab: True by default, the digraph is constructed from a copy-on-write
+          view (see :py:class:`~perfTabs.PerformanceTableauView`) of the performance tableau,
+          which is hence not modified. If False, *argPerfTab* is used without any copy
+          and its weights and evaluations may be converted in place to Decimal.
+        * Vectorized: False by default, the relation is then completely recomputed for each sample
+          and all the observations are stored. If True, the *numpy* package is required and the sampled outranking
+          relations are computed with the reweighting engine: the weight independent marginal
+          characteristics are computed once and each sample's concordance is a matrix-vector product
+          with the sampled weights. The statistics are accumulated incrementally, the quantiles with a
+          bounded memory merging procedure, which allows large sample sizes. The sampled weights are
+          drawn from a *numpy* random generator seeded with *samplingSeed*, so that the vectorized
+          results are reproducible but differ from the non vectorized ones.
         * other standard parameters from the BipolarOutrankingDigraph class (see documentation).
 
     """
@@ -9354,10 +10629,14 @@ class StochasticBipolarOutrankingDigraph(BipolarOutrankingDigraph):
                  hasNoVeto=False,
                  hasBipolarVeto=True,
                  Normalized=False,
+                 CopyPerfTab=True,
+                 Vectorized=False,
                  Debug=False,
                  SeeSampleCounter=False):
         # getting module ressources and setting the random seed
         from copy import copy, deepcopy
+        from time import time
+        tt = time()
         if distribution == 'extTriangular':
             from randomNumbers import ExtendedTriangularRandomVariable
         else:
@@ -9370,13 +10649,18 @@ class StochasticBipolarOutrankingDigraph(BipolarOutrankingDigraph):
             perfTab = RandomPerformanceTableau(commonThresholds = [(10.0,0.0),(20.0,0.0),(80.0,0.0),(101.0,0.0)])
         elif isinstance(argPerfTab,(str)):
             perfTab = PerformanceTableau(argPerfTab)
+        elif CopyPerfTab:
+            perfTab = PerformanceTableauView(argPerfTab)
         else:
-            perfTab = deepcopy(argPerfTab)
+            perfTab = argPerfTab
         # initializing the bipolar outranking digraph
+        # on the already copied performance tableau
         bodg = BipolarOutrankingDigraph(argPerfTab=perfTab,coalition=coalition,\
                                      hasNoVeto = hasNoVeto,\
                                      hasBipolarVeto = hasBipolarVeto,\
-                                     Normalized=Normalized)
+                                     Normalized=Normalized,
+                                     CopyPerfTab=False,
+                                     Vectorized=Vectorized)
         self.name = bodg.name + '_MC'
         self.sampleSize = sampleSize
         self.likelihood = likelihood
@@ -9386,11 +10670,31 @@ class StochasticBipolarOutrankingDigraph(BipolarOutrankingDigraph):
         self.criteria = copy(bodg.criteria)
         self.evaluation = copy(bodg.evaluation)
         self.NA = copy(bodg.NA)
-        self.relation = copy(bodg.relation)
+        self.runTimes = copy(bodg.runTimes)
+        if isinstance(bodg.relation,ArrayRelationView):
+            self.relation = bodg.relation.todict()
+        else:
+            self.relation = copy(bodg.relation)
         
         # normalize valuation to percentages
         self.recodeValuation(-100.0,100.0)
         Med = self.valuationdomain['med']
+
+        if Vectorized:
+            self._computeReweightedStatistics(perfTab,sampleSize,
+                                              criteria=self.criteria,
+                                              samplingSeed=samplingSeed,
+                                              distribution=distribution,
+                                              spread=spread,
+                                              likelihood=likelihood,
+                                              hasNoVeto=hasNoVeto,
+                                              hasBipolarVeto=hasBipolarVeto,
+                                              SeeSampleCounter=SeeSampleCounter)
+            if Normalized:
+                self.recodeValuation(-1,1)
+            self.runTimes['computeRelation'] = time() - tt - self.runTimes['dataInput']
+            self.runTimes['totalTime'] = time() - tt
+            return
         
         # bin breaks per percent unit
         breaks = [(x,i) for i,x  in enumerate(range(-100,101))]
@@ -9412,6 +10716,10 @@ class StochasticBipolarOutrankingDigraph(BipolarOutrankingDigraph):
 
         # initialize the weight modes
         weights = dict([(g,self.criteria[g]['weight']) for g in self.criteria])
+        # the sampled weights are written into copies of the criteria records
+        samplingCriteria = copy(perfTab.criteria)
+        for g in self.criteria:
+            samplingCriteria[g] = copy(perfTab.criteria[g])
         spread = Decimal(spread)
         if Debug:
             print(weights)
@@ -9441,10 +10749,10 @@ class StochasticBipolarOutrankingDigraph(BipolarOutrankingDigraph):
                     rw = Decimal( '%.2f' % ( extTrRdv.random() ) )
                 else:
                     print('Error: wrong distribution %s. Available laws: triangular (default), uniform, beta(2,2), beta(12,12)' % distribution)        
-                perfTab.criteria[g]['weight'] = rw
+                samplingCriteria[g]['weight'] = rw
 ##                if Debug:
 ##                    print(self.criteria[g]['weight'],rw)
-            srelation = self._constructRelation(perfTab.criteria,\
+            srelation = self._constructRelation(samplingCriteria,\
                                                perfTab.evaluation,\
                                                hasNoVeto = hasNoVeto,\
                                                hasBipolarVeto = hasBipolarVeto,\
@@ -9506,6 +10814,178 @@ class StochasticBipolarOutrankingDigraph(BipolarOutrankingDigraph):
         self.gamma = self.gammaSets()
         self.notGamma = self.notGammaSets()
 
+    @staticmethod
+    def _sampleWeights(criteria,sampleSize,samplingSeed=None,
+                       distribution='triangular',spread=1.0):
+        """
+        Renders the sampleSize x m *numpy* array of the absolute values of
+        random criteria significance weights, rounded to two decimals.
+        Renders None with an unknown *distribution*.
+        """
+        import numpy as np
+        rng = np.random.default_rng(samplingSeed)
+        W = np.empty((sampleSize,len(criteria)),dtype=np.float64)
+        for k,c in enumerate(criteria):
+            weightMode = float(criteria[c]['weight'])
+            lowerWeightLimit = weightMode - weightMode*float(spread)
+            upperWeightLimit = weightMode + weightMode*float(spread)
+            if lowerWeightLimit > upperWeightLimit:
+                lowerWeightLimit,upperWeightLimit = upperWeightLimit,lowerWeightLimit
+            weightRange = upperWeightLimit - lowerWeightLimit
+            if distribution == 'triangular':
+                if weightRange > 0.0:
+                    rw = rng.triangular(lowerWeightLimit,weightMode,
+                                        upperWeightLimit,sampleSize)
+                else:
+                    rw = np.full(sampleSize,weightMode)
+            elif distribution == 'uniform':
+                rw = rng.uniform(lowerWeightLimit,upperWeightLimit,sampleSize)
+            elif distribution == 'beta(2,2)':
+                rw = lowerWeightLimit + rng.beta(2,2,sampleSize)*weightRange
+            elif distribution == 'beta(4,4)':
+                rw = lowerWeightLimit + rng.beta(4,4,sampleSize)*weightRange
+            elif distribution == 'extTriangular':
+                # see randomNumbers.ExtendedTriangularRandomVariable
+                lowLimit = weightMode/2.0
+                highLimit = weightMode*2.0
+                u = rng.random(sampleSize)
+                rw = np.where(u < 0.5,
+                              lowLimit + np.sqrt(u/0.5)*(weightMode-lowLimit),
+                              highLimit - np.sqrt((1.0-u)/0.5)*(highLimit-weightMode))
+            else:
+                print('Error: wrong distribution %s. Available laws: triangular (default), uniform, beta(2,2), beta(4,4), extTriangular' % distribution)
+                return None
+            W[:,k] = np.abs(np.round(rw,2))
+        return W
+
+    def _computeReweightedStatistics(self,perfTab,sampleSize,
+                                     criteria=None,
+                                     samplingSeed=None,
+                                     distribution='triangular',
+                                     spread=1.0,
+                                     likelihood=0.9,
+                                     hasNoVeto=False,
+                                     hasBipolarVeto=True,
+                                     SeeSampleCounter=False):
+        """
+        Monte Carlo reweighting engine of the stochastic outranking digraph.
+
+        The weight independent marginal characteristics (local concordance,
+        veto and counter-veto states) of all pairs of actions are computed once.
+        The concordance of each sampled weight vector is then a matrix-vector
+        product, evaluated by blocks of samples. The means, standard deviations,
+        extreme values, cumulative frequencies and quantiles of the sampled
+        characteristics are accumulated block by block, without storing all
+        the observations (see :py:class:`~outrankingDigraphs._PairwiseQuantilesSketch`).
+
+        The results are stored, like with the original sampling procedure, in the
+        *self.relationStatistics*, *self.frequency* and *self.quantilesId* attributes,
+        and the median characteristic values with sufficient likelihood in *self.relation*.
+        The sampled *criteria*, by default the *perfTab* criteria, may be a coalition of them.
+        """
+        import numpy as np
+        actionsKeys = [x for x in self.actions]
+        n = len(actionsKeys)
+        N = n*n
+        if criteria is None:
+            criteria = perfTab.criteria
+        m = len(criteria)
+        Med = self.valuationdomain['med']
+        Max = float(self.valuationdomain['max'])
+
+        # weight independent marginal characteristics
+        L = np.zeros((N,m),dtype=np.float64)
+        hasVeto = np.zeros(N,dtype=bool)
+        hasCounterVeto = np.zeros(N,dtype=bool)
+        vetoIndex = np.full(N,-1.0)
+        for k,(c,lc,veto,negativeVeto) in enumerate(
+                self._iterArrayMarginalCharacteristics(criteria,perfTab.evaluation,
+                                                       actionsKeys,
+                                                       hasNoVeto=hasNoVeto,
+                                                       hasBipolarVeto=hasBipolarVeto)):
+            L[:,k] = lc.ravel()
+            if veto is not None:
+                veto = veto.ravel()
+                hasVeto |= veto > 0.0
+                np.maximum(vetoIndex,veto,out=vetoIndex)
+                if negativeVeto is not None:
+                    hasCounterVeto |= negativeVeto.ravel() > 0.0
+        hasVeto = hasVeto[:,np.newaxis]
+        hasCounterVeto = hasCounterVeto[:,np.newaxis]
+        vetoIndex = vetoIndex[:,np.newaxis]
+        diagonal = np.arange(n)*(n+1)
+
+        # sampled significance weights
+        W = self._sampleWeights(criteria,sampleSize,samplingSeed=samplingSeed,
+                                distribution=distribution,spread=spread)
+        if W is None:
+            return
+
+        # incremental statistics
+        blockSize = max(1,min(sampleSize,2**24 // max(N,1)))
+        sketch = _PairwiseQuantilesSketch(N)
+        sums = np.zeros(N)
+        squares = np.zeros(N)
+        mins = np.full(N,np.inf)
+        maxs = np.full(N,-np.inf)
+        # counts per left closed integer percent bins -100,...,100 (+ overflow)
+        counts = np.zeros(N*202,dtype=np.int64)
+        rowBins = (np.arange(N)*202)[:,np.newaxis]
+        for start in range(0,sampleSize,blockSize):
+            if SeeSampleCounter:
+                print(start)
+            Wb = W[start:start+blockSize]
+            totals = Wb.sum(axis=1)
+            totals[totals == 0.0] = 1.0
+            concordIndex = np.round((L @ Wb.T) / totals,12)
+            V = self._arrayOutrankingIndex(concordIndex,hasVeto,hasCounterVeto,
+                                           vetoIndex,hasBipolarVeto=hasBipolarVeto) * Max
+            V[diagonal,:] = 0.0
+            sums += V.sum(axis=1)
+            squares += (V*V).sum(axis=1)
+            np.minimum(mins,V.min(axis=1),out=mins)
+            np.maximum(maxs,V.max(axis=1),out=maxs)
+            bins = np.clip(np.ceil(np.round(V,9)).astype(np.int64) + 100,0,201)
+            counts += np.bincount((bins + rowBins).ravel(),minlength=N*202)
+            sketch.addBlock(V)
+        frequency = np.cumsum(counts.reshape((N,202)),axis=1)[:,:201]
+        mean = sums/sampleSize
+        sd = np.sqrt(np.maximum(squares/sampleSize - mean*mean,0.0))
+        medians = sketch.quantile(0.5)
+        Q1 = sketch.quantile(0.25)
+        Q3 = sketch.quantile(0.75)
+        negativeFrequency = frequency[:,100] / float(sampleSize)
+
+        # storing the results
+        self.quantilesId = dict([(x,i) for i,x  in enumerate(range(-100,101))])
+        self.frequency = {}
+        self.relationStatistics = {}
+        relation = self.relation
+        for i,x in enumerate(actionsKeys):
+            self.frequency[x] = {}
+            self.relationStatistics[x] = {}
+            rx = relation[x]
+            for j,y in enumerate(actionsKeys):
+                k = i*n + j
+                self.frequency[x][y] = frequency[k]
+                if rx[y] > Med:
+                    lh = 1.0 - float(negativeFrequency[k])
+                else:
+                    lh = float(negativeFrequency[k])
+                median = float(medians[k])
+                self.relationStatistics[x][y] = {'median': median,
+                                                 'likelihood': lh,
+                                                 'mean': float(mean[k]),
+                                                 'sd': float(sd[k]),
+                                                 'Q0': float(mins[k]),
+                                                 'Q1': float(Q1[k]),
+                                                 'Q3': float(Q3[k]),
+                                                 'Q4': float(maxs[k])}
+                if lh < likelihood:
+                    rx[y] = Med
+                else:
+                    rx[y] = Decimal('%.3f' % median)
+
     def computeCDF(self,x,y,rValue):
         """
         computes by interpolation the likelihood of a given rValue with respect to the sampled r(x,y) valuations.
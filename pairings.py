@@ -23,6 +23,212 @@ Copyright (C) 2023-2026 Raymond Bisdorff
 
 __version__ = "$Revision: Python 3.13.13"
 
+#-------------  swap-gain matrix kernels
+
+def _enhanceInterGroupSwaps(scores,assignment,maxIterations):
+    """
+    Swap-gain matrix kernel of the
+    :py:meth:`~pairings.InterGroupPairing.enhanceMatchingGeneralFairness` method.
+
+    *scores*[i][x] is the combined fitness score of the i-th person of
+    group A with the x-th person of group B and *assignment*[i] the index
+    of the partner of the i-th person of group A.
+
+    The gains of all the partner swaps are kept in a matrix updated only on the
+    rows and columns of the swapped pairs, together with the best gain of
+    each row. The tabu set contains the (i, x, j, y) tuples of the pairs
+    produced by the swaps.
+
+    Renders the enhanced assignment, the iterations counter and the
+    history list of the tabu tuples.
+    """
+    n = len(assignment)
+    sigma = list(assignment)
+    tabu = set()
+    history = []
+    gains = [[None]*n for i in range(n)]
+    rowBest = [None]*n
+
+    def updateGain(i,j):
+        si = sigma[i]
+        sj = sigma[j]
+        if (i,si,j,sj) in tabu:
+            gains[i][j] = None
+        else:
+            gains[i][j] = scores[i][sj] + scores[j][si]\
+                          - scores[i][si] - scores[j][sj]
+
+    def scanRow(i):
+        gi = gains[i]
+        best = None
+        for j in range(i+1,n):
+            g = gi[j]
+            if g is not None and (best is None or g > gi[best]):
+                best = j
+        rowBest[i] = best
+
+    for i in range(n):
+        for j in range(i+1,n):
+            updateGain(i,j)
+        scanRow(i)
+    t = 1
+    while True:
+        # the first maximal gain in row major order
+        ie = None
+        for i in range(n):
+            j = rowBest[i]
+            if j is not None and (ie is None or gains[i][j] > gains[ie][rowBest[ie]]):
+                ie = i
+        if ie is None:
+            break
+        je = rowBest[ie]
+        newPairs = (ie,sigma[je],je,sigma[ie])
+        if newPairs in tabu or int(gains[ie][je]) < 0:
+            break
+        sigma[ie],sigma[je] = sigma[je],sigma[ie]
+        tabu.add(newPairs)
+        history.append(newPairs)
+        t += 1
+        # updating the rows and columns of the swapped pairs
+        for k in (ie,je):
+            for j in range(k+1,n):
+                updateGain(k,j)
+            for i in range(k):
+                updateGain(i,k)
+        scanRow(ie)
+        scanRow(je)
+        for i in range(je):
+            if i == ie:
+                continue
+            best = rowBest[i]
+            if best == ie or best == je:
+                scanRow(i)
+                continue
+            gi = gains[i]
+            for j in (ie,je):
+                if j > i and gi[j] is not None:
+                    if best is None or gi[j] > gi[best] or\
+                       (gi[j] == gi[best] and j < best):
+                        best = j
+            rowBest[i] = best
+        if t > maxIterations:
+            break
+    return sigma,t,history
+
+def _enhanceIntraGroupSwaps(scores,correlations,pairs,t,maxIterations,
+                            visited=None):
+    """
+    Swap-gain matrix kernel of the
+    :py:meth:`~pairings.IntraGroupPairing.enhanceMatchingFairness` method.
+
+    *scores*[x][y] is the symmetric combined fitness score and
+    *correlations*[x][y] the individual correlation, in thousandths,
+    of person x when paired with person y. *pairs* is the list of
+    the [x,y] person indexes pairs and *t* the iterations counter.
+
+    The gains of the swapped (*[x,v],[u,y]*) and the twisted (*[x,u],[y,v]*)
+    recombinations of each couple of pairs *[x,y]* and *[u,v]* are kept in
+    two matrices updated only on the rows and columns of the recombined pairs.
+    The visited matchings are hashed in a set initialized with the *visited*
+    keys.
+
+    Renders the enhanced pairs, the sum of the individual correlations, the
+    list of the visited pairs and the iterations counter.
+    """
+    from heapq import heapify, heappop
+    n = len(pairs)
+    maxSum = 2000*n
+    pairs = [list(p) for p in pairs]
+    visitedList = []
+    if visited is None:
+        visitedSet = set()
+    else:
+        visitedSet = set(visited)
+    corrSum = 0
+    for x,y in pairs:
+        corrSum += correlations[x][y] + correlations[y][x]
+    t += 1
+    if corrSum == maxSum:
+        return pairs,corrSum,visitedList,t
+    swapGains = [[None]*n for i in range(n)]
+    twistGains = [[None]*n for i in range(n)]
+
+    def updateGains(i,j):
+        x,y = pairs[i]
+        u,v = pairs[j]
+        current = scores[x][y] + scores[u][v]
+        swapGains[i][j] = scores[x][v] + scores[u][y] - current
+        twistGains[i][j] = scores[x][u] + scores[y][v] - current
+
+    for i in range(n):
+        for j in range(i+1,n):
+            updateGains(i,j)
+    Enhanced = True
+    while Enhanced and t <= maxIterations:
+        Enhanced = False
+        # candidate recombinations in decreasing gains and scanning order
+        candidates = []
+        position = 0
+        for i in range(n):
+            for j in range(i+1,n):
+                candidates.append((-swapGains[i][j],position,i,j,False))
+                candidates.append((-twistGains[i][j],position+1,i,j,True))
+                position += 2
+        heapify(candidates)
+        ie = -1
+        je = -1
+        while candidates:
+            gain,position,i,j,Twisted = candidates[0]
+            if gain > 0 or i in (ie,je) or j in (ie,je):
+                break
+            heappop(candidates)
+            ie = i
+            je = j
+            x,y = pairs[ie]
+            u,v = pairs[je]
+            if Twisted:
+                npair1 = [x,u]
+                npair2 = [y,v]
+            else:
+                npair1 = [x,v]
+                npair2 = [u,y]
+            newSum = corrSum\
+                     - correlations[x][y] - correlations[y][x]\
+                     - correlations[u][v] - correlations[v][u]\
+                     + correlations[npair1[0]][npair1[1]]\
+                     + correlations[npair1[1]][npair1[0]]\
+                     + correlations[npair2[0]][npair2[1]]\
+                     + correlations[npair2[1]][npair2[0]]
+            newPairs = list(pairs)
+            newPairs[ie] = npair1
+            newPairs[je] = npair2
+            if newSum == maxSum:
+                return newPairs,newSum,visitedList,t
+            key = tuple(tuple(p) for p in newPairs)
+            if key in visitedSet:
+                continue
+            elif newSum < corrSum:
+                break
+            else:
+                corrSum = newSum
+                pairs = newPairs
+                visitedSet.add(key)
+                visitedList.append(pairs)
+                Enhanced = True
+                for k in (ie,je):
+                    for j in range(k+1,n):
+                        updateGains(k,j)
+                    for i in range(k):
+                        updateGains(i,k)
+        t += 1
+    return pairs,corrSum,visitedList,t
+
+def _multiStartSwapsWorker(kernel,args):
+    """
+    Multiprocessing pool worker running one start of a swap-gain kernel.
+    """
+    return kernel(*args)
+
 #-------------
 from graphs import BipartiteGraph
 class InterGroupPairing(BipartiteGraph):
@@ -449,96 +655,34 @@ class InterGroupPairing(BipartiteGraph):
         fitness=(matching,avgCorr,stdCorr,avgCorr-stdCorr,
         groupAScores,groupBScores,
         abs(avgCorrA-avgCorrB))
+
+        The individual correlations are computed with the
+        :py:meth:`~pairings.InterGroupPairing.computeCorrelationScore` method.
         """
-        # computing groupA's scores
-        from digraphs import IndeterminateDigraph
-        from decimal import Decimal
         from statistics import mean, stdev
-        groupAScores = {}
         vpA = self.vpA
         vpB = self.vpB
         groupA = [a for a in vpA.voters]
         groupB = [b for b in vpB.voters]
+        partner = {}
+        for m in matching:
+            pair = list(m)
+            partner[pair[0]] = pair[1]
+            partner[pair[1]] = pair[0]
+        # computing groupA's scores
+        groupAScores = {}
         for m in groupA:
-            edg = IndeterminateDigraph(order=len(vpA.candidates))
-            edg.actions = groupB
-            Min = edg.valuationdomain['min']
-            Med = edg.valuationdomain['med']
-            Max = edg.valuationdomain['max']
-
-            mmatch = [x for x in matching if m in x]
-            mmatch = [x for x in mmatch[0] if x != m]
-            
-            relation = {}
-            for x in groupB:
-                relation[x] = {}
-                for y in groupB:
-                    relation[x][y] = Med
-            n = len(edg.actions)
-            for i in range(n):
-                x = groupB[i]
-                for j in range(i+1,n):
-                    y = groupB[j]
-                    if x == mmatch[0]:
-                        relation[x][y] = Max
-                        relation[y][x] = Min
-                    elif y == mmatch[0]:
-                        relation[x][y] = Min
-                        relation[y][x] = Max
-                    else:
-                        pass
-            edg.relation = relation
-            edg.gamma = edg.gammaSets()
-            edg.notGamma = edg.notGammaSets()
-            #corr = edg.computeRankingCorrelation(vpA.linearBallot[m])
-            corr = edg.computeOrdinalCorrelation(vpA.ballot[m])
-            groupAScores[m] = Decimal('%.3f' % corr['correlation'])
-        
+            groupAScores[m] = self.computeCorrelationScore(vpA,m,partner[m])
         # computing groupB's scores
         groupBScores = {}
         for w in groupB:
-            edg.actions = groupA
-            Min = edg.valuationdomain['min']
-            Med = edg.valuationdomain['med']
-            Max = edg.valuationdomain['max']
-
-            wmmatch = [x for x in matching if w in x]
-            wmmatch = [x for x in wmmatch[0] if x != w]                
-            relation = {}
-            for x in groupA:
-                relation[x] = {}
-                for y in groupA:
-                    relation[x][y] = Med
-            n = len(edg.actions)
-            for i in range(n):
-                x = groupA[i]
-                for j in range(i+1,n):
-                    y = groupA[j]
-                    if x == wmmatch[0]:
-                        relation[x][y] = Max
-                        relation[y][x] = Min
-                    elif y == wmmatch[0]:
-                        relation[x][y] = Min
-                        relation[y][x] = Max
-                    else:
-                        pass
-            edg.relation = relation
-            edg.gamma = edg.gammaSets()
-            edg.notGamma = edg.notGammaSets()
-            #corr = edg.computeRankingCorrelation(vpB.linearBallot[w])
-            corr = edg.computeOrdinalCorrelation(vpB.ballot[w])
-            groupBScores[w] = Decimal('%.3f' % corr['correlation'])   
+            groupBScores[w] = self.computeCorrelationScore(vpB,w,partner[w])
 
         # computing matching fitness scores
 
-        fitness = []
-        aCorrelations = []
-        for w in groupAScores:
-            aCorrelations.append(groupAScores[w])
+        aCorrelations = [groupAScores[w] for w in groupAScores]
         ACorr = mean(aCorrelations)
-        bCorrelations = []
-        for m in groupBScores:
-            bCorrelations.append(groupBScores[m])
+        bCorrelations = [groupBScores[m] for m in groupBScores]
         BCorr = mean(bCorrelations)
         fairness = abs(ACorr-BCorr)
         matchingCorrelations = aCorrelations + bCorrelations
@@ -691,6 +835,92 @@ class InterGroupPairing(BipartiteGraph):
             score += ba[b][candidates[i]] - ba[candidates[i]][b]
         return score
 
+    def computeCorrelationScore(self,vpA,a,b):
+        """
+        Renders the ordinal correlation between the pairing preferences
+        of person *a* and the partial ranking putting partner *b* first,
+        i.e. the individual correlation of *a* when paired with *b*,
+        as computed by the :py:meth:`~pairings.InterGroupPairing.computeIndividualCorrelations` method.
+        """
+        from decimal import Decimal
+        ba = vpA.ballot[a]
+        one = Decimal('1')
+        correlation = Decimal('0')
+        determination = Decimal('0')
+        for c in vpA.candidates:
+            if c != b:
+                # the [-1,1] truncated values of b > c and c > b
+                bc = max(-one,min(one,ba[b][c]))
+                cb = max(-one,min(one,ba[c][b]))
+                correlation += bc - cb
+                determination += abs(bc) + abs(cb)
+        if determination > Decimal('0'):
+            correlation /= determination
+        else:
+            correlation = Decimal('0.0')
+        return Decimal('%.3f' % correlation)
+
+    def computeCorrelationScores(self,vpA,a):
+        """
+        Renders the dictionary of the individual correlations of person *a*
+        with each one of the potential partners
+        (see :py:meth:`~pairings.InterGroupPairing.computeCorrelationScore`),
+        computed with row and column sums over the ballot of *a*.
+        """
+        from decimal import Decimal
+        ba = vpA.ballot[a]
+        zero = Decimal('0')
+        one = Decimal('1')
+        candidates = [c for c in vpA.candidates]
+        rows = []
+        for i in range(len(candidates)):
+            bx = ba[candidates[i]]
+            if list(bx) == candidates:
+                row = list(bx.values())
+            else:
+                row = [bx[y] for y in candidates]
+            row[i] = zero
+            rows.append(row)
+        if max(max(row) for row in rows) > one or\
+           min(min(row) for row in rows) < -one:
+            rows = [[max(-one,min(one,v)) for v in row] for row in rows]
+        absRows = [list(map(abs,row)) for row in rows]
+        columns = list(zip(*rows))
+        absColumns = list(zip(*absRows))
+        scores = {}
+        for i in range(len(candidates)):
+            correlation = sum(rows[i],zero) - sum(columns[i],zero)
+            determination = sum(absRows[i],zero) + sum(absColumns[i],zero)
+            if determination > zero:
+                correlation /= determination
+            else:
+                correlation = Decimal('0.0')
+            scores[candidates[i]] = Decimal('%.3f' % correlation)
+        return scores
+
+    def computeCopelandScores(self,vpA,a):
+        """
+        Renders the dictionary of the Copeland scores of person *a* for each one
+        of the potential partners (see :py:meth:`~pairings.InterGroupPairing.computeCopelandScore`),
+        computed with row and column sums over the ballot of *a*.
+        """
+        from decimal import Decimal
+        ba = vpA.ballot[a]
+        zero = Decimal('0')
+        candidates = [c for c in vpA.candidates]
+        rows = []
+        for x in candidates:
+            bx = ba[x]
+            if list(bx) == candidates:
+                rows.append(list(bx.values()))
+            else:
+                rows.append([bx[y] for y in candidates])
+        columns = list(zip(*rows))
+        scores = {}
+        for i in range(len(candidates)):
+            scores[candidates[i]] = sum(rows[i],zero) - sum(columns[i],zero)
+        return scores
+
     def computeBachetScore(self,vpA,a,b,Reversed=False):
         """
         Replacement for the linear voting profiles information
@@ -718,17 +948,19 @@ class InterGroupPairing(BipartiteGraph):
                                        Comments=False,Debug=False):
         """
         Enahance fairness of a given matching using any reciprocal voting profiles
+
+        The partners of the couple of pairs with the highest fitness gain are swapped
+        as long as this gain is not negative and the resulting pairs have not yet
+        been visited. The swap gains are kept in a matrix updated incrementally
+        after each swap (see the :py:func:`~pairings._enhanceInterGroupSwaps` kernel).
         """
-                
-        vpA = self.vpA
-        vpB = self.vpB
+        from decimal import Decimal
         fg = matching
         pairs = []
         aKeys = [k for k in self.vpA.voters]
         bKeys = [k for k in self.vpB.voters]
         for m in matching:
             pair = list(m)
-            sortedPair = []
             if pair[0] in aKeys:
                 pairs.append([pair[0],pair[1]])
             else:
@@ -736,97 +968,19 @@ class InterGroupPairing(BipartiteGraph):
         pairs.sort()
         if Comments:
             print(pairs)
-        n = len(pairs)
-        newPairs = pairs.copy()    
-        t = 1
-        Enhanced = True
+        scores = self._computeSwapScores(pairs)
+        bIndex = {b: x for x,b in enumerate(bKeys)}
+        assignment = [bIndex[pair[1]] for pair in pairs]
+        sigma,t,tabuHistory = _enhanceInterGroupSwaps(scores,assignment,maxIterations)
+        if t > maxIterations:
+            print('!!!! Too many iterations (max=%d): %d\n' % (maxIterations,t))
+            print('You may adjust the *maxIterations* parameter')
         history = []
-        maxIterations = maxIterations
-        while Enhanced:            
-            Enhanced = False
-            if Comments:
-                print('==>>> Iteration: ', t)
-            if Debug:
-                print(pairs)
-            enhanceFitness = []
-            for i in range(n):
-                pair1 = pairs[i]
-                for j in range(i+1,n):
-                    if Debug:
-                        print(i,j)                
-                    pair2 = pairs[j]
-                    if [pair1,pair2] not in history:
-                        rankDifA1 = self.fitnessScores[pair1[0]][pair2[1]] - \
-                                    self.fitnessScores[pair1[0]][pair1[1]]
-                        rankDifA2 = self.fitnessScores[pair2[0]][pair1[1]] - \
-                                    self.fitnessScores[pair2[0]][pair2[1]]
-                        difGroupA = rankDifA1 + rankDifA2
-                        rankDifB1 = self.fitnessScores[pair1[1]][pair2[0]] - \
-                                    self.fitnessScores[pair1[1]][pair1[0]]
-                        rankDifB2 = self.fitnessScores[pair2[1]][pair1[0]] - \
-                                    self.fitnessScores[pair2[1]][pair2[0]]
-                        difGroupB = rankDifB1 + rankDifB2
-                        if difGroupA <= difGroupB:
-                            # enhance group B correlations
-                            enhanceFitness.append(((difGroupA + difGroupB),(difGroupB-difGroupA),(i,j)))
-                        else:
-                            # enhance group A correlations
-                            enhanceFitness.append(((difGroupA + difGroupB),(difGroupA-difGroupB),(i,j)))
-                    else:
-                        if Debug:
-                            print([pair1,pair2], ' in history !')                          
-##            if Debug:
-##                print(enhanceFitness)
-            from operator import itemgetter
-            enhanceFitness.sort(reverse=True,key=itemgetter(0))
-            if Debug:
-                print(enhanceFitness)
-            ie = enhanceFitness[0][2][0]
-            je = enhanceFitness[0][2][1]
-            if Comments:
-                print(ie,pairs[ie])
-                print(je,pairs[je])
-            pair1 = pairs[ie]
-            pair2 = pairs[je]
-            npair1 = [pair1[0],pair2[1]]
-            npair2 = [pair2[0],pair1[1]]
-            if [npair1,npair2] in history:
-                if Debug:
-                    print(history)
-                    print('!!!! Cycling :', [npair1,npair2])
-                Enhanced = False
-            elif (int(enhanceFitness[0][0]) >= 0):
-                if Comments:
-                    print(pair1,npair1)
-                    print(pair2,npair2)
-                if Debug:
-                    print(npair1,npair2)
-                    print(newPairs)
-                newPairs.pop(ie)
-                newPairs.insert(ie,npair1)
-                newPairs.pop(je)
-                newPairs.insert(je, npair2)
-                if Debug:
-                    print(newPairs)
-                history.append([npair1,npair2])
-                Enhanced = True
-                pairs = newPairs.copy()            
-                t += 1
-                if Debug:
-                    nfgt = []
-                    for pair in newPairs:
-                        nfgt.append(frozenset(pair))
-                    fitness = self.computeIndividualCorrelations(nfgt)
-                    print( '%.3f, %.3f, %.3f' \
-                           % (fitness[1],fitness[2],fitness[6]) )
-                    
-                if t > maxIterations:
-                    print('!!!! Too many iterations (max=%d): %d\n' % (maxIterations,t))
-                    print('You may adjust the *maxIterations* parameter')
-                    Enhanced = False
+        for i,x,j,y in tabuHistory:
+            history.append([[pairs[i][0],bKeys[x]],[pairs[j][0],bKeys[y]]])
         nfg = []
-        for pair in newPairs:
-            nfg.append(frozenset(pair))
+        for i in range(len(pairs)):
+            nfg.append(frozenset([pairs[i][0],bKeys[sigma[i]]]))
         fitness = self.computeIndividualCorrelations(nfg)
         if Comments:
             print('Given matching')
@@ -836,6 +990,93 @@ class InterGroupPairing(BipartiteGraph):
             print('number of iterations:',t)
         return nfg,t,history,fitness
 
+    def _computeSwapScores(self,pairs):
+        """
+        Renders the list of lists of the combined fitness scores of the group A persons,
+        in the order of the given *pairs*, with the group B persons.
+        The Bachet integer scores are converted to int.
+        """
+        from decimal import Decimal
+        fitnessScores = self.fitnessScores
+        bKeys = [k for k in self.vpB.voters]
+        scores = []
+        for pair in pairs:
+            a = pair[0]
+            row = []
+            for b in bKeys:
+                score = fitnessScores[a][b] + fitnessScores[b][a]
+                if not isinstance(score,(int,Decimal)):
+                    score = int(score)
+                row.append(score)
+            scores.append(row)
+        return scores
+
+    def computeMultiStartFairnessEnhancement(self,nbrOfStarts=4,
+                                             initialMatchings=None,
+                                             seed=None,maxIterations=None,
+                                             Threading=False,nbrCores=None,
+                                             startMethod=None,
+                                             Comments=False):
+        """
+        Enhances with the swap heuristic of the :py:meth:`~pairings.InterGroupPairing.enhanceMatchingGeneralFairness`
+        method the given *initialMatchings* list, completed with random perfect matchings
+        up to *nbrOfStarts*. With *Threading*, the starts are run in a multiprocessing pool.
+
+        Renders the (fitness, iterations, history) tuple of the enhanced matching
+        with highest average correlation and, in case of ties, lowest standard deviation.
+        """
+        import random
+        aKeys = [k for k in self.vpA.voters]
+        bKeys = [k for k in self.vpB.voters]
+        n = len(aKeys)
+        if maxIterations is None:
+            maxIterations = 2*n
+        random.seed(seed)
+        starts = []
+        if initialMatchings is not None:
+            for matching in initialMatchings:
+                partner = {}
+                for m in matching:
+                    pair = list(m)
+                    partner[pair[0]] = pair[1]
+                    partner[pair[1]] = pair[0]
+                starts.append([bKeys.index(partner[a]) for a in aKeys])
+        while len(starts) < nbrOfStarts:
+            assignment = list(range(n))
+            random.shuffle(assignment)
+            starts.append(assignment)
+        pairs = [[a] for a in aKeys]
+        scores = self._computeSwapScores(pairs)
+        argsList = [(scores,assignment,maxIterations) for assignment in starts]
+        if Threading and len(starts) > 1:
+            import multiprocessing as mp
+            if startMethod is None:
+                startMethod = 'spawn'
+            mpctx = mp.get_context(startMethod)
+            if nbrCores is None:
+                nbrCores = mpctx.cpu_count()
+            if Comments:
+                print('Enhancing %d starts with %d processes' %\
+                      (len(starts),min(nbrCores,len(starts))))
+            with mpctx.Pool(min(nbrCores,len(starts))) as proc:
+                results = proc.starmap(_multiStartSwapsWorker,
+                        [(_enhanceInterGroupSwaps,args) for args in argsList])
+        else:
+            results = [_enhanceInterGroupSwaps(*args) for args in argsList]
+        best = None
+        for sigma,t,tabuHistory in results:
+            matching = frozenset([frozenset([aKeys[i],bKeys[sigma[i]]])
+                                  for i in range(n)])
+            fitness = self.computeIndividualCorrelations(matching)
+            if Comments:
+                print('start: %.3f, %.3f, %d iterations' % (fitness[1],fitness[2],t))
+            if best is None or fitness[1] > best[0][1] or\
+               (fitness[1] == best[0][1] and fitness[2] < best[0][2]):
+                history = [[[aKeys[i],bKeys[x]],[aKeys[j],bKeys[y]]]
+                           for i,x,j,y in tabuHistory]
+                best = (fitness,t,history)
+        return best
+
 #------   specialized pairing classes -------
 
 class FairestBachetInterGroupMatching(InterGroupPairing):
@@ -957,6 +1198,10 @@ class FairnessEnhancedInterGroupMatching(InterGroupPairing):
          elif 'bestCopeland' a best Copeland intergroup matching is used,
          elif 'Random' a shuffled version of the bi is matched to the ai,
        * The *seed* parameter is used for allowing to repete the same experiment
+       * *nbrOfRandomStarts* : 0 (default) | the number of additionally enhanced random
+         initial matchings (see :py:meth:`~pairings.InterGroupPairing.computeMultiStartFairnessEnhancement`)
+       * *Threading* : False (default) | True, the random starts are enhanced
+         in a multiprocessing pool of *nbrCores* processes with the *startMethod* context
        
     See the :ref:`tutorial on computing fair intergroup pairings <Fair-InterGroup-Pairings-label>`.
     """
@@ -966,6 +1211,8 @@ class FairnessEnhancedInterGroupMatching(InterGroupPairing):
                  #RandomInit=False,
                  seed=None,
                  maxIterations=None,
+                 nbrOfRandomStarts=0,
+                 Threading=False,nbrCores=None,startMethod=None,
                  Comments=False,Debug=False):
         from time import time
         from decimal import Decimal
@@ -1010,14 +1257,10 @@ class FairnessEnhancedInterGroupMatching(InterGroupPairing):
                     copelandScores[bi][aj] = Decimal()
             for i in range(n):
                 ai = aKeys[i]
-                for j in range(n):
-                    bj = bKeys[j]   
-                    copelandScores[ai][bj] = self.computeCopelandScore(vpA,ai,bj)               
+                copelandScores[ai].update(self.computeCopelandScores(vpA,ai))
             for j in range(n):
                 bj = bKeys[j]
-                for i in range(n):
-                    ai = aKeys[i]   
-                    copelandScores[bj][ai] = self.computeCopelandScore(vpB,bj,ai)                
+                copelandScores[bj].update(self.computeCopelandScores(vpB,bj))
             self.fitnessScores = copelandScores
 ##            if Debug:
 ##                self.showCopelandRankingScores()
@@ -1318,7 +1561,29 @@ class FairnessEnhancedInterGroupMatching(InterGroupPairing):
                     self.groupAScores = fitnessG[4]
                     self.groupBScores = fitnessG[5]
                     self.runTimes['enhancing'] = time() - t2
-            
+
+        # enhancing random initial matchings
+        if nbrOfRandomStarts > 0:
+            tms = time()
+            fitnessMS,itMS,historyMS = self.computeMultiStartFairnessEnhancement(
+                                        nbrOfStarts=nbrOfRandomStarts,
+                                        seed=seed,
+                                        maxIterations=maxIterations,
+                                        Threading=Threading,nbrCores=nbrCores,
+                                        startMethod=startMethod,
+                                        Comments=Comments)
+            if fitnessMS[1] > self.maxCorr or\
+               (fitnessMS[1] == self.maxCorr and fitnessMS[2] < self.stDev):
+                if Comments or Debug:
+                    print('Storing fairness enhanced random initial matching')
+                self.matching = fitnessMS[0]
+                self.iterations = itMS
+                self.history = historyMS
+                self.maxCorr = fitnessMS[1]
+                self.stDev = fitnessMS[2]
+                self.groupAScores = fitnessMS[4]
+                self.groupBScores = fitnessMS[5]
+            self.runTimes['multiStart'] = time() - tms            
             
         #storing the Graph data
         self.vertices = vpA.voters | vpB.voters
@@ -1990,12 +2255,22 @@ class FairestInterGroupPairing(InterGroupPairing):
        * *vpB* : reciprocal VotingProfile instance
        * *oderLimit* : preventing a potential CPU memory or time overflow
        * *StableMatchings* : False (default) / True limits to only stable matchings
+       * *solver* : 'enumeration' (default) scores all the maximal matchings /
+         'assignment' computes directly a fairest pairing in polynomial time
+         and ignores the *orderLimit* parameter
+       * *FairnessTieBreaking* : True (default) / False, with the 'assignment' solver,
+         the ties of the average correlation are broken with the fairness criteria
+
+    With the 'assignment' solver, the *pairings* attribute only contains the
+    fairest pairing (see :py:meth:`~pairings.FairestInterGroupPairing._computeFairestAssignment`).
 
     See the :ref:`tutorial on computing fair intergroup pairings <Fair-InterGroup-Pairings-label>`.
     """
 
     def __init__(self,vpA,vpB,orderLimit=6,
                  StableMatchings=False,
+                 solver='enumeration',
+                 FairnessTieBreaking=True,
                  Comments=False,Debug=False):
 
         from copy import deepcopy
@@ -2007,10 +2282,14 @@ class FairestInterGroupPairing(InterGroupPairing):
         k = len(groupA)
         if Debug:
             print('groupA',groupA) 
-        if k > orderLimit:
+        if solver not in ('enumeration','assignment'):
+            print('!!!Error: solver = %s is not provided. Only enumeration and assignment are provided.' % solver)
+            return
+        if solver == 'enumeration' and k > orderLimit:
             print('The size %d of the groups to pair is too high' % k)
             print('The order limit is %d' % orderLimit)
             print('Use the orderLimit parameter for larger orders')
+            print("or the solver='assignment' parameter")
             return
         t0 = time()
         groupB = [x for x in vpB.voters]
@@ -2046,129 +2325,139 @@ class FairestInterGroupPairing(InterGroupPairing):
         runTimes['bipartiteGraph'] = t2 - t1
         if Comments:
             print(runTimes)
-        # compute maximal matchings
-        from graphs import LineGraph
-        lbpg = LineGraph(bpg)
-        lbpg.computeMIS()
-        maximalMatchings = lbpg.misset
-        nm = len(maximalMatchings)
-        t3 = time()
-        runTimes['maximalMatching'] = t3 - t2
-        if Comments:
-            print(runTimes)
-        # computing matching correlations
-        from statistics import mean, stdev
-        from decimal import Decimal
-        from digraphs import IndeterminateDigraph
-        pairings = []
-        groupAScores = {}
-        groupBScores = {}
-        ni = 1
-        for matching in maximalMatchings:
+        if solver == 'assignment':
+            # computing directly a fairest perfect matching
+            t3 = time()
+            pairings = [self._computeFairestAssignment(FairnessTieBreaking=FairnessTieBreaking,
+                                                       Debug=Debug)]
+            t4 = time()
+            runTimes['maximalMatching'] = t4 - t3
             if Comments:
-                print('%d/%d' % (ni,nm) )
-            ni += 1
-            # computing groupA's scores
+                print(runTimes)
+        else:
+            # compute maximal matchings
+            from graphs import LineGraph
+            lbpg = LineGraph(bpg)
+            lbpg.computeMIS()
+            maximalMatchings = lbpg.misset
+            nm = len(maximalMatchings)
+            t3 = time()
+            runTimes['maximalMatching'] = t3 - t2
+            if Comments:
+                print(runTimes)
+            # computing matching correlations
+            from statistics import mean, stdev
+            from decimal import Decimal
+            from digraphs import IndeterminateDigraph
+            pairings = []
             groupAScores = {}
-            for m in groupA:
-                edg = IndeterminateDigraph(order=len(vpA.candidates))
-                edg.actions = groupB
-                Min = edg.valuationdomain['min']
-                Med = edg.valuationdomain['med']
-                Max = edg.valuationdomain['max']
-
-                mmatch = [x for x in matching if m in x]
-                mmatch = [x for x in mmatch[0] if x != m]
+            groupBScores = {}
+            ni = 1
+            for matching in maximalMatchings:
+                if Comments:
+                    print('%d/%d' % (ni,nm) )
+                ni += 1
+                # computing groupA's scores
+                groupAScores = {}
+                for m in groupA:
+                    edg = IndeterminateDigraph(order=len(vpA.candidates))
+                    edg.actions = groupB
+                    Min = edg.valuationdomain['min']
+                    Med = edg.valuationdomain['med']
+                    Max = edg.valuationdomain['max']
+
+                    mmatch = [x for x in matching if m in x]
+                    mmatch = [x for x in mmatch[0] if x != m]
                 
-                relation = {}
-                for x in groupB:
-                    relation[x] = {}
-                    for y in groupB:
-                        relation[x][y] = Med
-                n = len(edg.actions)
-                for i in range(n):
-                    x = groupB[i]
-                    for j in range(i+1,n):
-                        y = groupB[j]
-                        if x == mmatch[0]:
-                            relation[x][y] = Max
-                            relation[y][x] = Min
-                        elif y == mmatch[0]:
-                            relation[x][y] = Min
-                            relation[y][x] = Max
-                        else:
-                            pass
-                edg.relation = relation
-                edg.gamma = edg.gammaSets()
-                edg.notGamma = edg.notGammaSets()
-                #corr = edg.computeRankingCorrelation(vpA.linearBallot[m])
-                corr = edg.computeOrdinalCorrelation(vpA.ballot[m])
-                groupAScores[m] = Decimal('%.3f' % corr['correlation'])
+                    relation = {}
+                    for x in groupB:
+                        relation[x] = {}
+                        for y in groupB:
+                            relation[x][y] = Med
+                    n = len(edg.actions)
+                    for i in range(n):
+                        x = groupB[i]
+                        for j in range(i+1,n):
+                            y = groupB[j]
+                            if x == mmatch[0]:
+                                relation[x][y] = Max
+                                relation[y][x] = Min
+                            elif y == mmatch[0]:
+                                relation[x][y] = Min
+                                relation[y][x] = Max
+                            else:
+                                pass
+                    edg.relation = relation
+                    edg.gamma = edg.gammaSets()
+                    edg.notGamma = edg.notGammaSets()
+                    #corr = edg.computeRankingCorrelation(vpA.linearBallot[m])
+                    corr = edg.computeOrdinalCorrelation(vpA.ballot[m])
+                    groupAScores[m] = Decimal('%.3f' % corr['correlation'])
             
-            # computing groupB's scores
-            groupBScores = {}
-            for w in groupB:
-                edg.actions = groupA
-                Min = edg.valuationdomain['min']
-                Med = edg.valuationdomain['med']
-                Max = edg.valuationdomain['max']
-
-                wmmatch = [x for x in matching if w in x]
-                wmmatch = [x for x in wmmatch[0] if x != w]                
-                relation = {}
-                for x in groupA:
-                    relation[x] = {}
-                    for y in groupA:
-                        relation[x][y] = Med
-                n = len(edg.actions)
-                for i in range(n):
-                    x = groupA[i]
-                    for j in range(i+1,n):
-                        y = groupA[j]
-                        if x == wmmatch[0]:
-                            relation[x][y] = Max
-                            relation[y][x] = Min
-                        elif y == wmmatch[0]:
-                            relation[x][y] = Min
-                            relation[y][x] = Max
-                        else:
-                            pass
-                edg.relation = relation
-                edg.gamma = edg.gammaSets()
-                edg.notGamma = edg.notGammaSets()
-                #corr = edg.computeRankingCorrelation(vpB.linearBallot[w])
-                corr = edg.computeOrdinalCorrelation(vpB.ballot[w])
-                groupBScores[w] = Decimal('%.3f' % corr['correlation'])
-            t3a = time()
-            runTimes['GroupCorrelations'] = t3a - t3
-            # computing matching fitness scores
-
-            aCorrelations = [groupAScores[w] for w in groupAScores]
-##            for w in groupAScores:
-##                aCorrelations.append(groupAScores[w])
-            bCorrelations = [groupBScores[m] for m in groupBScores]
-##            for m in groupBScores:
-##                bCorrelations.append(groupBScores[m])
-            ACorr = mean(aCorrelations)
-            BCorr = mean(bCorrelations)
-            fairness = abs(ACorr-BCorr)
-            matchingCorrelations = aCorrelations + bCorrelations
-            if Debug:
-                print(matching)
-                print(matchingCorrelations)
-            avgCorr = mean(matchingCorrelations)
-            stdCorr = stdev(matchingCorrelations)
-            if Debug:
-                print(avgCorr,stdCorr)
-            pairings.append((matching,avgCorr,-stdCorr,avgCorr-stdCorr,
-                             groupAScores,groupBScores,-fairness))
+                # computing groupB's scores
+                groupBScores = {}
+                for w in groupB:
+                    edg.actions = groupA
+                    Min = edg.valuationdomain['min']
+                    Med = edg.valuationdomain['med']
+                    Max = edg.valuationdomain['max']
+
+                    wmmatch = [x for x in matching if w in x]
+                    wmmatch = [x for x in wmmatch[0] if x != w]                
+                    relation = {}
+                    for x in groupA:
+                        relation[x] = {}
+                        for y in groupA:
+                            relation[x][y] = Med
+                    n = len(edg.actions)
+                    for i in range(n):
+                        x = groupA[i]
+                        for j in range(i+1,n):
+                            y = groupA[j]
+                            if x == wmmatch[0]:
+                                relation[x][y] = Max
+                                relation[y][x] = Min
+                            elif y == wmmatch[0]:
+                                relation[x][y] = Min
+                                relation[y][x] = Max
+                            else:
+                                pass
+                    edg.relation = relation
+                    edg.gamma = edg.gammaSets()
+                    edg.notGamma = edg.notGammaSets()
+                    #corr = edg.computeRankingCorrelation(vpB.linearBallot[w])
+                    corr = edg.computeOrdinalCorrelation(vpB.ballot[w])
+                    groupBScores[w] = Decimal('%.3f' % corr['correlation'])
+                t3a = time()
+                runTimes['GroupCorrelations'] = t3a - t3
+                # computing matching fitness scores
+
+                aCorrelations = [groupAScores[w] for w in groupAScores]
+    ##            for w in groupAScores:
+    ##                aCorrelations.append(groupAScores[w])
+                bCorrelations = [groupBScores[m] for m in groupBScores]
+    ##            for m in groupBScores:
+    ##                bCorrelations.append(groupBScores[m])
+                ACorr = mean(aCorrelations)
+                BCorr = mean(bCorrelations)
+                fairness = abs(ACorr-BCorr)
+                matchingCorrelations = aCorrelations + bCorrelations
+                if Debug:
+                    print(matching)
+                    print(matchingCorrelations)
+                avgCorr = mean(matchingCorrelations)
+                stdCorr = stdev(matchingCorrelations)
+                if Debug:
+                    print(avgCorr,stdCorr)
+                pairings.append((matching,avgCorr,-stdCorr,avgCorr-stdCorr,
+                                 groupAScores,groupBScores,-fairness))
 
-        # sorting the fitness scores
-        from operator import itemgetter
-        pairings.sort(reverse=True,key=itemgetter(1,6,2))
-        #pairings.sort(reverse=True,key=itemgetter(6,1,3))
-        t4 = time()
-        runTimes['Correlations'] = t4 - t3a
+            # sorting the fitness scores
+            from operator import itemgetter
+            pairings.sort(reverse=True,key=itemgetter(1,6,2))
+            #pairings.sort(reverse=True,key=itemgetter(6,1,3))
+            t4 = time()
+            runTimes['Correlations'] = t4 - t3a
         # index to stable pairings
         if StableMatchings:
             stableIndex = []
@@ -2236,6 +2525,115 @@ class FairestInterGroupPairing(InterGroupPairing):
     #                             matching=self.pairings[rank-1][0],
     #                             layout='circo')
        
+    def _computeFairestAssignment(self,FairnessTieBreaking=True,Debug=False):
+        """
+        Renders the fitness tuple, in the format of the self.pairings list,
+        of a fairest pairing computed with the Hungarian assignment algorithm
+        (see :py:func:`digraphsTools.computeMaximumWeightAssignment`).
+
+        The individual correlation of a person only depends on the partner
+        (see :py:meth:`~pairings.InterGroupPairing.computeCorrelationScore`).
+        The average correlation of a pairing is hence the sum of its pair
+        weights and is maximized exactly on integer weights in thousandths.
+
+        With *FairnessTieBreaking*, the ties are broken lexicographically.
+        As the average correlation is fixed, minimizing the standard deviation
+        amounts to minimizing the sum of the squared correlations, which is a
+        linear tie-breaker. The absolute difference between both group
+        averages is not linear; the fairest of the maximal pairings favouring
+        either group A, either group B, or neither of them, is kept and
+        further enhanced with partner swaps preserving the average correlation.
+        """
+        from statistics import mean, stdev
+        from digraphsTools import computeMaximumWeightAssignment
+        vpA = self.vpA
+        vpB = self.vpB
+        groupA = self.verticesKeysA
+        groupB = self.verticesKeysB
+        k = len(groupA)
+        aRows = {a: self.computeCorrelationScores(vpA,a) for a in groupA}
+        bRows = {b: self.computeCorrelationScores(vpB,b) for b in groupB}
+        aScores = [[aRows[a][b] for b in groupB] for a in groupA]
+        bScores = [[bRows[b][a] for b in groupB] for a in groupA]
+        # integer weights in thousandths and squared thousandths
+        fitness = []
+        fairness = []
+        squares = []
+        for i in range(k):
+            ai = [int(x*1000) for x in aScores[i]]
+            bi = [int(x*1000) for x in bScores[i]]
+            fitness.append([ai[j] + bi[j] for j in range(k)])
+            fairness.append([ai[j] - bi[j] for j in range(k)])
+            squares.append([ai[j]*ai[j] + bi[j]*bi[j] for j in range(k)])
+        if FairnessTieBreaking:
+            squaresRange = k*2000000 + 1
+            fitnessRange = (4*k*1000 + 1)*squaresRange
+            tieBreakers = (0,1,-1)
+        else:
+            squaresRange = 0
+            fitnessRange = 1
+            tieBreakers = (0,)
+        candidates = []
+        for sign in tieBreakers:
+            weights = [[fitness[i][j]*fitnessRange
+                        + sign*fairness[i][j]*squaresRange
+                        - (squares[i][j] if FairnessTieBreaking else 0)
+                        for j in range(k)] for i in range(k)]
+            assignment = computeMaximumWeightAssignment(weights)
+            if FairnessTieBreaking:
+                self._swapFairestAssignment(assignment,fitness,fairness,squares)
+            groupAScores = {}
+            groupBScores = {}
+            for i in range(k):
+                a = groupA[i]
+                b = groupB[assignment[i]]
+                groupAScores[a] = aScores[i][assignment[i]]
+                groupBScores[b] = bScores[i][assignment[i]]
+            matching = frozenset([frozenset([groupA[i],groupB[assignment[i]]])
+                                  for i in range(k)])
+            aCorrelations = [groupAScores[a] for a in groupA]
+            bCorrelations = [groupBScores[b] for b in groupB]
+            ACorr = mean(aCorrelations)
+            BCorr = mean(bCorrelations)
+            matchingCorrelations = aCorrelations + bCorrelations
+            avgCorr = mean(matchingCorrelations)
+            stdCorr = stdev(matchingCorrelations)
+            if Debug:
+                print(sign,matching,avgCorr,stdCorr)
+            candidates.append((matching,avgCorr,-stdCorr,avgCorr-stdCorr,
+                               groupAScores,groupBScores,-abs(ACorr-BCorr)))
+        from operator import itemgetter
+        candidates.sort(reverse=True,key=itemgetter(1,6,2))
+        return candidates[0]
+
+    def _swapFairestAssignment(self,assignment,fitness,fairness,squares):
+        """
+        Swaps in place the partners of two persons of group A in the given
+        maximal *assignment* as long as the total fitness is kept and the
+        absolute fairness difference, or else the sum of squares, decreases.
+        """
+        k = len(assignment)
+        totalFairness = sum(fairness[i][assignment[i]] for i in range(k))
+        improved = True
+        while improved:
+            improved = False
+            for i in range(k):
+                for j in range(i+1,k):
+                    bi = assignment[i]
+                    bj = assignment[j]
+                    if fitness[i][bj] + fitness[j][bi] != fitness[i][bi] + fitness[j][bj]:
+                        continue
+                    newFairness = totalFairness - fairness[i][bi] - fairness[j][bj]\
+                                  + fairness[i][bj] + fairness[j][bi]
+                    deltaSquares = squares[i][bj] + squares[j][bi]\
+                                   - squares[i][bi] - squares[j][bj]
+                    if abs(newFairness) < abs(totalFairness) or\
+                       (abs(newFairness) == abs(totalFairness) and deltaSquares < 0):
+                        assignment[i] = bj
+                        assignment[j] = bi
+                        totalFairness = newFairness
+                        improved = True
+
     def showFairestPairing(self,rank=1,WithIndividualCorrelations=False):
         """
         Setting the *rank* parameter to a value > 1,
@@ -2523,56 +2921,24 @@ class IntraGroupPairing(Graph):
         Individual correlations for intragroup pairing solution
         returns a tuple called fitness with following content
         avgCorr,stdCorr, groupScores
+
+        The individual correlations are computed with the
+        :py:meth:`~pairings.IntraGroupPairing.computeCorrelationScore` method.
         """
-        # computing groupA's scores
-        from digraphs import IndeterminateDigraph
-        from decimal import Decimal
         from statistics import mean, stdev
         groupAScores = {}
-        vpA = self.vpA
         groupA = self.persons
         if matching is None:
             matching = self.matching
+        partner = {}
+        for m in matching:
+            pair = list(m)
+            partner[pair[0]] = pair[1]
+            partner[pair[1]] = pair[0]
         for m in groupA:
-            groupB = groupA
-            edg = IndeterminateDigraph(order=len(groupA))
-            edg.actions = groupB
-            Min = edg.valuationdomain['min']
-            Med = edg.valuationdomain['med']
-            Max = edg.valuationdomain['max']
-
-            mmatch = [x for x in matching if m in x]
-            mmatch = [x for x in mmatch[0] if x != m]
-            
-            relation = {}
-            for x in groupB:
-                relation[x] = {}
-                for y in groupB:
-                    relation[x][y] = Med
-            n = len(groupB)
-            for i in range(n):
-                x = groupB[i]
-                for j in range(i+1,n):
-                    y = groupB[j]
-                    if x == mmatch[0]:
-                        relation[x][y] = Max
-                        relation[y][x] = Min
-                    elif y == mmatch[0]:
-                        relation[x][y] = Min
-                        relation[y][x] = Max
-                    else:
-                        pass
-            edg.relation = relation
-            edg.gamma = edg.gammaSets()
-            edg.notGamma = edg.notGammaSets()
-            if Debug:
-                print(m)
-                edg.showRelationTable()
-            ballot = vpA.ballot[m]
+            groupAScores[m] = self.computeCorrelationScore(m,partner[m])
             if Debug:
-                edg.showRelationTable(relation=ballot)
-            corr = edg.computeOrdinalCorrelation(ballot)
-            groupAScores[m] = Decimal('%.3f' % corr['correlation'])
+                print(m,partner[m],groupAScores[m])
         scores = [groupAScores[m] for m in groupAScores]
         
         return mean(scores), stdev(scores), groupAScores
@@ -2592,6 +2958,95 @@ class IntraGroupPairing(Graph):
             score += ba[b][candidates[i]] - ba[candidates[i]][b]
         return score
 
+    def computeCorrelationScore(self,a,b):
+        """
+        Renders the ordinal correlation between the pairing preferences
+        of person *a* and the partial ranking putting partner *b* first,
+        i.e. the individual correlation of *a* when paired with *b*,
+        as computed by the :py:meth:`~pairings.IntraGroupPairing.computeIndividualCorrelations` method.
+        """
+        from decimal import Decimal
+        vpA = self.vpA
+        ba = vpA.ballot[a]
+        one = Decimal('1')
+        correlation = Decimal('0')
+        determination = Decimal('0')
+        for c in vpA.voters:
+            if c != b:
+                # the [-1,1] truncated values of b > c and c > b
+                bc = max(-one,min(one,ba[b][c]))
+                cb = max(-one,min(one,ba[c][b]))
+                correlation += bc - cb
+                determination += abs(bc) + abs(cb)
+        if determination > Decimal('0'):
+            correlation /= determination
+        else:
+            correlation = Decimal('0.0')
+        return Decimal('%.3f' % correlation)
+
+    def computeCorrelationScores(self,a):
+        """
+        Renders the dictionary of the individual correlations of person *a*
+        with each one of the potential partners
+        (see :py:meth:`~pairings.IntraGroupPairing.computeCorrelationScore`),
+        computed with row and column sums over the ballot of *a*.
+        """
+        from decimal import Decimal
+        vpA = self.vpA
+        ba = vpA.ballot[a]
+        zero = Decimal('0')
+        one = Decimal('1')
+        candidates = [c for c in vpA.voters]
+        rows = []
+        for i in range(len(candidates)):
+            bx = ba[candidates[i]]
+            if list(bx) == candidates:
+                row = list(bx.values())
+            else:
+                row = [bx[y] for y in candidates]
+            row[i] = zero
+            rows.append(row)
+        if max(max(row) for row in rows) > one or\
+           min(min(row) for row in rows) < -one:
+            rows = [[max(-one,min(one,v)) for v in row] for row in rows]
+        absRows = [list(map(abs,row)) for row in rows]
+        columns = list(zip(*rows))
+        absColumns = list(zip(*absRows))
+        scores = {}
+        for i in range(len(candidates)):
+            correlation = sum(rows[i],zero) - sum(columns[i],zero)
+            determination = sum(absRows[i],zero) + sum(absColumns[i],zero)
+            if determination > zero:
+                correlation /= determination
+            else:
+                correlation = Decimal('0.0')
+            scores[candidates[i]] = Decimal('%.3f' % correlation)
+        return scores
+
+    def computeCopelandScores(self,a):
+        """
+        Renders the dictionary of the Copeland scores of person *a* for each one
+        of the potential partners (see :py:meth:`~pairings.IntraGroupPairing.computeCopelandScore`),
+        computed with row and column sums over the ballot of *a*.
+        """
+        from decimal import Decimal
+        vpA = self.vpA
+        ba = vpA.ballot[a]
+        zero = Decimal('0')
+        candidates = [c for c in vpA.voters]
+        rows = []
+        for x in candidates:
+            bx = ba[x]
+            if list(bx) == candidates:
+                rows.append(list(bx.values()))
+            else:
+                rows.append([bx[y] for y in candidates])
+        columns = list(zip(*rows))
+        scores = {}
+        for i in range(len(candidates)):
+            scores[candidates[i]] = sum(rows[i],zero) - sum(columns[i],zero)
+        return scores
+
     def computeBachetScore(self,a,b):
         """
         Computes fitness of swapping candidates
@@ -2680,22 +3135,17 @@ class IntraGroupPairing(Graph):
                                 Comments=False,Debug=False):
         """
         Heuristic for fairness enhancing of given matching
+
+        The couples of pairs are recombined in decreasing order of their
+        fitness gains as long as the average correlation does not decrease.
+        The gains are kept in matrices updated incrementally after each
+        recombination and the visited matchings are hashed
+        (see the :py:func:`~pairings._enhanceIntraGroupSwaps` kernel).
         """
-        from copy import copy
-        from decimal import Decimal
-        
-        
-        vpA = self.vpA
+        from statistics import mean
         persons = self.persons
         initialMatching = matching
         pairs = []
-        aKeys = persons
-        bKeys = persons
-        matchesVisited = [initialMatching]
-        corrA, stdDevA, groupAScores =\
-                self.computeIndividualCorrelations(initialMatching)
-        maxCorr = corrA
-
         for m in initialMatching:
             pair = list(m)
             pairs.append(pair)                
@@ -2703,188 +3153,26 @@ class IntraGroupPairing(Graph):
         if Comments:
             print('*---- Initial matching ----*')
             print(pairs)
-        n = len(pairs)
-        newPairs = pairs.copy()    
-        self.t += 1
-        if maxCorr < Decimal('1.0'):
-            Enhanced = True
-        else:
-            Enhanced = False
-            if Debug:
-                print('the given matching is fairest possible')
-                print(newPairs,maxCorr)
-            return pairs,maxCorr,matchesVisited
-        #history = []    
-        while Enhanced and self.t <= self.maxIterations:            
-            Enhanced = False
-            if Comments:
-                print('Enhancing iteration : ', self.t)
-            if Debug:
-                print(pairs)
-            enhanceFitness = []
-            for i in range(n):
-                pair1 = pairs[i]
-                for j in range(i+1,n):
-                    if Debug:
-                        print(i,j)                
-                    pair2 = pairs[j]
-                    #if (pair1,pair2) not in history:
-                        #history.append((pair1,pair2))
-                    rankDifA1 = self.fitnessScores[pair1[0]][pair2[1]] - \
-                                self.fitnessScores[pair1[0]][pair1[1]]
-                    rankDifA2 = self.fitnessScores[pair2[0]][pair1[1]] - \
-                                self.fitnessScores[pair2[0]][pair2[1]]
-##                    if Debug:
-##                        print('rankDifferences A')
-##                        print([pair1,pair2])
-##                        print(pair1[0],pair2[1],pair1[1],rankDifA1)
-##                        print(pair2[0],pair1[1],pair2[1],rankDifA2)
-                    difGroupA = rankDifA1 + rankDifA2
-                    rankDifB1 = self.fitnessScores[pair1[1]][pair2[0]] - \
-                                self.fitnessScores[pair1[1]][pair1[0]]
-                    rankDifB2 = self.fitnessScores[pair2[1]][pair1[0]] - \
-                                self.fitnessScores[pair2[1]][pair2[0]]
-##                    if Debug:
-##                        print('rankDifferences B')
-##                        print([pair1,pair2])      
-##                        print(rankDifB1)
-##                        print(rankDifB2)
-                    difGroupB = rankDifB1 + rankDifB2
-                    enhanceFitness.append( ( (difGroupA + difGroupB), (i,j), False ) )
-##                    if Debug:
-##                        print('Twisted')
-##                        print('avant',pair1,pair2)
-                    tpair1 = copy(pair1)
-                    tpair2 = copy(pair2)
-                    sw = copy(tpair1[1])
-                    tw = copy(tpair2[0])
-                    tpair1[1] = tw
-                    tpair2[0] = sw
-                    if Debug:
-                        print(tpair1,tpair2)
-##                    if [pair1,pair2] not in history:
-                    rankDifA1 = self.fitnessScores[tpair1[0]][tpair2[0]] - \
-                                self.fitnessScores[tpair1[0]][tpair1[1]]
-                    rankDifA2 = self.fitnessScores[tpair2[0]][tpair1[0]] - \
-                                self.fitnessScores[tpair2[0]][tpair2[1]]
-##                    if Debug:
-##                        print('rankDifferences A')
-##                        print([tpair1,tpair2])
-##                        print(rankDifA1,tpair1[0],tpair2[0],tpair1[1])
-##                        print(rankDifA2,tpair2[0],tpair1[0],tpair2[1])
-                    difGroupA = rankDifA1 + rankDifA2
-                    rankDifB1 = self.fitnessScores[tpair2[1]][tpair1[1]] - \
-                                self.fitnessScores[tpair2[1]][tpair2[0]]
-                    rankDifB2 = self.fitnessScores[tpair1[1]][tpair2[1]] - \
-                                self.fitnessScores[tpair1[1]][tpair1[0]]
-##                    if Debug:
-##                        print('rankDifferences B')
-##                        print([tpair1,tpair2])
-##                        print(rankDifB1,)
-##                        print(rankDifB2)
-                    difGroupB = rankDifB1 + rankDifB2
-                    enhanceFitness.append( ( -(difGroupA + difGroupB), (i,j), True ) )
-##                    else:
-##                        print((pair1,pair2), 'already in history')
-            if Debug:
-                print(self.t, enhanceFitness)
-                #print(history)
-            from operator import itemgetter
-            enhanceFitness.sort(reverse=True,key=itemgetter(0))
-            if Debug:
-                print(enhanceFitness)
-            ne = len(enhanceFitness)
-            _nbrOfSwappingRetrials = self._nbrOfSwappingRetrials
-            if _nbrOfSwappingRetrials >= ne:
-                _nbrOfSwappingRetrials = ne
-            
-            sortPosition = 0
-            ie = -1
-            je = -1
-            while enhanceFitness[sortPosition][0] >= Decimal('0') and\
-                  ie not in enhanceFitness[sortPosition][1] and \
-                  je not in enhanceFitness[sortPosition][1]:
-##                             and    sortPosition < _nbrOfSwappingRetrials:
-                newPairs = copy(pairs)
-                if Debug:
-                    print('sortPosition:', sortPosition)
-                    print(pairs)
-                ie = enhanceFitness[sortPosition][1][0]
-                je = enhanceFitness[sortPosition][1][1]
-                Twisted = enhanceFitness[sortPosition][2]
-                if Debug:
-                    print(ie,pairs[ie])
-                    print(je,pairs[je])
-                pair1 = pairs[ie]
-                pair2 = pairs[je]
-                if Twisted:
-                    npair1 = [pair1[0],pair2[0]]
-                    npair2 = [pair1[1],pair2[1]]
-                else:
-                    npair1 = [pair1[0],pair2[1]]
-                    npair2 = [pair2[0],pair1[1]]
-##                if Debug:
-##                    print(Twisted,npair1,npair2)
-##                    print(pair1,'-->>', npair1)
-##                    print(pair2,'-->>', npair2)
-##                    print(newPairs)
-                newPairs.pop(ie)
-                newPairs.insert(ie,npair1)
-                newPairs.pop(je)
-                newPairs.insert(je,npair2)
-                if Debug:
-                    print('-->>>', newPairs)
-                corrA, stdDevA, groupAScores =\
-                           self.computeIndividualCorrelations(newPairs)
-##                if Debug:
-##                    print('sortPosition:', sortPosition)
-##                    print(newPairs,corrA,stdDevA)
-                if corrA == Decimal('1.0'):
-                    if Debug:
-                        print('Current matching is fairest possible')
-                        print(newPairs,corrA)
-                    return newPairs,corrA,matchesVisited
-                if newPairs in matchesVisited:
-                    if Debug:
-                        print('Cycling:', newPairs)
-                    sortPosition += 1                
-                elif corrA < maxCorr:
-                    if Debug:
-                        print('No more correlation climbing')
-                        print('maxCorr: %.3f, corrA: %.3f' % (maxCorr,corrA))
-                    enhanced = False
-                    break
-                elif corrA >= maxCorr:
-                    if Debug:
-                        print('Correlation climbing')
-                        print('maxCorr: %.3f, corrA: %.3f' % (maxCorr,corrA))                        
-                    maxCorr = corrA
-                    pairs = newPairs.copy()
-                    matchesVisited.append(pairs)
-                    Enhanced = True
-                    sortPosition += 1
-                    if Debug:
-                        self.showMatchingFairness(pairs)
-                else:
-                    Enhanced = False
-                    break
-            self.t += 1
-##            if sortPosition < _nbrOfSwappingRetrials:
-##                #history.append([npair1,npair2])
-##                maxCorr = corrA
-##                pairs = newPairs.copy()
-##                matchesVisited.append(pairs)
-##                Enhanced = True
-##                t += 1
-##                if Debug:
-##                    self.showMatchingFairness(pairs)                    
-            if self.t > self.maxIterations:
-                print('!!!! Too many iterations (max=%d): %d\n' % (self.maxIterations,self.t))
-                print('You may adjust the *maxIterations* parameter')
-                Enhanced = False
-##        nfg = []
-##        for pair in newPairs:
-##            nfg.append(frozenset(pair))
+        index = {p: i for i,p in enumerate(persons)}
+        scores,correlations = self._computeSwapScores()
+        visited = []
+        if isinstance(initialMatching,list):
+            visited.append(tuple(tuple(index[p] for p in pair)
+                                 for pair in initialMatching))
+        indexPairs = [[index[pair[0]],index[pair[1]]] for pair in pairs]
+        indexPairs,corrSum,visitedPairs,self.t =\
+                _enhanceIntraGroupSwaps(scores,correlations,indexPairs,
+                                        self.t,self.maxIterations,
+                                        visited=visited)
+        if self.t > self.maxIterations:
+            print('!!!! Too many iterations (max=%d): %d\n' % (self.maxIterations,self.t))
+            print('You may adjust the *maxIterations* parameter')
+        pairs = [[persons[x],persons[y]] for x,y in indexPairs]
+        matchesVisited = [initialMatching]
+        for vp in visitedPairs:
+            matchesVisited.append([[persons[x],persons[y]] for x,y in vp])
+        maxCorr = mean([self.correlationScores[p][q] for p,q in pairs]
+                       + [self.correlationScores[q][p] for p,q in pairs])
         if Debug:
             print('Given matching')
             self.showMatchingFairness(initialMatching)
@@ -2893,6 +3181,96 @@ class IntraGroupPairing(Graph):
             print('number of iterations:',self.t)
         return pairs,maxCorr,matchesVisited
 
+    def _computeSwapScores(self):
+        """
+        Renders the lists of lists of the symmetric combined fitness scores
+        and of the individual correlations, in thousandths, of the persons.
+        The individual correlations are cached in the *correlationScores* attribute.
+        The Bachet integer scores are converted to int.
+        """
+        from decimal import Decimal
+        persons = self.persons
+        try:
+            correlationScores = self.correlationScores
+        except AttributeError:
+            correlationScores = {p: self.computeCorrelationScores(p)
+                                 for p in persons}
+            self.correlationScores = correlationScores
+        fitnessScores = self.fitnessScores
+        scores = []
+        correlations = []
+        for p in persons:
+            row = []
+            for q in persons:
+                score = fitnessScores[p][q] + fitnessScores[q][p]
+                if not isinstance(score,(int,Decimal)):
+                    score = int(score)
+                row.append(score)
+            scores.append(row)
+            correlations.append([int(correlationScores[p][q]*1000)
+                                 for q in persons])
+        return scores,correlations
+
+    def computeMultiStartFairnessEnhancement(self,nbrOfStarts=4,
+                                             initialMatchings=None,
+                                             seed=None,
+                                             Threading=False,nbrCores=None,
+                                             startMethod=None,
+                                             Comments=False):
+        """
+        Enhances with the heuristic of the :py:meth:`~pairings.IntraGroupPairing.enhanceMatchingFairness`
+        method the given *initialMatchings* list, completed with random perfect matchings
+        up to *nbrOfStarts*. Each start may run *self.maxIterations* iterations.
+        With *Threading*, the starts are run in a multiprocessing pool.
+
+        Renders the (matching, maxCorr, iterations) tuple of the enhanced matching
+        with highest average correlation.
+        """
+        import random
+        from statistics import mean
+        persons = self.persons
+        n = len(persons)
+        index = {p: i for i,p in enumerate(persons)}
+        random.seed(seed)
+        starts = []
+        if initialMatchings is not None:
+            for matching in initialMatchings:
+                pairs = sorted([list(m) for m in matching])
+                starts.append([[index[pair[0]],index[pair[1]]] for pair in pairs])
+        while len(starts) < nbrOfStarts:
+            shuffled = list(range(n))
+            random.shuffle(shuffled)
+            starts.append(sorted([sorted(shuffled[i:i+2]) for i in range(0,n,2)]))
+        scores,correlations = self._computeSwapScores()
+        argsList = [(scores,correlations,pairs,0,self.maxIterations)
+                    for pairs in starts]
+        if Threading and len(starts) > 1:
+            import multiprocessing as mp
+            if startMethod is None:
+                startMethod = 'spawn'
+            mpctx = mp.get_context(startMethod)
+            if nbrCores is None:
+                nbrCores = mpctx.cpu_count()
+            if Comments:
+                print('Enhancing %d starts with %d processes' %\
+                      (len(starts),min(nbrCores,len(starts))))
+            with mpctx.Pool(min(nbrCores,len(starts))) as proc:
+                results = proc.starmap(_multiStartSwapsWorker,
+                        [(_enhanceIntraGroupSwaps,args) for args in argsList])
+        else:
+            results = [_enhanceIntraGroupSwaps(*args) for args in argsList]
+        best = None
+        for pairs,corrSum,visitedPairs,t in results:
+            if Comments:
+                print('start: %.3f, %d iterations' % (corrSum/(1000*n),t))
+            if best is None or corrSum > best[0]:
+                best = (corrSum,pairs,t)
+        corrSum,pairs,t = best
+        matching = [[persons[x],persons[y]] for x,y in pairs]
+        maxCorr = mean([self.correlationScores[p][q] for p,q in matching]
+                       + [self.correlationScores[q][p] for p,q in matching])
+        return matching,maxCorr,t
+
 #-----------------------
 
 class FairnessEnhancedIntraGroupMatching(IntraGroupPairing):
@@ -2909,6 +3287,10 @@ class FairnessEnhancedIntraGroupMatching(IntraGroupPairing):
           elif 'random' a random maximal matching will be used with given *seed*
           elif 'bestCopeland' the best Copeland matching will be used as initial matching
         * *fitnessScores* : 'Bachet' | 'Copeland' (default)
+        * *nbrOfRandomStarts* : 0 (default) | the number of additionally enhanced random
+          initial matchings (see :py:meth:`~pairings.IntraGroupPairing.computeMultiStartFairnessEnhancement`)
+        * *Threading* : False (default) | True, the random starts are enhanced
+          in a multiprocessing pool of *nbrCores* processes with the *startMethod* context
     
     See the :ref:`tutorial on computing fair intragroup pairings <Fair-IntraGroup-Pairings-label>`.
           
@@ -2920,6 +3302,8 @@ class FairnessEnhancedIntraGroupMatching(IntraGroupPairing):
                  _nbrOfSwappingRetrials=None,
                  #RandomInit=False,
                  seed=None,
+                 nbrOfRandomStarts=0,
+                 Threading=False,nbrCores=None,startMethod=None,
                  Comments=False,Debug=False):
         from decimal import Decimal
         from time import time
@@ -2971,10 +3355,11 @@ class FairnessEnhancedIntraGroupMatching(IntraGroupPairing):
                         copelandScores[pi][pj] = Decimal()
                 for i in range(order):
                     pi = persons[i]
-                    for j in range(i+1,order):
-                        pj = persons[j]   
-                        copelandScores[pi][pj] = self.computeCopelandScore(pi,pj)
-                        copelandScores[pj][pi] = self.computeCopelandScore(pj,pi)                
+                    scores = self.computeCopelandScores(pi)
+                    for j in range(order):
+                        if j != i:
+                            pj = persons[j]
+                            copelandScores[pi][pj] = scores[pj]
                 self.fitnessScores = copelandScores
                 
             else:
@@ -3190,6 +3575,23 @@ class FairnessEnhancedIntraGroupMatching(IntraGroupPairing):
                 runTimes['rightEnhancing'] = 0
                 runTimes['enhancing'] = time() - te
 
+        # enhancing random initial matchings
+        if nbrOfRandomStarts > 0:
+            tms = time()
+            matchingMS,maxCorrMS,itMS = self.computeMultiStartFairnessEnhancement(
+                                        nbrOfStarts=nbrOfRandomStarts,
+                                        seed=seed,
+                                        Threading=Threading,nbrCores=nbrCores,
+                                        startMethod=startMethod,
+                                        Comments=Comments)
+            if maxCorrMS > self.maxCorr:
+                if Comments or Debug:
+                    print('Storing fairness enhanced random initial matching')
+                self.matching = matchingMS
+                self.maxCorr = maxCorrMS
+                self.iterations = itMS
+            runTimes['multiStart'] = time() - tms
+
 ##        t4 = time()
 ##        runTimes['totalTime'] = t4 -t0
 ##        self.runTimes = runTimes
@@ -3247,11 +3649,21 @@ class FairestIntraGroupPairing(IntraGroupPairing):
 
        * *vpA* : any type of VotingProfile instance
        * *oderLimit* : preventing a potential CPU memory or time overflow
+       * *solver* : 'enumeration' (default) scores all the maximal matchings /
+         'blossom' computes directly a fairest pairing in polynomial time
+         and ignores the *orderLimit* parameter
+       * *FairnessTieBreaking* : True (default) / False, with the 'blossom' solver,
+         the ties of the average correlation are broken with the standard deviation
+
+    With the 'blossom' solver, the *pairings* attribute only contains the
+    fairest pairing (see :py:meth:`~pairings.FairestIntraGroupPairing._computeFairestBlossomMatching`).
 
     See the :ref:`tutorial on computing fair intragroup pairings <Fair-IntraGroup-Pairings-label>`.
     """
 
     def __init__(self,vp,orderLimit=6,
+                 solver='enumeration',
+                 FairnessTieBreaking=True,
                  Comments=False,Debug=False):
         from copy import deepcopy
         from decimal import Decimal
@@ -3264,10 +3676,14 @@ class FairestIntraGroupPairing(IntraGroupPairing):
         order = len(persons)
         if Debug:
             print('persons',persons) 
-        if order > orderLimit:
+        if solver not in ('enumeration','blossom'):
+            print('!!!Error: solver = %s is not provided. Only enumeration and blossom are provided.' % solver)
+            return
+        if solver == 'enumeration' and order > orderLimit:
             print('The size %d of the group to pair is too high' % order)
             print('The order limit is %d' % orderLimit)
             print('Use the orderLimit parameter for larger orders')
+            print("or the solver='blossom' parameter")
             return
         if order % 2 != 0:
             print('The size %d of the group is not even' % order)
@@ -3296,93 +3712,104 @@ class FairestIntraGroupPairing(IntraGroupPairing):
         if Comments:
             print('Run time for input data: %.4f sec.' % runTimes['dataInput'])
 
-        # compute maximal matchings
-        tmm = time()
-        from graphs import CompleteGraph,LineGraph
-        cg = CompleteGraph(verticesKeys=verticesKeys)
-        lcg = LineGraph(cg)
-        lcg.computeMIS()
-        maximalMatchings = lcg.misset
-        nbrOfMatchings = len(maximalMatchings)
-        if Comments:
-            print('Number of maximal matchings: %d' % nbrOfMatchings)
-        self.nbrOfMatchings = nbrOfMatchings                    
-        runTimes['maximalMatching'] = time() - tmm
-        if Comments:
-            print('Run time for computing the maximxal matchings: %.4f sec.' %\
-                  runTimes['maximalMatching'])
-
-        # computing matching correlations
-        tmc = time()
-        from statistics import mean, stdev
-        from decimal import Decimal
-        from digraphs import IndeterminateDigraph
-        pairings = []
-        groupScores = {}
-
-        for matching in maximalMatchings:
-            if Debug:
-                print('matching:', matching)
-            # computing groupA's scores
+        if solver == 'blossom':
+            # computing directly a fairest perfect matching
+            tmm = time()
+            pairings = [self._computeFairestBlossomMatching(
+                            FairnessTieBreaking=FairnessTieBreaking,
+                            Debug=Debug)]
+            runTimes['maximalMatching'] = time() - tmm
+            if Comments:
+                print('Run time for computing a fairest matching: %.4f sec.' %\
+                      runTimes['maximalMatching'])
+        else:
+            # compute maximal matchings
+            tmm = time()
+            from graphs import CompleteGraph,LineGraph
+            cg = CompleteGraph(verticesKeys=verticesKeys)
+            lcg = LineGraph(cg)
+            lcg.computeMIS()
+            maximalMatchings = lcg.misset
+            nbrOfMatchings = len(maximalMatchings)
+            if Comments:
+                print('Number of maximal matchings: %d' % nbrOfMatchings)
+            self.nbrOfMatchings = nbrOfMatchings                    
+            runTimes['maximalMatching'] = time() - tmm
+            if Comments:
+                print('Run time for computing the maximxal matchings: %.4f sec.' %\
+                      runTimes['maximalMatching'])
+
+            # computing matching correlations
+            tmc = time()
+            from statistics import mean, stdev
+            from decimal import Decimal
+            from digraphs import IndeterminateDigraph
+            pairings = []
             groupScores = {}
-            for m in persons:
-                edg = IndeterminateDigraph(order=len(vp.candidates))
-                edg.actions = [x for x in vp.voters]
-                Min = edg.valuationdomain['min']
-                Med = edg.valuationdomain['med']
-                Max = edg.valuationdomain['max']
-
-                mmatch = [x for x in matching if m in x]
-                if Debug:
-                    print(mmatch)
-                mmatch = [x for x in mmatch[0] if x != m]
+
+            for matching in maximalMatchings:
                 if Debug:
-                    print(mmatch)
-                relation = {}
-                for x in edg.actions:
-                    relation[x] = {}
-                    for y in edg.actions:
-                        relation[x][y] = Med
-                n = len(edg.actions)
-                for i in range(n):
-                    x = edg.actions[i]
-                    for j in range(i+1,n):
-                        y = edg.actions[j]
-                        if x == mmatch[0]:
-                            relation[x][y] = Max
-                            relation[y][x] = Min
-                        elif y == mmatch[0]:
-                            relation[x][y] = Min
-                            relation[y][x] = Max
-                        else:
-                            pass
-                edg.relation = relation
-                edg.gamma = edg.gammaSets()
-                edg.notGamma = edg.notGammaSets()
-                corr = edg.computeOrdinalCorrelation(vp.ballot[m])
-                groupScores[m] = Decimal('%.3f' % corr['correlation'])
+                    print('matching:', matching)
+                # computing groupA's scores
+                groupScores = {}
+                for m in persons:
+                    edg = IndeterminateDigraph(order=len(vp.candidates))
+                    edg.actions = [x for x in vp.voters]
+                    Min = edg.valuationdomain['min']
+                    Med = edg.valuationdomain['med']
+                    Max = edg.valuationdomain['max']
+
+                    mmatch = [x for x in matching if m in x]
+                    if Debug:
+                        print(mmatch)
+                    mmatch = [x for x in mmatch[0] if x != m]
+                    if Debug:
+                        print(mmatch)
+                    relation = {}
+                    for x in edg.actions:
+                        relation[x] = {}
+                        for y in edg.actions:
+                            relation[x][y] = Med
+                    n = len(edg.actions)
+                    for i in range(n):
+                        x = edg.actions[i]
+                        for j in range(i+1,n):
+                            y = edg.actions[j]
+                            if x == mmatch[0]:
+                                relation[x][y] = Max
+                                relation[y][x] = Min
+                            elif y == mmatch[0]:
+                                relation[x][y] = Min
+                                relation[y][x] = Max
+                            else:
+                                pass
+                    edg.relation = relation
+                    edg.gamma = edg.gammaSets()
+                    edg.notGamma = edg.notGammaSets()
+                    corr = edg.computeOrdinalCorrelation(vp.ballot[m])
+                    groupScores[m] = Decimal('%.3f' % corr['correlation'])
             
-            # computing matching fitness scores
-            correlations = [groupScores[w] for w in groupScores]
-            avgCorr = mean(correlations)
-            stdCorr = stdev(correlations)           
-            if Debug:
-                print(avgCorr,stdCorr)
-            pairings.append((matching,avgCorr,stdCorr,
-                             groupScores,-stdCorr))
-        runTimes['matchingCorrelations'] = time() - tmc
-        if Comments:
-            print('Run time for individual correlations: %.4f sec.' %\
-                  runTimes['matchingCorrelations'])
+                # computing matching fitness scores
+                correlations = [groupScores[w] for w in groupScores]
+                avgCorr = mean(correlations)
+                stdCorr = stdev(correlations)           
+                if Debug:
+                    print(avgCorr,stdCorr)
+                pairings.append((matching,avgCorr,stdCorr,
+                                 groupScores,-stdCorr))
+            runTimes['matchingCorrelations'] = time() - tmc
+            if Comments:
+                print('Run time for individual correlations: %.4f sec.' %\
+                      runTimes['matchingCorrelations'])
 
-        # sorting the fitness scores
-        ts = time()
-        from operator import itemgetter
-        pairings.sort(reverse=True,key=itemgetter(1,4))
-        runTimes['sortingFitness'] = time() - ts
-        if Comments:
-                print('Run time for fitness ranking: %.4f sec.' %\
-                      runTimes['sortingFitness'])
+            # sorting the fitness scores
+            ts = time()
+            from operator import itemgetter
+            pairings.sort(reverse=True,key=itemgetter(1,4))
+            runTimes['sortingFitness'] = time() - ts
+            if Comments:
+                    print('Run time for fitness ranking: %.4f sec.' %\
+                          runTimes['sortingFitness'])
             
             
         #self.cg = cg
@@ -3440,6 +3867,50 @@ class FairestIntraGroupPairing(IntraGroupPairing):
         
     #------------- class methods
 
+    def _computeFairestBlossomMatching(self,FairnessTieBreaking=True,Debug=False):
+        """
+        Renders the fitness tuple, in the format of the self.pairings list,
+        of a fairest pairing computed with Edmonds' weighted blossom algorithm
+        (see :py:func:`digraphsTools.computeMaximumWeightPerfectMatching`).
+
+        The weight of a pair is the sum of the individual correlations
+        of both partners (see :py:meth:`~pairings.IntraGroupPairing.computeCorrelationScore`),
+        so that the average correlation is maximized exactly on integer weights in thousandths.
+
+        With *FairnessTieBreaking*, the ties are broken by minimizing the
+        sum of the squared correlations, i.e. the standard deviation.
+        """
+        from statistics import mean, stdev
+        from digraphsTools import computeMaximumWeightPerfectMatching
+        persons = self.persons
+        n = len(persons)
+        rows = {p: self.computeCorrelationScores(p) for p in persons}
+        scores = [[rows[p][q] if p != q else None
+                   for q in persons] for p in persons]
+        if FairnessTieBreaking:
+            squaresRange = n*1000000 + 1
+        weights = {}
+        for i in range(n):
+            for j in range(i+1,n):
+                sij = int(scores[i][j]*1000)
+                sji = int(scores[j][i]*1000)
+                if FairnessTieBreaking:
+                    weights[(i,j)] = (sij + sji)*squaresRange - sij*sij - sji*sji
+                else:
+                    weights[(i,j)] = sij + sji
+        mate = computeMaximumWeightPerfectMatching(n,weights)
+        groupScores = {}
+        for i in range(n):
+            groupScores[persons[i]] = scores[i][mate[i]]
+        matching = frozenset([frozenset([persons[i],persons[mate[i]]])
+                              for i in range(n) if i < mate[i]])
+        correlations = [groupScores[p] for p in persons]
+        avgCorr = mean(correlations)
+        stdCorr = stdev(correlations)
+        if Debug:
+            print(matching,avgCorr,stdCorr)
+        return (matching,avgCorr,stdCorr,groupScores,-stdCorr)
+
     def computeMatchingFairnessIndex(self,matching,Comments=False):
         """
         Renders the index position of the given matching in the
@@ -21,7 +21,7 @@ import json
 import decimal
 # from digraphsTools import *
 from decimal import Decimal
-from collections import OrderedDict
+from collections import OrderedDict, abc
 from ast import literal_eval
 
 class PerformanceTableau(object):
@@ -166,10 +166,14 @@ The performance evaluations of each decision alternative on each criterion are g
                     % list(self.__dict__.keys())     
         return reprString
 
-    def __init__(self,filePerfTab=None,isEmpty=False):
+    def __init__(self,filePerfTab=None,isEmpty=False,MemoryMapped=False):
         from decimal import Decimal
         from collections import OrderedDict
-        if filePerfTab is not None:
+        from digraphsTools import isBinarySnapshotFile
+        if filePerfTab is not None and isBinarySnapshotFile(filePerfTab):
+            # binary snapshot stored with the saveBinary() method
+            self.loadBinary(filePerfTab,MemoryMapped=MemoryMapped)
+        elif filePerfTab is not None:
             fileName = filePerfTab + '.py'
             argDict = {}
             fi = open(fileName,'r')
@@ -830,7 +834,8 @@ The performance evaluations of each decision alternative on each criterion are g
         criteria = self.criteria
         criteriaList = [x for x in self.criteria]
         for g in criteriaList:
-            criteria[g]['weight'] = Decimal(str(criteria[g]['weight']))
+            if not isinstance(criteria[g]['weight'],Decimal):
+                criteria[g]['weight'] = Decimal(str(criteria[g]['weight']))
         self.criteria = criteria
 
     def convertEvaluation2Decimal(self):
@@ -842,8 +847,10 @@ The performance evaluations of each decision alternative on each criterion are g
         actionsList = [x for x in self.actions]
         criteriaList = [x for x in self.criteria]
         for g in criteriaList:
+            evg = evaluation[g]
             for x in actionsList:
-                evaluation[g][x] = Decimal(str(evaluation[g][x]))
+                if not isinstance(evg[x],Decimal):
+                    evg[x] = Decimal(str(evg[x]))
         self.evaluation = evaluation
 
     def convertWeights2Negative(self):
@@ -2837,6 +2844,99 @@ The performance evaluations of each decision alternative on each criterion are g
         fo.write( '}\n')
         fo.close()
 
+    def saveBinary(self,fileName='tempperftab',Comments=True):
+        """
+        Persistent storage of a performance tableau in a compact binary
+        snapshot file <fileName.d3b> (see :py:func:`digraphsTools.saveBinarySnapshot`).
+
+        The actions, objectives and criteria are stored in the JSON index header
+        and the evaluations in a float64 criteria x actions array.
+        Such a snapshot is reloaded, without parsing and executing any Python code,
+        with the *PerformanceTableau(fileName)* constructor or the
+        :py:meth:`~perfTabs.PerformanceTableau.loadBinary` method.
+
+        Requires the *numpy* package.
+        """
+        import numpy as np
+        from digraphsTools import saveBinarySnapshot, computeDecimalDigits
+        fileName = str(fileName)
+        if not fileName.endswith('.d3b'):
+            fileName += '.d3b'
+        if Comments:
+            print('*--- Saving performance tableau in binary file: <%s> ---*' % fileName)
+        actionsKeys = [x for x in self.actions]
+        criteriaKeys = [g for g in self.criteria]
+        evaluation = self.evaluation
+        try:
+            NA = self.NA
+        except AttributeError:
+            NA = Decimal('-999')
+        values = []
+        for g in criteriaKeys:
+            evg = evaluation[g]
+            for x in actionsKeys:
+                try:
+                    values.append(evg[x])
+                except KeyError:
+                    values.append(NA)
+        evaluationArray = np.array([float(v) for v in values],dtype=np.float64)
+        evaluationArray = evaluationArray.reshape((len(criteriaKeys),len(actionsKeys)))
+        header = {'type': 'PerformanceTableau',
+                  'class': self.__class__.__name__,
+                  'name': self.name,
+                  'actions': self.actions,
+                  'criteria': self.criteria,
+                  'actionsKeys': actionsKeys,
+                  'criteriaKeys': criteriaKeys,
+                  'NA': NA,
+                  'evaluationDigits': computeDecimalDigits(values + [NA]),
+                  }
+        for att in ('description','objectives','weightPreorder'):
+            try:
+                header[att] = getattr(self,att)
+            except AttributeError:
+                pass
+        saveBinarySnapshot(fileName,header,{'evaluation': evaluationArray})
+
+    def loadBinary(self,fileName,MemoryMapped=False):
+        """
+        Loads a performance tableau stored with the
+        :py:meth:`~perfTabs.PerformanceTableau.saveBinary` method.
+
+        With *MemoryMapped* = True, *self.evaluation* is a lazy dictionary view
+        (:py:class:`digraphsTools.ArrayRelationView`) on a copy-on-write memory
+        mapping of the snapshot file, otherwise a genuine double dictionary of
+        Decimal values.
+        """
+        from digraphsTools import loadBinarySnapshot, ArrayRelationView
+        name = str(fileName)
+        if name.endswith('.d3b'):
+            name = name[:-4]
+        header,arrays = loadBinarySnapshot(name + '.d3b',MemoryMapped=MemoryMapped)
+        if header.get('type') != 'PerformanceTableau':
+            print('Error: %s.d3b is not a performance tableau snapshot!' % name)
+            return
+        self.name = name
+        if 'description' in header:
+            self.description = header['description']
+        self.actions = header['actions']
+        self.objectives = header.get('objectives',OrderedDict())
+        self.criteria = header['criteria']
+        if 'weightPreorder' in header:
+            self.weightPreorder = header['weightPreorder']
+        else:
+            self.weightPreorder = self.computeWeightPreorder()
+        self.setObjectiveWeights()
+        self.NA = header['NA']
+        evaluation = ArrayRelationView(arrays['evaluation'],
+                                       header['criteriaKeys'],
+                                       ndigits=header['evaluationDigits'],
+                                       columnKeys=header['actionsKeys'])
+        if MemoryMapped:
+            self.evaluation = evaluation
+        else:
+            self.evaluation = evaluation.todict()
+
     def _saveXML(self,name='temp',category='standard',
                  subcategory='standard',author='digraphs Module (RB)',
                  reference='saved from Python'):
@@ -4559,6 +4659,130 @@ class PartialPerformanceTableau(PerformanceTableau):
                 evaluation[g][x] = deepcopy(inPerfTab.evaluation[g][x])
         self.evaluation = evaluation
         
+#-----------------------
+def _copyContainers(value):
+    """
+    Renders a copy of the nested dictionaries and lists of *value*.
+
+    Dictionaries keep their type, like OrderedDict, and all other values,
+    like Decimal, float, str or tuple values, are shared and not copied.
+    """
+    if isinstance(value,dict):
+        copied = value.copy()
+        for key,v in list(copied.items()):
+            if isinstance(v,(dict,list)):
+                copied[key] = _copyContainers(v)
+        return copied
+    elif isinstance(value,list):
+        return [_copyContainers(v) if isinstance(v,(dict,list)) else v\
+                for v in value]
+    else:
+        return value
+
+class _CopyOnWriteDict(abc.MutableMapping):
+    """
+    Lazy copy-on-write mapping on a *base* dictionary.
+
+    The entries are read from the *base* dictionary, which is shallow copied,
+    keeping its type, only on the first write. Nested dictionaries are
+    rendered as copy-on-write mappings themselves, and nested lists are copied
+    on their first access, so that writing through the mapping never modifies
+    the *base* dictionary. Pickled or deep copied instances become genuine
+    dictionaries.
+    """
+    __slots__ = ('_base','_data')
+    def __init__(self,base):
+        self._base = base
+        self._data = None
+
+    def _own(self):
+        if self._data is None:
+            self._data = self._base.copy()
+        return self._data
+
+    def __getitem__(self,key):
+        data = self._base if self._data is None else self._data
+        value = data[key]
+        if isinstance(value,dict):
+            value = _CopyOnWriteDict(value)
+            self._own()[key] = value
+        elif isinstance(value,list):
+            value = _copyContainers(value)
+            self._own()[key] = value
+        return value
+
+    def __setitem__(self,key,value):
+        self._own()[key] = value
+
+    def __delitem__(self,key):
+        del self._own()[key]
+
+    def __contains__(self,key):
+        return key in (self._base if self._data is None else self._data)
+
+    def __iter__(self):
+        return iter(self._base if self._data is None else self._data)
+
+    def __len__(self):
+        return len(self._base if self._data is None else self._data)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def copy(self):
+        if self._data is None:
+            return _CopyOnWriteDict(self._base)
+        return _CopyOnWriteDict(self._data.copy())
+
+    def __reduce__(self):
+        return (type(self._base),(list(self.items()),))
+
+def _readOnlyDict(mapping):
+    """
+    Renders the dictionary currently holding the entries of a copy-on-write
+    *mapping*, or the *mapping* itself, for fast read-only access.
+    """
+    if isinstance(mapping,_CopyOnWriteDict):
+        return mapping._base if mapping._data is None else mapping._data
+    return mapping
+
+class PerformanceTableauView(PerformanceTableau):
+    """
+    Copy-on-write view of a performance tableau *perfTab*.
+
+    The top level actions, objectives, criteria and evaluation dictionaries
+    of the view are copies, keeping their type, of the ones of *perfTab*.
+    Their entries, like the evaluations on a criterion or the attributes of
+    an action, are lazy copy-on-write mappings sharing the *perfTab* data:
+    an entry is copied only when it is written through the view. Editing
+    the view, converting for instance its weights or evaluations to Decimal,
+    hence never modifies *perfTab*.
+
+    The outranking digraph constructors use such a view instead of deep
+    copies when the *CopyPerfTab* flag is True.
+
+    >>> from randomPerfTabs import RandomPerformanceTableau
+    >>> t = RandomPerformanceTableau(numberOfActions=5,seed=1)
+    >>> v = PerformanceTableauView(t)
+    >>> v.criteria['g1']['weight'] = Decimal('10')
+    >>> v.evaluation['g1']['a1'] = Decimal('0')
+    >>> t.criteria['g1']['weight'] == Decimal('10'), t.evaluation['g1']['a1'] == Decimal('0')
+    (False, False)
+
+    """
+    def __init__(self,perfTab):
+        for key,value in perfTab.__dict__.items():
+            if isinstance(value,dict):
+                value = value.copy()
+                for k,v in value.items():
+                    if isinstance(v,dict):
+                        value[k] = _CopyOnWriteDict(v)
+                    elif isinstance(v,list):
+                        value[k] = _copyContainers(v)
+            elif isinstance(value,list):
+                value = _copyContainers(value)
+            self.__dict__[key] = value
+
 #-----------------------
 class ConstantPerformanceTableau(PerformanceTableau):
     """
@@ -1009,14 +1009,193 @@ The number of so far observed evaluations per criteria are the following:
 ##                print('  quantile Q1 (x_25)    : %.2f' % (quantileQ1))
 ##                print('  minimal evaluation    : %.2f' % (minEvaluation))
 
+
+    @property
+    def limitingQuantiles(self):
+        """
+        Dictionary of the Decimal limiting quantiles per criterion.
+        The limiting quantiles of the criteria updated through their float
+        quantiles sketches are converted when read.
+        """
+        self._readQuantilesSketches()
+        return self.__dict__['limitingQuantiles']
+
+    @limitingQuantiles.setter
+    def limitingQuantiles(self,value):
+        self.__dict__['limitingQuantiles'] = value
+
+    @property
+    def cdf(self):
+        """
+        Dictionary of the cumulative distribution functions per criterion,
+        mapping the limiting quantiles to their frequencies.
+        """
+        self._readQuantilesSketches()
+        return self.__dict__['cdf']
+
+    @cdf.setter
+    def cdf(self,value):
+        self.__dict__['cdf'] = value
+
+    def _readQuantilesSketches(self):
+        """
+        Converts the limiting quantiles of the criteria whose sketches were
+        updated since the last reading.
+        """
+        pending = self.__dict__.get('pendingSketches')
+        if pending:
+            for g in pending:
+                self._setLimitingQuantilesFromSketch(g)
+            pending.clear()
         
-    def updateQuantiles(self,newData,historySize=None,Debug=False):
+    def _initQuantilesSketches(self,sketchSize=101):
+        """
+        Initializes the mergeable quantiles sketches of the vectorized update path
+        from the present limiting quantiles.
+
+        The sketch of a criterion is the *numpy* array of its estimated
+        quantiles on a grid of *sketchSize* equally spaced probabilities.
+        """
+        import numpy as np
+        probs = np.linspace(0.0,1.0,max(2,sketchSize))
+        p = np.array([float(x) for x in self.quantilesFrequencies])
+        sketches = {}
+        for g in self.criteria:
+            q = np.array([float(x) for x in self.limitingQuantiles[g]])
+            sketches[g] = np.interp(probs,p,q)
+        self.sketchProbabilities = probs
+        self.quantilesSketches = sketches
+        self.pendingSketches = set()
+
+    @staticmethod
+    def _mergeQuantilesSketches(q1,n1,q2,n2,probs):
+        """
+        Merges two quantiles sketches *q1* and *q2*, estimated from *n1*,
+        respectively *n2* observations, by averaging their piecewise linear CDFs
+        weighted by their numbers of observations, and inverting the merged
+        CDF on the *probs* grid.
+        """
+        import numpy as np
+        if n1 <= 0:
+            return q2.copy()
+        if n2 <= 0:
+            return q1.copy()
+        def _cdf(x,q):
+            # last knot of each run of equal quantiles
+            last = np.append(q[1:] != q[:-1],True)
+            return np.interp(x,q[last],probs[last])
+        U = np.union1d(q1,q2)
+        F = (n1*_cdf(U,q1) + n2*_cdf(U,q2)) / float(n1+n2)
+        F = np.maximum.accumulate(F)
+        # first value of each run of equal cumulative frequencies
+        first = np.insert(F[1:] != F[:-1],0,True)
+        newq = np.interp(probs,F[first],U[first])
+        newq[0] = U[0]
+        newq[-1] = U[-1]
+        return newq
+
+    def _updateCriterionSketch(self,g,newValues,historySize=None):
+        """
+        Vectorized update of the quantiles sketch and the limiting quantiles
+        of criterion *g* with the *numpy* array of non missing *newValues*.
+        """
+        import numpy as np
+        nt = len(newValues)
+        if nt == 0:
+            return
+        probs = self.sketchProbabilities
+        newValues = np.sort(newValues)
+        # exact quantiles of the new observations
+        pos = probs * (nt-1)
+        low = np.floor(pos).astype(np.int64)
+        high = np.minimum(low+1,nt-1)
+        batch = newValues[low] + (pos-low)*(newValues[high]-newValues[low])
+        if historySize is None:
+            t = self.historySizes[g]
+        else:
+            t = historySize
+        if newValues[0] < self.quantilesSketches[g][0]:
+            self.criteria[g]['minValue'] = Decimal(str(newValues[0]))
+        if newValues[-1] > self.quantilesSketches[g][-1]:
+            self.criteria[g]['maxValue'] = Decimal(str(newValues[-1]))
+        if t > 0:
+            self.quantilesSketches[g] = self._mergeQuantilesSketches(
+                            self.quantilesSketches[g],t,batch,nt,probs)
+        else:
+            # no past observations to take into account
+            self.quantilesSketches[g] = batch
+        self.pendingSketches.add(g)
+        if historySize is None:
+            self.historySizes[g] += nt
+        else:
+            self.historySizes[g] = historySize + nt
+
+    def _setLimitingQuantilesFromSketch(self,g):
+        """
+        Sets the Decimal limiting quantiles and the cdf of criterion *g* by
+        interpolating its float quantiles sketch at the quantiles frequencies.
+        """
+        import numpy as np
+        p = np.array([float(x) for x in self.quantilesFrequencies])
+        q = np.interp(p,self.sketchProbabilities,self.quantilesSketches[g])
+        q = [Decimal(str(x)) for x in q]
+        self.__dict__['limitingQuantiles'][g] = q
+        cdf = {}
+        for i in range(len(q)):
+            cdf[q[i]] = self.quantilesFrequencies[i]
+        self.__dict__['cdf'][g] = cdf
+
+    def mergeQuantiles(self,other,sketchSize=101):
+        """
+        Merges the *other* PerformanceQuantiles instance, gathered for instance by
+        another worker process on the same criteria and quantiles frequencies,
+        into *self*. Both limiting quantiles are weighted by their respective
+        history sizes. Requires the *numpy* package.
+        """
+        if other.quantilesFrequencies != self.quantilesFrequencies:
+            print('Error: the quantiles frequencies of both instances must be the same!')
+            return
+        try:
+            self.quantilesSketches
+        except AttributeError:
+            self._initQuantilesSketches(sketchSize)
+        try:
+            otherSketches = other.quantilesSketches
+        except AttributeError:
+            other._initQuantilesSketches(len(self.sketchProbabilities))
+            otherSketches = other.quantilesSketches
+        probs = self.sketchProbabilities
+        for g in self.criteria:
+            q2 = otherSketches[g]
+            if len(q2) != len(probs):
+                import numpy as np
+                q2 = np.interp(probs,other.sketchProbabilities,q2)
+            n1 = self.historySizes[g]
+            n2 = other.historySizes[g]
+            self.quantilesSketches[g] = self._mergeQuantilesSketches(
+                self.quantilesSketches[g],n1,q2,n2,probs)
+            self.pendingSketches.add(g)
+            self.historySizes[g] = n1 + n2
+
+    def updateQuantiles(self,newData,historySize=None,
+                        Vectorized=False,sketchSize=101,Debug=False):
         """
         Update the PerformanceQuantiles with a set of new random decision actions.
         Parameter *historysize* allows to take more or less into account the historical situation.
         For instance, *historySize=0* does not take into account at all any past observations.
         Otherwise, if *historySize=None* (the default setting), the new observations become less and less
         influential compared to the historical data.
+
+        With *Vectorized* = True, the update uses *numpy* arrays and a bounded memory
+        quantiles sketch per criterion, i.e. the estimated quantiles on a grid of
+        *sketchSize* equally spaced probabilities. The current sketch and the empirical
+        distribution of the new observations are merged by averaging their CDFs,
+        weighted by the history size (*historySize* if given, otherwise the number
+        of observations seen so far) and by the number of new observations.
+        The Decimal limiting quantiles are only converted from the float sketches
+        when they are read.
+        The sketches of different instances may be merged with the
+        :py:meth:`~performanceQuantiles.PerformanceQuantiles.mergeQuantiles` method.
        """
 ##        if t is not None:
 ##            self.historySizes = t
@@ -1028,6 +1207,21 @@ The number of so far observed evaluations per criteria are the following:
             newEvaluation = newData.evaluation
 
         NA = self.NA
+        if Vectorized:
+            import numpy as np
+            try:
+                self.quantilesSketches
+            except AttributeError:
+                self._initQuantilesSketches(sketchSize)
+            NAf = float(NA)
+            for g in self.criteria:
+                gNewEvaluation = newEvaluation[g]
+                values = np.fromiter(map(float,map(gNewEvaluation.__getitem__,
+                                                   newActions)),
+                                     dtype=np.float64,count=len(newActions))
+                values = values[values != NAf]
+                self._updateCriterionSketch(g,values,historySize=historySize)
+            return
         for g in self.criteria:
             gNewValues = []
             gNewEvaluation = newEvaluation[g]
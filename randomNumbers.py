@@ -56,6 +56,22 @@ class IncrementalQuantilesEstimator(object):
         2.737259509189501
         >>> # saving the iqAgent's state
         >>> iqAgent.saveState('test.csv')
+
+    Batches of values may be assimilated with the *addMany()* method and
+    the estimators fed with different partitions of the data may be combined
+    with the *merge()* method:
+
+        >>> shards = [IncrementalQuantilesEstimator(nbuf=100) for i in range(4)]
+        >>> for shard in shards:
+        ...     shard.addMany([random.gauss(mu=0,sigma=1) for i in range(1000)])
+        >>> reducer = IncrementalQuantilesEstimator(nbuf=100)
+        >>> for shard in shards:
+        ...     reducer.merge(shard)
+        >>> reducer.nt
+        4000
+        >>> q,low,high = reducer.report(0.5,WithAccuracy=True)
+        >>> low <= q <= high
+        True
   
     """
 
@@ -137,6 +153,36 @@ class IncrementalQuantilesEstimator(object):
         for datum in listDatum:
             self.add(datum)
 
+    def addMany(self,values):
+        """
+        Assimilate an iterable, a list or a numpy array, of new values.
+
+        The values are appended by slices to the income buffer, which is
+        processed each time it is full. The resulting state is the same as
+        the one obtained by adding the values one by one with the *add()* method.
+        """
+        try:
+            values = values.tolist()
+        except AttributeError:
+            values = list(values)
+        n = len(values)
+        if n == 0:
+            return
+        x = min(values)
+        if x < self.q0:
+            self.q0 = x
+        x = max(values)
+        if x > self.qm:
+            self.qm = x
+        nbuf = self.nbuf
+        i = 0
+        while i < n:
+            j = i + nbuf - len(self.dbuf)
+            self.dbuf.extend(values[i:j])
+            i = j
+            if len(self.dbuf) >= nbuf:
+                self._update()
+
     def _update(self):
         """
         Batch update. For internal use only.
@@ -240,16 +286,26 @@ class IncrementalQuantilesEstimator(object):
             fileName = 'saveState-%d.csv' % self.nbrupd
             self.saveState(fileName)
         
-    def report(self, p = 0.5):
+    def report(self, p = 0.5, WithAccuracy=False, alpha=0.05):
         """
         Return estimated *p*-quantile (default = median)
         for the data seen so far 
+
+        If *WithAccuracy* is True, the triple (quantile, lower, upper) is
+        returned, where [lower, upper] is the range of the quantiles
+        reported for the p-values band given by the *accuracyBound()* method
+        with confidence level 1 - *alpha*.
         """
+        if WithAccuracy:
+            eps = self.accuracyBound(p,alpha=alpha)
+            return (self.report(p),
+                    self.report(max(0.0,p-eps)),
+                    self.report(min(1.0,p+eps)))
+        if len(self.dbuf) > 0:
+            self._update()
         nq = self.nq
         pval = self.pval
         qile = self.qile
-        if len(self.dbuf) > 0:
-            self._update()
         jl = 0
         jh = nq-1
         while (jh - jl) > 1:
@@ -267,15 +323,101 @@ class IncrementalQuantilesEstimator(object):
             
         return max(qile[0],min(qile[nq-1],q))
 
+    def accuracyBound(self,p=0.5,alpha=0.05):
+        """
+        Renders the half width *eps* of the probability band [p-eps,p+eps]
+        containing, with a confidence level of 1 - *alpha*, the actual rank
+        of the *p*-quantile reported for the data seen so far.
+
+        *eps* is the Dvoretzky-Kiefer-Wolfowitz bound sqrt(ln(2/alpha)/(2n))
+        of the sampling error with *n* observations, increased by half the
+        local step of the p-values grid for the interpolation error.
+        """
+        from math import log, sqrt
+        from bisect import bisect_left
+        if len(self.dbuf) > 0:
+            self._update()
+        if self.nt <= 0:
+            return 1.0
+        pval = self.pval
+        j = min(max(bisect_left(pval,p),1),self.nq-1)
+        eps = sqrt(log(2.0/alpha)/(2.0*self.nt))
+        return eps + 0.5*(pval[j]-pval[j-1])
+
+    def merge(self,other):
+        """
+        Merges the state of the *other* estimator, fed for instance with
+        another partition of the data, into the *self* estimator.
+
+        The piecewise linear cumulative distributions of both estimators
+        are averaged, weighted by their numbers of observations, and the
+        merged distribution is interpolated on the *self* p-values grid.
+        The income buffer of *other* is left unchanged and its content is
+        added to the *self* income buffer.
+        """
+        from bisect import bisect_left, bisect_right
+        if len(self.dbuf) > 0:
+            self._update()
+        otherBuffer = list(other.dbuf)
+        n1 = self.nt
+        n2 = other.nt
+        if n2 > 0:
+            q1 = self.qile
+            p1 = self.pval
+            q2 = other.qile
+            p2 = other.pval
+            def _cdf(x,q,p):
+                j = bisect_right(q,x) - 1
+                if j < 0:
+                    return 0.0
+                if j >= len(q)-1:
+                    return 1.0
+                return p[j] + (p[j+1]-p[j])*(x-q[j])/(q[j+1]-q[j])
+            if n1 > 0:
+                U = sorted(set(q1) | set(q2))
+                F = []
+                Fmax = 0.0
+                for x in U:
+                    Fx = (n1*_cdf(x,q1,p1) + n2*_cdf(x,q2,p2))/(n1+n2)
+                    Fmax = max(Fmax,Fx)
+                    F.append(Fmax)
+            else:
+                U = list(q2)
+                F = list(p2)
+            nq = self.nq
+            pval = self.pval
+            qile = [0.0 for i in range(nq)]
+            for iq in range(1,nq-1):
+                target = pval[iq]
+                k = bisect_left(F,target)
+                if k == 0:
+                    qile[iq] = U[0]
+                elif k >= len(U):
+                    qile[iq] = U[-1]
+                elif F[k] > F[k-1]:
+                    qile[iq] = U[k-1] + (U[k]-U[k-1])*(target-F[k-1])/(F[k]-F[k-1])
+                else:
+                    qile[iq] = U[k-1]
+            self.q0 = min(self.q0,other.q0)
+            self.qm = max(self.qm,other.qm)
+            qile[0] = self.q0
+            qile[nq-1] = self.qm
+            self.qile = qile
+            self.nt = n1 + n2
+            pval[0] = min(0.5/self.nt,0.5*pval[1])
+            pval[nq-1] = max(1.0-0.5/self.nt,0.5*(1.0+pval[nq-2]))
+        if len(otherBuffer) > 0:
+            self.addMany(otherBuffer)
+
     def cdf(self,x=0):
         """
         return proportion of data lower or equal to value x
         """
+        if len(self.dbuf) > 0:
+            self._update()
         nq = self.nq
         pval = self.pval
         qile = self.qile
-        if len(self.dbuf) > 0:
-            self._update
         jl = 0
         jh = nq-1
         while (jh - jl) > 1:
@@ -316,6 +458,59 @@ class IncrementalQuantilesEstimator(object):
             self.qile[i] = float(row['quantile'])
         fo.close()
 
+    def binaryState(self):
+        """
+        Renders the compact binary state (bytes) of the estimator: the
+        numbers of quantiles and observations, the buffer size, the
+        minimal and maximal values seen so far, followed by the p-values,
+        the quantiles and the content of the income buffer as little endian doubles.
+        """
+        from struct import pack
+        nq = self.nq
+        nd = len(self.dbuf)
+        state = pack('<4sIQIIdd',b'IQE1',nq,self.nt,self.nbuf,nd,
+                     self.q0,self.qm)
+        state += pack('<%dd' % nq,*self.pval)
+        state += pack('<%dd' % nq,*self.qile)
+        state += pack('<%dd' % nd,*self.dbuf)
+        return state
+
+    def saveBinaryState(self,fileName='state.iqe'):
+        """
+        Save the compact binary state of the estimator (see *binaryState()*).
+        """
+        fo = open(fileName,'wb')
+        fo.write(self.binaryState())
+        fo.close()
+
+    def loadBinaryState(self,state='state.iqe'):
+        """
+        Load a binary state, given either as bytes rendered by the
+        *binaryState()* method or as the name of a file saved with the
+        *saveBinaryState()* method.
+        """
+        from struct import unpack_from, calcsize
+        if not isinstance(state,(bytes,bytearray)):
+            fi = open(state,'rb')
+            state = fi.read()
+            fi.close()
+        header = '<4sIQIIdd'
+        magic,nq,nt,nbuf,nd,q0,qm = unpack_from(header,state)
+        if magic != b'IQE1':
+            print('Error: not an IncrementalQuantilesEstimator binary state!')
+            return
+        offset = calcsize(header)
+        self.nq = nq
+        self.nt = nt
+        self.nbuf = nbuf
+        self.q0 = q0
+        self.qm = qm
+        self.pval = list(unpack_from('<%dd' % nq,state,offset))
+        offset += 8*nq
+        self.qile = list(unpack_from('<%dd' % nq,state,offset))
+        offset += 8*nq
+        self.dbuf = list(unpack_from('<%dd' % nd,state,offset))
+
 
 class DiscreteRandomVariable():
     """
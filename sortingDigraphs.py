@@ -1571,6 +1571,19 @@ class _myQSDGThread(Process):
         fo.close()
         
     # .......
+def _arraySortingWorker(args):
+    """
+    Multiprocessing pool worker computing the vectorized quantiles sorting
+    characteristics of a chunk of actions
+    (see :py:meth:`~sortingDigraphs.QuantilesSortingDigraph._computeArraySortingCharacteristics`).
+    """
+    state,evaluationArrays,actionsKeys,hasNoVeto = args
+    digraph = object.__new__(QuantilesSortingDigraph)
+    digraph.__dict__.update(state)
+    return digraph._computeArraySortingCharacteristics(digraph.criteria,
+                                        None,actionsKeys,hasNoVeto=hasNoVeto,
+                                        evaluationArrays=evaluationArrays)
+
 class QuantilesSortingDigraph(SortingDigraph):
     """
     Specialisation of the root :py:class:`sortingDigraphs.SortingDigraph` class
@@ -1586,6 +1599,18 @@ class QuantilesSortingDigraph(SortingDigraph):
         Mind that setting *Threading* to *True when running from a python script file
         the main program entry must be started with a *__name__=='__main__'* test.
 
+        With *Vectorized* set to *True*, the *numpy* package is required and the outranking characteristics
+        of the actions versus the category limits, as well as the sorting characteristics, are computed
+        on actions x profiles arrays, criterion by criterion. With *Threading*, the actions are then split into chunks
+        processed by a multiprocessing pool whose workers receive the float evaluations of their chunk
+        and return their results in memory. The characteristic values are rounded to *ndigits* decimal digits.
+
+        Mind that with the default *WithSortingRelation* = True, the weak ordering relation between all
+        pairs of actions is constructed, which requires memory quadratic in the number of actions.
+        For large performance tableaux, like in the pre-ranking of sparse outranking digraphs,
+        set *WithSortingRelation* to False; the category contents and, with *StoreSorting*,
+        the sorting characteristics remain available.
+
     Example Python3 session:
 
     >>> from sortingDigraphs import QuantilesSortingDigraph
@@ -1635,6 +1660,8 @@ class QuantilesSortingDigraph(SortingDigraph):
                  tempDir=None,
                  nbrCores=None,
                  nbrOfProcesses=None,
+                 Vectorized=False,
+                 ndigits=4,
                  Comments=False,
                  Debug=False):
         """
@@ -1643,10 +1670,6 @@ class QuantilesSortingDigraph(SortingDigraph):
         """
         from time import time
         from copy import copy, deepcopy
-        if CopyPerfTab:
-            copy2self = deepcopy
-        else:
-            copy2self = copy
         from decimal import Decimal
 
         # import the performance tableau
@@ -1655,6 +1678,8 @@ class QuantilesSortingDigraph(SortingDigraph):
             print('Error: a valid performance tableau is required!')
 ##            perfTab = RandomPerformanceTableau(numberOfActions=10,
 ##                                               numberOfCriteria=13)
+        elif CopyPerfTab:
+            perfTab = PerformanceTableauView(argPerfTab)
         else:
             perfTab = argPerfTab
         # normalize the actions as a dictionary construct
@@ -1663,7 +1688,7 @@ class QuantilesSortingDigraph(SortingDigraph):
             for x in perfTab.actions:
                 actions[x] = {'name': str(x)}
         else:
-            actions = copy2self(perfTab.actions)
+            actions = copy(perfTab.actions)
         actions = actions
         self.actions = actions
         self.order = len(actions)
@@ -1681,7 +1706,7 @@ class QuantilesSortingDigraph(SortingDigraph):
         self.convertWeight2Decimal()
         evaluation = normPerfTab.evaluation
         self.evaluation = evaluation
-        self.NA = copy2self(perfTab.NA)
+        self.NA = copy(perfTab.NA)
         self.convertEvaluation2Decimal()
         self.runTimes = {'dataInput': time()-tt}
 
@@ -1823,7 +1848,9 @@ class QuantilesSortingDigraph(SortingDigraph):
                                                     nbrCores=nbrCores,
                                                     Comments=Comments,
                                                     WithSortingRelation=WithSortingRelation,
-                                                    StoreSorting=StoreSorting)
+                                                    StoreSorting=StoreSorting,
+                                                    Vectorized=Vectorized,
+                                                    ndigits=ndigits)
 
         if WithSortingRelation:
             if LowerClosed:
@@ -1889,7 +1916,8 @@ class QuantilesSortingDigraph(SortingDigraph):
                            WithVetoCounts=True,
                             WithSortingRelation=True,
                             StoreSorting=True,
-                           nbrCores=None,Comments=False):
+                           nbrCores=None,Comments=False,
+                           Vectorized=False,ndigits=4):
         """
         Specialization of the corresponding BipolarOutrankingDigraph method
         """
@@ -1897,6 +1925,18 @@ class QuantilesSortingDigraph(SortingDigraph):
         
         LowerClosed = self.criteriaCategoryLimits['LowerClosed']        
 
+        if Vectorized:
+            return self._constructArraySortingRelation(criteria,evaluation,
+                                    initial=initial,terminal=terminal,
+                                    hasNoVeto=hasNoVeto,
+                                    Threading=Threading,
+                                    startMethod=startMethod,
+                                    nbrCores=nbrCores,
+                                    WithSortingRelation=WithSortingRelation,
+                                    StoreSorting=StoreSorting,
+                                    ndigits=ndigits,
+                                    Comments=Comments)
+
         if not Threading or cpu_count() < 2:
             # set parameters for non threading
             self.nbrThreads = 0
@@ -2130,6 +2170,183 @@ class QuantilesSortingDigraph(SortingDigraph):
                     self.sorting = sorting
                 if WithSortingRelation:
                     return relation
+
+    def _computeArraySortingCharacteristics(self,criteria,evaluation,
+                                            actionsKeys,hasNoVeto=False,
+                                            evaluationArrays=None):
+        """
+        Vectorized quantiles sorting kernel.
+
+        Renders the tuple (lowLimit, notHighLimit, outrankings) of float *numpy* arrays:
+        the n x k arrays of the *lowLimit* and *notHighLimit* sorting characteristics
+        of the n *actionsKeys* in the k categories, and the n x k (LowerClosed),
+        respectively k x n, array of the outranking characteristics of the actions
+        versus the category limits, respectively of the limits versus the actions.
+        The outranking characteristics are computed in one batched pass per criterion,
+        with bipolar vetoes, like in the *_constructRelationSimple* method.
+        The float evaluations may be given instead as *evaluationArrays*
+        (see the *_iterArrayMarginalCharacteristics* method).
+        """
+        import numpy as np
+        LowerClosed = self.criteriaCategoryLimits['LowerClosed']
+        Min = float(self.valuationdomain['min'])
+        Max = float(self.valuationdomain['max'])
+        if LowerClosed:
+            profileKeys = [c+'-m' for c in self.categories]
+            rows,columns = actionsKeys,profileKeys
+        else:
+            profileKeys = [c+'-M' for c in self.categories]
+            rows,columns = profileKeys,actionsKeys
+        shape = (len(rows),len(columns))
+        totalweight = float(sum(abs(criteria[c]['weight']) for c in criteria))
+        concordance = np.zeros(shape,dtype=np.float64)
+        hasVeto = np.zeros(shape,dtype=bool)
+        hasCounterVeto = np.zeros(shape,dtype=bool)
+        for c,lc,veto,negativeVeto in self._iterArrayMarginalCharacteristics(
+                                        criteria,evaluation,rows,
+                                        hasNoVeto=hasNoVeto,
+                                        hasBipolarVeto=True,
+                                        hasSymmetricThresholds=True,
+                                        columnsKeys=columns,
+                                        evaluationArrays=evaluationArrays):
+            concordance += lc * abs(float(criteria[c]['weight']))
+            if veto is None:
+                continue
+            hasVeto |= veto > 0.0
+            hasCounterVeto |= negativeVeto > 0.0
+        if totalweight != 0.0:
+            concordance /= totalweight
+        concordIndex = np.round(concordance,12)
+        outrankings = self._arrayOutrankingIndex(concordIndex,hasVeto,
+                                                 hasCounterVeto,None,
+                                                 hasBipolarVeto=True) * Max
+        if LowerClosed:
+            lowLimit = outrankings
+            notHighLimit = np.full(shape,Max)
+            notHighLimit[:,:-1] = Max - outrankings[:,1:] + Min
+        else:
+            notHighLimit = outrankings.T
+            lowLimit = np.full(notHighLimit.shape,Max)
+            lowLimit[:,1:] = Max - notHighLimit[:,:-1] + Min
+        return lowLimit,notHighLimit,outrankings
+
+    def _constructArraySortingRelation(self,criteria,evaluation,
+                                       initial=None,terminal=None,
+                                       hasNoVeto=False,
+                                       Threading=False,startMethod=None,
+                                       nbrCores=None,
+                                       WithSortingRelation=True,
+                                       StoreSorting=True,
+                                       ndigits=4,Comments=False):
+        """
+        Vectorized, and with *Threading* multiprocessing pool based, computation of
+        the outranking characteristics between actions and category limits, of the
+        *self.sorting* characteristics (if *StoreSorting*) and of the *self.categoryContent*.
+
+        Renders the relation as a double dictionary if *WithSortingRelation* is True,
+        otherwise as a rectangular :py:class:`~digraphsTools.ArrayRelationView`.
+        """
+        import numpy as np
+        from decimal import Decimal
+        from digraphsTools import ArrayRelationView
+        LowerClosed = self.criteriaCategoryLimits['LowerClosed']
+        categories = list(self.categories)
+        if LowerClosed:
+            actionsKeys = list(initial)
+            profileKeys = [c+'-m' for c in categories]
+        else:
+            actionsKeys = list(terminal)
+            profileKeys = [c+'-M' for c in categories]
+        n = len(actionsKeys)
+        if Threading and nbrCores is None:
+            nbrCores = mp.cpu_count()
+        # a single process pool is slower than the serial computation
+        if Threading and n > 1 and nbrCores > 1:
+            if startMethod is None:
+                startMethod = 'spawn'
+            mpctx = mp.get_context(startMethod)
+            Pool = mpctx.Pool
+            self.nbrThreads = nbrCores
+            self.startMethod = mpctx.get_start_method()
+            state = {'criteria': criteria,
+                     'NA': self.NA,
+                     'valuationdomain': self.valuationdomain,
+                     'categories': self.categories,
+                     'criteriaCategoryLimits': self.criteriaCategoryLimits}
+            # the workers receive float arrays of the evaluations of
+            # their chunk of actions and of the category limits
+            actionsArrays = {}
+            profilesArrays = {}
+            for g in criteria:
+                evg = evaluation[g]
+                actionsArrays[g] = np.array([float(evg[x]) for x in actionsKeys],
+                                            dtype=np.float64)
+                profilesArrays[g] = np.array([float(evg[x]) for x in profileKeys],
+                                             dtype=np.float64)
+            chunkSize = -(-n // nbrCores)
+            argsList = []
+            for i in range(0,n,chunkSize):
+                chunk = actionsKeys[i:i+chunkSize]
+                if LowerClosed:
+                    chunkArrays = {g: (actionsArrays[g][i:i+chunkSize],
+                                       profilesArrays[g]) for g in criteria}
+                else:
+                    chunkArrays = {g: (profilesArrays[g],
+                                       actionsArrays[g][i:i+chunkSize]) for g in criteria}
+                argsList.append((state,chunkArrays,chunk,hasNoVeto))
+            if Comments:
+                print('Vectorized sorting of %d actions with %d processes' %\
+                      (n,len(argsList)))
+            with Pool(nbrCores) as proc:
+                results = proc.map(_arraySortingWorker,argsList)
+            lowLimit = np.concatenate([r[0] for r in results],axis=0)
+            notHighLimit = np.concatenate([r[1] for r in results],axis=0)
+            if LowerClosed:
+                outrankings = np.concatenate([r[2] for r in results],axis=0)
+            else:
+                outrankings = np.concatenate([r[2] for r in results],axis=1)
+        else:
+            self.nbrThreads = 0
+            lowLimit,notHighLimit,outrankings = \
+                self._computeArraySortingCharacteristics(criteria,evaluation,
+                                                actionsKeys,hasNoVeto=hasNoVeto)
+        membership = np.minimum(lowLimit,notHighLimit)
+        # category contents
+        Med = float(self.valuationdomain['med'])
+        isMember = membership >= Med
+        categoryContent = {}
+        for j,c in enumerate(categories):
+            categoryContent[c] = [actionsKeys[i] for i in np.flatnonzero(isMember[:,j])]
+        self.categoryContent = categoryContent
+        # sorting characteristics sharing their Decimal values
+        if StoreSorting:
+            characteristics = np.round(np.stack((lowLimit,notHighLimit,membership)),
+                                       ndigits)
+            values,inverse = np.unique(characteristics,return_inverse=True)
+            formatString = '%%.%df' % ndigits
+            decimals = [Decimal(formatString % v) for v in values.tolist()]
+            inverse = inverse.reshape(characteristics.shape).tolist()
+            sorting = {}
+            for i,x in enumerate(actionsKeys):
+                low = inverse[0][i]
+                notHigh = inverse[1][i]
+                member = inverse[2][i]
+                sorting[x] = {c: {'lowLimit': decimals[low[j]],
+                                  'notHighLimit': decimals[notHigh[j]],
+                                  'categoryMembership': decimals[member[j]]}
+                              for j,c in enumerate(categories)}
+            self.sorting = sorting
+        if LowerClosed:
+            relation = ArrayRelationView(np.round(outrankings,ndigits),actionsKeys,
+                                         ndigits=ndigits,columnKeys=profileKeys)
+        else:
+            relation = ArrayRelationView(np.round(outrankings,ndigits),profileKeys,
+                                         ndigits=ndigits,columnKeys=actionsKeys)
+        if WithSortingRelation:
+            relation = relation.todict()
+            self.relation = relation
+        return relation
+
     def showCriteriaCategoryLimits(self,ByCriterion=False):
         """
         Dummy for showCriteriaQuantileLimits()
@@ -3309,10 +3526,6 @@ class ConfidentQuantilesSortingDigraph(QuantilesSortingDigraph):
         """
         from time import time
         from copy import copy, deepcopy
-        if CopyPerfTab:
-            copy2self = deepcopy
-        else:
-            copy2self = copy
         from decimal import Decimal
 
         # import the performance tableau
@@ -3321,6 +3534,8 @@ class ConfidentQuantilesSortingDigraph(QuantilesSortingDigraph):
             print('Error: a valid performance tableau is required!')
 ##            perfTab = RandomPerformanceTableau(numberOfActions=10,
 ##                                               numberOfCriteria=13)
+        elif CopyPerfTab:
+            perfTab = PerformanceTableauView(argPerfTab)
         else:
             perfTab = argPerfTab
         # normalize the actions as a dictionary construct
@@ -3329,7 +3544,7 @@ class ConfidentQuantilesSortingDigraph(QuantilesSortingDigraph):
             for x in perfTab.actions:
                 actions[x] = {'name': str(x)}
         else:
-            actions = copy2self(perfTab.actions)
+            actions = copy(perfTab.actions)
         #self.actions = actions
 
         # keep a copy of the original actions set before adding the profiles
@@ -3345,7 +3560,7 @@ class ConfidentQuantilesSortingDigraph(QuantilesSortingDigraph):
         #self.convertWeight2Decimal()
         evaluation = normPerfTab.evaluation
         self.evaluation = evaluation
-        self.NA = copy2self(perfTab.NA)
+        self.NA = copy(perfTab.NA)
         #self.convertEvaluation2Decimal()
         self.runTimes = {'dataInput': time()-tt}
 
@@ -1389,6 +1389,144 @@ class SparseOutrankingDigraph(BipolarOutrankingDigraph):
 
 ########################
 # multiprocessing workers
+class _ComponentsStore(object):
+    """
+    On-disk store of the component relations of a sparse outranking digraph.
+
+    Each component relation is appended as a float64 square array to a
+    binary file in *tempDir* (the system default temporary directory when None),
+    which is removed when the store is garbage collected. The stored relations
+    are paged in on demand through a read only memory mapping and the
+    *cacheSize* most recently used component sub-digraphs are kept in memory.
+
+    Pickled or deep copied stores carry the stored relations and write them
+    to a store file of their own.
+    """
+    def __init__(self,tempDir=None,cacheSize=32):
+        self.tempDir = tempDir
+        self._newFile()
+        self.cacheSize = max(1,cacheSize)
+        self.index = {}
+        self.size = 0
+        self._array = None
+        self._cache = OrderedDict()
+
+    def _newFile(self):
+        """
+        Creates an empty store file which is removed when the store is garbage collected.
+        """
+        import weakref
+        from tempfile import mkstemp
+        from os import close, remove
+        try:
+            fd,self.fileName = mkstemp(suffix='.d3c',dir=self.tempDir)
+        except OSError:
+            # the temporary directory of the pickled store is not available
+            fd,self.fileName = mkstemp(suffix='.d3c')
+        close(fd)
+        self._finalizer = weakref.finalize(self,remove,self.fileName)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop('_finalizer')
+        state.pop('fileName')
+        state['_array'] = None
+        state['_cache'] = OrderedDict()
+        with open(self.fileName,'rb') as fi:
+            state['storedRelations'] = fi.read()
+        return state
+
+    def __setstate__(self,state):
+        state = dict(state)
+        storedRelations = state.pop('storedRelations')
+        self.__dict__.update(state)
+        self._newFile()
+        with open(self.fileName,'wb') as fo:
+            fo.write(storedRelations)
+
+    def append(self,compKey,subGraph):
+        """
+        Writes the relation of the *subGraph* digraph at the end of the store.
+        """
+        import numpy as np
+        from digraphsTools import computeDecimalDigits
+        actionsKeys = [x for x in subGraph.actions]
+        n = len(actionsKeys)
+        relation = subGraph.relation
+        values = [relation[x][y] for x in actionsKeys for y in actionsKeys]
+        a = np.array([float(v) for v in values],dtype=np.float64)
+        with open(self.fileName,'ab') as fo:
+            fo.write(a.tobytes())
+        self.index[compKey] = {'offset': self.size,
+                               'actionsKeys': actionsKeys,
+                               'ndigits': computeDecimalDigits(values),
+                               'name': subGraph.name,
+                               'valuationdomain': subGraph.valuationdomain}
+        try:
+            self.index[compKey]['ranking'] = subGraph.ranking
+        except AttributeError:
+            pass
+        self.size += n*n
+        self._array = None
+
+    def subGraph(self,compKey,actions):
+        """
+        Renders the component *compKey* as a Digraph instance whose relation
+        is a lazy view on the memory mapped store.
+        *actions* is the actions dictionary of the sparse digraph.
+        """
+        try:
+            self._cache.move_to_end(compKey)
+            return self._cache[compKey]
+        except KeyError:
+            pass
+        import numpy as np
+        from digraphsTools import ArrayRelationView
+        if self._array is None:
+            self._array = np.memmap(self.fileName,dtype=np.float64,
+                                    mode='r',shape=(self.size,))
+        record = self.index[compKey]
+        actionsKeys = record['actionsKeys']
+        n = len(actionsKeys)
+        offset = record['offset']
+        pg = Digraph()
+        pg.name = record['name']
+        pg.actions = OrderedDict([(x,actions[x]) for x in actionsKeys])
+        pg.order = n
+        pg.valuationdomain = record['valuationdomain']
+        pg.relation = ArrayRelationView(
+            self._array[offset:offset+n*n].reshape((n,n)),
+            actionsKeys,ndigits=record['ndigits'])
+        if 'ranking' in record:
+            pg.ranking = record['ranking']
+        pg.resetNeighbourhoods()
+        self._cache[compKey] = pg
+        if len(self._cache) > self.cacheSize:
+            self._cache.popitem(last=False)
+        return pg
+
+class _StoredComponent(dict):
+    """
+    Component record of an out-of-core sparse outranking digraph
+    whose 'subGraph' entry is paged in on demand from a :py:class:`_ComponentsStore`.
+    """
+    def __init__(self,compKey,compDict,store,actions):
+        dict.__init__(self,compDict)
+        self.pop('subGraph',None)
+        self.compKey = compKey
+        self.store = store
+        self.actions = actions
+
+    def __getitem__(self,key):
+        if key == 'subGraph':
+            return self.store.subGraph(self.compKey,self.actions)
+        return dict.__getitem__(self,key)
+
+    def get(self,key,default=None):
+        if key == 'subGraph' or key in self:
+            return self[key]
+        return default
+
 def _worker(input):
     global _decomposition
     for Comments,args in iter(input.get, 'STOP'):
@@ -1447,6 +1585,8 @@ class PreRankedOutrankingDigraph(SparseOutrankingDigraph,PerformanceTableau):
 
     By default, the number of quantiles is set to 5 when the numer of actions is less than 100, to 10 when the number of actions is less than 1000, or otherwise to 0.5% of the numer of decision actions. The number of quantiles can be set much lower for bigger orders. Mind the effective availability of CPU memory when tackling big digraph orders.
 
+    With *OutOfCore* = True, the component relations are not kept in memory but written, one component after the other, to a binary store in *tempDir* (the system default temporary directory when None). The component sub-digraphs are paged in on demand, via a read only memory mapping, by the *relation(x,y)* method or the *self.components[compKey]['subGraph']* entries, and only the *componentsCacheSize* most recently used ones are kept in memory. The component rankings are computed before storing, so that the boosted ranking never requires all the components at once. Requires the *numpy* package.
+
     For other parameters settings, see the corresponding :py:class:`sortingDigraphs.QuantilesSortingDigraph` class.
 
     """
@@ -1465,6 +1605,8 @@ class PreRankedOutrankingDigraph(SparseOutrankingDigraph,PerformanceTableau):
                  nbrOfThreads=0,
                  save2File=None,
                  CopyPerfTab=True,
+                 OutOfCore=False,
+                 componentsCacheSize=32,
                  Comments=False,
                  Debug=False):
         """
@@ -1496,10 +1638,11 @@ class PreRankedOutrankingDigraph(SparseOutrankingDigraph,PerformanceTableau):
         perfTab = argPerfTab
         # setting quantiles sorting parameters
         if CopyPerfTab:
-            self.actions = deepcopy(perfTab.actions)
-            self.criteria = deepcopy(perfTab.criteria)
-            self.evaluation = deepcopy(perfTab.evaluation)
-            self.NA = deepcopy(perfTab.NA)
+            perfTabView = PerformanceTableauView(perfTab)
+            self.actions = perfTabView.actions
+            self.criteria = perfTabView.criteria
+            self.evaluation = perfTabView.evaluation
+            self.NA = perfTabView.NA
         else:
             self.__dict__.update(perfTab.__dict__)
             # self.actions = perfTab.actions
@@ -1587,6 +1730,12 @@ class PreRankedOutrankingDigraph(SparseOutrankingDigraph,PerformanceTableau):
         nc = len(_decomposition)
         self.nbrComponents = nc
         self.nd = len(str(nc))
+        self.OutOfCore = OutOfCore
+        if OutOfCore:
+            from linearOrders import CopelandOrder,NetFlowsOrder
+            store = _ComponentsStore(tempDir=tempDir,
+                                     cacheSize=componentsCacheSize)
+            self.componentsStore = store
         if not Threading:
             self.nbrThreads = 0
             self.startMethod = None,
@@ -1609,6 +1758,14 @@ class PreRankedOutrankingDigraph(SparseOutrankingDigraph,PerformanceTableau):
                 pg.__class__ = Digraph
                 components[compKey]['subGraph'] = pg
                 components[compKey]['score']=(comp[2],comp[3],comp[4])
+                if OutOfCore:
+                    if componentRankingRule == 'NetFlows':
+                        pg.ranking = NetFlowsOrder(pg).netFlowsRanking
+                    else:
+                        pg.ranking = CopelandOrder(pg).copelandRanking
+                    store.append(compKey,pg)
+                    components[compKey] = _StoredComponent(compKey,
+                                components[compKey],store,self.actions)
         else:   # if self.sortingParameters['Threading'] == True:
             from copy import copy, deepcopy
             from pickle import dumps, loads, load, dump
@@ -1665,8 +1822,14 @@ class PreRankedOutrankingDigraph(SparseOutrankingDigraph,PerformanceTableau):
                     fi.close()
                     if Debug:
                         print('splitComponent',splitComponent)
-                    components[splitComponent['compKey']] = splitComponent['compDict']
-                    boostedRanking += splitComponent['compDict']['subGraph'].ranking
+                    compKey = splitComponent['compKey']
+                    compDict = splitComponent['compDict']
+                    boostedRanking += compDict['subGraph'].ranking
+                    if OutOfCore:
+                        store.append(compKey,compDict['subGraph'])
+                        compDict = _StoredComponent(compKey,compDict,
+                                                    store,self.actions)
+                    components[compKey] = compDict
                 self.boostedRanking = boostedRanking
                 self.boostedOrder = list(reversed(self.boostedRanking))
 
@@ -1676,12 +1839,15 @@ class PreRankedOutrankingDigraph(SparseOutrankingDigraph,PerformanceTableau):
         fillRate = 0
         maximalComponentSize = 0
         for compKey,comp in components.items():
-            pg = comp['subGraph']
-            npg = pg.order
+            if OutOfCore:
+                compActions = store.index[compKey]['actionsKeys']
+            else:
+                compActions = comp['subGraph'].actions
+            npg = len(compActions)
             if npg > maximalComponentSize:
                 maximalComponentSize = npg
             fillRate += npg*(npg-1)
-            for x in pg.actions.keys():
+            for x in compActions:
                 self.actions[x]['component'] = compKey
         self.fillRate = fillRate/(self.order * (self.order-1))
         self.maximalComponentSize = maximalComponentSize
@@ -1699,7 +1865,12 @@ class PreRankedOutrankingDigraph(SparseOutrankingDigraph,PerformanceTableau):
         if not self.sortingParameters['Threading']:
             self.componentRankingRule = componentRankingRule
             t0 = time()
-            self.boostedRanking = self.computeBoostedRanking(
+            if OutOfCore:
+                self.boostedRanking = []
+                for compKey in components:
+                    self.boostedRanking += store.index[compKey]['ranking']
+            else:
+                self.boostedRanking = self.computeBoostedRanking(
                                        rankingRule=componentRankingRule)
             self.boostedOrder = list(reversed(self.boostedRanking))
             self.runTimes['ordering'] = time() - t0
@@ -2515,6 +2686,8 @@ class PreRankedConfidentOutrankingDigraph(PreRankedOutrankingDigraph):
 
     By default, the number of quantiles is set to 5 when the numer of actions is less than 100, to 10 when the number of actions is less than 1000, or otherwise to 0.5% of the numer of decision actions. The number of quantiles can be set much lower for bigger orders. Mind the effective availability of CPU memory when tackling big digraph orders.
 
+    The pairwise CLT likelihoods are by default (*Vectorized* = True) computed with *numpy* arrays.
+
     For other parameters settings, see the corresponding classes:
     :py:class:`sortingDigraphs.QuantilesSortingDigraph` and :py:class:`outrankingDigraphs.ConfidentBipolarOutrankingDigraph` .
 
@@ -2536,6 +2709,7 @@ class PreRankedConfidentOutrankingDigraph(PreRankedOutrankingDigraph):
                  nbrOfThreads=0,
                  save2File=None,
                  CopyPerfTab=True,
+                 Vectorized=True,
                  Comments=False,
                  Debug=False):
 
@@ -2560,7 +2734,7 @@ class PreRankedConfidentOutrankingDigraph(PreRankedOutrankingDigraph):
         perfTab = argPerfTab
         # setting quantiles sorting parameters
         if CopyPerfTab:
-            self.__dict__ = deepcopy(perfTab.__dict__)
+            self.__dict__ = PerformanceTableauView(perfTab).__dict__
 ##            self.actions = deepcopy(perfTab.actions)
 ##            self.criteria = deepcopy(perfTab.criteria)
 ##            self.evaluation = deepcopy(perfTab.evaluation)
@@ -2626,6 +2800,7 @@ class PreRankedConfidentOutrankingDigraph(PreRankedOutrankingDigraph):
 
         self.likelihoods = self.computeCLTLikelihoods(distribution=distribution,
                                                       betaParameter=betaParameter,
+                                                      Vectorized=Vectorized,
                                                       Debug=Debug)
 
         self.confidentRelation = self._computeConfidentRelation(qs.relation,
@@ -2680,7 +2855,7 @@ class PreRankedConfidentOutrankingDigraph(PreRankedOutrankingDigraph):
 
 
         if CopyPerfTab:
-            self.evaluation = deepcopy(perfTab.evaluation)
+            self.evaluation = PerformanceTableauView(perfTab).evaluation
         else:
             self.evaluation = perfTab.evaluation
 
@@ -2839,11 +3014,23 @@ class PreRankedConfidentOutrankingDigraph(PreRankedOutrankingDigraph):
 
     def computeCLTLikelihoods(self,distribution="triangular",
                               betaParameter=None,
+                              Vectorized=True,
                               Debug=False):
         """
         Renders the pairwise CLT likelihood of the at least as good as relation
         neglecting all considerable large performance differences polarisations.
-        """
+
+        With *Vectorized* = True (default), the likelihoods of all the pairs
+        are computed at once with *numpy* arrays
+        (see the BipolarOutrankingDigraph._computeArrayCLTLikelihoods method).
+        """
+        if Vectorized:
+            if betaParameter is None:
+                betaParameter = self.betaParameter
+            return self._computeArrayCLTLikelihoods(self.sortingRelation,
+                                                    distribution=distribution,
+                                                    betaParameter=betaParameter,
+                                                    Debug=Debug)
         from decimal import Decimal
         from math import sqrt
         #from random import gauss
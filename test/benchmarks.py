@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+#######################
+# Digraph3 benchmark harness
+# Scaling curves of the relation construction back-ends
+# R. Bisdorff (c) 2025
+#######################
+"""
+Reproducible benchmark harness for the Digraph3 relation construction back-ends.
+
+The benchmarked performance tableaux are :py:class:`randomPerfTabs.RandomCBPerformanceTableau`
+instances with fixed seeds, and the sweep covers the number of decision actions (order),
+the number of criteria and the number of cores used by the parallel back-ends.
+For each case the best run time over *repeats* runs and the peak Python memory traced
+in the main process (tracemalloc) are recorded.
+The results are saved to a JSON file and may be compared with a previously stored baseline.
+
+Usage from the test/results directory, like the pytests::
+
+    ..$ python3 ../benchmarks.py --orders 100 200 400 --criteria 7 13 --cores 1 4 \\
+                                 --output benchmarks.json
+    ..$ python3 ../benchmarks.py --quick --baseline benchmarks.json --tolerance 0.25
+
+The *cython* back-ends are skipped when the compiled modules are not available.
+The process exits with status 1 when a regression versus the baseline is detected.
+"""
+
+import sys
+import json
+import tracemalloc
+from time import time, strftime
+
+__version__ = '1.0'
+
+#--------- benchmarked back-ends ---------------
+
+def _bipolarOutranking(perfTab,nbrCores):
+    from outrankingDigraphs import BipolarOutrankingDigraph
+    return BipolarOutrankingDigraph(perfTab)
+
+def _bipolarOutrankingVectorized(perfTab,nbrCores):
+    from outrankingDigraphs import BipolarOutrankingDigraph
+    return BipolarOutrankingDigraph(perfTab,Vectorized=True)
+
+def _bipolarOutrankingThreading(perfTab,nbrCores):
+    from outrankingDigraphs import BipolarOutrankingDigraph
+    return BipolarOutrankingDigraph(perfTab,Threading=True,
+                                    nbrCores=nbrCores)
+
+def _mpBipolarOutranking(perfTab,nbrCores):
+    from mpOutrankingDigraphs import MPBipolarOutrankingDigraph
+    return MPBipolarOutrankingDigraph(perfTab,nbrCores=nbrCores)
+
+def _preRankedOutranking(perfTab,nbrCores):
+    from sparseOutrankingDigraphs import PreRankedOutrankingDigraph
+    return PreRankedOutrankingDigraph(perfTab,quantiles=10,
+                                      Threading=(nbrCores > 1),
+                                      nbrOfCPUs=nbrCores)
+
+def _integerBipolarOutranking(perfTab,nbrCores):
+    from cIntegerOutrankingDigraphs import IntegerBipolarOutrankingDigraph
+    return IntegerBipolarOutrankingDigraph(perfTab.convert2BigData(),
+                                           Threading=(nbrCores > 1),
+                                           nbrCores=nbrCores)
+
+def _npBipolarOutranking(perfTab,nbrCores):
+    from cnpBipolarDigraphs import npBipolarOutrankingDigraph
+    return npBipolarOutrankingDigraph(perfTab.convert2BigData())
+
+def _quantilesSorting(perfTab,nbrCores):
+    from sortingDigraphs import QuantilesSortingDigraph
+    return QuantilesSortingDigraph(perfTab,limitingQuantiles=10,
+                                   Threading=(nbrCores > 1),
+                                   nbrCores=nbrCores)
+
+def _quantilesSortingVectorized(perfTab,nbrCores):
+    from sortingDigraphs import QuantilesSortingDigraph
+    return QuantilesSortingDigraph(perfTab,limitingQuantiles=10,
+                                   Vectorized=True,
+                                   Threading=(nbrCores > 1),
+                                   nbrCores=nbrCores)
+
+# back-end name: (constructor, is multiprocessing, required module)
+Backends = {
+    'BipolarOutrankingDigraph': (_bipolarOutranking,False,None),
+    'BipolarOutrankingDigraph-Vectorized': (_bipolarOutrankingVectorized,False,'numpy'),
+    'BipolarOutrankingDigraph-Threading': (_bipolarOutrankingThreading,True,None),
+    'MPBipolarOutrankingDigraph': (_mpBipolarOutranking,True,None),
+    'PreRankedOutrankingDigraph': (_preRankedOutranking,True,None),
+    'IntegerBipolarOutrankingDigraph': (_integerBipolarOutranking,True,
+                                        'cIntegerOutrankingDigraphs'),
+    'npBipolarOutrankingDigraph': (_npBipolarOutranking,False,
+                                   'cnpBipolarDigraphs'),
+    'QuantilesSortingDigraph': (_quantilesSorting,True,None),
+    'QuantilesSortingDigraph-Vectorized': (_quantilesSortingVectorized,True,'numpy'),
+    }
+
+def _isAvailable(moduleName):
+    """
+    Checks whether the module required by a back-end may be imported.
+    """
+    if moduleName is None:
+        return True
+    try:
+        __import__(moduleName)
+        return True
+    except ImportError:
+        return False
+
+def _caseKey(record):
+    return '%s/%d/%d/%d' % (record['backend'],record['order'],
+                            record['criteria'],record['cores'])
+
+#--------- measurements ---------------
+
+def runBenchmark(backend,order,nbrCriteria,nbrCores=1,
+                 seed=1,repeats=3,WithMemory=True,Comments=False):
+    """
+    Runs the *backend* constructor on a seeded RandomCBPerformanceTableau instance
+    of *order* actions and *nbrCriteria* criteria and renders a result record
+    with the best wall clock run time (in seconds) over *repeats* runs and the peak traced
+    memory (in MiB) of a separate traced run. The performance tableau generation is not timed.
+    """
+    from randomPerfTabs import RandomCBPerformanceTableau
+    constructor,Parallel,moduleName = Backends[backend]
+    if not Parallel:
+        nbrCores = 1
+    perfTab = RandomCBPerformanceTableau(numberOfActions=order,
+                                         numberOfCriteria=nbrCriteria,
+                                         seed=seed)
+    runTimes = []
+    for i in range(repeats):
+        t0 = time()
+        g = constructor(perfTab,nbrCores)
+        runTimes.append(time() - t0)
+        del g
+    peakMemory = None
+    if WithMemory:
+        tracemalloc.start()
+        g = constructor(perfTab,nbrCores)
+        current,peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del g
+        peakMemory = round(peak / 2**20,3)
+    record = {'backend': backend,
+              'order': order,
+              'criteria': nbrCriteria,
+              'cores': nbrCores,
+              'seed': seed,
+              'repeats': repeats,
+              'time': round(min(runTimes),6),
+              'meanTime': round(sum(runTimes)/repeats,6),
+              'peakMemory': peakMemory}
+    if Comments:
+        print('%-38s n=%-6d c=%-3d cores=%-3d %10.4f sec. %10s MiB' %\
+              (backend,order,nbrCriteria,nbrCores,record['time'],
+               str(peakMemory)))
+    return record
+
+def runSweep(backends=None,orders=(100,200,400),criteria=(7,13),
+             cores=(1,4),seed=1,repeats=3,WithMemory=True,Comments=True):
+    """
+    Runs the benchmark over all the combinations of *backends*, *orders*, *criteria*
+    and *cores*. Non parallel back-ends are only run once with one core.
+    Unavailable back-ends are reported as skipped.
+
+    Renders a dictionary with the host information and the list of result records.
+    """
+    import platform
+    import multiprocessing
+    if backends is None:
+        backends = list(Backends)
+    results = []
+    skipped = []
+    for backend in backends:
+        if backend not in Backends:
+            print('Error: unknown back-end %s !' % backend)
+            continue
+        constructor,Parallel,moduleName = Backends[backend]
+        if not _isAvailable(moduleName):
+            skipped.append(backend)
+            if Comments:
+                print('%-38s skipped: module %s not available' %\
+                      (backend,moduleName))
+            continue
+        if Parallel:
+            backendCores = cores
+        else:
+            backendCores = (1,)
+        for n in orders:
+            for c in criteria:
+                for nbrCores in backendCores:
+                    results.append(runBenchmark(backend,n,c,nbrCores,
+                                                seed=seed,repeats=repeats,
+                                                WithMemory=WithMemory,
+                                                Comments=Comments))
+    return {'version': __version__,
+            'date': strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpuCount': multiprocessing.cpu_count(),
+            'seed': seed,
+            'skipped': skipped,
+            'results': results}
+
+#--------- persistence and regressions ---------------
+
+def saveResults(benchmark,fileName='benchmarks.json'):
+    """
+    Saves the *benchmark* results in JSON format.
+    """
+    with open(fileName,'w') as fo:
+        json.dump(benchmark,fo,indent=2)
+
+def loadResults(fileName='benchmarks.json'):
+    """
+    Loads benchmark results previously saved in JSON format.
+    """
+    with open(fileName) as fi:
+        return json.load(fi)
+
+def compareWithBaseline(benchmark,baseline,tolerance=0.25,
+                        minTime=0.01,Comments=True):
+    """
+    Compares the *benchmark* results with the *baseline* ones on their common cases.
+    A case regresses when its run time, or its peak memory, exceeds
+    the baseline value by more than the relative *tolerance*.
+    Run times below *minTime* seconds are considered as noise.
+
+    Renders the list of regressed case records, each completed with the baseline values
+    and the corresponding ratios.
+    """
+    baselineRecords = {_caseKey(r): r for r in baseline['results']}
+    regressions = []
+    if Comments:
+        print('%-50s %10s %10s %8s %8s' % ('case','time','baseline',
+                                            'ratio','memory'))
+    for record in benchmark['results']:
+        key = _caseKey(record)
+        try:
+            base = baselineRecords[key]
+        except KeyError:
+            continue
+        timeRatio = record['time'] / max(base['time'],minTime)
+        if record['peakMemory'] and base['peakMemory']:
+            memoryRatio = record['peakMemory'] / base['peakMemory']
+        else:
+            memoryRatio = None
+        Regressed = (record['time'] > minTime and timeRatio > 1.0 + tolerance)\
+                    or (memoryRatio is not None and memoryRatio > 1.0 + tolerance)
+        if Comments:
+            print('%-50s %10.4f %10.4f %8.2f %8s %s' %\
+                  (key,record['time'],base['time'],timeRatio,
+                   '%.2f' % memoryRatio if memoryRatio is not None else 'n.a.',
+                   '<< regression' if Regressed else ''))
+        if Regressed:
+            regression = dict(record)
+            regression['baselineTime'] = base['time']
+            regression['baselinePeakMemory'] = base['peakMemory']
+            regression['timeRatio'] = round(timeRatio,3)
+            regression['memoryRatio'] = memoryRatio
+            regressions.append(regression)
+    return regressions
+
+#--------- command line ---------------
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Digraph3 relation construction benchmarks')
+    parser.add_argument('--backends',nargs='*',default=None,
+                        help='benchmarked back-ends (default: all), among: %s'\
+                        % ', '.join(Backends))
+    parser.add_argument('--orders',nargs='*',type=int,default=[100,200,400])
+    parser.add_argument('--criteria',nargs='*',type=int,default=[7,13])
+    parser.add_argument('--cores',nargs='*',type=int,default=[1,4])
+    parser.add_argument('--seed',type=int,default=1)
+    parser.add_argument('--repeats',type=int,default=3)
+    parser.add_argument('--noMemory',action='store_true',
+                        help='do not trace the peak memory')
+    parser.add_argument('--quick',action='store_true',
+                        help='small sweep: orders 50 100, 7 criteria, 1 and 2 cores, 1 repeat')
+    parser.add_argument('--output',default='benchmarks.json')
+    parser.add_argument('--baseline',default=None,
+                        help='JSON file of baseline results to compare with')
+    parser.add_argument('--tolerance',type=float,default=0.25)
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.orders = [50,100]
+        args.criteria = [7]
+        args.cores = [1,2]
+        args.repeats = 1
+    benchmark = runSweep(backends=args.backends,orders=args.orders,
+                         criteria=args.criteria,cores=args.cores,
+                         seed=args.seed,repeats=args.repeats,
+                         WithMemory=not args.noMemory)
+    saveResults(benchmark,args.output)
+    print('Results saved in %s' % args.output)
+    if args.baseline is not None:
+        regressions = compareWithBaseline(benchmark,loadResults(args.baseline),
+                                          tolerance=args.tolerance)
+        if regressions:
+            print('%d regression(s) versus %s' % (len(regressions),
+                                                  args.baseline))
+            return 1
+        print('No regression versus %s' % args.baseline)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -680,6 +680,25 @@ def testExportPrincipalImage():
     g.exportPrincipalImage('monopolar',pictureFormat='xfig',fontcolor='black',fontsize='1.2')
    
 
+def testNativePrincipalScores():
+    print('*------- test in process principal scores --------*')
+    from linearOrders import PrincipalOrder
+    t = RandomCBPerformanceTableau(numberOfActions=20,seed=1)
+    g = BipolarOutrankingDigraph(t)
+    values,P,actionsList = g.computePrincipalAxes()
+    assert len(values) == g.order
+    assert values[0] >= values[1] >= values[2]
+    rvalues,rP,ractionsList = g.computePrincipalAxes(nbrOfAxes=2,
+                                                     Randomized=True,seed=1)
+    assert abs(rvalues[0]-values[0]) < 1e-6*values[0]
+    assert max(abs(rP[0][i]-P[0][i]) for i in range(g.order)) < 1e-3
+    principalScores = g.computePrincipalScores(Colwise=True)
+    print(principalScores)
+    assert len(principalScores) == g.order
+    assert principalScores[0][0] >= principalScores[-1][0]
+    pri = PrincipalOrder(g,Colwise=True)
+    assert set(pri.principalRanking) == set(g.actions)
+
 def testCompleteness():
     print('*------- test (Weakly) Completeness ------*')
     g = RandomValuationDigraph()
@@ -781,3 +800,238 @@ def testChoiceRecommendation():
     ranking = g.showChoiceRecommendation('IteratedCondorcetWinners',ReturnRanking=True)
     g.showHTMLPerformanceHeatmap(actionsList=ranking,Correlations=True)
     
+
+def testBinarySnapshot():
+    print('*------- test binary digraph snapshots --------*')
+    t = RandomCBPerformanceTableau(numberOfActions=15,seed=5)
+    g = BipolarOutrankingDigraph(t)
+    g.save('testBinaryDigraph')
+    g.saveBinary('testBinaryDigraph')
+    g1 = Digraph('testBinaryDigraph')
+    g2 = Digraph('testBinaryDigraph.d3b')
+    # the binary snapshot keeps all the decimal digits
+    assert g2.relation == g.relation
+    assert g2.gamma == g1.gamma == g.gamma
+    assert g2.valuationdomain['max'] == g1.valuationdomain['max']
+    g3 = Digraph('testBinaryDigraph.d3b',MemoryMapped=True)
+    assert g3.computeRelationalStructure() == g1.computeRelationalStructure()
+    assert g3.computeOrdinalCorrelation(g)['correlation'] == Decimal('1')
+    for att in ('actions','valuationdomain','relation'):
+        assert getattr(g2,att) == getattr(g,att)
+    # objects without snapshot encoding are reported, not stored as repr
+    g.actions[list(g.actions)[0]]['comment'] = object()
+    try:
+        g.saveBinary('testBinaryDigraph')
+        assert False
+    except TypeError as error:
+        assert "actions" in str(error) and "'comment'" in str(error)
+
+def testLazyNeighbourhoods():
+    print('*------- test lazy gamma sets and bitset index --------*')
+    from digraphsTools import NeighbourhoodBitsets
+    t = RandomCBPerformanceTableau(numberOfActions=20,seed=7)
+    g = BipolarOutrankingDigraph(t)
+    assert 'gamma' not in g.__dict__
+    gamma = Digraph.gammaSets(g)
+    assert g.gamma == gamma
+    assert g.notGamma == Digraph.notGammaSets(g)
+    nb = g.neighbourhoodBitsets
+    assert isinstance(nb,NeighbourhoodBitsets)
+    Med = g.valuationdomain['med']
+    for x in g.actions:
+        assert nb.dneighbors(x) == gamma[x][0]
+        assert nb.aneighbors(x) == gamma[x][1]
+    actionsList = list(g.actions)
+    for i in range(len(actionsList)-1):
+        choice = actionsList[i:i+2]
+        assert nb.isIndependent(choice) == (g.intstab(set(choice)) >= Med)
+    gv = BipolarOutrankingDigraph(t,Vectorized=True)
+    assert gv.gamma == gamma
+    g.closeTransitive()
+    assert 'gamma' not in g.__dict__
+    assert g.gamma == Digraph.gammaSets(g)
+    g.recodeValuation(-10,10)
+    assert 'notGamma' not in g.__dict__
+    assert g.notGamma == Digraph.notGammaSets(g)
+
+def testBitsetPreKernels():
+    print('*------- test bitset MIS and prekernels enumeration --------*')
+    from randomDigraphs import RandomValuationDigraph
+    for seed in range(5):
+        g = RandomValuationDigraph(order=12,seed=seed)
+        actions = set(g.actions)
+        misset = set()
+        dompreKernels = set()
+        abspreKernels = set()
+        for choice in g.independentChoices(g.singletons()):
+            restactions = actions - choice[0][0]
+            if restactions <= choice[0][1]:
+                dompreKernels.add(choice[0][0])
+            if restactions <= choice[0][2]:
+                abspreKernels.add(choice[0][0])
+            if choice[0][3] <= choice[0][0]:
+                misset.add(choice[0][0])
+        g.misset = set()
+        assert set(g.MISgen()) == misset == g.misset
+        g.computePreKernels()
+        assert g.dompreKernels == dompreKernels
+        assert g.abspreKernels == abspreKernels
+        assert set(g.generateDomPreKernels()) == dompreKernels
+
+def _polarities(g):
+    Med = g.valuationdomain['med']
+    return {(x,y): (g.relation[x][y] > Med) - (g.relation[x][y] < Med)
+            for x in g.actions for y in g.actions}
+
+def testValuationBackendsConformance():
+    print('*------- conformance of float and integer valuation backends --------*')
+    from copy import deepcopy
+    from randomDigraphs import RandomValuationDigraph
+    t = RandomCBPerformanceTableau(numberOfActions=15,seed=11)
+    digraphs = [BipolarOutrankingDigraph(t),
+                BipolarOutrankingDigraph(t,Vectorized=True),
+                RandomValuationDigraph(order=12,seed=2)]
+    for g in digraphs:
+        for backend in ('float','integer'):
+            h = deepcopy(g)
+            h.convertValuationBackend(backend)
+            assert h.valuationBackend() == backend
+            assert _polarities(h) == _polarities(g)
+            assert h.gamma == g.gamma
+            assert abs(h.computeDeterminateness(InPercents=True) -\
+                       float(g.computeDeterminateness(InPercents=True))) < 1e-9
+            assert abs(h.computeDeterminateness() -\
+                       float(g.computeDeterminateness())) < 1e-9
+            gMean,gStdDev = g.computeValuationStatistics()
+            hMean,hStdDev = h.computeValuationStatistics()
+            assert abs(hMean - float(gMean)) < 1e-9
+            assert abs(hStdDev - gStdDev) < 1e-9
+            assert h.computeCopelandRanking() == g.computeCopelandRanking()
+            assert h.computeRankingByChoosing()['ranking'] ==\
+                   g.computeRankingByChoosing()['ranking']
+            h.showRubisBestChoiceRecommendation()
+            corr = h.computeOrdinalCorrelation(g)
+            assert abs(corr['correlation'] - 1.0) < 1e-9
+            corr = h.computeOrdinalCorrelation(g,MedianCut=True)
+            assert abs(corr['determination'] -\
+                       float(g.computeOrdinalCorrelation(g,MedianCut=True)['determination'])) < 1e-9
+            gc = deepcopy(g)
+            hc = deepcopy(h)
+            gc.closeTransitive()
+            hc.closeTransitive()
+            assert _polarities(hc) == _polarities(gc)
+            gc.recodeValuation(0,10,ndigits=3)
+            hc.recodeValuation(0,10,ndigits=3)
+            assert _polarities(hc) == _polarities(gc)
+            assert hc.valuationBackend() == backend
+            # Decimal remains the export format
+            h.convertValuationBackend('decimal')
+            assert h.valuationBackend() == 'decimal'
+            assert h.relation == g.relation
+
+def testBitsetTransitiveClosure():
+    print('*------- test SCC based transitive closure --------*')
+    from randomDigraphs import RandomDigraph, RandomValuationDigraph
+    from digraphsTools import computeBitsetStrongComponents,\
+         computeBitsetTransitiveClosure
+    for seed in range(1,6):
+        g = RandomDigraph(order=12,arcProbability=0.15,seed=seed)
+        Med = g.valuationdomain['med']
+        nb = g.neighbourhoodBitsets
+        components = computeBitsetStrongComponents(nb.dominated)
+        assert {frozenset(nb.members(c)) for c in components} ==\
+               g.strongComponents()
+        closure = computeBitsetTransitiveClosure(nb.dominated)
+        # a closure row is the set of nodes reachable with at least one arc
+        for i,x in enumerate(nb.actionsList):
+            reached = set()
+            frontier = set(g.gamma[x][0])
+            while frontier:
+                reached |= frontier
+                frontier = set().union(*[g.gamma[y][0] for y in frontier]) - reached
+            assert nb.members(closure[i]) == reached - {x}
+        rel = g.closeTransitive(InSite=False)
+        for i,x in enumerate(nb.actionsList):
+            assert {y for y in g.actions if y != x and rel[x][y] > Med} ==\
+                   nb.members(closure[i])
+        assert g.computeSizeTransitiveClosure() ==\
+               sum(1 for x in rel for y in rel[x] if rel[x][y] > Med)
+    # transitivity degree counts versus the listed triples
+    g = RandomValuationDigraph(order=10,seed=2)
+    closed,open = g.computeTransitivityDegree(ReturnTransitiveTriples=True,
+                                              ReturnIntransitiveTriples=True)
+    assert g.computeTransitivityDegree() ==\
+           Decimal(len(closed))/Decimal(len(closed)+len(open))
+    # the max-min strength closes the missing transitive links
+    g.closeTransitive()
+    assert g.isTransitive()
+    # reverse mode drops the transitive links of a linear order
+    from linearOrders import RandomLinearOrder
+    lo = RandomLinearOrder(numberOfActions=8,seed=1)
+    lo.closeTransitive(Reverse=True)
+    Med = lo.valuationdomain['med']
+    assert sum(1 for x in lo.actions for y in lo.actions\
+               if x != y and lo.relation[x][y] > Med) == 7
+
+def testBitsetShortestPathLengths():
+    print('*------- test BFS shortest path lengths --------*')
+    from randomDigraphs import RandomDigraph
+    from digraphsTools import PathLengthsView
+    g = RandomDigraph(order=15,arcProbability=0.2,seed=3)
+    Med = g.valuationdomain['med']
+    distances = g.computeShortestPathLengths()
+    assert isinstance(distances,PathLengthsView)
+    strengths = g.computeBottleneckPathStrengths()
+    for x in g.actions:
+        assert distances[x][x] == 0
+        for y in g.actions:
+            if x != y:
+                # a finite distance iff a positive bottleneck path strength
+                assert (distances[x][y] is None) == (strengths[x][y] <= Med)
+                if distances[x][y] == 1:
+                    assert g.relation[x][y] > Med
+                elif distances[x][y] is not None:
+                    assert g.relation[x][y] <= Med
+                    assert min(distances[x][z] + 1 for z in g.gamma[y][1]
+                               if distances[x][z] is not None) == distances[x][y]
+    centres = g.computeDigraphCentres()
+    eccentricities = [max(distances.array[i]) for i in range(g.order)
+                      if min(distances.array[i]) >= 0]
+    if eccentricities:
+        assert g.radius == min(eccentricities)
+    weakDistances = g.computeShortestPathLengths(WeakPaths=True)
+    for x in g.actions:
+        for y in g.actions:
+            if distances[x][y] is not None:
+                assert weakDistances[x][y] <= distances[x][y]
+
+def testDigraphCondensation():
+    print('*------- test strong components condensation --------*')
+    from randomDigraphs import RandomDigraph
+    g = RandomDigraph(order=20,arcProbability=0.08,seed=4)
+    Med = g.valuationdomain['med']
+    cd = g.computeCondensation()
+    print(cd)
+    cd.showComponents()
+    assert set(cd.components) == g.strongComponents()
+    assert sum(len(c) for c in cd) == g.order
+    # topological order of the DAG arcs
+    for k in range(len(cd)):
+        for kj in cd.successors[k]:
+            assert kj > k
+            assert k in cd.predecessors[kj]
+    for x in g.actions:
+        for y in g.gamma[x][0]:
+            kx,ky = cd.componentOf[x],cd.componentOf[y]
+            assert kx == ky or ky in cd.successors[kx]
+    assert cd.sources() and cd.sinks()
+    # component restricted views share the relation
+    k = max(range(len(cd)),key=lambda k: len(cd[k]))
+    sub = cd.componentDigraph(k)
+    assert set(sub.actions) == cd[k]
+    x = list(sub.actions)[0]
+    assert dict(sub.relation[x]) == {y: g.relation[x][y] for y in sub.actions}
+    assert sub.strongComponents() == {cd[k]}
+    scc = StrongComponentsCollapsedDigraph(g)
+    assert list(scc.actions) == cd.topologicalOrder()
+    assert g.computeCondensation(Potential=True).order <= cd.order
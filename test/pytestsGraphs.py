@@ -303,3 +303,16 @@ def testTreeGraphs():
     print(tg.computeTreeCenters())
     tg.exportOrientedTreeGraphViz(fileName='testOrTree')
     
+
+def testBitsetMISAndCliques():
+    print('*------- test bitset MIS and cliques enumeration --------*')
+    for seed in range(5):
+        g = RandomGraph(order=12,edgeProbability=0.4,seed=seed)
+        misset = [m[0] for m in g.generateIndependent(g._singletons()) if m[0] == m[2]]
+        g.computeMIS()
+        assert set(g.misset) == set(misset)
+        assert len(g.misset) == len(misset)
+        dg = -g
+        cliques = [m[0] for m in dg.generateIndependent(dg._singletons()) if m[0] == m[2]]
+        g.computeCliques()
+        assert set(g.cliques) == set(cliques)
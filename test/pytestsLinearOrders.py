@@ -18,6 +18,24 @@ def testKemenyOrdering():
     ke = KemenyOrder(g,Debug=True)
     print(ke.orderedMaximalRankings)
 
+def testExactKemenyRanking():
+    print('*-------- Testing exact Kemeny rankings beyond order 7 -------')
+    t = RandomCBPerformanceTableau(numberOfActions=7,seed=1)
+    g = BipolarOutrankingDigraph(t)
+    kr = g.computeKemenyRanking()
+    enumRankings = [list(r) for r in g.maximalRankings]
+    dpRankings,kemenyIndex = g.computeExactKemenyRankings()
+    assert kemenyIndex == kr[1]
+    assert sorted(enumRankings) == sorted(dpRankings)
+    t = RandomCBPerformanceTableau(numberOfActions=15,seed=3)
+    g = BipolarOutrankingDigraph(t)
+    assert g.computeKemenyRanking() is None
+    kr = g.computeKemenyRanking(orderLimit=15)
+    print(kr,len(g.maximalRankings))
+    assert kr[1] == Decimal('73.2084')
+    ke = KemenyRanking(g,orderLimit=15)
+    assert ke.kemenyRanking in g.maximalRankings
+
 def testSlaterOrdering():
     print('*-------- Testing KemenyOrder class -------')
     t = RandomCBPerformanceTableau(numberOfActions=6)
@@ -25,6 +43,34 @@ def testSlaterOrdering():
     g = BipolarOutrankingDigraph(t)
     sl = SlaterOrder(g,Debug=True)
 
+def testExactAndHeuristicSlaterRanking():
+    print('*-------- Testing exact and heuristic Slater rankings -------')
+    from randomDigraphs import RandomValuationDigraph
+    g = RandomValuationDigraph(order=7,seed=3,ndigits=1)
+    Med = g.valuationdomain['med']
+    from math import copysign
+    def sign(v):
+        # a median valuation counts as +1
+        return copysign(1,v - Med)
+    def slaterIndex(r):
+        return sum(sign(g.relation[r[i]][r[j]]) - sign(g.relation[r[j]][r[i]])\
+                   for i in range(len(r)) for j in range(i+1,len(r)))
+    maxIndex = max(slaterIndex(r) for r in all_perms(list(g.actions)))
+    ranking,index = g.computeSlaterRanking()
+    assert index == maxIndex == slaterIndex(ranking)
+    # small digraphs are ranked with the same Slater index
+    sl = SlaterRanking(g)
+    assert sl.slaterIndex == maxIndex == slaterIndex(sl.slaterRanking)
+    t = RandomCBPerformanceTableau(numberOfActions=20,seed=2)
+    g = BipolarOutrankingDigraph(t)
+    exact = SlaterRanking(g,orderLimit=20)
+    heuristic = SlaterRanking(g,Heuristic=True,seed=1)
+    print(exact.slaterIndex,heuristic.slaterIndex)
+    assert heuristic.slaterIndex <= exact.slaterIndex
+    budget = g.computeSlaterRanking(Heuristic=True,seed=1,sampleSize=1)
+    assert budget[1] <= exact.slaterIndex
+    assert exact.computeOrderCorrelation(exact.slaterOrder)['correlation'] == Decimal('1.0')
+
 def testRankedPairsOrdering():
     print('*-------- Testing RankedPairsOrder class -------')
     t = RandomPerformanceTableau(numberOfActions=15)
@@ -22,3 +22,65 @@ def testMPBipolarOutrankingDigraph():
                                     nbrCores=None,Comments=True)
         print(bg)
         print('Run time: %.4f' % (time() - t0) )
+
+def testMPWorkerPool():
+    print('*------- Testing persistent MPWorkerPool reuse ----*')
+    from randomPerfTabs import RandomCBPerformanceTableau
+    pt1 = RandomCBPerformanceTableau(numberOfActions=30,seed=1)
+    pt2 = RandomCBPerformanceTableau(numberOfActions=30,seed=2)
+    bg1 = MPBipolarOutrankingDigraph(pt1,nbrCores=2)
+    with MPWorkerPool(nbrCores=2,startMethod='spawn') as pool:
+        print(pool)
+        pbg1 = MPBipolarOutrankingDigraph(pt1,workerPool=pool)
+        pbg2 = MPBipolarOutrankingDigraph(pt2,workerPool=pool)
+        # an explicitly broadcasted pt1 is not broadcasted again
+        pool.broadcast(pt1)
+        pbg1b = MPBipolarOutrankingDigraph(pt1,workerPool=pool)
+        assert len(pool._broadcasts) == 1
+        pool.release(pt1)
+        print(pool)
+    print(pbg2)
+    assert bg1.relation == pbg1.relation
+    assert pbg1.relation == pbg1b.relation
+    assert pbg1.workerPool and not bg1.workerPool
+    assert sum(pbg1.runTimes.values()) > 0.0
+    sharedPool = getSharedWorkerPool(nbrCores=2)
+    assert sharedPool is getSharedWorkerPool()
+    sbg1 = MPBipolarOutrankingDigraph(pt1,workerPool=sharedPool)
+    assert sbg1.relation == bg1.relation
+    closeSharedWorkerPool()
+
+def testMPWorkerPoolSharedMemoryRelease():
+    print('*------- Testing MPWorkerPool shared memory release ----*')
+    from copy import deepcopy
+    from multiprocessing import shared_memory
+    from randomPerfTabs import RandomCBPerformanceTableau
+    pt = RandomCBPerformanceTableau(numberOfActions=20,seed=3)
+    with MPWorkerPool(nbrCores=2,startMethod='spawn') as pool:
+        handles = []
+        for i in range(3):
+            ptc = deepcopy(pt)
+            handles.append(pool.broadcast(ptc))
+            bg = MPBipolarOutrankingDigraph(ptc,workerPool=pool)
+            pool.release(ptc)
+        assert pool._broadcasts == {}
+        # no shared memory block remains after the constructions
+        for handle in handles:
+            try:
+                shm = shared_memory.SharedMemory(name=handle.sharedMemoryName)
+                shm.close()
+                assert False
+            except FileNotFoundError:
+                pass
+        for i in range(3):
+            bg = MPBipolarOutrankingDigraph(deepcopy(pt),workerPool=pool)
+        assert pool._broadcasts == {}
+        # a tableau modified after its broadcast is shared again
+        ptm = deepcopy(pt)
+        handle = pool.broadcast(ptm)
+        g = list(ptm.criteria)[0]
+        ptm.criteria[g]['weight'] += 10
+        bgm = MPBipolarOutrankingDigraph(ptm,workerPool=pool)
+        assert bgm.relation == MPBipolarOutrankingDigraph(ptm,nbrCores=2).relation
+        pool.release(handle)
+        assert pool._broadcasts == {}
@@ -378,6 +378,49 @@ def testStochasticOutrankingDigraphs():
     gmcrbc = RankingByChoosingDigraph(gmc)
     gmcrbc.showTransitiveDigraph()
 
+def testVectorizedStochasticOutrankingDigraph():
+    print('*---- test reweighting engine of stochastic outranking digraphs ----*')
+    from outrankingDigraphs import StochasticBipolarOutrankingDigraph
+    t = RandomCBPerformanceTableau(numberOfActions=10,\
+                                   numberOfCriteria=7,\
+                                   weightDistribution='equiobjectives',
+                                   seed=5)
+    t0 = deepcopy(t)
+    gl = StochasticBipolarOutrankingDigraph(t,Normalized=False,\
+                                            sampleSize=200,likelihood=0.9,\
+                                            Vectorized=False,samplingSeed=1)
+    # neither the tableau nor the digraph criteria keep sampled weights
+    assert t.criteria == t0.criteria and t.evaluation == t0.evaluation
+    assert [gl.criteria[g]['weight'] for g in gl.criteria] ==\
+           [t.criteria[g]['weight'] for g in t.criteria]
+    gv = StochasticBipolarOutrankingDigraph(t,Normalized=False,\
+                                            sampleSize=200,likelihood=0.9,\
+                                            Vectorized=True,samplingSeed=1)
+    print(gv)
+    gv.showRelationStatistics('medians')
+    # the vectorized sampling is reproducible with the same seed
+    gv1 = StochasticBipolarOutrankingDigraph(t,Normalized=False,\
+                                             sampleSize=200,likelihood=0.9,\
+                                             Vectorized=True,samplingSeed=1)
+    Med = gv.valuationdomain['med']
+    for x in gv.actions:
+        for y in gv.actions:
+            assert gv.relation[x][y] == gv1.relation[x][y]
+            stv = gv.relationStatistics[x][y]
+            assert stv['Q0'] <= stv['Q1'] <= stv['median'] <= stv['Q3'] <= stv['Q4']
+            assert stv['Q0'] <= stv['mean'] <= stv['Q4']
+            assert 0.0 <= gv.computeCDF(x,y,stv['median']) <= 1.0
+            if gl.relation[x][y] != Med and gv.relation[x][y] != Med:
+                assert (gl.relation[x][y] > Med) == (gv.relation[x][y] > Med)
+    # a coalition is sampled without modifying the criteria of t
+    coalition = list(t.criteria)[:4]
+    criteria = dict(t.criteria)
+    gc = StochasticBipolarOutrankingDigraph(t,coalition=coalition,\
+                                            sampleSize=50,Vectorized=True,\
+                                            samplingSeed=1)
+    assert list(gc.criteria) == coalition
+    assert t.criteria == criteria
+    
 def testRandomWeightsLaws():
     print('*------- test random laws for stochastic outranking ------*')
     t = RandomCBPerformanceTableau(numberOfActions=15,\
@@ -455,6 +498,27 @@ def testConfidentBipolarOutrankingDigraphs():
                                            betaParameter=7.5,Debug=False)
     lg.showRelationTable(LikelihoodDenotation=True)
 
+def testVectorizedCLTLikelihoods():
+    print('*------- test vectorized CLT likelihoods ------*')
+    t = RandomCBPerformanceTableau(numberOfActions=15,\
+                                   numberOfCriteria=13,\
+                                   missingDataProbability=0.05,\
+                                   seed=3)
+    lg = ConfidentBipolarOutrankingDigraph(t,Vectorized=False)
+    lgv = ConfidentBipolarOutrankingDigraph(t)
+    lgv.showRelationTable()
+    for x in lg.actions:
+        for y in lg.actions:
+            assert abs(lg.likelihoods[x][y] - lgv.likelihoods[x][y]) < 1e-12
+            assert lg.relation[x][y] == lgv.relation[x][y]
+    for distribution,betaParameter in (('uniform',None),('beta',7.5)):
+        lh = lgv.computeCLTLikelihoods(distribution,betaParameter,
+                                       Vectorized=False)
+        lhv = lgv.computeCLTLikelihoods(distribution,betaParameter)
+        for x in lh:
+            for y in lh[x]:
+                assert abs(lh[x][y] - lhv[x][y]) < 1e-12
+
 def testShowMarginalVersusGlobalOutrankingCorrelation():
     print('*-------- MarginalVersusGlobalOutranking -------')
     t = RandomCBPerformanceTableau(numberOfActions=10,\
@@ -546,3 +610,127 @@ def testAverageFusionLDigraphs():
     afg.showRelationTable()
     afg = SymmetricAverageFusionOutrankingDigraph(t,Comments=True)
     afg.showRelationTable()
+
+def testVectorizedBipolarOutrankingDigraph():
+    print('==>> Testing the vectorized BipolarOutrankingDigraph construction')
+    from copy import deepcopy
+    t = Random3ObjectivesPerformanceTableau(numberOfActions=20,
+                                            missingDataProbability=0.05,
+                                            vetoProbability=0.5,seed=1)
+    for hasBipolarVeto in (True,False):
+        g = BipolarOutrankingDigraph(t,hasBipolarVeto=hasBipolarVeto)
+        gv = BipolarOutrankingDigraph(t,hasBipolarVeto=hasBipolarVeto,
+                                      Vectorized=True)
+        print(gv)
+        for x in g.actions:
+            for y in g.actions:
+                assert g.relation[x][y] == gv.relation[x][y]
+        assert g.gamma == gv.gamma
+        assert g.notGamma == gv.notGamma
+        assert len(g.vetos) == len(gv.vetos)
+        if hasBipolarVeto:
+            gv.showVetos()
+    gv.showRelationTable()
+    gc = deepcopy(gv)
+    gc.recodeValuation(-10,10)
+    assert gc.computeOrdinalCorrelation(g)['correlation'] == Decimal('1')
+
+def testSharedMemoryThreading():
+    print('==>> Testing the shared memory threading of BipolarOutrankingDigraph')
+    t = RandomCBPerformanceTableau(numberOfActions=30,seed=2)
+    g = BipolarOutrankingDigraph(t)
+    gs = BipolarOutrankingDigraph(t,Threading=True,SharedMemory=True,
+                                  nbrCores=3,startMethod='spawn')
+    print(gs)
+    for x in g.actions:
+        for y in g.actions:
+            assert g.relation[x][y] == gs.relation[x][y]
+    assert g.gamma == gs.gamma
+    gs.showRelationTable(actionsSubset=list(t.actions)[:5])
+
+def testAddRemoveActions():
+    print('==>> Testing the incremental addActions and removeActions methods')
+    from perfTabs import PartialPerformanceTableau
+    t = RandomCBPerformanceTableau(numberOfActions=14,numberOfCriteria=9,
+                                   missingDataProbability=0.05,seed=2)
+    keys = list(t.actions)
+    keptKeys = keys[:3] + keys[6:]
+    for Vectorized in (False,True):
+        g = BipolarOutrankingDigraph(PartialPerformanceTableau(t,actionsSubset=keys[:10]),
+                                     Vectorized=Vectorized)
+        gamma = g.gamma
+        g.addActions(PartialPerformanceTableau(t,actionsSubset=keys[10:]))
+        print(g)
+        gf = BipolarOutrankingDigraph(t,Vectorized=Vectorized)
+        for x in keys:
+            for y in keys:
+                assert g.relation[x][y] == gf.relation[x][y]
+                assert g.concordanceRelation[x][y] == gf.concordanceRelation[x][y]
+                assert g.largePerformanceDifferencesCount[x][y] ==\
+                       gf.largePerformanceDifferencesCount[x][y]
+        assert sorted(g.vetos) == sorted(gf.vetos)
+        assert sorted(g.negativeVetos) == sorted(gf.negativeVetos)
+        if Vectorized:
+            # the veto records keep the rounding of the vectorized constructor
+            assert str(sorted(g.vetos)) == str(sorted(gf.vetos))
+            assert str(sorted(g.negativeVetos)) == str(sorted(gf.negativeVetos))
+        assert g.gamma == gf.gamma
+        assert g.notGamma == gf.notGamma
+        g.removeActions(keys[3:6])
+        gr = BipolarOutrankingDigraph(PartialPerformanceTableau(t,actionsSubset=keptKeys),
+                                      Vectorized=Vectorized)
+        assert list(g.relation) == keptKeys
+        for x in keptKeys:
+            for y in keptKeys:
+                assert g.relation[x][y] == gr.relation[x][y]
+        assert sorted(g.vetos) == sorted(gr.vetos)
+        assert g.gamma == gr.gamma
+        assert g.notGamma == gr.notGamma
+
+def testUpdateCriterion():
+    print('==>> Testing the criterion level updates of outranking digraphs')
+    t = RandomCBPerformanceTableau(numberOfActions=20,numberOfCriteria=9,
+                                   missingDataProbability=0.05,seed=4)
+    edits = [('c2',{'weight': 7}),
+             ('c3',{'thresholds': {'ind': (2,0), 'veto': (30,0)}}),
+             ('c1',{'weight': -3}),
+             ('c1',{'thresholds': {'veto': None}}),
+             ('b1',{'weight': 4, 'thresholds': {'ind': (0,0), 'pref': (1,0)}})]
+    for Vectorized in (False,True):
+        tu = deepcopy(t)
+        g = BipolarOutrankingDigraph(t,Vectorized=Vectorized,
+                                     WithMarginalCharacteristics=True)
+        # a no-op update keeps the constructor's records unchanged
+        concordanceRelation = deepcopy(g.concordanceRelation)
+        vetos = deepcopy(g.vetos)
+        g.updateCriterion('c1')
+        for x in t.actions:
+            for y in t.actions:
+                assert str(g.concordanceRelation[x][y]) ==\
+                       str(concordanceRelation[x][y])
+        assert str(g.vetos) == str(vetos)
+        for c,edit in edits:
+            totalTime = g.runTimes['totalTime']
+            g.updateCriterion(c,**edit)
+            assert g.runTimes['totalTime'] ==\
+                   totalTime + g.runTimes['updateCriterion']
+            if 'weight' in edit:
+                tu.criteria[c]['weight'] = Decimal(str(edit['weight']))
+            for key,value in edit.get('thresholds',{}).items():
+                if value is None:
+                    tu.criteria[c]['thresholds'].pop(key)
+                else:
+                    tu.criteria[c]['thresholds'][key] = (Decimal(str(value[0])),
+                                                         Decimal(str(value[1])))
+            gu = BipolarOutrankingDigraph(tu,Vectorized=Vectorized)
+            for x in t.actions:
+                for y in t.actions:
+                    assert g.relation[x][y] == gu.relation[x][y]
+                    assert g.largePerformanceDifferencesCount[x][y] ==\
+                           gu.largePerformanceDifferencesCount[x][y]
+                    assert g.concordanceRelation[x][y] ==\
+                           gu.concordanceRelation[x][y]
+            assert g.vetos == gu.vetos
+            assert g.negativeVetos == gu.negativeVetos
+            assert g.gamma == gu.gamma
+    print(g.runTimes)
@@ -158,3 +158,65 @@ def testBestCopelandBachetIntraGroupMatching():
     bac = BestBachetIntraGroupMatching(vpG,
                                         Comments=True,Debug=False)
     bac.showMatchingFairness(WithIndividualCorrelations=True)
+
+def testPolynomialFairestPairings():
+    k = 6
+    lvA = RandomLinearVotingProfile(numberOfVoters=k,numberOfCandidates=k,
+                                      votersIdPrefix='a',
+                                      candidatesIdPrefix='b',seed=1)
+    lvB = RandomLinearVotingProfile(numberOfVoters=k,numberOfCandidates=k,
+                                      votersIdPrefix='b',
+                                        candidatesIdPrefix='a',seed=2)
+    fp = FairestInterGroupPairing(lvA,lvB)
+    ap = FairestInterGroupPairing(lvA,lvB,solver='assignment')
+    ap.showFairestPairing(rank=1,WithIndividualCorrelations=True)
+    assert ap.pairings[0][1] == fp.pairings[0][1]
+    fitness = fp.computeIndividualCorrelations(ap.matching)
+    assert fitness[4] == ap.pairings[0][4]
+    assert fitness[5] == ap.pairings[0][5]
+    vpG = RandomLinearVotingProfile(numberOfVoters=k,numberOfCandidates=k,
+                                    votersIdPrefix='p',
+                                    IntraGroup=True,seed=3)
+    fp = FairestIntraGroupPairing(vpG)
+    bp = FairestIntraGroupPairing(vpG,solver='blossom')
+    assert bp.avgCorr == fp.avgCorr
+    assert bp.stdCorr == fp.stdCorr
+    assert bp.computeIndividualCorrelations()[2] == bp.groupScores
+    k = 30
+    lvA = RandomLinearVotingProfile(numberOfVoters=k,numberOfCandidates=k,
+                                      votersIdPrefix='a',
+                                      candidatesIdPrefix='b',seed=4)
+    lvB = RandomLinearVotingProfile(numberOfVoters=k,numberOfCandidates=k,
+                                      votersIdPrefix='b',
+                                        candidatesIdPrefix='a',seed=5)
+    ap = FairestInterGroupPairing(lvA,lvB,solver='assignment')
+    print(ap)
+    assert len(ap.matching) == k
+
+def testMultiStartFairnessEnhancement():
+    from votingProfiles import RandomBipolarApprovalVotingProfile
+    order = 20
+    lvA = RandomLinearVotingProfile(numberOfVoters=order,numberOfCandidates=order,
+                                      votersIdPrefix='a',
+                                      candidatesIdPrefix='b',seed=1)
+    lvB = RandomLinearVotingProfile(numberOfVoters=order,numberOfCandidates=order,
+                                      votersIdPrefix='b',
+                                        candidatesIdPrefix='a',seed=2)
+    em = FairnessEnhancedInterGroupMatching(lvA,lvB,Comments=False)
+    ems = FairnessEnhancedInterGroupMatching(lvA,lvB,nbrOfRandomStarts=3,seed=3,
+                                             Threading=True,nbrCores=2,
+                                             Comments=True)
+    print(ems)
+    assert ems.maxCorr >= em.maxCorr
+    fitness = ems.computeIndividualCorrelations(ems.matching)
+    assert fitness[1] == ems.maxCorr
+    assert len(em.history) == len(set(str(h) for h in em.history))
+    rigvp = RandomBipolarApprovalVotingProfile(numberOfVoters=16,
+                                               votersIdPrefix='p',
+                                               IntraGroup=True,seed=4)
+    fgm = FairnessEnhancedIntraGroupMatching(intraVp=rigvp)
+    fgms = FairnessEnhancedIntraGroupMatching(intraVp=rigvp,
+                                              nbrOfRandomStarts=3,seed=5,
+                                              Comments=True)
+    assert fgms.maxCorr >= fgm.maxCorr
+    assert fgms.computeIndividualCorrelations()[0] == fgms.maxCorr
@@ -263,3 +263,74 @@ def testComputeQuantileOrder():
     res.reverse()
     resrev = t.computeQuantileRanking()
     assert resrev == res
+
+def testBinarySnapshot():
+    print('*---- testing binary performance tableau snapshots -----*')
+    t = RandomCBPerformanceTableau(numberOfActions=20,numberOfCriteria=7,
+                                   missingDataProbability=0.05,seed=10)
+    t.save('testBinaryPerfTab',Comments=False)
+    t.saveBinary('testBinaryPerfTab')
+    t1 = PerformanceTableau('testBinaryPerfTab')
+    t2 = PerformanceTableau('testBinaryPerfTab.d3b')
+    assert t2.evaluation == t1.evaluation
+    assert t2.criteria == t1.criteria
+    assert list(t2.actions) == list(t1.actions)
+    assert t2.NA == t1.NA
+    # all the saved attributes round trip unchanged
+    for att in ('actions','criteria','evaluation','NA',
+                'objectives','weightPreorder','description'):
+        if hasattr(t,att):
+            assert getattr(t2,att) == getattr(t,att)
+    t3 = PerformanceTableau('testBinaryPerfTab.d3b',MemoryMapped=True)
+    for g in t1.criteria:
+        for x in t1.actions:
+            assert t3.evaluation[g][x] == t1.evaluation[g][x]
+    g1 = BipolarOutrankingDigraph(t1)
+    g3 = BipolarOutrankingDigraph(t3)
+    assert g1.relation == g3.relation
+
+def testPerformanceTableauView():
+    print('*---- testing copy-on-write performance tableau views -----*')
+    from copy import deepcopy
+    from pickle import dumps, loads
+    t = RandomCBPerformanceTableau(numberOfActions=20,numberOfCriteria=7,
+                                   seed=11)
+    t0 = deepcopy(t)
+    v = PerformanceTableauView(t)
+    g1,g2 = list(t.criteria)[:2]
+    v.criteria[g1]['weight'] = Decimal('100')
+    v.evaluation[g2]['a01'] = Decimal('-999')
+    v.actions['a02']['name'] = 'changed'
+    assert t.criteria == t0.criteria
+    assert t.evaluation == t0.evaluation
+    assert t.actions == t0.actions
+    assert loads(dumps(v.evaluation))[g2]['a01'] == Decimal('-999')
+    # the entries are copied only when written
+    v = PerformanceTableauView(t)
+    row = v.evaluation[g1]
+    assert row['a01'] == t.evaluation[g1]['a01']
+    assert row._data is None
+    row['a01'] = Decimal('0')
+    assert row._data is not None and v.evaluation[g2]._data is None
+    # plain dict reads, updates and nested writes of a view
+    v = PerformanceTableauView(t)
+    assert type(v.criteria) == type(t.criteria)
+    assert type(v.actions) == type(t.actions)
+    ev = dict(v.evaluation)
+    ev[g1]['a01'] = Decimal('-999')
+    acts = {**v.actions}
+    acts['a03']['name'] = 'changed'
+    crit = {}
+    crit.update(v.criteria)
+    crit[g2]['thresholds']['ind'] = (Decimal('50'),Decimal('0'))
+    v.criteria.update({g1: {'weight': Decimal('0')}})
+    for g,row in v.evaluation.items():
+        row['a04'] = Decimal('0')
+    assert t.criteria == t0.criteria
+    assert t.evaluation == t0.evaluation
+    assert t.actions == t0.actions
+    g = BipolarOutrankingDigraph(t)
+    g0 = BipolarOutrankingDigraph(t0,CopyPerfTab=False)
+    assert g.relation == g0.relation
+    assert t.criteria == deepcopy(t0).criteria
+    assert loads(dumps(g)).relation == g.relation
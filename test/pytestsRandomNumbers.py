@@ -233,3 +233,36 @@ def testMontyHallGameSimulator():
     print('==>> Testing the Monthy Hall Game Simulator')
     m = MontyHallGameSimulator(numberOfDoors=6,numberOfClues=3)
     m.simulate(100000,1)
+
+def testIqAgentAddManyMerge():
+    print('==>> Testing batched adds, merging and binary states of iqagents')
+    from randomNumbers import IncrementalQuantilesEstimator
+    import random
+    random.seed(2)
+    data = [random.gauss(mu=0,sigma=1) for i in range(20000)]
+    iqAgent1 = IncrementalQuantilesEstimator(nbuf=100)
+    for x in data[:5050]:
+        iqAgent1.add(x)
+    iqAgent2 = IncrementalQuantilesEstimator(nbuf=100)
+    iqAgent2.addMany(data[:5050])
+    assert iqAgent1.dbuf == iqAgent2.dbuf
+    assert iqAgent1.qile == iqAgent2.qile
+    shards = [IncrementalQuantilesEstimator(nbuf=500) for i in range(4)]
+    for i in range(4):
+        shards[i].addMany(data[i*5000:(i+1)*5000])
+    reducer = IncrementalQuantilesEstimator(nbuf=500)
+    for shard in shards:
+        reducer.merge(shard)
+    assert reducer.nt == 20000
+    data.sort()
+    for p in (0.1,0.25,0.5,0.75,0.9):
+        q,low,high = reducer.report(p,WithAccuracy=True)
+        print(p,data[int(p*20000)],q,low,high)
+        assert low <= data[int(p*20000)] <= high
+    state = reducer.binaryState()
+    iqAgent3 = IncrementalQuantilesEstimator()
+    iqAgent3.loadBinaryState(state)
+    assert iqAgent3.report(0.5) == reducer.report(0.5)
+    reducer.saveBinaryState('testIqAgent.iqe')
+    iqAgent3.loadBinaryState('testIqAgent.iqe')
+    assert iqAgent3.qile == reducer.qile
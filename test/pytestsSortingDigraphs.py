@@ -228,3 +228,73 @@ def testStudentNormedRating():
     nqr.exportGraphViz()
     nqr.showHTMLPerformanceHeatmap()
 
+
+def testVectorizedUpdateQuantiles():
+    print('*-------- Testing vectorized performance quantiles updates -------')
+    from performanceQuantiles import PerformanceQuantiles
+    from randomPerfTabs import RandomCBPerformanceTableau
+    from randomPerfTabs import RandomPerformanceGenerator
+    tp = RandomCBPerformanceTableau(numberOfActions=500,numberOfCriteria=7,
+                                    seed=3)
+    pq = PerformanceQuantiles(tp,'deciles',LowerClosed=True)
+    tpg = RandomPerformanceGenerator(tp,seed=5)
+    batches = [tpg.randomPerformanceTableau(500) for i in range(4)]
+    for batch in batches:
+        pq.updateQuantiles(batch,Vectorized=True)
+    g = 'b2'    # cardinal criterion
+    assert pq.historySizes[g] > 0
+    assert len(pq.quantilesSketches[g]) == 101
+    values = []
+    for t in [tp] + batches:
+        values += [t.evaluation[g][x] for x in t.actions\
+                   if t.evaluation[g][x] != tp.NA]
+    values.sort()
+    # the estimated median lies between the exact 45% and 55% quantiles
+    median = pq.limitingQuantiles[g][5]
+    assert values[int(0.45*len(values))] <= median <= values[int(0.55*len(values))]
+    # merging quantiles gathered by two workers
+    pq1 = PerformanceQuantiles(tp,'deciles',LowerClosed=True)
+    pq1.updateQuantiles(batches[0],historySize=0,Vectorized=True)
+    # the Decimal limiting quantiles are converted when read
+    assert g in pq1.pendingSketches
+    # without history, only the new values are taken into account
+    batchValues = sorted([float(batches[0].evaluation[g][x])\
+                          for x in batches[0].actions\
+                          if batches[0].evaluation[g][x] != tp.NA])
+    assert pq1.limitingQuantiles[g][0] == Decimal(str(batchValues[0]))
+    assert pq1.limitingQuantiles[g][-1] == Decimal(str(batchValues[-1]))
+    assert pq1.pendingSketches == set()
+    pq2 = PerformanceQuantiles(tp,'deciles',LowerClosed=True)
+    pq2.updateQuantiles(batches[1],historySize=0,Vectorized=True)
+    pq1.mergeQuantiles(pq2)
+    nbrValues = len([x for x in batches[0].actions\
+                     if batches[0].evaluation[g][x] != tp.NA])
+    assert pq1.historySizes[g] == nbrValues + pq2.historySizes[g]
+    q = pq1.limitingQuantiles[g]
+    assert q == sorted(q)
+    assert pq1.cdf[g][q[5]] == pq1.quantilesFrequencies[5]
+
+def testVectorizedQuantilesSortingDigraph():
+    print('==>> Testing vectorized quantiles sorting')
+    t = RandomCBPerformanceTableau(numberOfActions=50,numberOfCriteria=7,
+                                   seed=2)
+    for LowerClosed in (True,False):
+        qs = QuantilesSortingDigraph(t,limitingQuantiles=7,
+                                     LowerClosed=LowerClosed,
+                                     StoreSorting=True)
+        qsv = QuantilesSortingDigraph(t,limitingQuantiles=7,
+                                      LowerClosed=LowerClosed,
+                                      StoreSorting=True,Vectorized=True)
+        assert qs.categoryContent == qsv.categoryContent
+        for x in t.actions:
+            for c in qs.categories:
+                assert abs(qs.sorting[x][c]['categoryMembership'] -\
+                           qsv.sorting[x][c]['categoryMembership']) < Decimal('0.0001')
+        # pool based parallel mode with in memory results
+        qsp = QuantilesSortingDigraph(t,limitingQuantiles=7,
+                                      LowerClosed=LowerClosed,
+                                      StoreSorting=True,Vectorized=True,
+                                      Threading=True,nbrCores=2)
+        assert qsp.categoryContent == qsv.categoryContent
+        assert qsp.sorting == qsv.sorting
+        assert qsp.relation == qsv.relation
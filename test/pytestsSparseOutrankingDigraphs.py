@@ -154,6 +154,16 @@ def testPreRankedConfidentOutrankingDigraph():
     bg1.showComponents(direction='descending')
     bg1.showRelationMap()
 
+def testVectorizedPreRankedConfidentLikelihoods():
+    print('==>> Testing vectorized PreRankedConfidentOutrankingDigraph likelihoods')
+    tp = Random3ObjectivesPerformanceTableau(numberOfActions=50,seed=2)
+    bg1 = PreRankedConfidentOutrankingDigraph(tp,quantiles=5,Vectorized=False)
+    bg2 = PreRankedConfidentOutrankingDigraph(tp,quantiles=5)
+    for x in bg1.likelihoods:
+        for y in bg1.likelihoods[x]:
+            assert abs(bg1.likelihoods[x][y] - bg2.likelihoods[x][y]) < 1e-12
+    assert bg1.boostedRanking == bg2.boostedRanking
+
 def testConfidentVersusStdPreRankedOutrankingDigraph():
     print('==>> Testing confident versus standard PreRanked vesrion')
     MP  = True
@@ -221,3 +231,38 @@ def testEstimateRankingCorrelation():
     print(pg.computeRankingCorrelation(preRankedSample))
     print(bg1.estimateRankingCorrelation(sampleSize,seed))
     
+
+def testOutOfCorePreRankedOutrankingDigraph():
+    print('*==>> testing out-of-core pre-ranked outranking digraphs ----*')
+    from os.path import isfile
+    t = RandomCBPerformanceTableau(numberOfActions=200,seed=5)
+    g = PreRankedOutrankingDigraph(t,quantiles=10)
+    og = PreRankedOutrankingDigraph(t,quantiles=10,OutOfCore=True,
+                                    componentsCacheSize=3)
+    print(og)
+    assert isfile(og.componentsStore.fileName)
+    assert og.boostedRanking == g.boostedRanking
+    assert og.fillRate == g.fillRate
+    actionKeys = [x for x in t.actions]
+    for x in actionKeys:
+        for y in actionKeys:
+            assert og.relation(x,y) == g.relation(x,y)
+    assert len(og.componentsStore._cache) <= 3
+    assert og.computeBoostedRanking(rankingRule='NetFlows') ==\
+           g.computeBoostedRanking(rankingRule='NetFlows')
+    # pickled and deep copied digraphs own a copy of the store file
+    from copy import deepcopy
+    from pickle import dumps, loads
+    import gc
+    fileName = og.componentsStore.fileName
+    cg = deepcopy(og)
+    pg = loads(dumps(og))
+    assert cg.componentsStore.fileName != fileName
+    assert pg.componentsStore.fileName != fileName
+    del og
+    gc.collect()
+    assert not isfile(fileName)
+    for x in actionKeys[::7]:
+        for y in actionKeys[::5]:
+            assert cg.relation(x,y) == g.relation(x,y)
+            assert pg.relation(x,y) == g.relation(x,y)
@@ -160,3 +160,21 @@ def testPreorderVotingProfile():
     pv.save()
     
 
+
+def testBinarySnapshot():
+    print('*---- testing binary voting profile snapshots -----*')
+    v = RandomLinearVotingProfile(numberOfVoters=30,numberOfCandidates=6,seed=3)
+    v.save('testBinaryLinearProfile')
+    v.saveBinary('testBinaryLinearProfile')
+    v1 = LinearVotingProfile('testBinaryLinearProfile')
+    v2 = LinearVotingProfile('testBinaryLinearProfile.d3b')
+    assert v2.linearBallot == v1.linearBallot
+    assert v2.ballot == v1.ballot
+    assert CondorcetDigraph(v2).relation == CondorcetDigraph(v1).relation
+    a = RandomBipolarApprovalVotingProfile(numberOfVoters=10,numberOfCandidates=5,seed=3)
+    a.save('testBinaryAVProfile')
+    a.saveBinary('testBinaryAVProfile')
+    a1 = BipolarApprovalVotingProfile('testBinaryAVProfile')
+    a2 = BipolarApprovalVotingProfile('testBinaryAVProfile.d3b')
+    assert a2.approvalBallot == a1.approvalBallot
+    assert a2.ballot == a1.ballot
@@ -1299,7 +1299,9 @@ class PrincipalInOutDegreesOrderingFusion(TransitiveDigraph):
         self.order = len(self.actions)
         self.valuationdomain = digraph.valuationdomain
 
-        if Threading and cpu_count()>2:
+        # the principal scores being computed in process, threading
+        # is only useful when the principal images are drawn with R
+        if Threading and cpu_count()>2 and imageType is not None:
             print('Threading ...')
             from tempfile import TemporaryDirectory
             with TemporaryDirectory() as tempDirName:
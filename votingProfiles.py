@@ -74,7 +74,10 @@ class VotingProfile(object):
     
     def __init__(self,fileVotingProfile=None,seed=None):
 
-        if fileVotingProfile is not None:
+        if fileVotingProfile is not None and isBinarySnapshotFile(fileVotingProfile):
+            # binary snapshot stored with the saveBinary() method
+            self.loadBinary(fileVotingProfile)
+        elif fileVotingProfile is not None:
             fileName = fileVotingProfile+'.py'
             argDict = {}
             fi = open(fileName,'r')
@@ -162,6 +165,111 @@ class VotingProfile(object):
         fo.write( '}\n')
         fo.close()
 
+    def saveBinary(self,fileName='tempVotingProfile',Comments=True):
+        """
+        Persistent storage of a voting profile in a compact binary
+        snapshot file <fileName.d3b> (see :py:func:`digraphsTools.saveBinarySnapshot`).
+
+        The candidates and voters are stored in the JSON index header.
+        Linear ballots are stored as an int32 voters x candidates array of
+        candidate indexes, otherwise the ballots are stored as a float64
+        voters x candidates x candidates array.
+        Such a snapshot is reloaded, without parsing and executing any Python code,
+        with the class constructor or the
+        :py:meth:`~votingProfiles.VotingProfile.loadBinary` method.
+
+        Requires the *numpy* package.
+        """
+        import numpy as np
+        fileName = str(fileName)
+        if not fileName.endswith('.d3b'):
+            fileName += '.d3b'
+        if Comments:
+            print('*--- Saving voting profile in binary file: <%s> ---*' % fileName)
+        candidatesKeys = [x for x in self.candidates]
+        votersKeys = [v for v in self.voters]
+        header = {'type': 'VotingProfile',
+                  'class': self.__class__.__name__,
+                  'name': self.name,
+                  'candidates': self.candidates,
+                  'voters': self.voters,
+                  'candidatesKeys': candidatesKeys,
+                  'votersKeys': votersKeys,
+                  }
+        for att in ('prerankedBallot','approvalBallot','IntraGroup','seed'):
+            try:
+                header[att] = getattr(self,att)
+            except AttributeError:
+                pass
+        arrays = {}
+        try:
+            linearBallot = self.linearBallot
+        except AttributeError:
+            linearBallot = None
+        if linearBallot is not None:
+            index = {x: i for i,x in enumerate(candidatesKeys)}
+            ballotArray = np.full((len(votersKeys),len(candidatesKeys)),-1,
+                                  dtype=np.int32)
+            for i,v in enumerate(votersKeys):
+                for j,x in enumerate(linearBallot[v]):
+                    ballotArray[i,j] = index[x]
+            arrays['linearBallot'] = ballotArray
+        else:
+            ballot = self.ballot
+            values = [ballot[v][x][y] for v in votersKeys\
+                      for x in candidatesKeys for y in candidatesKeys]
+            header['ballotDigits'] = computeDecimalDigits(values)
+            ballotArray = np.array([float(value) for value in values],dtype=np.float64)
+            arrays['ballot'] = ballotArray.reshape((len(votersKeys),
+                                                    len(candidatesKeys),
+                                                    len(candidatesKeys)))
+        saveBinarySnapshot(fileName,header,arrays)
+
+    def loadBinary(self,fileName):
+        """
+        Loads a voting profile stored with the
+        :py:meth:`~votingProfiles.VotingProfile.saveBinary` method.
+        """
+        name = str(fileName)
+        if name.endswith('.d3b'):
+            name = name[:-4]
+        header,arrays = loadBinarySnapshot(name + '.d3b')
+        if header.get('type') != 'VotingProfile':
+            print('Error: %s.d3b is not a voting profile snapshot!' % name)
+            return
+        self.name = name
+        self.candidates = header['candidates']
+        self.voters = header['voters']
+        candidatesKeys = header['candidatesKeys']
+        votersKeys = header['votersKeys']
+        for att in ('prerankedBallot','approvalBallot','IntraGroup','seed'):
+            if att in header:
+                setattr(self,att,header[att])
+        if 'linearBallot' in arrays:
+            ballotArray = arrays['linearBallot'].tolist()
+            self.linearBallot = {}
+            for i,v in enumerate(votersKeys):
+                self.linearBallot[v] = [candidatesKeys[j] for j in ballotArray[i] if j >= 0]
+        if ('prerankedBallot' in header or 'approvalBallot' in header)\
+             and hasattr(self,'computeBallot'):
+            # the ballot is recomputed as when loading the python source file
+            self.ballot = self.computeBallot()
+        elif 'linearBallot' in arrays:
+            self.ballot = LinearVotingProfile.computeBallot(self)
+        else:
+            formatString = '%%.%df' % header['ballotDigits']
+            ballotArray = arrays['ballot'].tolist()
+            self.ballot = {}
+            for i,v in enumerate(votersKeys):
+                self.ballot[v] = {}
+                for j,x in enumerate(candidatesKeys):
+                    row = ballotArray[i][j]
+                    self.ballot[v][x] = {y: Decimal(formatString % row[k])\
+                                         for k,y in enumerate(candidatesKeys)}
+        if 'approvalBallot' in header:
+            self.netApprovalScores = self.computeNetApprovalScores()
+        self.sumWeights = sum(self.voters[v]['weight'] for v in self.voters)
+
     def computePrerankedBallot(self,preranking,Debug=False):
         """
         Renders the bipolar-valued ballot obtained from
@@ -299,6 +407,10 @@ class PrerankedVotingProfile(VotingProfile):
     """
     def __init__(self,fileVotingProfile=None):
 
+        if fileVotingProfile is not None and isBinarySnapshotFile(fileVotingProfile):
+            # binary snapshot stored with the saveBinary() method
+            self.loadBinary(fileVotingProfile)
+            return
         if fileVotingProfile is not None:
             fileName = fileVotingProfile+'.py'
             argDict = {}
@@ -554,7 +666,10 @@ class LinearVotingProfile(VotingProfile):
     """
     def __init__(self,fileVotingProfile=None,numberOfCandidates=5,
                  numberOfVoters=9):
-        if fileVotingProfile is not None:
+        if fileVotingProfile is not None and isBinarySnapshotFile(fileVotingProfile):
+            # binary snapshot stored with the saveBinary() method
+            self.loadBinary(fileVotingProfile)
+        elif fileVotingProfile is not None:
             fileName = fileVotingProfile + '.py'
         ##     fileName = 'testapprovalvotingprofile.py'
             argDict = {}
@@ -1397,7 +1512,10 @@ class BipolarApprovalVotingProfile(VotingProfile):
         ...
     """
     def __init__(self,fileVotingProfile=None,seed=None):
-        if fileVotingProfile is not None:
+        if fileVotingProfile is not None and isBinarySnapshotFile(fileVotingProfile):
+            # binary snapshot stored with the saveBinary() method
+            self.loadBinary(fileVotingProfile)
+        elif fileVotingProfile is not None:
             fileName = fileVotingProfile + '.py'
         ## else:
         ##     fileName = 'testapprovalvotingprofile.py'